@@ -0,0 +1,339 @@
+"""
+Process-wide bandwidth scheduling for downloads.
+
+With a global cap set, every running transfer holds a ``BandwidthLease``
+with a slice of the cap. While an info fetch is running, a reserved share of
+the cap goes to it and to any other interactive work. The rest is split
+between downloads by platform weight. Each lease is a token bucket:
+the download's progress hook (or the Instagram session's read loop) charges
+the bytes it just received and sleeps while it is ahead of its rate.
+yt-dlp also gets the rate as ``ydl.params["ratelimit"]``, so its HTTP
+reader paces itself instead of bursting into the bucket. Changing the cap or
+the weights resizes the running leases at once, and downloads pick up the
+new rate on their next read.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from constants import DEFAULT_INTERACTIVE_SHARE, PLATFORM_BANDWIDTH_WEIGHTS
+
+# Lease kinds
+BULK = "bulk"
+INTERACTIVE = "interactive"
+
+BURST_SECONDS = 0.5  # bucket depth, in seconds of the lease's rate
+MIN_BURST_BYTES = 64 * 1024
+MIN_RATE = 16 * 1024  # no lease is starved below this, even with many running
+MAX_WAIT_SECONDS = 0.25  # a waiting transfer re-reads its rate at least this often
+MAX_INTERACTIVE_SHARE = 90
+
+
+@dataclass(frozen=True)
+class Allocation:
+    """How the cap is split right now; rates in bytes/s."""
+
+    limit: int = 0  # 0 = unlimited
+    platforms: Dict[str, int] = field(default_factory=dict)  # summed over a platform's downloads
+    interactive: int = 0
+    downloads: int = 0
+
+    @property
+    def unlimited(self) -> bool:
+        return self.limit <= 0
+
+
+class BandwidthLease:
+    """One transfer's slice of the cap, enforced as a token bucket.
+
+    ``rate`` is None while no cap is set. ``on_change(rate)`` runs on the
+    thread that resized the lease. Inside ``with lease:``,
+    ``BandwidthScheduler.current()`` returns the lease on this thread.
+    """
+
+    def __init__(self, scheduler: "BandwidthScheduler", platform: str, kind: str) -> None:
+        self.platform = platform
+        self.kind = kind
+        self.rate: Optional[int] = None
+        self.on_change: Optional[Callable[[Optional[int]], None]] = None
+        self.closed = False
+        self._scheduler = scheduler
+        self._tokens = 0.0
+        self._stamp = scheduler.clock()
+        self._seen = 0
+
+    def consume(self, nbytes: int) -> float:
+        """Charge ``nbytes``; sleeps while the bucket is in debt. Returns the seconds waited."""
+        return self._scheduler._consume(self, nbytes)
+
+    def account(self, total: int) -> float:
+        """``consume`` for progress hooks, which report a running total per file."""
+        with self._scheduler._condition:
+            if total < self._seen:
+                self._seen = 0  # the next file, e.g. the audio after the video
+            delta = total - self._seen
+            self._seen = total
+        return self.consume(delta) if delta > 0 else 0.0
+
+    def close(self) -> None:
+        self._scheduler.release(self)
+
+    def __enter__(self) -> "BandwidthLease":
+        self._scheduler._thread_leases().append(self)
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        leases = self._scheduler._thread_leases()
+        if leases and leases[-1] is self:
+            leases.pop()
+        self.close()
+
+
+class BandwidthScheduler:
+    """Split a global rate cap between the transfers currently running.
+
+    ``limit`` is in bytes/s (0 means no cap), ``weights`` maps platform to a
+    relative share (1 if missing) and ``interactive_share`` is the percent
+    of the cap held back for ``INTERACTIVE`` leases while downloads run too.
+    With a 0 share, interactive leases weigh the same as a download. Without
+    any interactive work the downloads get the whole cap. Listeners get an
+    ``Allocation`` after every change, on the thread that made it.
+    """
+
+    def __init__(
+        self,
+        limit: int = 0,
+        weights: Optional[Dict[str, float]] = None,
+        interactive_share: int = DEFAULT_INTERACTIVE_SHARE,
+        burst_seconds: float = BURST_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.clock = clock
+        self.burst_seconds = burst_seconds
+        self.limit = 0
+        self.weights: Dict[str, float] = dict(PLATFORM_BANDWIDTH_WEIGHTS)
+        self.interactive_share = DEFAULT_INTERACTIVE_SHARE
+        self._condition = threading.Condition()
+        self._leases: List[BandwidthLease] = []
+        self._listeners: List[Callable[[Allocation], None]] = []
+        self._allocation = Allocation()
+        self._local = threading.local()
+        self.configure(limit, weights, interactive_share)
+
+    def configure(
+        self,
+        limit: Optional[int] = None,
+        weights: Optional[Dict[str, float]] = None,
+        interactive_share: Optional[int] = None,
+    ) -> None:
+        """Change any of the settings; running leases are resized immediately."""
+        with self._condition:
+            if limit is not None:
+                self.limit = max(0, int(limit))
+            if weights is not None:
+                merged = dict(PLATFORM_BANDWIDTH_WEIGHTS)
+                merged.update(weights)
+                self.weights = {name: max(0.1, float(weight)) for name, weight in merged.items()}
+            if interactive_share is not None:
+                self.interactive_share = min(max(int(interactive_share), 0), MAX_INTERACTIVE_SHARE)
+        self._reallocate()
+
+    def open(self, platform: str, kind: str = BULK) -> BandwidthLease:
+        lease = BandwidthLease(self, platform, kind)
+        with self._condition:
+            self._leases.append(lease)
+        self._reallocate()
+        return lease
+
+    def release(self, lease: BandwidthLease) -> None:
+        with self._condition:
+            if lease.closed:
+                return
+            lease.closed = True
+            self._leases.remove(lease)
+            self._condition.notify_all()
+        self._reallocate()
+
+    def current(self) -> Optional[BandwidthLease]:
+        """The innermost lease entered on the calling thread, if any."""
+        leases = self._thread_leases()
+        return leases[-1] if leases else None
+
+    def allocation(self) -> Allocation:
+        with self._condition:
+            return self._allocation
+
+    def add_listener(self, listener: Callable[[Allocation], None]) -> None:
+        with self._condition:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[Allocation], None]) -> None:
+        with self._condition:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    # ─── Internals ───────────────────────────────────────────────────────
+
+    def _thread_leases(self) -> List[BandwidthLease]:
+        leases = getattr(self._local, "leases", None)
+        if leases is None:
+            leases = self._local.leases = []
+        return leases
+
+    def _weight(self, lease: BandwidthLease) -> float:
+        return self.weights.get(lease.platform, 1.0) if lease.kind == BULK else 1.0
+
+    def _rates(self) -> Dict[int, Optional[int]]:
+        if not self.limit:
+            return {id(lease): None for lease in self._leases}
+        bulk = [lease for lease in self._leases if lease.kind == BULK]
+        interactive = [lease for lease in self._leases if lease.kind != BULK]
+        reserve = 0
+        if interactive:
+            reserve = self.limit * self.interactive_share // 100 if bulk else self.limit
+        shared = bulk if reserve else bulk + interactive
+        rates: Dict[int, Optional[int]] = {}
+        total_weight = sum(self._weight(lease) for lease in shared)
+        for lease in shared:
+            share = (self.limit - reserve) * self._weight(lease) / total_weight
+            rates[id(lease)] = max(MIN_RATE, int(share))
+        if reserve:
+            for lease in interactive:
+                rates[id(lease)] = max(MIN_RATE, reserve // len(interactive))
+        return rates
+
+    def _reallocate(self) -> None:
+        changed: List[BandwidthLease] = []
+        with self._condition:
+            rates = self._rates()
+            platforms: Dict[str, int] = {}
+            interactive = 0
+            for lease in self._leases:
+                rate = rates[id(lease)]
+                if rate != lease.rate:
+                    self._refill(lease)  # tokens earned so far count at the old rate
+                    lease.rate = rate
+                    changed.append(lease)
+                if lease.kind == BULK:
+                    platforms[lease.platform] = platforms.get(lease.platform, 0) + (rate or 0)
+                else:
+                    interactive += rate or 0
+            self._allocation = Allocation(
+                limit=self.limit,
+                platforms=platforms,
+                interactive=interactive,
+                downloads=sum(1 for lease in self._leases if lease.kind == BULK),
+            )
+            allocation = self._allocation
+            listeners = list(self._listeners)
+            self._condition.notify_all()
+        for lease in changed:
+            callback = lease.on_change
+            if callback is not None:
+                callback(lease.rate)
+        for listener in listeners:
+            listener(allocation)
+
+    def _refill(self, lease: BandwidthLease) -> None:
+        now = self.clock()
+        if lease.rate:
+            burst = max(MIN_BURST_BYTES, lease.rate * self.burst_seconds)
+            lease._tokens = min(burst, lease._tokens + (now - lease._stamp) * lease.rate)
+        else:
+            lease._tokens = 0.0
+        lease._stamp = now
+
+    def _consume(self, lease: BandwidthLease, nbytes: int) -> float:
+        if nbytes <= 0:
+            return 0.0
+        waited = 0.0
+        with self._condition:
+            if lease.rate is None or lease.closed:
+                return 0.0
+            self._refill(lease)
+            lease._tokens -= nbytes
+            while lease._tokens < 0 and lease.rate and not lease.closed:
+                started = self.clock()
+                # Woken early when the allocation changes
+                self._condition.wait(min(-lease._tokens / lease.rate, MAX_WAIT_SECONDS))
+                waited += self.clock() - started
+                self._refill(lease)
+        return waited
+
+
+@contextmanager
+def ydl_rate_limit(ydl: Any, lease: BandwidthLease) -> Iterator[None]:
+    """Keep ``ydl.params["ratelimit"]`` at the lease's rate, then restore it.
+
+    yt-dlp's HTTP downloader reads the limit for every block, so a resized
+    lease applies mid-download. Fragment downloads copy their params when
+    they start; the lease's own bucket covers those.
+    """
+    params = ydl.params
+    had_limit = "ratelimit" in params
+    previous = params.get("ratelimit")
+
+    def apply(rate: Optional[int]) -> None:
+        if rate:
+            params["ratelimit"] = rate
+        elif had_limit:
+            params["ratelimit"] = previous
+        else:
+            params.pop("ratelimit", None)
+
+    lease.on_change = apply
+    apply(lease.rate)
+    try:
+        yield
+    finally:
+        lease.on_change = None
+        apply(None)
+
+
+def throttle_session(session: Any, scheduler: BandwidthScheduler) -> Any:
+    """Charge response bodies read through a ``requests`` session to the reading thread's lease.
+
+    Responses that arrive while the thread holds no lease are left alone.
+    Installing twice is a no-op.
+    """
+    hooks = session.hooks.setdefault("response", [])
+    if any(getattr(hook, "bandwidth_scheduler", None) is scheduler for hook in hooks):
+        return session
+
+    def charge_reads(response: Any, *args: Any, **kwargs: Any) -> Any:
+        lease = scheduler.current()
+        raw = getattr(response, "raw", None)
+        if lease is None or raw is None:
+            return response
+        read = raw.read
+
+        def read_throttled(*read_args: Any, **read_kwargs: Any) -> Any:
+            data = read(*read_args, **read_kwargs)
+            if data:
+                lease.consume(len(data))
+            return data
+
+        raw.read = read_throttled
+        return response
+
+    charge_reads.bandwidth_scheduler = scheduler
+    hooks.append(charge_reads)
+    return session
+
+
+_shared_scheduler: Optional[BandwidthScheduler] = None
+_shared_scheduler_lock = threading.Lock()
+
+
+def get_shared_bandwidth() -> BandwidthScheduler:
+    """Return the process-wide scheduler every downloader draws from."""
+    global _shared_scheduler
+    with _shared_scheduler_lock:
+        if _shared_scheduler is None:
+            _shared_scheduler = BandwidthScheduler()
+        return _shared_scheduler
@@ -0,0 +1,92 @@
+"""
+Benchmark: HistoryStore insert, query and search latency at 100k entries.
+
+Also times a single legacy history.json rewrite at the same size, which is
+what every completed download used to cost.
+
+    python benchmarks/bench_history_store.py [--entries 100000] [--batch 64]
+"""
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from history_search import parse_query  # noqa: E402
+from history_store import HistoryStore  # noqa: E402
+
+PLATFORMS = ["youtube", "tiktok", "instagram", "facebook", "twitter", "vimeo", "dailymotion", "twitch"]
+
+# Search-box inputs: common and rare terms, filters alone and combined
+SEARCHES = [
+    "some", "vid", "4242", "number 4242", "platform:vimeo", "platform:vimeo title",
+    "date:2023-04", "date:2023-04 some", "size:>10MB", "size:>1GB some", "uploader:nobody",
+]
+
+
+def make_entry(n: int) -> dict:
+    return {
+        "filename": f"Some video title number {n}.mp4",
+        "platform": PLATFORMS[n % len(PLATFORMS)],
+        "size": "12.3 MB",
+        "filepath": f"C:/Users/me/Downloads/VideoDownloader/Some video title number {n}.mp4",
+        "date": f"20{20 + n % 6}-{n % 12 + 1:02d}-{n % 28 + 1:02d}T{n % 24:02d}:{n % 60:02d}:00",
+        "source_url": f"https://www.youtube.com/watch?v={n:011d}",
+    }
+
+
+def timed(func, repeat: int = 50) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--entries", type=int, default=100_000)
+    parser.add_argument("--batch", type=int, default=64)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = HistoryStore(Path(tmp) / "history.db", batch_size=args.batch)
+        entries = [make_entry(n) for n in range(args.entries)]
+
+        start = time.perf_counter()
+        for entry in entries:
+            store.add(entry)
+        store.flush()
+        insert_total = time.perf_counter() - start
+
+        probe = random.Random(1)
+        print(f"entries:                 {store.count()}")
+        print(f"insert (batch={args.batch}):       {insert_total / args.entries * 1e6:.1f} us/entry "
+              f"({insert_total:.2f} s total)")
+        print(f"recent(50):              {timed(lambda: store.recent(50)):.3f} ms")
+        print(f"by_platform('vimeo'):    {timed(lambda: store.by_platform('vimeo')):.3f} ms")
+        print(f"by_source_url:           "
+              f"{timed(lambda: store.by_source_url(make_entry(probe.randrange(args.entries))['source_url'])):.3f} ms")
+        print(f"between(one month):      {timed(lambda: store.between('2023-04-01', '2023-05-01', 50)):.3f} ms")
+        for text in SEARCHES:
+            query = parse_query(text)
+            hits = len(store.search(query))
+            print(f"search {text!r:32} {timed(lambda: store.search(query), 10):7.3f} ms ({hits} rows)")
+        store.close()
+
+        legacy = Path(tmp) / "history.json"
+        start = time.perf_counter()
+        with open(legacy, "w", encoding="utf-8") as f:
+            json.dump(entries, f, ensure_ascii=False, indent=2)
+        print(f"legacy history.json rewrite at {args.entries}: {(time.perf_counter() - start) * 1000:.0f} ms per completed download")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Benchmark: cost of one status change with 1,000 queued items.
+
+Compares the old behaviour (destroy and rebuild every row) with
+``QueueView.sync``. Uses real ``QueueItemWidget`` rows when a display is
+available; otherwise falls back to counting stub rows so the diffing cost
+and the number of widget operations can still be measured headless.
+
+    python benchmarks/bench_queue_view.py [--items 1000] [--flips 20]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from widgets.queue_item import QueueItem  # noqa: E402
+from widgets.queue_view import QueueView  # noqa: E402
+
+
+class StubRow:
+    """Stands in for ``QueueItemWidget`` and counts widget operations."""
+
+    ops = 0
+
+    def __init__(self, item):
+        self.item = item
+        StubRow.ops += 1
+
+    def refresh_status(self):
+        StubRow.ops += 1
+
+    def pack(self, **kwargs):
+        StubRow.ops += 1
+
+    def pack_forget(self):
+        StubRow.ops += 1
+
+    def destroy(self):
+        StubRow.ops += 1
+
+
+def make_row_factory():
+    """Real widgets when Tk can open a window, stub rows otherwise."""
+    try:
+        import customtkinter as ctk
+        from widgets.queue_item import QueueItemWidget
+
+        root = ctk.CTk()
+        frame = ctk.CTkFrame(root)
+        frame.pack()
+
+        def factory(item):
+            return QueueItemWidget(frame, item, lambda _item: None)
+
+        def settle():
+            root.update_idletasks()
+
+        return "tk", factory, settle, root.destroy
+    except Exception:
+        return "stub", StubRow, lambda: None, lambda: None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--flips", type=int, default=20)
+    args = parser.parse_args()
+
+    mode, factory, settle, close = make_row_factory()
+    items = [QueueItem(url=f"https://www.youtube.com/watch?v={n:011d}", platform="youtube") for n in range(args.items)]
+
+    # Old path: every change tears down and rebuilds all rows
+    rows = [factory(item) for item in items]
+    rebuild_samples = []
+    rebuild_ops = 0
+    for flip in range(min(args.flips, 5)):
+        items[flip].status = "downloading"
+        StubRow.ops = 0
+        start = time.perf_counter()
+        for row in rows:
+            row.destroy()
+        rows = [factory(item) for item in items]
+        for row in rows:
+            row.pack(fill="x", pady=2)
+        settle()
+        rebuild_samples.append(time.perf_counter() - start)
+        rebuild_ops = StubRow.ops
+    for row in rows:
+        row.destroy()
+    for item in items:
+        item.status = "pending"
+
+    # New path: diff against the rendered rows
+    view = QueueView(factory)
+    view.sync(items)
+    settle()
+    sync_samples = []
+    sync_ops = 0
+    for flip in range(args.flips):
+        items[flip].status = "downloading" if flip % 2 == 0 else "completed"
+        StubRow.ops = 0
+        start = time.perf_counter()
+        view.sync(items)
+        settle()
+        sync_samples.append(time.perf_counter() - start)
+        sync_ops = StubRow.ops
+    close()
+
+    print(f"rows:                  {args.items} ({mode} widgets)")
+    print(f"rebuild per change:    {statistics.median(rebuild_samples) * 1000:.2f} ms"
+          + (f", {rebuild_ops} widget ops" if mode == "stub" else ""))
+    print(f"diff sync per change:  {statistics.median(sync_samples) * 1000:.2f} ms"
+          + (f", {sync_ops} widget ops" if mode == "stub" else ""))
+
+
+if __name__ == "__main__":
+    main()
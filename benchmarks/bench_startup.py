@@ -0,0 +1,103 @@
+"""
+Benchmark: startup cost of main.py with lazy vs. eager backend imports.
+
+Reports the ``python -X importtime`` cumulative time of ``import main`` and
+its largest top-level imports, then the wall clock from interpreter start
+to the first idle callback of ``mainloop`` (needs a display; skipped
+otherwise). "eager" imports yt-dlp and instaloader up front, as main.py
+used to through downloader.py. Runs against a throwaway home directory so
+settings and history are not touched.
+
+    python benchmarks/bench_startup.py [--runs 5] [--top 8]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+EAGER_IMPORTS = "import yt_dlp, yt_dlp.extractor.extractors, instaloader; "
+
+FIRST_IDLE_SNIPPET = """
+import time
+start = time.perf_counter()
+{preload}import main
+app = main.VideoDownloaderApp()
+def first_idle():
+    print(f"{{time.perf_counter() - start:.6f}}")
+    app.destroy()
+app.after_idle(first_idle)
+app.mainloop()
+"""
+
+
+def run_python(args, home: str) -> subprocess.CompletedProcess:
+    env = dict(os.environ, HOME=home, USERPROFILE=home, LOCALAPPDATA=home)
+    return subprocess.run(
+        [sys.executable, *args], cwd=PROJECT_ROOT, env=env, capture_output=True, text=True, timeout=120
+    )
+
+
+def parse_importtime(stderr: str):
+    """Return ``{module: cumulative_us}`` for the top-level imports of the ``-c`` command.
+
+    Interpreter start-up imports (everything up to and including ``site``)
+    are left out so only the application's own import cost is counted.
+    """
+    top_level = {}
+    after_site = False
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative_us, raw_name = line.split("|", 2)
+        name = raw_name.strip()
+        if raw_name.startswith("  "):
+            continue  # nested import, already part of its parent's cumulative time
+        if not after_site:
+            after_site = name == "site"
+            continue
+        top_level[name] = int(cumulative_us)
+    return top_level
+
+
+def importtime(preload: str, home: str):
+    result = run_python(["-X", "importtime", "-c", preload + "import main"], home)
+    return parse_importtime(result.stderr)
+
+
+def first_idle(preload: str, home: str):
+    result = run_python(["-c", FIRST_IDLE_SNIPPET.format(preload=preload)], home)
+    if result.returncode != 0:
+        return None
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=8)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as home:
+        for label, preload in (("lazy", ""), ("eager", EAGER_IMPORTS)):
+            samples = [importtime(preload, home) for _ in range(args.runs)]
+            modules = samples[-1]
+            total = statistics.median(sum(sample.values()) for sample in samples)
+            print(f"[{label}] importtime total: {total / 1000:.1f} ms (median of {args.runs})")
+            for name, cumulative in sorted(modules.items(), key=lambda item: item[1], reverse=True)[:args.top]:
+                print(f"    {cumulative / 1000:8.1f} ms  {name}")
+
+        for label, preload in (("lazy", ""), ("eager", EAGER_IMPORTS)):
+            timings = [first_idle(preload, home) for _ in range(args.runs)]
+            if any(timing is None for timing in timings):
+                print(f"[{label}] first mainloop idle: skipped (no display)")
+                continue
+            print(f"[{label}] first mainloop idle: {statistics.median(timings) * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
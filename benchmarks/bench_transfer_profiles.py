@@ -0,0 +1,106 @@
+"""
+Benchmark: HLS download time with different fragment concurrency settings.
+
+A local HTTP server serves a VOD playlist of MPEG-TS segments and holds
+every request for a fixed latency, like a CDN far away would. The same
+video is downloaded through YTDLPDownloader once per transfer profile.
+
+    python benchmarks/bench_transfer_profiles.py [--segments 40] [--segment-kb 256] [--latency-ms 80]
+"""
+
+import argparse
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import yt_dlp  # noqa: E402
+
+from downloader import YTDLPDownloader  # noqa: E402
+from info_cache import InfoCache  # noqa: E402
+from transfer_profiles import TransferProfile  # noqa: E402
+from ydl_pool import YoutubeDLPool  # noqa: E402
+
+TS_PACKET = b"\x47" + b"\0" * 187
+
+
+def make_handler(segments: int, segment: bytes, latency: float):
+    playlist = "".join(
+        ["#EXTM3U\n#EXT-X-VERSION:3\n#EXT-X-TARGETDURATION:4\n#EXT-X-MEDIA-SEQUENCE:0\n"]
+        + [f"#EXTINF:4.0,\nseg{index}.ts\n" for index in range(segments)]
+        + ["#EXT-X-ENDLIST\n"]
+    ).encode()
+
+    class _Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):  # noqa: N802
+            time.sleep(latency)
+            if self.path.endswith(".m3u8"):
+                body, content_type = playlist, "application/vnd.apple.mpegurl"
+            else:
+                body, content_type = segment, "video/mp2t"
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return _Handler
+
+
+def make_pool() -> YoutubeDLPool:
+    # The segments are padding, not video; keep an installed FFmpeg from "fixing" them
+    return YoutubeDLPool(factory=lambda params: yt_dlp.YoutubeDL({**params, "fixup": "never"}))
+
+
+def run_download(url: str, profile: TransferProfile) -> float:
+    pool = make_pool()
+    with tempfile.TemporaryDirectory() as tmp:
+        downloader = YTDLPDownloader(
+            Path(tmp), "twitch", pool=pool, info_cache=InfoCache(), transfer_profile=profile,
+        )
+        start = time.perf_counter()
+        result = downloader.download(url)
+        elapsed = time.perf_counter() - start
+    pool.close()
+    if not result.success:
+        raise RuntimeError(result.error)
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--segments", type=int, default=40)
+    parser.add_argument("--segment-kb", type=int, default=256)
+    parser.add_argument("--latency-ms", type=float, default=80)
+    args = parser.parse_args()
+
+    segment = TS_PACKET * (args.segment_kb * 1024 // len(TS_PACKET))
+    server = ThreadingHTTPServer(
+        ("127.0.0.1", 0), make_handler(args.segments, segment, args.latency_ms / 1000)
+    )
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/vod/index.m3u8"
+    total_mb = args.segments * len(segment) / (1024 * 1024)
+
+    print(f"segments:          {args.segments} x {len(segment) // 1024} KB, {args.latency_ms:.0f} ms per request")
+    baseline = None
+    for fragments in (1, 4, 8, 16):
+        elapsed = run_download(url, TransferProfile(fragment_concurrency=fragments))
+        baseline = baseline or elapsed
+        print(f"{fragments:>2} fragment(s):     {elapsed:.2f} s, {total_mb / elapsed:.1f} MB/s, "
+              f"{baseline / elapsed:.2f}x")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
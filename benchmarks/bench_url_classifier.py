@@ -0,0 +1,124 @@
+"""
+Benchmark: URL classification over 1M URLs, regex scan vs. host table.
+
+The legacy path is what a pasted URL used to cost: ``normalize_media_url``
+(which ran ``detect_platform`` itself) followed by another ``detect_platform``
+on the result. It is compared against ``classify_url`` with its cache
+disabled and with the cache warm (URLs drawn from a pool of distinct ones).
+
+    python benchmarks/bench_url_classifier.py [--urls 1000000] [--distinct 5000]
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from url_classifier import _classify, classify_url  # noqa: E402
+
+TEMPLATES = [
+    "https://www.youtube.com/watch?v={id}&si=tracking{n}",
+    "https://youtu.be/{id}?t={n}",
+    "https://www.youtube.com/shorts/{id}",
+    "https://www.tiktok.com/@user{n}/video/{n}",
+    "https://www.instagram.com/p/{id}/?igsh={n}",
+    "https://www.instagram.com/someone/reel/{id}/",
+    "https://www.instagram.com/stories/someone/{n}/",
+    "https://www.facebook.com/watch/?v={n}&ref=share",
+    "https://x.com/user{n}/status/{n}",
+    "https://vimeo.com/{n}",
+    "https://www.dailymotion.com/video/{id}",
+    "https://www.twitch.tv/videos/{n}",
+    "https://www.example.com/watch?v={id}",
+    "https://news.site.org/articles/{n}?utm_source=x",
+]
+
+
+# ─── Legacy implementation (substring regexes, before url_classifier) ───
+
+_LEGACY_PATTERNS = {
+    'youtube': [r'(youtube\.com|youtu\.be)'],
+    'tiktok': [r'tiktok\.com', r'vm\.tiktok\.com'],
+    'instagram': [r'instagram\.com', r'instagr\.am'],
+    'facebook': [r'facebook\.com', r'fb\.watch'],
+    'twitter': [r'twitter\.com', r'x\.com'],
+    'vimeo': [r'vimeo\.com'],
+    'dailymotion': [r'dailymotion\.com', r'dai\.ly'],
+    'twitch': [r'twitch\.tv'],
+}
+_LEGACY_ALLOWED = {'youtube': {'v', 'list', 'index', 't'}, 'instagram': {'img_index'}, 'facebook': {'v'}}
+
+
+def legacy_detect(url):
+    normalized_url = url.strip().lower()
+    if not normalized_url:
+        return None
+    for platform, patterns in _LEGACY_PATTERNS.items():
+        for pattern in patterns:
+            if re.search(pattern, normalized_url):
+                return platform
+    return None
+
+
+def legacy_normalize(url):
+    cleaned = url.strip()
+    parsed = urlparse(cleaned)
+    if not parsed.scheme or not parsed.netloc:
+        return cleaned
+    keep = _LEGACY_ALLOWED.get(legacy_detect(cleaned), set())
+    query = urlencode([(k, v) for k, v in parse_qsl(parsed.query) if k in keep])
+    return urlunparse(parsed._replace(query=query, fragment=''))
+
+
+def legacy_classify(url):
+    normalized = legacy_normalize(url)
+    return normalized, legacy_detect(normalized)
+
+
+# ─────────────────────────────────────────────────────────────────────────
+
+def make_url(rng: random.Random, n: int) -> str:
+    video_id = "".join(rng.choices("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_-", k=11))
+    return rng.choice(TEMPLATES).format(id=video_id, n=n)
+
+
+def run(label: str, func, urls) -> float:
+    start = time.perf_counter()
+    for url in urls:
+        func(url)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {elapsed:>7.2f} s  {elapsed / len(urls) * 1e6:>6.2f} µs/URL")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--urls", type=int, default=1_000_000)
+    parser.add_argument("--distinct", type=int, default=5_000)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    pool = [make_url(rng, n) for n in range(args.distinct)]
+    urls = [rng.choice(pool) for _ in range(args.urls)]
+    print(f"{args.urls:,} URLs drawn from {args.distinct:,} distinct\n")
+
+    legacy = run("legacy normalize + detect", legacy_classify, urls)
+    uncached = run("classify_url (no cache)", _classify, urls)
+    classify_url.cache_clear()
+    cached = run("classify_url (cached)", classify_url, urls)
+    print(f"\nspeed-up: {legacy / uncached:.1f}x uncached, {legacy / cached:.1f}x cached")
+
+    mismatches = sum(
+        1 for url in pool
+        if legacy_classify(url) != (classify_url(url).normalized, classify_url(url).platform)
+    )
+    print(f"results differing from legacy: {mismatches} of {len(pool):,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Benchmark: per-item overhead of YTDLPDownloader with and without the YoutubeDL pool.
+
+Serves a 100-URL queue from a local HTTP server through a fake extractor whose
+one-time initialisation stands in for the cookie/TLS setup of a real site.
+
+    python benchmarks/bench_ydl_pool.py [--items 100]
+"""
+
+import argparse
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import yt_dlp  # noqa: E402
+from yt_dlp.extractor.common import InfoExtractor  # noqa: E402
+
+from downloader import YTDLPDownloader  # noqa: E402
+from ydl_pool import YoutubeDLPool  # noqa: E402
+
+PAYLOAD = b"\0" * (64 * 1024)
+HANDSHAKE_DELAY = 0.02
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):  # noqa: N802
+        if self.path == "/handshake":
+            time.sleep(HANDSHAKE_DELAY)
+            body = b"ok"
+            content_type = "text/plain"
+        else:
+            body = PAYLOAD
+            content_type = "video/mp4"
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def make_fake_extractor(port: int):
+    class FakeQueueIE(InfoExtractor):
+        IE_NAME = "fakequeue"
+        _VALID_URL = r"fakequeue://(?P<id>\d+)"
+
+        def _real_initialize(self):
+            self._download_webpage(f"http://127.0.0.1:{port}/handshake", None, note=False)
+
+        def _real_extract(self, url):
+            video_id = self._match_id(url)
+            return {
+                "id": video_id,
+                "title": f"item {video_id}",
+                "url": f"http://127.0.0.1:{port}/media/{video_id}.mp4",
+                "ext": "mp4",
+            }
+
+    return FakeQueueIE
+
+
+def make_factory(ie_class):
+    def factory(params):
+        ydl = yt_dlp.YoutubeDL(params, auto_init=False)
+        ydl.add_info_extractor(ie_class())
+        ydl.add_default_info_extractors()
+        return ydl
+    return factory
+
+
+def run_queue(pool: YoutubeDLPool, items: int) -> float:
+    with tempfile.TemporaryDirectory() as tmp:
+        downloader = YTDLPDownloader(Path(tmp), "youtube", pool=pool)
+        start = time.perf_counter()
+        for index in range(items):
+            result = downloader.download(f"fakequeue://{index}")
+            if not result.success:
+                raise RuntimeError(result.error)
+        elapsed = time.perf_counter() - start
+    pool.close()
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=100)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    factory = make_factory(make_fake_extractor(server.server_address[1]))
+
+    fresh = run_queue(YoutubeDLPool(max_idle_per_key=0, factory=factory), args.items)
+    pooled_pool = YoutubeDLPool(factory=factory)
+    pooled = run_queue(pooled_pool, args.items)
+    server.shutdown()
+
+    print(f"items:             {args.items}")
+    print(f"fresh instance:    {fresh:.2f} s total, {fresh / args.items * 1000:.1f} ms/item")
+    print(f"pooled instance:   {pooled:.2f} s total, {pooled / args.items * 1000:.1f} ms/item "
+          f"(created {pooled_pool.created}, reused {pooled_pool.reused})")
+    print(f"speedup:           {fresh / pooled:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
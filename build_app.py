@@ -59,10 +59,32 @@ def build_exe():
         '--hidden-import=tkinter.ttk',
         '--hidden-import=constants',
         '--hidden-import=i18n',
+        '--hidden-import=scheduler',
+        '--hidden-import=ydl_pool',
+        '--hidden-import=info_cache',
+        '--hidden-import=toolchain',
+        '--hidden-import=progress_bus',
+        '--hidden-import=history_store',
+        '--hidden-import=history_search',
+        '--hidden-import=lazy_import',
+        '--hidden-import=startup_manifest',
+        '--hidden-import=resumable_download',
+        '--hidden-import=startup_profile',
+        '--hidden-import=url_classifier',
+        '--hidden-import=url_import',
+        '--hidden-import=playlist_expander',
+        '--hidden-import=download_queue',
+        '--hidden-import=metadata_prefetch',
+        '--hidden-import=transfer_profiles',
+        '--hidden-import=bandwidth',
+        '--hidden-import=queue_journal',
+        '--hidden-import=retry_engine',
         '--hidden-import=widgets',
         '--hidden-import=widgets.queue_item',
+        '--hidden-import=widgets.queue_view',
         '--hidden-import=widgets.video_preview',
         '--hidden-import=widgets.history_item',
+        '--hidden-import=widgets.virtual_list',
         '--hidden-import=widgets.stats_panel',
         '--hidden-import=dialogs',
         '--hidden-import=dialogs.instagram_login',
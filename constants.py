@@ -83,9 +83,67 @@ INSTAGRAM_MEDIA_MODES = {
     "image": "ig_media_image",
 }
 
-# History limits
-MAX_HISTORY_ITEMS = 50
-MAX_HISTORY_DISPLAY = 10
+# Queue concurrency
+DEFAULT_MAX_CONCURRENT_DOWNLOADS = 3
+MAX_CONCURRENT_DOWNLOADS_CHOICES = [1, 2, 3, 4, 6, 8]
+
+# Per-platform caps on simultaneous queue downloads
+PLATFORM_CONCURRENCY_LIMITS = {
+    "instagram": 1,
+    "youtube": 4,
+}
+
+# yt-dlp transfer profiles (see transfer_profiles.py); settings override per platform
+DEFAULT_TRANSFER_PROFILE = {
+    "fragment_concurrency": 4,
+    "chunk_size_mb": 0,
+    "retries": 10,
+    "buffer_kb": 0,
+}
+PLATFORM_TRANSFER_PROFILES = {
+    # Long single-range reads from googlevideo get throttled; request 10 MB at a time
+    "youtube": {"chunk_size_mb": 10},
+    # HLS VODs with many short segments
+    "twitch": {"fragment_concurrency": 8},
+    "vimeo": {"fragment_concurrency": 8},
+    # Progressive MP4s; nothing to split into fragments
+    "tiktok": {"fragment_concurrency": 1},
+}
+TRANSFER_PROFILE_PLATFORMS = [p for p in SUPPORTED_PLATFORMS if p != "instagram"]
+FRAGMENT_CONCURRENCY_CHOICES = [1, 2, 4, 8, 16]
+CHUNK_SIZE_MB_CHOICES = [0, 1, 5, 10, 25, 50]
+TRANSFER_RETRY_CHOICES = [0, 3, 5, 10, 20, 50]
+BUFFER_SIZE_KB_CHOICES = [0, 16, 64, 256, 1024]
+
+# Bandwidth scheduler (see bandwidth.py); rates in KB/s, 0 = unlimited
+BANDWIDTH_LIMIT_CHOICES_KB = [0, 256, 512, 1024, 2048, 5120, 10240, 25600, 51200]
+# Relative share of the capped rate per download; platforms not listed weigh 1
+PLATFORM_BANDWIDTH_WEIGHTS = {
+    "instagram": 2.0,
+}
+# Percent of the cap held back for info fetches while any are running
+DEFAULT_INTERACTIVE_SHARE = 20
+INTERACTIVE_SHARE_CHOICES = [0, 10, 20, 30, 50]
+
+# Queue retries and per-platform circuit breakers (see retry_engine.py)
+DEFAULT_QUEUE_RETRIES = 5
+QUEUE_RETRY_CHOICES = [0, 1, 3, 5, 10]
+CIRCUIT_FAILURE_THRESHOLD = 3  # transient failures in a row that pause a platform
+CIRCUIT_COOLDOWN_SECONDS = 60  # doubled each time a probe fails ...
+CIRCUIT_MAX_COOLDOWN_SECONDS = 15 * 60  # ... up to this
+
+# UI refresh interval for download progress (ms)
+PROGRESS_FRAME_MS = 100
+
+# Extracted info cache (shared by "Fetch info" and the download itself)
+INFO_CACHE_MAX_ENTRIES = 64
+INFO_CACHE_TTL_SECONDS = 30 * 60
+
+# History limits (the store itself is unbounded)
+HISTORY_RECENT_ITEMS = 500
+HISTORY_ROW_HEIGHT = 56
+HISTORY_SEARCH_LIMIT = 1000
+HISTORY_FLUSH_MS = 1000
 
 # Settings defaults
 DEFAULT_SETTINGS = {
@@ -95,6 +153,13 @@ DEFAULT_SETTINGS = {
     "auto_folder": False,
     "notifications": True,
     "auto_update_check": True,
+    "max_concurrent_downloads": DEFAULT_MAX_CONCURRENT_DOWNLOADS,
+    "platform_concurrency": dict(PLATFORM_CONCURRENCY_LIMITS),
+    "transfer_profiles": {},  # platform -> fields that differ from the built-in profile
+    "bandwidth_limit_kb": 0,
+    "bandwidth_weights": dict(PLATFORM_BANDWIDTH_WEIGHTS),
+    "interactive_share": DEFAULT_INTERACTIVE_SHARE,
+    "queue_max_retries": DEFAULT_QUEUE_RETRIES,
 }
 
 # Available languages
@@ -1,11 +1,15 @@
 """Batch URL import dialog."""
 
+import tkinter as tk
 import customtkinter as ctk
 from tkinter import filedialog
 from i18n import t
-from utils import extract_urls_from_text
+from url_import import ImportCounts, UrlImportScan, collect_urls
 from constants import COLORS
 
+# Pause after the last keystroke before pasted text is rescanned
+TEXT_SCAN_DELAY_MS = 300
+
 
 class BatchImportDialog(ctk.CTkToplevel):
     """Dialog for importing multiple URLs at once."""
@@ -13,6 +17,9 @@ class BatchImportDialog(ctk.CTkToplevel):
     def __init__(self, master, on_import: callable):
         super().__init__(master)
         self.on_import = on_import
+        self._scan = None
+        self._from_file = False
+        self._text_job = None
 
         self.title(t("batch_title"))
         self.geometry("550x450")
@@ -78,7 +85,7 @@ class BatchImportDialog(ctk.CTkToplevel):
             command=self.load_from_file,
         ).pack(side="left")
 
-        ctk.CTkButton(
+        self.add_btn = ctk.CTkButton(
             btn_frame,
             text=t("batch_add_all"),
             width=160,
@@ -88,31 +95,109 @@ class BatchImportDialog(ctk.CTkToplevel):
             fg_color=COLORS["primary"],
             hover_color=COLORS["primary_hover"],
             command=self.add_all,
-        ).pack(side="right")
+        )
+        self.add_btn.pack(side="right")
+
+    # ─── Pasted text ───
 
     def _on_text_change(self, event=None):
-        text = self.text_area.get("1.0", "end")
-        urls = extract_urls_from_text(text)
-        self.url_count_label.configure(text=t("batch_url_count", count=len(urls)))
+        if self._from_file:
+            return
+        if self._text_job is not None:
+            self.after_cancel(self._text_job)
+        self._text_job = self.after(TEXT_SCAN_DELAY_MS, self._scan_text)
+
+    def _scan_text(self):
+        self._text_job = None
+        self._start_scan(UrlImportScan.from_text(self.text_area.get("1.0", "end"), **self._scan_callbacks()))
+
+    # ─── File import ───
 
     def load_from_file(self):
         filepath = filedialog.askopenfilename(
             title=t("batch_load_file"),
             filetypes=[("Text files", "*.txt"), ("All files", "*.*")],
         )
-        if filepath:
+        if not filepath:
+            return
+        if self._text_job is not None:
+            self.after_cancel(self._text_job)
+            self._text_job = None
+        # The file is only previewed; the full list stays in the scan
+        self._from_file = True
+        self.text_area.configure(state="normal")
+        self.text_area.delete("1.0", "end")
+        self.text_area.configure(state="disabled")
+        self.add_btn.configure(state="disabled")
+        self.url_count_label.configure(text=t("batch_scanning", lines=0, count=0))
+        self._start_scan(UrlImportScan.from_file(
+            filepath, on_preview=self._post(self._show_preview), **self._scan_callbacks()
+        ))
+
+    def _show_preview(self, lines: list, truncated: bool):
+        if truncated:
+            lines = lines + [t("batch_preview_more", count=len(lines))]
+        self.text_area.configure(state="normal")
+        self.text_area.delete("1.0", "end")
+        self.text_area.insert("1.0", "\n".join(lines))
+        self.text_area.configure(state="disabled")
+
+    # ─── Scanning ───
+
+    def _scan_callbacks(self) -> dict:
+        return {"on_progress": self._post(self._show_progress), "on_done": self._post(self._show_result)}
+
+    def _start_scan(self, scan: UrlImportScan):
+        if self._scan is not None:
+            self._scan.cancel()
+        self._scan = scan
+        scan.start()
+
+    def _post(self, func):
+        """Wrap ``func`` so the scan thread can call it; it runs on the UI thread."""
+        def callback(*args):
             try:
-                with open(filepath, "r", encoding="utf-8") as f:
-                    content = f.read()
-                self.text_area.delete("1.0", "end")
-                self.text_area.insert("1.0", content)
-                self._on_text_change()
-            except Exception:
-                pass
+                self.after(0, lambda: func(*args))
+            except (RuntimeError, tk.TclError):
+                pass  # dialog already closed
+        return callback
+
+    def _show_progress(self, counts: ImportCounts):
+        if self._from_file:
+            self.url_count_label.configure(text=t("batch_scanning", lines=counts.lines, count=counts.urls))
+
+    def _show_result(self, scan: UrlImportScan):
+        if scan is not self._scan or scan.cancelled:
+            return
+        if scan.error is not None:
+            # Back to pasting, so the user can paste the URLs or pick another file
+            self._from_file = False
+            self._scan = None
+            self.text_area.configure(state="normal")
+            self.text_area.delete("1.0", "end")
+            self.add_btn.configure(state="normal")
+            self.url_count_label.configure(text=t("batch_file_error"))
+            return
+        counts = scan.counts
+        if counts.duplicates:
+            text = t("batch_url_summary", count=counts.urls, duplicates=counts.duplicates)
+        else:
+            text = t("batch_url_count", count=counts.urls)
+        self.url_count_label.configure(text=text)
+        self.add_btn.configure(state="normal")
 
     def add_all(self):
-        text = self.text_area.get("1.0", "end")
-        urls = extract_urls_from_text(text)
+        if self._from_file:
+            if self._scan is None or not self._scan.done.is_set():
+                return
+            urls = self._scan.urls
+        else:
+            urls = collect_urls(self.text_area.get("1.0", "end"))
         if urls:
             self.on_import(urls)
             self.destroy()
+
+    def destroy(self):
+        if self._scan is not None:
+            self._scan.cancel()
+        super().destroy()
@@ -2,7 +2,22 @@
 
 import customtkinter as ctk
 from i18n import t, get_available_languages
-from constants import FILENAME_TEMPLATES, LANGUAGES, COLORS
+from constants import (
+    FILENAME_TEMPLATES, LANGUAGES, COLORS, DEFAULT_SETTINGS, MAX_CONCURRENT_DOWNLOADS_CHOICES,
+    TRANSFER_PROFILE_PLATFORMS, FRAGMENT_CONCURRENCY_CHOICES, CHUNK_SIZE_MB_CHOICES,
+    TRANSFER_RETRY_CHOICES, BUFFER_SIZE_KB_CHOICES, PLATFORM_ICONS,
+    BANDWIDTH_LIMIT_CHOICES_KB, INTERACTIVE_SHARE_CHOICES, QUEUE_RETRY_CHOICES,
+)
+from transfer_profiles import TransferProfile, profile_for, profile_overrides
+from utils import format_rate
+
+# Transfer profile field -> (label key, choices)
+TRANSFER_FIELDS = {
+    "fragment_concurrency": ("transfer_fragments", FRAGMENT_CONCURRENCY_CHOICES),
+    "chunk_size_mb": ("transfer_chunk_size", CHUNK_SIZE_MB_CHOICES),
+    "retries": ("transfer_retries", TRANSFER_RETRY_CHOICES),
+    "buffer_kb": ("transfer_buffer", BUFFER_SIZE_KB_CHOICES),
+}
 
 
 class SettingsDialog(ctk.CTkToplevel):
@@ -122,6 +137,48 @@ class SettingsDialog(ctk.CTkToplevel):
             font=ctk.CTkFont(size=12),
         ).pack(anchor="w", padx=30, pady=4)
 
+        # --- Queue Concurrency ---
+        self._add_section_header(scroll, t("settings_concurrency"))
+        self.concurrency_var = ctk.StringVar(
+            value=str(self.settings.get(
+                "max_concurrent_downloads", DEFAULT_SETTINGS["max_concurrent_downloads"]
+            ))
+        )
+        ctk.CTkOptionMenu(
+            scroll,
+            values=[str(choice) for choice in MAX_CONCURRENT_DOWNLOADS_CHOICES],
+            variable=self.concurrency_var,
+            width=100,
+            height=32,
+        ).pack(anchor="w", padx=30, pady=(0, 4))
+
+        # --- Queue Retries ---
+        self._add_section_header(scroll, t("settings_queue_retries"))
+        ctk.CTkLabel(
+            scroll,
+            text=t("settings_queue_retries_desc"),
+            font=ctk.CTkFont(size=11),
+            text_color=COLORS["muted_text"],
+            wraplength=400,
+            justify="left",
+        ).pack(anchor="w", padx=20, pady=(0, 8))
+        self.queue_retries_var = ctk.StringVar(
+            value=str(self.settings.get("queue_max_retries", DEFAULT_SETTINGS["queue_max_retries"]))
+        )
+        ctk.CTkOptionMenu(
+            scroll,
+            values=[str(choice) for choice in QUEUE_RETRY_CHOICES],
+            variable=self.queue_retries_var,
+            width=100,
+            height=32,
+        ).pack(anchor="w", padx=30, pady=(0, 4))
+
+        # --- Bandwidth ---
+        self._setup_bandwidth_section(scroll)
+
+        # --- Transfer Profiles ---
+        self._setup_transfer_section(scroll)
+
         # --- Save Button ---
         ctk.CTkButton(
             scroll,
@@ -135,6 +192,110 @@ class SettingsDialog(ctk.CTkToplevel):
             command=self.save_and_close,
         ).pack(pady=20)
 
+    def _setup_bandwidth_section(self, parent):
+        self._add_section_header(parent, t("settings_bandwidth"))
+        ctk.CTkLabel(
+            parent,
+            text=t("settings_bandwidth_desc"),
+            font=ctk.CTkFont(size=11),
+            text_color=COLORS["muted_text"],
+            wraplength=400,
+            justify="left",
+        ).pack(anchor="w", padx=20, pady=(0, 8))
+
+        grid = ctk.CTkFrame(parent, fg_color="transparent")
+        grid.pack(fill="x", padx=30, pady=(0, 4))
+
+        self.bandwidth_labels = {
+            self._bandwidth_limit_label(limit_kb): limit_kb for limit_kb in BANDWIDTH_LIMIT_CHOICES_KB
+        }
+        self.bandwidth_limit_var = ctk.StringVar(
+            value=self._bandwidth_limit_label(self.settings.get("bandwidth_limit_kb") or 0)
+        )
+        self.interactive_share_var = ctk.StringVar(
+            value=str(self.settings.get("interactive_share", DEFAULT_SETTINGS["interactive_share"]))
+        )
+        rows = (
+            ("settings_bandwidth_limit", list(self.bandwidth_labels), self.bandwidth_limit_var),
+            ("settings_interactive_share", [str(choice) for choice in INTERACTIVE_SHARE_CHOICES],
+             self.interactive_share_var),
+        )
+        for row, (label_key, values, var) in enumerate(rows):
+            ctk.CTkLabel(grid, text=t(label_key), font=ctk.CTkFont(size=12)).grid(
+                row=row, column=0, sticky="w", pady=3
+            )
+            ctk.CTkOptionMenu(grid, values=values, variable=var, width=120, height=28).grid(
+                row=row, column=1, sticky="w", padx=(15, 0), pady=3
+            )
+
+    @staticmethod
+    def _bandwidth_limit_label(limit_kb: int) -> str:
+        return format_rate(limit_kb * 1024) if limit_kb else t("bandwidth_unlimited")
+
+    def _setup_transfer_section(self, parent):
+        self._add_section_header(parent, t("settings_transfer"))
+        ctk.CTkLabel(
+            parent,
+            text=t("settings_transfer_desc"),
+            font=ctk.CTkFont(size=11),
+            text_color=COLORS["muted_text"],
+            wraplength=400,
+            justify="left",
+        ).pack(anchor="w", padx=20, pady=(0, 8))
+
+        overrides = self.settings.get("transfer_profiles")
+        self.transfer_profiles = {
+            platform: profile_for(platform, overrides) for platform in TRANSFER_PROFILE_PLATFORMS
+        }
+        self.transfer_platform = TRANSFER_PROFILE_PLATFORMS[0]
+        self.transfer_platform_var = ctk.StringVar(value=self._platform_label(self.transfer_platform))
+        ctk.CTkOptionMenu(
+            parent,
+            values=[self._platform_label(platform) for platform in TRANSFER_PROFILE_PLATFORMS],
+            variable=self.transfer_platform_var,
+            command=self._on_transfer_platform_change,
+            width=180,
+            height=32,
+        ).pack(anchor="w", padx=30, pady=(0, 6))
+
+        grid = ctk.CTkFrame(parent, fg_color="transparent")
+        grid.pack(fill="x", padx=30, pady=(0, 4))
+        self.transfer_vars = {}
+        profile = self.transfer_profiles[self.transfer_platform]
+        for row, (name, (label_key, choices)) in enumerate(TRANSFER_FIELDS.items()):
+            ctk.CTkLabel(grid, text=t(label_key), font=ctk.CTkFont(size=12)).grid(
+                row=row, column=0, sticky="w", pady=3
+            )
+            var = ctk.StringVar(value=str(getattr(profile, name)))
+            ctk.CTkOptionMenu(
+                grid,
+                values=[str(choice) for choice in choices],
+                variable=var,
+                width=100,
+                height=28,
+            ).grid(row=row, column=1, sticky="w", padx=(15, 0), pady=3)
+            self.transfer_vars[name] = var
+
+    @staticmethod
+    def _platform_label(platform: str) -> str:
+        return f"{PLATFORM_ICONS.get(platform, '')} {platform.capitalize()}"
+
+    def _on_transfer_platform_change(self, label: str):
+        self._store_transfer_profile()
+        for platform in TRANSFER_PROFILE_PLATFORMS:
+            if self._platform_label(platform) == label:
+                self.transfer_platform = platform
+                break
+        profile = self.transfer_profiles[self.transfer_platform]
+        for name, var in self.transfer_vars.items():
+            var.set(str(getattr(profile, name)))
+
+    def _store_transfer_profile(self):
+        """Keep the values shown for the selected platform."""
+        values = {name: var.get() for name, var in self.transfer_vars.items()}
+        current = self.transfer_profiles[self.transfer_platform]
+        self.transfer_profiles[self.transfer_platform] = TransferProfile.from_dict(values, current)
+
     def _add_section_header(self, parent, text: str):
         ctk.CTkLabel(
             parent,
@@ -149,5 +310,13 @@ class SettingsDialog(ctk.CTkToplevel):
         self.settings["auto_folder"] = self.auto_folder_var.get()
         self.settings["notifications"] = self.notifications_var.get()
         self.settings["auto_update_check"] = self.auto_update_var.get()
+        self.settings["max_concurrent_downloads"] = int(self.concurrency_var.get())
+        self.settings["queue_max_retries"] = int(self.queue_retries_var.get())
+        self._store_transfer_profile()
+        self.settings["transfer_profiles"] = profile_overrides(self.transfer_profiles)
+        self.settings["bandwidth_limit_kb"] = self.bandwidth_labels.get(
+            self.bandwidth_limit_var.get(), self.settings.get("bandwidth_limit_kb") or 0
+        )
+        self.settings["interactive_share"] = int(self.interactive_share_var.get())
         self.on_save(self.settings)
         self.destroy()
@@ -0,0 +1,165 @@
+"""Download queue with O(1) duplicate detection, optionally journaled to disk."""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
+
+from metadata_prefetch import METADATA_FETCHING, METADATA_NONE
+
+if TYPE_CHECKING:
+    from queue_journal import QueueJournal
+    from widgets.queue_item import QueueItem
+
+# An item in one of these states blocks a duplicate from being queued
+ACTIVE_STATUSES = frozenset({"pending", "downloading"})
+FINISHED_STATUSES = frozenset({"completed", "error"})
+
+
+def restore_items(items: Iterable["QueueItem"]) -> List["QueueItem"]:
+    """Unfinished items from the journal, ready to be queued again.
+
+    Finished items are dropped; the history has them. An item that was
+    downloading when the app went away goes back to pending. If its partial
+    file is still there it keeps its progress and yt-dlp continues the file,
+    otherwise it starts over.
+    """
+    restored: List["QueueItem"] = []
+    for item in items:
+        if item.status in FINISHED_STATUSES:
+            continue
+        if item.status == "downloading":
+            partial = Path(item.partial_file) if item.partial_file else None
+            if partial is not None and partial.exists():
+                if item.filesize:
+                    item.progress = min(99, partial.stat().st_size * 100 / item.filesize)
+            else:
+                item.partial_file = ""
+                item.progress = 0
+        item.status = "pending"
+        item.speed = ""
+        if item.metadata_state == METADATA_FETCHING:
+            item.metadata_state = METADATA_NONE
+        restored.append(item)
+    return restored
+
+
+class DownloadQueue:
+    """Ordered queue items plus an index of the latest item per dedupe key.
+
+    Items are keyed by ``QueueItem.dedupe_key()`` (canonical URL and the
+    download options). Since an item is only added while no other item
+    with its key is active, the newest item for a key is the only one that
+    can still be pending or downloading, so a duplicate check is one dict
+    lookup plus a look at that item's current status. Workers keep setting
+    ``item.status`` directly; nothing has to be told about it.
+
+    All methods take the queue's own lock once, so ``add_many`` inserts a
+    whole import without letting the workers in between items.
+
+    With a ``journal``, additions and removals are written through to it;
+    changes to an item's fields are recorded with ``touch``. Records are
+    taken under the queue lock but written (and fsynced) after it is
+    released, so ``pending()`` and ``progress()`` never wait on the disk.
+    A separate journal lock keeps the writes in the order the records were
+    taken, so an old record can't land after a newer one or a delete.
+    """
+
+    def __init__(self, items: Iterable["QueueItem"] = (), journal: Optional["QueueJournal"] = None) -> None:
+        self._items: Dict[int, "QueueItem"] = {}
+        self._latest: Dict[Hashable, "QueueItem"] = {}
+        self._lock = threading.Lock()
+        self._journal_lock = threading.Lock()
+        self.journal = journal
+        self.add_many(items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator["QueueItem"]:
+        return iter(self.snapshot())
+
+    def __contains__(self, item: object) -> bool:
+        return self._items.get(id(item)) is item
+
+    def snapshot(self) -> List["QueueItem"]:
+        with self._lock:
+            return list(self._items.values())
+
+    def find_active(self, item: "QueueItem") -> Optional["QueueItem"]:
+        """The pending/downloading item ``item`` would duplicate, if any."""
+        with self._lock:
+            return self._active_for(item.dedupe_key())
+
+    def add(self, item: "QueueItem") -> bool:
+        """Queue ``item`` unless an equivalent one is still active."""
+        return bool(self.add_many((item,)))
+
+    def add_many(self, items: Iterable["QueueItem"]) -> List["QueueItem"]:
+        """Queue every item that isn't a duplicate; returns the ones added."""
+        # Keys canonicalize the URL; work that doesn't need the lock
+        keyed = [(item.dedupe_key(), item) for item in items]
+        added: List["QueueItem"] = []
+        with self._journal_lock:
+            with self._lock:
+                for key, item in keyed:
+                    if self._active_for(key) is not None or id(item) in self._items:
+                        continue
+                    self._items[id(item)] = item
+                    self._latest[key] = item
+                    added.append(item)
+                records = [(item.item_id, item.to_record()) for item in added]
+            if records and self.journal is not None:
+                self.journal.put_many(records)
+        return added
+
+    def restore(self, items: Iterable["QueueItem"]) -> List["QueueItem"]:
+        """Queue the unfinished items read back from the journal.
+
+        The journal is then compacted down to exactly the restored items.
+        """
+        added = self.add_many(restore_items(items))
+        if self.journal is not None:
+            self.journal.retain(item.item_id for item in added)
+        return added
+
+    def touch(self, item: "QueueItem") -> None:
+        """Journal the current fields of ``item`` (status, progress, ...)."""
+        if self.journal is None:
+            return
+        with self._journal_lock:
+            with self._lock:
+                if self._items.get(id(item)) is not item:
+                    return
+                record = item.to_record()
+            self.journal.put(item.item_id, record)
+
+    def remove(self, item: "QueueItem") -> bool:
+        with self._journal_lock:
+            with self._lock:
+                if self._items.get(id(item)) is not item:
+                    return False
+                del self._items[id(item)]
+                key = item.dedupe_key()
+                if self._latest.get(key) is item:
+                    del self._latest[key]
+            if self.journal is not None:
+                self.journal.delete(item.item_id)
+            return True
+
+    def pending(self) -> List["QueueItem"]:
+        with self._lock:
+            return [item for item in self._items.values() if item.status == "pending"]
+
+    def progress(self) -> Tuple[int, int]:
+        """``(finished, total)`` for the overall queue progress."""
+        with self._lock:
+            finished = sum(1 for item in self._items.values() if item.status in FINISHED_STATUSES)
+            return finished, len(self._items)
+
+    def _active_for(self, key: Hashable) -> Optional["QueueItem"]:
+        latest = self._latest.get(key)
+        if latest is not None and latest.status in ACTIVE_STATUSES:
+            return latest
+        return None
@@ -2,32 +2,42 @@
 
 from __future__ import annotations
 
+import copy
 import os
-import re
 import shutil
-import subprocess
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from datetime import date
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, Hashable, Iterator, Optional, Tuple
 
-import instaloader
-import yt_dlp
+from bandwidth import INTERACTIVE, BandwidthScheduler, get_shared_bandwidth, throttle_session, ydl_rate_limit
+from info_cache import InfoCache, get_shared_info_cache
+from progress_bus import ProgressBus
+from retry_engine import AUTH_REQUIRED, classify_error
+from toolchain import get_toolchain
+from constants import QUALITY_OPTIONS
+from playlist_expander import entry_date
+from url_classifier import CHANNEL, PLAYLIST, POST, REEL, STORY, classify_url
+from transfer_profiles import TransferProfile, profile_for
+from lazy_import import LazyModule
+from ydl_pool import YoutubeDLPool, get_shared_pool
 
+# Imported on first use so that opening the window does not wait for it
+instaloader = LazyModule("instaloader")
+
+# Flat listing: pages through a playlist without resolving each video
+_FLAT_OPTIONS = {"quiet": True, "no_warnings": True, "extract_flat": "in_playlist"}
+MAX_LISTING_REDIRECTS = 3
+MAX_LISTING_DEPTH = 1  # a channel's tabs, but not playlists linked from them
+
+# Download errors that mean a cached signed media URL is no longer valid
+_STALE_URL_ERRORS = ("HTTP Error 403", "HTTP Error 410", "Forbidden", "expired")
 
-def check_and_get_ffmpeg() -> Optional[str]:
-    """Return ffmpeg executable path if available."""
-    try:
-        result = subprocess.run(["ffmpeg", "-version"], capture_output=True, text=True)
-        if result.returncode == 0:
-            return "ffmpeg"
-    except FileNotFoundError:
-        pass
 
-    ffmpeg_path = Path.home() / "AppData" / "Local" / "yt-dlp" / "ffmpeg.exe"
-    if ffmpeg_path.exists():
-        return str(ffmpeg_path)
-    return None
+def check_and_get_ffmpeg() -> Optional[str]:
+    """Return ffmpeg executable path if available (probed once per process)."""
+    return get_toolchain().ffmpeg_path()
 
 
 @dataclass
@@ -39,20 +49,54 @@ class DownloadResult:
     filepath: str = ""
     filesize: int = 0
     error: str = ""
+    error_kind: str = ""  # retry_engine kind; empty means classify ``error``
     platform: str = ""
     source_url: str = ""
+    uploader: str = ""
 
 
 class ProgressCallback:
-    """Simple callback wrapper for progress updates."""
+    """Progress sink for a single download.
+
+    Forwards each update to an optional ``callback`` and/or publishes it to
+    a ``ProgressBus`` slot identified by ``key``. ``on_partial_file(path)``
+    hears about each ``.part`` file a download starts writing.
+    """
 
-    def __init__(self, callback: Callable[[float, str, str], None]) -> None:
+    def __init__(
+        self,
+        callback: Optional[Callable[[float, str, str], None]] = None,
+        bus: Optional[ProgressBus] = None,
+        key: Hashable = None,
+        on_partial_file: Optional[Callable[[str], None]] = None,
+    ) -> None:
         self.callback = callback
+        self.bus = bus
+        self.key = key
+        self.on_partial_file = on_partial_file
         self.last_percent = 0.0
+        self.partial_file = ""
 
-    def update(self, percent: float, status: str, speed: str = "") -> None:
+    def report_partial_file(self, path: str) -> None:
+        if path and path != self.partial_file:
+            self.partial_file = path
+            if self.on_partial_file:
+                self.on_partial_file(path)
+
+    def update(
+        self,
+        percent: float,
+        status: str,
+        speed: str = "",
+        downloaded_bytes: int = 0,
+        total_bytes: int = 0,
+        speed_bps: float = 0.0,
+        eta: Optional[float] = None,
+    ) -> None:
         if self.callback:
             self.callback(percent, status, speed)
+        if self.bus is not None:
+            self.bus.publish(self.key, percent, status, speed, downloaded_bytes, total_bytes, speed_bps, eta)
         self.last_percent = percent
 
 
@@ -85,10 +129,22 @@ class BaseDownloader(ABC):
 class YTDLPDownloader(BaseDownloader):
     """yt-dlp backend for YouTube/TikTok and similar platforms."""
 
-    def __init__(self, download_path: Path, platform: str = "youtube") -> None:
+    def __init__(
+        self,
+        download_path: Path,
+        platform: str = "youtube",
+        pool: Optional[YoutubeDLPool] = None,
+        info_cache: Optional[InfoCache] = None,
+        transfer_profile: Optional[TransferProfile] = None,
+        bandwidth: Optional[BandwidthScheduler] = None,
+    ) -> None:
         super().__init__(download_path)
         self.platform = platform
         self.filename_template = "%(title)s"
+        self.pool = pool or get_shared_pool()
+        self.info_cache = info_cache if info_cache is not None else get_shared_info_cache()
+        self.transfer_profile = transfer_profile or profile_for(platform)
+        self.bandwidth = bandwidth or get_shared_bandwidth()
 
     def _get_ydl_opts(
         self,
@@ -105,8 +161,14 @@ class YTDLPDownloader(BaseDownloader):
             "outtmpl": str(self.download_path / f"{template}.%(ext)s"),
             "quiet": True,
             "no_warnings": True,
+            "noprogress": True,
             "extract_flat": False,
+            # watch?v=...&list=... is one video; whole playlists are expanded into the queue
+            "noplaylist": True,
+            # A queue item restored after a restart picks up its .part file
+            "continuedl": True,
         }
+        opts.update(self.transfer_profile.ydl_options())
 
         if ffmpeg_path:
             opts["ffmpeg_location"] = ffmpeg_path
@@ -114,6 +176,10 @@ class YTDLPDownloader(BaseDownloader):
         if as_audio:
             if not ffmpeg_path:
                 raise RuntimeError("MP3 dönüşümü için FFmpeg gerekli!")
+            toolchain = get_toolchain()
+            ffmpeg_info = toolchain.get("ffmpeg")
+            if ffmpeg_info and ffmpeg_info.encoders and not toolchain.has_encoder("libmp3lame"):
+                raise RuntimeError("Bu FFmpeg sürümü MP3 kodlayıcısı (libmp3lame) içermiyor!")
             opts.update(
                 {
                     "format": "bestaudio/best",
@@ -178,10 +244,17 @@ class YTDLPDownloader(BaseDownloader):
                 total = data.get("total_bytes") or data.get("total_bytes_estimate") or 0
                 done = data.get("downloaded_bytes") or 0
                 speed = data.get("speed") or 0
+                # Blocks this download thread while it is ahead of its bandwidth share
+                lease.account(int(done))
+                if progress_callback:
+                    progress_callback.report_partial_file(data.get("tmpfilename") or "")
                 if total > 0 and progress_callback:
                     percent = (float(done) / float(total)) * 100.0
                     speed_str = f"{speed / (1024 * 1024):.1f} MB/s" if speed else ""
-                    progress_callback.update(percent, "İndiriliyor...", speed_str)
+                    progress_callback.update(
+                        percent, "İndiriliyor...", speed_str,
+                        int(done), int(total), float(speed), data.get("eta"),
+                    )
             elif status == "finished":
                 downloaded_file = data.get("filename", "")
                 if progress_callback:
@@ -189,8 +262,9 @@ class YTDLPDownloader(BaseDownloader):
 
         try:
             options = self._get_ydl_opts(as_audio, quality, progress_hook, filename_template, download_subtitles)
-            with yt_dlp.YoutubeDL(options) as ydl:
-                info = ydl.extract_info(url, download=True)
+            with self.bandwidth.open(self.platform) as lease, self.pool.checkout(options) as ydl:
+                with ydl_rate_limit(ydl, lease):
+                    info = self._download_with_cached_info(ydl, url)
 
             if info:
                 if as_audio:
@@ -205,17 +279,54 @@ class YTDLPDownloader(BaseDownloader):
                 result.filename = os.path.basename(downloaded_file) if downloaded_file else info.get("title", "video")
                 result.filepath = downloaded_file
                 result.filesize = int(info.get("filesize") or info.get("filesize_approx") or 0)
+                result.uploader = info.get("uploader") or info.get("channel") or ""
                 if result.filepath and Path(result.filepath).exists() and result.filesize == 0:
                     result.filesize = Path(result.filepath).stat().st_size
         except Exception as exc:  # noqa: BLE001
             result.error = str(exc)
+            result.error_kind = classify_error(exc)
 
         return result
 
+    def _download_with_cached_info(self, ydl: Any, url: str) -> Optional[Dict[str, Any]]:
+        """Download from the cached info dict if there is one, else extract.
+
+        A cached entry whose signed format URLs were rejected by the server
+        is dropped and the URL is extracted again transparently.
+        """
+        cached = self.info_cache.get(url)
+        if cached is None:
+            return ydl.extract_info(url, download=True)
+        try:
+            return ydl.process_ie_result(copy.deepcopy(cached), download=True)
+        except Exception as exc:  # noqa: BLE001
+            if not any(marker in str(exc) for marker in _STALE_URL_ERRORS):
+                raise
+            self.info_cache.invalidate(url)
+            return ydl.extract_info(url, download=True)
+
+    def _extract_raw_info(self, ydl: Any, url: str) -> Optional[Dict[str, Any]]:
+        """Return the unprocessed info dict for ``url``, using the cache."""
+        cached = self.info_cache.get(url)
+        if cached is not None:
+            return copy.deepcopy(cached)
+        raw = ydl.extract_info(url, download=False, process=False)
+        if raw and raw.get("_type", "video") == "video":
+            self.info_cache.put(url, copy.deepcopy(raw))
+        return raw
+
     def get_info(self, url: str) -> Dict[str, Any]:
+        # Holds the interactive share of a bandwidth cap while it runs
+        with self.bandwidth.open(self.platform, INTERACTIVE):
+            return self._get_info(url)
+
+    def _get_info(self, url: str) -> Dict[str, Any]:
+        if classify_url(url).kind in (PLAYLIST, CHANNEL):
+            return self._get_playlist_info(url)
         try:
-            with yt_dlp.YoutubeDL({"quiet": True, "no_warnings": True, "extract_flat": False}) as ydl:
-                info = ydl.extract_info(url, download=False)
+            with self.pool.checkout({"quiet": True, "no_warnings": True, "extract_flat": False, "noplaylist": True}) as ydl:
+                raw = self._extract_raw_info(ydl, url)
+                info = ydl.process_ie_result(raw, download=False) if raw else None
             if not info:
                 return {}
             return {
@@ -230,6 +341,79 @@ class YTDLPDownloader(BaseDownloader):
         except Exception as exc:  # noqa: BLE001
             return {"error": str(exc)}
 
+    def _get_playlist_info(self, url: str) -> Dict[str, Any]:
+        """Title and owner of a playlist/channel without listing its entries."""
+        try:
+            with self.pool.checkout(_FLAT_OPTIONS) as ydl:
+                info = self._resolve_listing(ydl, url)
+            if not info:
+                return {}
+            return {
+                "title": info.get("title") or info.get("id") or url,
+                "duration": 0,
+                "thumbnail": "",
+                "uploader": info.get("uploader") or info.get("channel") or "",
+                "view_count": 0,
+                "qualities": list(QUALITY_OPTIONS),
+                "filesize": 0,
+                "is_playlist": True,
+                "playlist_count": info.get("playlist_count"),
+            }
+        except Exception as exc:  # noqa: BLE001
+            return {"error": str(exc)}
+
+    def iter_playlist_entries(self, url: str, since: Optional[date] = None) -> Iterator[Dict[str, Any]]:
+        """Yield the flat entries of a playlist/channel as yt-dlp pages them in.
+
+        A channel's tabs (videos, shorts, ...) are listed one after another.
+        Channel listings are newest first, so with ``since`` a channel stops
+        at its first older video instead of paging through its whole history.
+        Closing the generator stops the listing.
+        """
+        options = dict(_FLAT_OPTIONS)
+        if since is not None:
+            # Flat YouTube listings only carry a (relative) date when asked to
+            options["extractor_args"] = {"youtubetab": {"approximate_date": [""]}}
+        with self.pool.checkout(options) as ydl:
+            listing = self._resolve_listing(ydl, url)
+            if listing:
+                yield from self._walk_listing(ydl, listing, url, since, depth=0)
+
+    @staticmethod
+    def _resolve_listing(ydl: Any, url: str) -> Optional[Dict[str, Any]]:
+        """Flat-extract ``url``, following the redirects a channel URL may give."""
+        info = ydl.extract_info(url, download=False, process=False)
+        for _ in range(MAX_LISTING_REDIRECTS):
+            if not info or info.get("_type") not in ("url", "url_transparent") or not info.get("url"):
+                break
+            info = ydl.extract_info(info["url"], download=False, process=False)
+        return info
+
+    def _walk_listing(
+        self, ydl: Any, listing: Dict[str, Any], url: str, since: Optional[date], depth: int,
+    ) -> Iterator[Dict[str, Any]]:
+        if listing.get("_type", "video") == "video":
+            yield listing
+            return
+        newest_first = classify_url(listing.get("webpage_url") or url).kind == CHANNEL
+        for entry in listing.get("entries") or ():
+            if not entry:
+                continue
+            nested_url = entry.get("url") or entry.get("webpage_url") or ""
+            if depth < MAX_LISTING_DEPTH and entry.get("_type") == "playlist":
+                yield from self._walk_listing(ydl, entry, nested_url, since, depth + 1)
+                continue
+            if depth < MAX_LISTING_DEPTH and nested_url and classify_url(nested_url).kind in (PLAYLIST, CHANNEL):
+                nested = self._resolve_listing(ydl, nested_url)
+                if nested:
+                    yield from self._walk_listing(ydl, nested, nested_url, since, depth + 1)
+                continue
+            if newest_first and since is not None:
+                day = entry_date(entry)
+                if day is not None and day < since:
+                    return
+            yield entry
+
     def _get_available_qualities(self, info: Dict[str, Any]) -> list[str]:
         qualities: set[str] = set()
         for fmt in info.get("formats", []):
@@ -252,8 +436,9 @@ class YTDLPDownloader(BaseDownloader):
 class InstagramDownloader(BaseDownloader):
     """Instaloader backend for Instagram content."""
 
-    def __init__(self, download_path: Path) -> None:
+    def __init__(self, download_path: Path, bandwidth: Optional[BandwidthScheduler] = None) -> None:
         super().__init__(download_path)
+        self.bandwidth = bandwidth or get_shared_bandwidth()
         self.loader = self._create_loader(download_path)
         self.logged_in = False
         self.username: Optional[str] = None
@@ -371,6 +556,20 @@ class InstagramDownloader(BaseDownloader):
         path = Path.home() / f".instaloader-session-{username}"
         return path if path.exists() else None
 
+    def _throttle_context(self) -> None:
+        """Charge Instagram traffic to the calling thread's bandwidth lease.
+
+        Media files are fetched through a fresh anonymous session each time,
+        and logging in replaces the API session, so both are covered here
+        rather than once at construction.
+        """
+        context = self.loader.context
+        throttle_session(context._session, self.bandwidth)
+        if not getattr(context, "_bandwidth_throttled", False):
+            make_session = context.get_anonymous_session
+            context.get_anonymous_session = lambda: throttle_session(make_session(), self.bandwidth)
+            context._bandwidth_throttled = True
+
     def download(
         self,
         url: str,
@@ -381,6 +580,24 @@ class InstagramDownloader(BaseDownloader):
         download_subtitles: bool = False,
         instagram_content_type: str = "auto",
         instagram_media_mode: str = "auto",
+    ) -> DownloadResult:
+        self._throttle_context()
+        with self.bandwidth.open("instagram"):
+            return self._download(
+                url, as_audio, quality, progress_callback, filename_template,
+                download_subtitles, instagram_content_type, instagram_media_mode,
+            )
+
+    def _download(
+        self,
+        url: str,
+        as_audio: bool,
+        quality: str,
+        progress_callback: Optional[ProgressCallback],
+        filename_template: Optional[str],
+        download_subtitles: bool,
+        instagram_content_type: str,
+        instagram_media_mode: str,
     ) -> DownloadResult:
         _ = as_audio
         _ = quality
@@ -433,17 +650,26 @@ class InstagramDownloader(BaseDownloader):
             result.filename = downloaded_file.name
             result.filepath = str(downloaded_file)
             result.filesize = downloaded_file.stat().st_size
+            result.uploader = post.owner_username
             return result
         except instaloader.exceptions.LoginRequiredException:
             result.error = "Bu içerik için Instagram girişi gerekli"
+            result.error_kind = AUTH_REQUIRED
         except instaloader.exceptions.PrivateProfileNotFollowedException:
             result.error = "Bu içerik gizli bir hesaba ait"
+            result.error_kind = AUTH_REQUIRED
         except Exception as exc:  # noqa: BLE001
             result.error = str(exc)
+            result.error_kind = classify_error(exc)
 
         return result
 
     def get_info(self, url: str) -> Dict[str, Any]:
+        self._throttle_context()
+        with self.bandwidth.open("instagram", INTERACTIVE):
+            return self._get_info(url)
+
+    def _get_info(self, url: str) -> Dict[str, Any]:
         try:
             story_username, story_id = self._extract_story_identifiers(url)
             if story_username and story_id:
@@ -475,25 +701,15 @@ class InstagramDownloader(BaseDownloader):
         return {}
 
     def _extract_shortcode(self, url: str) -> Optional[str]:
-        normalized = url.strip().rstrip("/")
-        patterns = [
-            r"instagram\.com/(?:[^/]+/)?p/([A-Za-z0-9_-]+)",
-            r"instagram\.com/(?:[^/]+/)?reel/([A-Za-z0-9_-]+)",
-            r"instagram\.com/(?:[^/]+/)?reels/([A-Za-z0-9_-]+)",
-            r"instagram\.com/(?:[^/]+/)?tv/([A-Za-z0-9_-]+)",
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, normalized, flags=re.IGNORECASE)
-            if match:
-                return match.group(1)
+        info = classify_url(url)
+        if info.platform == "instagram" and info.kind in (POST, REEL):
+            return info.media_id
         return None
 
     def _extract_content_type(self, url: str) -> str:
-        lowered = url.lower()
-        if "/stories/" in lowered:
-            return "story"
-        if re.search(r"/(?:[^/]+/)?(reel|reels|tv)/", lowered):
-            return "reel"
+        kind = classify_url(url).kind
+        if kind in (STORY, REEL):
+            return kind
         return "post"
 
     def _find_latest_downloaded_file(self, shortcode: str, media_mode: str = "auto") -> Optional[Path]:
@@ -518,14 +734,10 @@ class InstagramDownloader(BaseDownloader):
         return max(candidates, key=lambda file: file.stat().st_mtime)
 
     def _extract_story_identifiers(self, url: str) -> Tuple[Optional[str], Optional[str]]:
-        match = re.search(r"instagram\.com/stories/([^/]+)/([^/?#]+)", url)
-        if not match:
+        info = classify_url(url)
+        if info.platform != "instagram" or info.kind != STORY:
             return None, None
-        username = match.group(1)
-        story_id = match.group(2).split("?")[0]
-        if not username or not story_id:
-            return None, None
-        return username, story_id
+        return info.owner, info.media_id
 
     def _download_story(
         self,
@@ -567,17 +779,21 @@ class InstagramDownloader(BaseDownloader):
         result.filename = downloaded_file.name
         result.filepath = str(downloaded_file)
         result.filesize = downloaded_file.stat().st_size
+        result.uploader = username
         return result
 
 
-def create_downloader(platform: str, download_path: Path) -> BaseDownloader:
-    """Create the right downloader implementation for the platform."""
-    if platform == "youtube":
-        return YTDLPDownloader(download_path, "youtube")
-    if platform == "tiktok":
-        return YTDLPDownloader(download_path, "tiktok")
+def create_downloader(
+    platform: str,
+    download_path: Path,
+    transfer_profiles: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> BaseDownloader:
+    """Create the right downloader implementation for the platform.
+
+    ``transfer_profiles`` is the ``settings["transfer_profiles"]`` value.
+    """
     if platform == "instagram":
         return InstagramDownloader(download_path)
-    if platform in {"facebook", "twitter", "vimeo", "dailymotion", "twitch"}:
-        return YTDLPDownloader(download_path, platform)
+    if platform in {"youtube", "tiktok", "facebook", "twitter", "vimeo", "dailymotion", "twitch"}:
+        return YTDLPDownloader(download_path, platform, transfer_profile=profile_for(platform, transfer_profiles))
     raise ValueError(f"Desteklenmeyen platform: {platform}")
@@ -0,0 +1,179 @@
+"""History search: query parsing and an off-UI-thread, cancellable searcher."""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from constants import HISTORY_SEARCH_LIMIT
+from utils import parse_size
+
+# Sorts after every character that can follow a date prefix in an ISO timestamp
+_DATE_PREFIX_END = "\uffff"
+
+
+@dataclass
+class HistoryQuery:
+    """Parsed form of the history search box.
+
+    ``terms`` are matched as word prefixes against filename, platform,
+    source URL and uploader. Date bounds compare ISO strings (``date_to``
+    is exclusive); size bounds are inclusive byte counts.
+    """
+
+    terms: List[str] = field(default_factory=list)
+    platform: Optional[str] = None
+    uploader: Optional[str] = None
+    date_from: Optional[str] = None
+    date_to: Optional[str] = None
+    size_min: Optional[int] = None
+    size_max: Optional[int] = None
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.terms and all(
+            value is None
+            for value in (self.platform, self.uploader, self.date_from, self.date_to, self.size_min, self.size_max)
+        )
+
+
+def _parse_date_range(value: str) -> Optional[Tuple[str, str]]:
+    """``2024``, ``2024-05`` or ``2024-05-01..2024-06-01`` → ``[start, end)``."""
+    if ".." in value:
+        start, end = value.split("..", 1)
+        return (start or None, (end + _DATE_PREFIX_END) if end else None) if start or end else None
+    if not value[:4].isdigit():
+        return None
+    return value, value + _DATE_PREFIX_END
+
+
+def _parse_size_range(value: str) -> Optional[Tuple[Optional[int], Optional[int]]]:
+    """``>100MB``, ``<=1GB`` or ``10MB..1GB`` → inclusive ``(min, max)`` bytes."""
+    if ".." in value:
+        low_text, high_text = value.split("..", 1)
+        low = parse_size(low_text) if low_text else None
+        high = parse_size(high_text) if high_text else None
+        if (low_text and low is None) or (high_text and high is None):
+            return None
+        return low, high
+    for prefix, is_min, strict in ((">=", True, False), ("<=", False, False), (">", True, True), ("<", False, True)):
+        if value.startswith(prefix):
+            size = parse_size(value[len(prefix):])
+            if size is None:
+                return None
+            if strict:
+                size = size + 1 if is_min else size - 1
+            return (size, None) if is_min else (None, size)
+    return None
+
+
+def parse_query(text: str) -> HistoryQuery:
+    """Split the search box into free-text terms and ``key:value`` filters.
+
+    Supported filters: ``platform:``, ``uploader:``, ``date:`` (prefix or
+    ``a..b`` range), ``after:``, ``before:`` and ``size:`` (``>``, ``<``,
+    ``>=``, ``<=`` or ``a..b``). Anything unrecognised is searched as text.
+    """
+    query = HistoryQuery()
+    for token in text.split():
+        key, sep, value = token.partition(":")
+        key = key.lower()
+        handled = False
+        if sep and value:
+            if key == "platform":
+                query.platform = value.lower()
+                handled = True
+            elif key == "uploader":
+                query.uploader = value.lower()
+                handled = True
+            elif key == "after":
+                query.date_from = value
+                handled = True
+            elif key == "before":
+                query.date_to = value
+                handled = True
+            elif key == "date":
+                bounds = _parse_date_range(value)
+                if bounds:
+                    query.date_from, query.date_to = bounds
+                    handled = True
+            elif key == "size":
+                bounds = _parse_size_range(value)
+                if bounds:
+                    query.size_min, query.size_max = bounds
+                    handled = True
+        if not handled:
+            query.terms.append(token.lower())
+    return query
+
+
+class HistorySearcher:
+    """Run history searches on one worker thread, newest query wins.
+
+    ``submit`` bumps a generation counter; the worker only ever runs the
+    latest submitted query, and a query that is still executing when a
+    newer one arrives is interrupted inside SQLite. Callbacks run on the
+    worker thread and receive the generation they belong to, so the UI can
+    drop anything that is no longer ``is_current``.
+    """
+
+    def __init__(self, store: Any, limit: int = HISTORY_SEARCH_LIMIT) -> None:
+        self.store = store
+        self.limit = limit
+        self._generation = 0
+        self._pending: Optional[Tuple[int, str, Callable[[int, List[Dict[str, Any]]], None]]] = None
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def is_current(self, generation: int) -> bool:
+        return generation == self._generation
+
+    def submit(self, text: str, callback: Callable[[int, List[Dict[str, Any]]], None]) -> int:
+        with self._condition:
+            self._generation += 1
+            self._pending = (self._generation, text, callback)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+            self._condition.notify()
+            return self._generation
+
+    def cancel(self) -> None:
+        """Drop the pending query and interrupt the running one."""
+        with self._condition:
+            self._generation += 1
+            self._pending = None
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            self._generation += 1
+            self._pending = None
+            self._condition.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while self._pending is None and not self._closed:
+                    self._condition.wait()
+                if self._closed:
+                    return
+                generation, text, callback = self._pending
+                self._pending = None
+
+            try:
+                rows = self.store.search(
+                    parse_query(text),
+                    limit=self.limit,
+                    is_cancelled=lambda: not self.is_current(generation),
+                )
+            except Exception:
+                rows = []
+            if rows is not None and self.is_current(generation):
+                callback(generation, rows)
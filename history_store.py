@@ -0,0 +1,527 @@
+"""SQLite-backed download history with batched writes."""
+
+from __future__ import annotations
+
+import json
+import re
+import sqlite3
+import threading
+import unicodedata
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+from utils import parse_size
+
+if TYPE_CHECKING:
+    from history_search import HistoryQuery
+
+SCHEMA_VERSION = 3
+
+HISTORY_FIELDS = ("filename", "platform", "size", "filepath", "date", "source_url", "uploader", "size_bytes")
+INTEGER_FIELDS = ("size_bytes",)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    filename TEXT NOT NULL DEFAULT '',
+    platform TEXT NOT NULL DEFAULT '',
+    size TEXT NOT NULL DEFAULT '',
+    filepath TEXT NOT NULL DEFAULT '',
+    date TEXT NOT NULL DEFAULT '',
+    source_url TEXT NOT NULL DEFAULT '',
+    uploader TEXT NOT NULL DEFAULT '',
+    size_bytes INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS stats_platform (
+    platform TEXT PRIMARY KEY,
+    count INTEGER NOT NULL DEFAULT 0,
+    bytes INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS stats_day (
+    day TEXT PRIMARY KEY,
+    count INTEGER NOT NULL DEFAULT 0,
+    bytes INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+# Running aggregates maintained in the same transaction as each insert/delete
+_STATS_TRIGGERS = """
+CREATE TRIGGER IF NOT EXISTS entries_stats_insert AFTER INSERT ON entries BEGIN
+    INSERT INTO stats_platform (platform, count, bytes) VALUES (new.platform, 1, new.size_bytes)
+        ON CONFLICT(platform) DO UPDATE SET count = count + 1, bytes = bytes + excluded.bytes;
+    INSERT INTO stats_day (day, count, bytes) VALUES (substr(new.date, 1, 10), 1, new.size_bytes)
+        ON CONFLICT(day) DO UPDATE SET count = count + 1, bytes = bytes + excluded.bytes;
+END;
+CREATE TRIGGER IF NOT EXISTS entries_stats_delete AFTER DELETE ON entries BEGIN
+    UPDATE stats_platform SET count = count - 1, bytes = bytes - old.size_bytes
+        WHERE platform = old.platform;
+    UPDATE stats_day SET count = count - 1, bytes = bytes - old.size_bytes
+        WHERE day = substr(old.date, 1, 10);
+END;
+"""
+
+_INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_entries_date ON entries(date);
+CREATE INDEX IF NOT EXISTS idx_entries_platform ON entries(platform, date);
+CREATE INDEX IF NOT EXISTS idx_entries_source_url ON entries(source_url);
+CREATE INDEX IF NOT EXISTS idx_entries_size ON entries(size_bytes);
+"""
+
+# External-content FTS5 index kept in sync by triggers; ``prefix`` adds
+# 2- and 3-character prefix indexes so short search-as-you-type terms stay fast
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE entries_fts USING fts5(
+    filename, platform, source_url, uploader,
+    content='entries', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+);
+CREATE TRIGGER entries_fts_insert AFTER INSERT ON entries BEGIN
+    INSERT INTO entries_fts(rowid, filename, platform, source_url, uploader)
+    VALUES (new.id, new.filename, new.platform, new.source_url, new.uploader);
+END;
+CREATE TRIGGER entries_fts_delete AFTER DELETE ON entries BEGIN
+    INSERT INTO entries_fts(entries_fts, rowid, filename, platform, source_url, uploader)
+    VALUES ('delete', old.id, old.filename, old.platform, old.source_url, old.uploader);
+END;
+"""
+
+# Columns searched by free-text terms when FTS5 is not compiled in
+_TEXT_SEARCH_COLUMNS = ("filename", "platform", "source_url", "uploader")
+
+# Up to this many rows left by date/size filters are text-matched in Python
+SEARCH_SCAN_THRESHOLD = 2000
+
+_WORD = re.compile(r"\w+")
+
+_SELECT_COLUMNS = ", ".join(f"e.{name}" for name in ("id",) + HISTORY_FIELDS)
+
+
+def _row_value(entry: Dict[str, Any], name: str) -> Any:
+    if name == "size_bytes":
+        value = entry.get("size_bytes")
+        if value is None:
+            value = parse_size(str(entry.get("size") or "")) or 0
+        return int(value)
+    return str(entry.get(name) or "")
+
+
+def _tokens(text: str) -> List[str]:
+    """Approximate FTS5 ``unicode61 remove_diacritics`` tokenization."""
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return _WORD.findall(stripped)
+
+
+def _phrase_in(tokens: List[str], phrase: List[str]) -> bool:
+    """True if ``phrase`` occurs in ``tokens`` with its last word as a prefix."""
+    if not phrase:
+        return True
+    *head, last = phrase
+    for start in range(len(tokens) - len(phrase) + 1):
+        if tokens[start:start + len(head)] == head and tokens[start + len(head)].startswith(last):
+            return True
+    return False
+
+
+def _row_matches_text(row: Any, query: "HistoryQuery") -> bool:
+    """Python-side equivalent of the FTS match built by ``_search_clause``."""
+    tokens = _tokens(" ".join(str(row[column]) for column in _TEXT_SEARCH_COLUMNS))
+    if not all(_phrase_in(tokens, _tokens(term)) for term in query.terms):
+        return False
+    return not query.uploader or _phrase_in(_tokens(str(row["uploader"])), _tokens(query.uploader))
+
+
+def _filter_conditions(query: "HistoryQuery") -> List[Tuple[str, List[Any]]]:
+    """One ``(template, params)`` per indexed filter; ``{col}`` is the column prefix."""
+    conditions: List[Tuple[str, List[Any]]] = []
+    if query.platform is not None:
+        conditions.append(("{col}platform = ?", [query.platform]))
+    for column, low, high, low_op, high_op in (
+        ("date", query.date_from, query.date_to, ">=", "<"),
+        ("size_bytes", query.size_min, query.size_max, ">=", "<="),
+    ):
+        parts, params = [], []
+        if low is not None:
+            parts.append(f"{{col}}{column} {low_op} ?")
+            params.append(low)
+        if high is not None:
+            parts.append(f"{{col}}{column} {high_op} ?")
+            params.append(high)
+        if parts:
+            conditions.append((" AND ".join(parts), params))
+    return conditions
+
+
+def _fts_phrase(text: str) -> Optional[str]:
+    """Quote ``text`` as an FTS5 prefix phrase; None if it has no word characters."""
+    if not any(char.isalnum() for char in text):
+        return None
+    return '"' + text.replace('"', '""') + '"*'
+
+
+@dataclass
+class HistoryStats:
+    """Download totals over the whole history, per platform and per day."""
+
+    count: int = 0
+    total_bytes: int = 0
+    platform_counts: Dict[str, int] = field(default_factory=dict)
+    platform_bytes: Dict[str, int] = field(default_factory=dict)
+    day_counts: Dict[str, int] = field(default_factory=dict)
+    day_bytes: Dict[str, int] = field(default_factory=dict)
+
+    def record(self, platform: str, day: str, size_bytes: int) -> None:
+        """Account for one more entry — O(1)."""
+        self.count += 1
+        self.total_bytes += size_bytes
+        self.platform_counts[platform] = self.platform_counts.get(platform, 0) + 1
+        self.platform_bytes[platform] = self.platform_bytes.get(platform, 0) + size_bytes
+        self.day_counts[day] = self.day_counts.get(day, 0) + 1
+        self.day_bytes[day] = self.day_bytes.get(day, 0) + size_bytes
+
+    def top_platforms(self, limit: int = 3) -> List[Tuple[str, int]]:
+        return sorted(self.platform_counts.items(), key=lambda item: item[1], reverse=True)[:limit]
+
+    def copy(self) -> "HistoryStats":
+        return HistoryStats(
+            self.count,
+            self.total_bytes,
+            dict(self.platform_counts),
+            dict(self.platform_bytes),
+            dict(self.day_counts),
+            dict(self.day_bytes),
+        )
+
+
+class HistoryStore:
+    """Unbounded download history stored in SQLite.
+
+    ``add`` only buffers the entry; buffered entries are written in a single
+    transaction by ``flush`` (called by the UI on a short timer and on exit)
+    or as soon as ``batch_size`` entries are waiting. Reads flush first so
+    they always see every added entry.
+
+    ``search`` runs on a second, read-only connection so a long query on a
+    worker thread never holds the write lock, and can be interrupted.
+
+    Per-platform and per-day totals are kept by triggers in the same
+    transaction as every insert or delete, and mirrored in memory (pending
+    entries included) so ``stats`` never scans the history.
+    """
+
+    def __init__(self, db_path: Path, batch_size: int = 64) -> None:
+        self.db_path = Path(db_path)
+        self.batch_size = max(1, batch_size)
+        self._lock = threading.RLock()
+        self._read_lock = threading.Lock()
+        self._reader: Optional[sqlite3.Connection] = None
+        self._pending: List[Dict[str, Any]] = []
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        self._conn.executescript(_SCHEMA)
+        if 0 < version < 2:
+            self._migrate_v1_to_v2()
+        self._conn.executescript(_INDEXES)
+        self._conn.executescript(_STATS_TRIGGERS)
+        if 0 < version < 3:
+            self._rebuild_stats()
+        self.has_fts = self._ensure_fts()
+        self._conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+        self._conn.commit()
+        self._stats = self._load_stats()
+
+    def _migrate_v1_to_v2(self) -> None:
+        """Add uploader/size_bytes and backfill bytes from the display strings."""
+        with self._conn:
+            self._conn.execute("ALTER TABLE entries ADD COLUMN uploader TEXT NOT NULL DEFAULT ''")
+            self._conn.execute("ALTER TABLE entries ADD COLUMN size_bytes INTEGER NOT NULL DEFAULT 0")
+            rows = self._conn.execute("SELECT id, size FROM entries").fetchall()
+            self._conn.executemany(
+                "UPDATE entries SET size_bytes = ? WHERE id = ?",
+                [(parse_size(row["size"]) or 0, row["id"]) for row in rows],
+            )
+
+    def _rebuild_stats(self) -> None:
+        """Recompute the aggregate tables from scratch (schema upgrade only)."""
+        with self._conn:
+            self._conn.execute("DELETE FROM stats_platform")
+            self._conn.execute("DELETE FROM stats_day")
+            self._conn.execute(
+                "INSERT INTO stats_platform (platform, count, bytes) "
+                "SELECT platform, COUNT(*), SUM(size_bytes) FROM entries GROUP BY platform"
+            )
+            self._conn.execute(
+                "INSERT INTO stats_day (day, count, bytes) "
+                "SELECT substr(date, 1, 10), COUNT(*), SUM(size_bytes) FROM entries GROUP BY substr(date, 1, 10)"
+            )
+
+    def _load_stats(self) -> HistoryStats:
+        stats = HistoryStats()
+        for row in self._conn.execute("SELECT platform, count, bytes FROM stats_platform WHERE count > 0"):
+            stats.platform_counts[row["platform"]] = row["count"]
+            stats.platform_bytes[row["platform"]] = row["bytes"]
+            stats.count += row["count"]
+            stats.total_bytes += row["bytes"]
+        for row in self._conn.execute("SELECT day, count, bytes FROM stats_day WHERE count > 0"):
+            stats.day_counts[row["day"]] = row["count"]
+            stats.day_bytes[row["day"]] = row["bytes"]
+        return stats
+
+    def _ensure_fts(self) -> bool:
+        """Create and populate the full-text index; False if FTS5 is unavailable."""
+        exists = self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'entries_fts'"
+        ).fetchone()
+        if exists:
+            return True
+        try:
+            with self._conn:
+                self._conn.executescript(_FTS_SCHEMA)
+                self._conn.execute("INSERT INTO entries_fts(entries_fts) VALUES ('rebuild')")
+        except sqlite3.OperationalError:
+            return False
+        return True
+
+    # ─── Writes ───
+
+    def add(self, entry: Dict[str, Any]) -> None:
+        with self._lock:
+            self._pending.append(entry)
+            self._record(entry)
+            if len(self._pending) >= self.batch_size:
+                self.flush()
+
+    def add_many(self, entries: List[Dict[str, Any]]) -> None:
+        with self._lock:
+            self._pending.extend(entries)
+            for entry in entries:
+                self._record(entry)
+            self.flush()
+
+    def _record(self, entry: Dict[str, Any]) -> None:
+        self._stats.record(
+            _row_value(entry, "platform"),
+            _row_value(entry, "date")[:10],
+            _row_value(entry, "size_bytes"),
+        )
+
+    def flush(self) -> int:
+        """Write buffered entries in one transaction; returns how many."""
+        with self._lock:
+            if not self._pending:
+                return 0
+            rows = [tuple(_row_value(entry, name) for name in HISTORY_FIELDS) for entry in self._pending]
+            with self._conn:
+                self._conn.executemany(
+                    f"INSERT INTO entries ({', '.join(HISTORY_FIELDS)}) "
+                    f"VALUES ({', '.join('?' for _ in HISTORY_FIELDS)})",
+                    rows,
+                )
+            self._pending.clear()
+            return len(rows)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pending.clear()
+            with self._conn:
+                self._conn.execute("DELETE FROM entries")
+                self._conn.execute("DELETE FROM stats_platform")
+                self._conn.execute("DELETE FROM stats_day")
+            self._stats = HistoryStats()
+
+    # ─── Reads ───
+
+    def stats(self) -> HistoryStats:
+        """Snapshot of the running totals, including entries not yet flushed."""
+        with self._lock:
+            return self._stats.copy()
+
+    def count(self) -> int:
+        with self._lock:
+            self.flush()
+            return self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def recent(self, limit: int = 50, offset: int = 0) -> List[Dict[str, Any]]:
+        """Newest entries first."""
+        return self._query("ORDER BY date DESC, id DESC LIMIT ? OFFSET ?", (limit, offset))
+
+    def by_platform(self, platform: str, limit: int = 50) -> List[Dict[str, Any]]:
+        return self._query("WHERE platform = ? ORDER BY date DESC, id DESC LIMIT ?", (platform, limit))
+
+    def by_source_url(self, source_url: str) -> List[Dict[str, Any]]:
+        return self._query("WHERE source_url = ? ORDER BY date DESC, id DESC", (source_url,))
+
+    def between(self, start: str, end: str, limit: int = 1000) -> List[Dict[str, Any]]:
+        """Entries whose ISO date falls in ``[start, end)``."""
+        return self._query(
+            "WHERE date >= ? AND date < ? ORDER BY date DESC, id DESC LIMIT ?", (start, end, limit)
+        )
+
+    def search(
+        self,
+        query: "HistoryQuery",
+        limit: int = 1000,
+        offset: int = 0,
+        is_cancelled: Optional[Callable[[], bool]] = None,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Newest entries matching ``query``; None if ``is_cancelled`` fired mid-query.
+
+        Text searches walk the full-text index in descending rowid order and
+        stop after ``limit`` hits instead of collecting and sorting every
+        match. Rows are inserted as downloads complete, so rowid order is
+        the same newest-first order that ``recent`` uses.
+
+        If one of the platform, date or size filters leaves only a few
+        thousand rows, those rows are read through that filter's index,
+        text-matched in Python and sorted here. Otherwise a filter matching
+        almost nothing would make SQLite walk the whole date index (or a
+        common term's whole posting list) looking for ``limit`` hits.
+        """
+        self.flush()
+        with self._read_lock:
+            reader = self._get_reader()
+            if is_cancelled is not None:
+                reader.set_progress_handler(lambda: 1 if is_cancelled() else 0, 1000)
+            try:
+                rows = self._search_narrow(reader, query)
+                if rows is not None:
+                    return rows[offset:offset + limit]
+                source, where, params, order = self._search_clause(query)
+                sql = f"SELECT {_SELECT_COLUMNS} FROM {source} {where} ORDER BY {order} LIMIT ? OFFSET ?"
+                return [dict(row) for row in reader.execute(sql, params + [limit, offset])]
+            except sqlite3.OperationalError:
+                if is_cancelled is not None and is_cancelled():
+                    return None
+                raise
+            finally:
+                reader.set_progress_handler(None, 0)
+
+    def _search_narrow(self, reader: sqlite3.Connection, query: "HistoryQuery") -> Optional[List[Dict[str, Any]]]:
+        """Every match, via the most selective filter index; None if none is selective."""
+        conditions = _filter_conditions(query)
+        best = None
+        for index, (template, params) in enumerate(conditions):
+            probe = f"SELECT COUNT(*) FROM (SELECT 1 FROM entries e WHERE {template.format(col='e.')} LIMIT ?)"
+            count = reader.execute(probe, params + [SEARCH_SCAN_THRESHOLD + 1]).fetchone()[0]
+            if count <= SEARCH_SCAN_THRESHOLD and (best is None or count < best[0]):
+                best = (count, index)
+        if best is None:
+            return None
+        if best[0] == 0:
+            return []
+
+        # The chosen filter uses its index; unary + keeps SQLite from picking another
+        clauses, params = [], []
+        for index, (template, condition_params) in enumerate(conditions):
+            clauses.append(template.format(col="e." if index == best[1] else "+e."))
+            params.extend(condition_params)
+        rows = reader.execute(f"SELECT {_SELECT_COLUMNS} FROM entries e WHERE {' AND '.join(clauses)}", params)
+        if query.terms or query.uploader:
+            matched = [dict(row) for row in rows if _row_matches_text(row, query)]
+        else:
+            matched = [dict(row) for row in rows]
+        matched.sort(key=lambda row: (row["date"], row["id"]), reverse=True)
+        return matched
+
+    def _search_clause(self, query: "HistoryQuery") -> Tuple[str, str, List[Any], str]:
+        """Build ``(FROM source, WHERE clause, params, ORDER BY)`` for ``search``."""
+        source = "entries e"
+        order = "e.date DESC, e.id DESC"
+        clauses: List[str] = []
+        params: List[Any] = []
+
+        phrases = [phrase for phrase in map(_fts_phrase, query.terms) if phrase]
+        uploader_phrase = _fts_phrase(query.uploader) if query.uploader else None
+        if self.has_fts:
+            if uploader_phrase:
+                phrases.append(f"uploader : {uploader_phrase}")
+            platform_phrase = _fts_phrase(query.platform) if query.platform else None
+            if phrases and platform_phrase:
+                # Lets FTS intersect doclists instead of filtering every text hit
+                phrases.append(f"platform : {platform_phrase}")
+            match = " AND ".join(phrases)
+            if match:
+                source = "entries_fts f JOIN entries e ON e.id = f.rowid"
+                order = "f.rowid DESC"
+                clauses.append("entries_fts MATCH ?")
+                params.append(match)
+        else:
+            for term in query.terms:
+                clauses.append("(" + " OR ".join(f"e.{column} LIKE ?" for column in _TEXT_SEARCH_COLUMNS) + ")")
+                params.extend([f"%{term}%"] * len(_TEXT_SEARCH_COLUMNS))
+            if query.uploader:
+                clauses.append("e.uploader LIKE ?")
+                params.append(f"%{query.uploader}%")
+
+        for template, condition_params in _filter_conditions(query):
+            clauses.append(template.format(col="e."))
+            params.extend(condition_params)
+        where = ("WHERE " + " AND ".join(clauses)) if clauses else ""
+        return source, where, params, order
+
+    def _get_reader(self) -> sqlite3.Connection:
+        if self._reader is None:
+            self._reader = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            self._reader.row_factory = sqlite3.Row
+        return self._reader
+
+    def _query(self, clause: str, params: tuple) -> List[Dict[str, Any]]:
+        with self._lock:
+            self.flush()
+            rows = self._conn.execute(
+                f"SELECT id, {', '.join(HISTORY_FIELDS)} FROM entries {clause}", params
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    # ─── Lifecycle ───
+
+    def migrate_from_json(self, json_path: Path) -> int:
+        """Import a legacy ``history.json`` once, then rename it aside."""
+        json_path = Path(json_path)
+        if not json_path.exists() or self._get_meta("migrated_json"):
+            return 0
+        try:
+            with open(json_path, "r", encoding="utf-8") as f:
+                legacy = json.load(f)
+        except (OSError, ValueError):
+            return 0
+        if not isinstance(legacy, list):
+            return 0
+
+        # history.json is newest-first; insert oldest-first so ids follow time
+        entries = [entry for entry in reversed(legacy) if isinstance(entry, dict)]
+        with self._lock:
+            self.add_many(entries)
+            with self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('migrated_json', ?)",
+                    (str(json_path),),
+                )
+        try:
+            json_path.replace(json_path.with_name(json_path.name + ".migrated"))
+        except OSError:
+            pass
+        return len(entries)
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def close(self) -> None:
+        with self._lock:
+            self.flush()
+            self._conn.close()
+        with self._read_lock:
+            if self._reader is not None:
+                self._reader.close()
+                self._reader = None
@@ -1,16 +1,32 @@
 """
 Internationalization (i18n) system for Syronss's Media Downloader.
 Supports Turkish and English with dynamic language switching.
+
+Switching language compiles a flat catalog for it (the Turkish fallback is
+merged in ahead of time) and re-applies every text binding registered with
+``bind_text``, so only the bound widget options are reconfigured.
 """
 
 import json
+import string
+import weakref
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
+
+FALLBACK_LANGUAGE = "tr"
 
 _current_language = "tr"
 _translations: Dict[str, Dict[str, str]] = {}
 _loaded = False
 
+# Compiled catalog for the current language: key → text, plus a bound
+# ``str.format`` for the entries that are format templates
+_catalog: Optional[Dict[str, str]] = None
+_templates: Dict[str, Callable[..., str]] = {}
+
+# widget → {option: (key, format kwargs)}; entries vanish with their widgets
+_bindings: "weakref.WeakKeyDictionary[Any, Dict[str, Tuple[str, Dict[str, Any]]]]" = weakref.WeakKeyDictionary()
+
 
 def _load_translations() -> None:
     """Load all translation files from the i18n directory."""
@@ -29,12 +45,49 @@ def _load_translations() -> None:
     _loaded = True
 
 
+def _is_template(text: str) -> bool:
+    """True if ``text`` is a well-formed ``str.format`` template."""
+    if "{" not in text and "}" not in text:
+        return False
+    try:
+        list(string.Formatter().parse(text))
+    except ValueError:
+        return False  # Malformed braces; shown as-is
+    return True
+
+
+def compile_catalog(lang: str) -> Tuple[Dict[str, str], Dict[str, Callable[..., str]]]:
+    """Merge ``lang`` over the fallback language and pick out its templates.
+
+    Returns the flat catalog and, for template entries only, their bound
+    ``str.format``. Plain entries never go through formatting, and text with
+    malformed braces is shown as-is. The templates are still parsed by
+    ``str.format`` on every call; that is faster than joining segments
+    parsed ahead of time in Python.
+    """
+    _load_translations()
+    catalog = dict(_translations.get(FALLBACK_LANGUAGE, {}))
+    catalog.update(_translations.get(lang, {}))
+    templates = {key: text.format for key, text in catalog.items() if _is_template(text)}
+    return catalog, templates
+
+
+def _activate(lang: str) -> None:
+    global _catalog, _templates
+    _catalog, _templates = compile_catalog(lang)
+
+
 def set_language(lang: str) -> None:
-    """Set the active language."""
+    """Set the active language and re-translate every bound widget."""
     global _current_language
     _load_translations()
-    if lang in _translations:
-        _current_language = lang
+    if lang not in _translations:
+        return
+    changed = lang != _current_language or _catalog is None
+    _current_language = lang
+    if changed:
+        _activate(lang)
+        refresh_bindings()
 
 
 def get_language() -> str:
@@ -48,23 +101,65 @@ def t(key: str, **kwargs) -> str:
     Supports format placeholders: t("hello_user", name="Syronss")
     Falls back to Turkish, then returns the key itself.
     """
-    _load_translations()
+    if _catalog is None:
+        _activate(_current_language)
 
-    text = _translations.get(_current_language, {}).get(key)
-    if text is None:
-        text = _translations.get("tr", {}).get(key)
+    text = _catalog.get(key)
     if text is None:
         return key
 
     if kwargs:
-        try:
-            text = text.format(**kwargs)
-        except (KeyError, IndexError):
-            pass
+        template = _templates.get(key)
+        if template is not None:
+            try:
+                return template(**kwargs)
+            except (KeyError, IndexError, ValueError):
+                pass
 
     return text
 
 
+def bind_text(widget: Any, key: str, option: str = "text", **kwargs) -> Any:
+    """Show ``t(key, **kwargs)`` in ``widget``'s ``option`` and keep it translated.
+
+    The option is set now and again after every language switch. Binding the
+    same option again replaces the old binding, so state-dependent labels
+    just re-bind when their state changes. Returns the widget.
+    """
+    widget.configure(**{option: t(key, **kwargs)})
+    _bindings.setdefault(widget, {})[option] = (key, kwargs)
+    return widget
+
+
+def unbind_text(widget: Any, option: Optional[str] = None) -> None:
+    """Stop re-translating ``option`` (or every option) of ``widget``."""
+    options = _bindings.get(widget)
+    if options is None:
+        return
+    if option is None:
+        options.clear()
+    else:
+        options.pop(option, None)
+    if not options:
+        _bindings.pop(widget, None)
+
+
+def refresh_bindings() -> int:
+    """Re-apply every text binding; returns how many widgets were updated."""
+    updated = 0
+    for widget, options in list(_bindings.items()):
+        if not options:
+            continue
+        try:
+            widget.configure(**{option: t(key, **kwargs) for option, (key, kwargs) in options.items()})
+        except Exception:
+            # Destroyed widget (TclError); forget it
+            _bindings.pop(widget, None)
+            continue
+        updated += 1
+    return updated
+
+
 def get_available_languages() -> Dict[str, str]:
     """Return dict of available language codes to their native names."""
     _load_translations()
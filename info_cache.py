@@ -0,0 +1,125 @@
+"""TTL + LRU cache of extracted yt-dlp info dicts, shared by fetch and download."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from constants import INFO_CACHE_MAX_ENTRIES, INFO_CACHE_TTL_SECONDS
+from url_classifier import classify_url
+
+# Top-level fields that are never needed to (re)process a download
+TRIMMED_INFO_FIELDS = ("thumbnails", "heatmap", "comments", "__post_extractor")
+
+# Signed media URLs are treated as expired this many seconds before their deadline
+URL_EXPIRY_MARGIN_SECONDS = 120
+
+
+def trim_info(info: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop bulky fields that play no part in format selection or downloading."""
+    trimmed = {key: value for key, value in info.items() if key not in TRIMMED_INFO_FIELDS}
+    formats = trimmed.get("formats")
+    if formats:
+        # Storyboards are image sprites, never a downloadable media format
+        trimmed["formats"] = [fmt for fmt in formats if fmt.get("ext") != "mhtml"]
+    return trimmed
+
+
+def earliest_url_expiry(info: Dict[str, Any]) -> Optional[float]:
+    """Return the earliest ``expire=`` deadline among the info's media URLs."""
+    deadlines = []
+    urls = [info.get("url")] + [fmt.get("url") for fmt in info.get("formats") or []]
+    for url in urls:
+        if not url or "expire" not in url:
+            continue
+        values = parse_qs(urlparse(url).query).get("expire")
+        if not values:
+            continue
+        try:
+            deadlines.append(float(values[0]))
+        except ValueError:
+            continue
+    return min(deadlines) if deadlines else None
+
+
+class InfoCache:
+    """Thread-safe cache of raw info dicts keyed by normalized URL.
+
+    Entries leave the cache when their TTL elapses, when the least recently
+    used entry has to make room, or when one of their signed format URLs is
+    about to expire — in every case the caller simply extracts again.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = INFO_CACHE_MAX_ENTRIES,
+        ttl_seconds: float = INFO_CACHE_TTL_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(url: str) -> str:
+        return classify_url(url).normalized
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        key = self.make_key(url)
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, info = entry
+            if now - stored_at > self.ttl_seconds or self._urls_expired(info, now):
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return info
+
+    def put(self, url: str, info: Dict[str, Any]) -> None:
+        key = self.make_key(url)
+        with self._lock:
+            self._entries[key] = (self._clock(), trim_info(info))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, url: str) -> None:
+        with self._lock:
+            self._entries.pop(self.make_key(url), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __contains__(self, url: str) -> bool:
+        return self.get(url) is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    @staticmethod
+    def _urls_expired(info: Dict[str, Any], now: float) -> bool:
+        deadline = earliest_url_expiry(info)
+        return deadline is not None and deadline - URL_EXPIRY_MARGIN_SECONDS <= now
+
+
+_shared_cache: Optional[InfoCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_shared_info_cache() -> InfoCache:
+    """Return the process-wide cache used by ``YTDLPDownloader``."""
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = InfoCache()
+        return _shared_cache
@@ -11,11 +11,19 @@ from pathlib import Path
 import tkinter as tk
 from tkinter import ttk, messagebox
 import threading
-import urllib.request
-import zipfile
 import shutil
-import ssl
 import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+# The launcher runs before the app's dependencies are checked or installed,
+# so these modules (and anything they import) must stick to the standard library
+from lazy_import import AppPreloader
+from resumable_download import ResumableDownload, extract_members, fetch_sha256
+from startup_manifest import StartupManifest, clear_manifest, file_digest, load_manifest, save_manifest
+from startup_profile import phase
+from toolchain import get_managed_ffmpeg_dir, get_toolchain
+
+FFMPEG_DOWNLOAD_URL = "https://www.gyan.dev/ffmpeg/builds/ffmpeg-release-essentials.zip"
 
 # CRITICAL: Required for PyInstaller frozen builds to prevent infinite respawn
 multiprocessing.freeze_support()
@@ -31,9 +39,7 @@ def get_app_dir():
 def get_ffmpeg_dir():
     """FFmpeg'in kaydedileceği dizini al."""
     # AppData'da sakla - böylece uygulama güncellendiğinde tekrar indirmek zorunda kalmaz
-    app_data = Path(os.environ.get('LOCALAPPDATA', Path.home() / 'AppData' / 'Local'))
-    ffmpeg_dir = app_data / 'SyronssMediaDownloader' / 'ffmpeg'
-    return ffmpeg_dir
+    return get_managed_ffmpeg_dir()
 
 
 def get_required_packages():
@@ -51,6 +57,34 @@ def get_required_packages():
     return packages
 
 
+def find_missing_packages():
+    """requirements.txt içinde olup import edilemeyen paketleri döndür."""
+    map_pkg_to_import = {
+        "Pillow": "PIL",
+        "customtkinter": "customtkinter",
+        "yt-dlp": "yt_dlp",
+        "instaloader": "instaloader"
+    }
+
+    missing_packages = []
+    for pkg_line in get_required_packages():
+        pkg_name = pkg_line.split(">=")[0].split("==")[0].split("<")[0].strip()
+        import_name = map_pkg_to_import.get(pkg_name, pkg_name)
+
+        if importlib.util.find_spec(import_name) is None:
+            missing_packages.append(pkg_line)
+    return missing_packages
+
+
+def add_to_path(directory):
+    """Dizini PATH'in başına ekle (zaten varsa dokunma)."""
+    if not directory:
+        return
+    current = os.environ.get("PATH", "")
+    if directory not in current.split(os.pathsep):
+        os.environ["PATH"] = directory + os.pathsep + current
+
+
 class LauncherUI:
     def __init__(self):
         self.root = tk.Tk()
@@ -105,6 +139,14 @@ class LauncherUI:
         
         self.app_ready = False
         self.ffmpeg_declined = False
+        # Başlangıç manifestosu: kontroller geçtiyse sonraki açılışta atlanır
+        self.requirements_hash = file_digest(get_app_dir() / "requirements.txt")
+        self.ffmpeg_location = None  # (ffmpeg yolu, PATH'e eklenen dizin)
+        self.warm_start = False
+        # Ana uygulama kontroller sürerken arka planda import edilir
+        self.preloader = None
+        self.import_detail = ""
+        self.handed_off = False
 
     def update_status(self, text, detail="", progress_val=None, mode="determinate"):
         self.root.after(0, lambda: self._update_ui(text, detail, progress_val, mode))
@@ -131,40 +173,78 @@ class LauncherUI:
 
     def run_checks(self):
         try:
-            # Frozen (Compiled) Kontrolü
-            if getattr(sys, 'frozen', False):
-                # Derlenmiş uygulamada paketler zaten içindedir
-                self.ensure_ffmpeg()
-                return
-
-            # Python Paketlerini Kontrol Et
-            packages = get_required_packages()
-            missing_packages = []
-            
-            map_pkg_to_import = {
-                "Pillow": "PIL",
-                "customtkinter": "customtkinter",
-                "yt-dlp": "yt_dlp",
-                "instaloader": "instaloader"
-            }
-            
-            for pkg_line in packages:
-                pkg_name = pkg_line.split(">=")[0].split("==")[0].split("<")[0].strip()
-                import_name = map_pkg_to_import.get(pkg_name, pkg_name)
-                
-                if importlib.util.find_spec(import_name) is None:
-                    missing_packages.append(pkg_line)
-            
-            if missing_packages:
-                self.install_packages(missing_packages)
-            
-            # FFmpeg Kontrol
-            self.ensure_ffmpeg()
-            
+            with phase("launcher.checks"):
+                self._run_checks()
         except Exception as e:
             error_msg = f"Başlatma hatası:\n{str(e)}\n\n{traceback.format_exc()}"
             self.root.after(0, lambda: self.show_error_and_exit(error_msg))
 
+    def _run_checks(self):
+        with phase("manifest"):
+            manifest = load_manifest()
+
+        # Sıcak başlangıç: paketler ve FFmpeg son başarılı açılıştan beri değişmedi
+        if manifest and manifest.is_warm(self.requirements_hash):
+            self.warm_start = True
+            self.start_preload()
+            add_to_path(manifest.path_dir)
+            self.launch_app()
+            return
+
+        # Derlenmiş uygulamada paketler zaten içindedir
+        check_packages = not getattr(sys, 'frozen', False) and not (
+            manifest and manifest.packages_valid(self.requirements_hash))
+
+        # Soğuk başlangıç: paket ve FFmpeg kontrolleri birbirinden bağımsız, aynı anda çalışır
+        self.update_status("Bağımlılıklar kontrol ediliyor...", mode="indeterminate")
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            ffmpeg_future = pool.submit(self.locate_ffmpeg)
+            if check_packages:
+                with phase("packages"):
+                    missing_packages = find_missing_packages()
+                    if missing_packages:
+                        self.install_packages(missing_packages)
+            # Paketler hazır: FFmpeg yoklanırken uygulamayı import etmeye başla
+            self.start_preload()
+            with phase("ffmpeg.wait"):
+                location = ffmpeg_future.result()
+
+        self.ensure_ffmpeg(location)
+
+    def start_preload(self):
+        self.preloader = AppPreloader(
+            on_phase=lambda index, total, label: self.root.after(
+                0, lambda: self._show_import_phase(index, total, label)),
+            on_done=lambda: self.root.after(0, self._on_preload_done),
+        )
+        self.preloader.start()
+
+    def _show_import_phase(self, index, total, label):
+        self.import_detail = f"Yükleniyor: {label} ({index + 1}/{total})"
+        try:
+            self.progress.stop()
+            self.progress["mode"] = "determinate"
+            self.progress["value"] = index / total * 100
+            self.detail_label.config(text=self.import_detail)
+        except tk.TclError:
+            pass  # Widget destroyed
+
+    def _on_preload_done(self):
+        try:
+            self.progress["value"] = 100
+        except tk.TclError:
+            pass
+        self.try_handoff()
+
+    def try_handoff(self):
+        """Kontroller bitti ve uygulama import edildiyse tek adımda geçiş yap."""
+        if self.handed_off or not self.app_ready:
+            return
+        if self.preloader is not None and not self.preloader.done.is_set():
+            return  # _on_preload_done tekrar çağıracak
+        self.handed_off = True
+        self.close_and_start()
+
     def show_error_and_exit(self, msg):
         messagebox.showerror("Kritik Hata", msg)
         self.root.destroy()
@@ -188,55 +268,48 @@ class LauncherUI:
         
         self.update_status("Kütüphaneler hazır", "", 100)
 
-    def ensure_ffmpeg(self):
-        self.update_status("FFmpeg kontrol ediliyor...", mode="indeterminate")
-        
-        # 1. Sistemde kurulu mu?
-        if self.check_ffmpeg_in_path():
-            self.launch_app()
-            return
-        
-        # 2. AppData'da var mı?
-        ffmpeg_dir = get_ffmpeg_dir()
-        ffmpeg_exe = ffmpeg_dir / "ffmpeg.exe"
-        
-        if ffmpeg_exe.exists() and self.verify_ffmpeg_works(ffmpeg_exe):
-            os.environ["PATH"] = str(ffmpeg_dir) + os.pathsep + os.environ.get("PATH", "")
+    def ensure_ffmpeg(self, location):
+        if location:
+            ffmpeg_path, path_dir = location
+            add_to_path(path_dir)
+            self.ffmpeg_location = (str(ffmpeg_path), path_dir)
             self.launch_app()
             return
         
-        # 3. Uygulama yanında bin/ klasöründe var mı?
-        app_bin = get_app_dir() / "bin"
-        app_ffmpeg = app_bin / "ffmpeg.exe"
-        if app_ffmpeg.exists() and self.verify_ffmpeg_works(app_ffmpeg):
-            os.environ["PATH"] = str(app_bin) + os.pathsep + os.environ.get("PATH", "")
-            self.launch_app()
-            return
-        
-        # 4. FFmpeg yok - kullanıcıya sor
+        # FFmpeg yok - kullanıcıya sor
         self.root.after(0, self.ask_ffmpeg_download)
 
-    def check_ffmpeg_in_path(self):
-        try:
-            result = subprocess.run(['ffmpeg', '-version'], 
-                                   capture_output=True, 
-                                   creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0)
-            return result.returncode == 0
-        except FileNotFoundError:
-            return False
+    def locate_ffmpeg(self):
+        """Çalışan bir FFmpeg bul: (yol, PATH'e eklenecek dizin) ya da None.
+
+        Adaylar öncelik sırasıyla: sistem PATH'i, AppData, uygulama yanındaki
+        bin/ klasörü. Hepsi aynı anda yoklanır, ilk çalışan aday seçilir.
+        """
+        with phase("launcher.ffmpeg_probe"):
+            return self._locate_ffmpeg()
+
+    def _locate_ffmpeg(self):
+        candidates = []
+        found = shutil.which("ffmpeg")
+        if found:
+            candidates.append((Path(found), ""))
+        for directory in (get_ffmpeg_dir(), get_app_dir() / "bin"):
+            ffmpeg_exe = directory / "ffmpeg.exe"
+            if ffmpeg_exe.exists():
+                candidates.append((ffmpeg_exe, str(directory)))
+        if not candidates:
+            return None
+
+        with ThreadPoolExecutor(max_workers=len(candidates)) as pool:
+            results = list(pool.map(lambda candidate: self.verify_ffmpeg_works(candidate[0]), candidates))
+        for candidate, works in zip(candidates, results):
+            if works:
+                return candidate
+        return None
 
     def verify_ffmpeg_works(self, ffmpeg_path):
-        """FFmpeg dosyasının çalışıp çalışmadığını doğrula."""
-        try:
-            result = subprocess.run(
-                [str(ffmpeg_path), '-version'],
-                capture_output=True,
-                creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0,
-                timeout=10
-            )
-            return result.returncode == 0
-        except Exception:
-            return False
+        """FFmpeg dosyasının çalışıp çalışmadığını doğrula (önbellekli yoklama)."""
+        return get_toolchain().verify(Path(ffmpeg_path)) is not None
 
     def ask_ffmpeg_download(self):
         result = messagebox.askyesno(
@@ -264,88 +337,55 @@ class LauncherUI:
 
     def download_ffmpeg(self):
         ffmpeg_dir = get_ffmpeg_dir()
-        
-        # Eski dosyaları temizle
-        if ffmpeg_dir.exists():
-            try:
-                shutil.rmtree(ffmpeg_dir)
-            except Exception:
-                pass
-        
+        # Önceki yarım indirme (.part) korunur; kaldığı yerden devam edilir
         ffmpeg_dir.mkdir(parents=True, exist_ok=True)
         
         # Windows için gyan.dev'den essentials build
-        url = "https://www.gyan.dev/ffmpeg/builds/ffmpeg-release-essentials.zip"
+        url = FFMPEG_DOWNLOAD_URL
         zip_path = ffmpeg_dir / "ffmpeg_download.zip"
         
         self.update_status("FFmpeg indiriliyor...", "Bağlantı kuruluyor...", 0, "determinate")
         
         try:
-            # İndirme işlemi
-            def report_progress(block_num, block_size, total_size):
-                if total_size > 0:
-                    percent = min((block_num * block_size / total_size) * 100, 100)
-                    downloaded_mb = (block_num * block_size) / (1024 * 1024)
+            def report_progress(downloaded, total_size):
+                if total_size:
+                    percent = min(downloaded / total_size * 100, 100)
+                    downloaded_mb = downloaded / (1024 * 1024)
                     total_mb = total_size / (1024 * 1024)
                     self.update_status("FFmpeg indiriliyor...", 
                                       f"{downloaded_mb:.1f} / {total_mb:.1f} MB (%{percent:.0f})", 
                                       percent)
 
-            # SSL context oluştur
-            ssl_context = ssl.create_default_context()
+            # Yayınlanan SHA-256 varsa indirme onunla doğrulanır (yoksa ZIP CRC'leri yeterli)
+            checksum = fetch_sha256(url + ".sha256")
             
-            # İndirmeyi başlat
-            urllib.request.urlretrieve(url, zip_path, report_progress)
-            
-            # ZIP dosyası var mı kontrol et
-            if not zip_path.exists():
-                raise Exception("ZIP dosyası indirilemedi!")
+            # Kesintide HTTP Range ile kaldığı yerden devam eder
+            ResumableDownload(url, zip_path, expected_sha256=checksum, progress=report_progress).run()
             
             zip_size = zip_path.stat().st_size
             if zip_size < 1000000:  # 1MB'dan küçükse hata var
                 raise Exception(f"ZIP dosyası çok küçük ({zip_size} bytes), indirme başarısız olmuş olabilir.")
             
-            self.update_status("FFmpeg kuruluyor...", "Arşivden çıkarılıyor...", mode="indeterminate")
-            
-            # ZIP'i aç ve dosyaları çıkar
-            ffmpeg_found = False
-            ffprobe_found = False
+            self.update_status("FFmpeg kuruluyor...", "ffmpeg.exe ve ffprobe.exe çıkarılıyor...", mode="indeterminate")
             
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                # Zip içindeki tüm dosyaları listele
-                all_files = zip_ref.namelist()
-                
-                self.update_status("FFmpeg kuruluyor...", f"Arşivde {len(all_files)} dosya bulundu...", mode="indeterminate")
-                
-                # ffmpeg.exe ve ffprobe.exe dosyalarını bul
-                for name in all_files:
-                    # Dosya adını al (path'siz)
-                    basename = os.path.basename(name)
-                    
-                    if basename == "ffmpeg.exe":
-                        self.update_status("FFmpeg kuruluyor...", "ffmpeg.exe çıkarılıyor...", mode="indeterminate")
-                        self.extract_file_safe(zip_ref, name, ffmpeg_dir / "ffmpeg.exe")
-                        ffmpeg_found = True
-                        
-                    elif basename == "ffprobe.exe":
-                        self.update_status("FFmpeg kuruluyor...", "ffprobe.exe çıkarılıyor...", mode="indeterminate")
-                        self.extract_file_safe(zip_ref, name, ffmpeg_dir / "ffprobe.exe")
-                        ffprobe_found = True
-                    
-                    if ffmpeg_found and ffprobe_found:
-                        break
-
-            # Zip'i sil
+            # Sadece gereken iki dosya, arşivin merkezi dizininden bulunup çıkarılır
             try:
-                zip_path.unlink()
-            except Exception:
-                pass
+                extracted = extract_members(zip_path, {
+                    "ffmpeg.exe": ffmpeg_dir / "ffmpeg.exe",
+                    "ffprobe.exe": ffmpeg_dir / "ffprobe.exe",
+                })
+            finally:
+                # Bozuk ya da kullanılmış arşiv tekrar kullanılmaz
+                try:
+                    zip_path.unlink()
+                except Exception:
+                    pass
             
             # Dosyaların çıkarıldığını kontrol et
             ffmpeg_exe = ffmpeg_dir / "ffmpeg.exe"
             ffprobe_exe = ffmpeg_dir / "ffprobe.exe"
             
-            if not ffmpeg_exe.exists():
+            if "ffmpeg.exe" not in extracted:
                 raise Exception("ffmpeg.exe çıkarılamadı! Arşiv yapısı beklenenden farklı.")
             
             # Dosya boyutunu kontrol et (en az 50MB olmalı)
@@ -360,7 +400,9 @@ class LauncherUI:
                 raise Exception("FFmpeg yüklendi ancak çalıştırılamıyor! Dosya bozuk olabilir.")
             
             # PATH'e ekle
-            os.environ["PATH"] = str(ffmpeg_dir) + os.pathsep + os.environ.get("PATH", "")
+            add_to_path(str(ffmpeg_dir))
+            get_toolchain().refresh()
+            self.ffmpeg_location = (str(ffmpeg_exe), str(ffmpeg_dir))
             
             # Başarı mesajı
             self.update_status("FFmpeg başarıyla kuruldu!", 
@@ -371,25 +413,6 @@ class LauncherUI:
             error_msg = f"FFmpeg kurulum hatası:\n{str(e)}"
             self.root.after(0, lambda: self.handle_ffmpeg_error(error_msg))
 
-    def extract_file_safe(self, zip_ref, src_name, dest_path):
-        """Dosyayı güvenli bir şekilde çıkar."""
-        try:
-            with zip_ref.open(src_name) as source:
-                # Dosyayı parça parça kopyala (bellek sorunlarını önlemek için)
-                with open(dest_path, "wb") as target:
-                    while True:
-                        chunk = source.read(1024 * 1024)  # 1MB parçalar
-                        if not chunk:
-                            break
-                        target.write(chunk)
-            
-            # Dosyanın yazıldığını doğrula
-            if not dest_path.exists():
-                raise Exception(f"{dest_path.name} oluşturulamadı!")
-                
-        except Exception as e:
-            raise Exception(f"Dosya çıkarma hatası ({src_name}): {str(e)}")
-
     def handle_ffmpeg_error(self, error_msg):
         result = messagebox.askyesno(
             "FFmpeg İndirme Hatası",
@@ -407,24 +430,41 @@ class LauncherUI:
             sys.exit(1)
 
     def launch_app(self):
-        self.update_status("Uygulama başlatılıyor...", mode="indeterminate")
+        self.update_status("Uygulama başlatılıyor...", self.import_detail, mode=None)
+        if not self.warm_start:
+            self.remember_checks()
+        if self.preloader is None:
+            self.start_preload()
         self.app_ready = True
-        self.root.after(800, self.close_and_start)
+        self.root.after(0, self.try_handoff)
+
+    def remember_checks(self):
+        """Geçen kontrolleri manifestoya yaz; sonraki açılış onları atlar."""
+        ffmpeg_path, path_dir = self.ffmpeg_location or (None, "")
+        save_manifest(StartupManifest.capture(self.requirements_hash, ffmpeg_path, path_dir))
 
     def close_and_start(self):
         try:
             self.progress.stop()
         except Exception:
             pass
+        # Arka plandaki yt-dlp ısıtması uygulamanın açılışını yavaşlatmasın
+        if self.preloader is not None:
+            self.preloader.stop_extra()
         
-        self.root.destroy()
+        with phase("launcher.destroy"):
+            self.root.destroy()
         
         try:
-            # Ana uygulamayı import et ve başlat
-            import main
-            app = main.VideoDownloaderApp()
+            # Ana uygulama genelde önceden import edilmiştir; sadece pencere kurulur
+            with phase("app.construct"):
+                with phase("import main"):
+                    import main
+                app = main.VideoDownloaderApp()
             app.mainloop()
         except Exception as e:
+            # Manifesto artık güvenilir değil; sonraki açılış her şeyi yeniden kontrol etsin
+            clear_manifest()
             # Hata penceresini göster
             error_root = tk.Tk()
             error_root.withdraw()
@@ -439,7 +479,9 @@ class LauncherUI:
 
 def main():
     try:
-        LauncherUI().start()
+        with phase("launcher.window"):
+            ui = LauncherUI()
+        ui.start()
     except Exception as e:
         # Son çare - herhangi bir hata olursa
         root = tk.Tk()
@@ -0,0 +1,132 @@
+"""Deferred imports: the heavy download backends and the launcher's app pre-import."""
+
+from __future__ import annotations
+
+import importlib
+import sys
+import threading
+from types import ModuleType
+from typing import Callable, Iterable, Optional, Sequence, Tuple
+
+from startup_profile import phase
+
+# Imported on first use, or ahead of time by ``warm_up`` once the UI is up.
+# The extractor registry is what the first ``YoutubeDL()`` would otherwise load.
+BACKEND_MODULES = ("yt_dlp", "yt_dlp.extractor.extractors", "instaloader")
+
+# What ``import main`` pulls in, as (label, modules) steps the launcher can show.
+# customtkinter brings Pillow with it and is the bulk of the cost.
+APP_IMPORT_PHASES: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("customtkinter", ("customtkinter",)),
+    ("widgets", ("widgets", "dialogs", "downloader")),
+    ("history", ("history_store", "history_search")),
+    ("main", ("main",)),
+)
+
+
+class LazyModule:
+    """Stand-in for a module that is imported on first attribute access.
+
+    ``yt_dlp = LazyModule("yt_dlp")`` keeps call sites such as
+    ``yt_dlp.YoutubeDL(...)`` unchanged while moving the import (yt-dlp
+    loads hundreds of extractor modules) off the startup path.
+    """
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._module: Optional[ModuleType] = None
+        self._lock = threading.Lock()
+
+    def load(self) -> ModuleType:
+        if self._module is None:
+            with self._lock:
+                if self._module is None:
+                    self._module = importlib.import_module(self._name)
+        return self._module
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._module is not None or self._name in sys.modules
+
+    def __getattr__(self, attribute: str):
+        return getattr(self.load(), attribute)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.is_loaded else "not loaded"
+        return f"<LazyModule {self._name!r} ({state})>"
+
+
+def warm_up(modules: Iterable[str] = BACKEND_MODULES) -> None:
+    """Import ``modules`` now; meant to run on a background thread."""
+    for name in modules:
+        try:
+            importlib.import_module(name)
+        except Exception:
+            # The real import error surfaces again when the backend is used
+            pass
+
+
+def start_warm_up(modules: Iterable[str] = BACKEND_MODULES) -> threading.Thread:
+    """Run ``warm_up`` on a daemon thread and return it."""
+    thread = threading.Thread(target=warm_up, args=(tuple(modules),), name="backend-warm-up", daemon=True)
+    thread.start()
+    return thread
+
+
+class AppPreloader:
+    """Import the application phase by phase on a background thread.
+
+    ``on_phase(index, total, label)`` is called before each phase and
+    ``on_done()`` once every phase has run; both run on the worker thread.
+    A failed phase is recorded in ``error`` and ends the preload, so the
+    real import can raise it again where it is handled. After the phases,
+    ``extra`` modules are imported while nobody is waiting; ``stop_extra()``
+    skips whatever has not started yet.
+    """
+
+    def __init__(
+        self,
+        phases: Sequence[Tuple[str, Sequence[str]]] = APP_IMPORT_PHASES,
+        extra: Iterable[str] = BACKEND_MODULES,
+        on_phase: Optional[Callable[[int, int, str], None]] = None,
+        on_done: Optional[Callable[[], None]] = None,
+    ) -> None:
+        self.phases = tuple(phases)
+        self.extra = tuple(extra)
+        self.on_phase = on_phase
+        self.on_done = on_done
+        self.error: Optional[BaseException] = None
+        self.done = threading.Event()
+        self._stop_extra = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> threading.Thread:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="app-preload", daemon=True)
+            self._thread.start()
+        return self._thread
+
+    def stop_extra(self) -> None:
+        self._stop_extra.set()
+
+    def _run(self) -> None:
+        total = len(self.phases)
+        try:
+            for index, (label, modules) in enumerate(self.phases):
+                if self.on_phase is not None:
+                    self.on_phase(index, total, label)
+                with phase(f"import {label}"):
+                    for name in modules:
+                        importlib.import_module(name)
+        except Exception as exc:
+            self.error = exc
+        finally:
+            self.done.set()
+            if self.on_done is not None:
+                self.on_done()
+
+        if self.error is None:
+            for name in self.extra:
+                if self._stop_extra.is_set():
+                    break
+                warm_up((name,))
@@ -18,22 +18,40 @@ import json
 
 from constants import (
     APP_NAME, APP_VERSION, COLORS, FILENAME_TEMPLATES,
-    DEFAULT_SETTINGS, MAX_HISTORY_ITEMS, MAX_HISTORY_DISPLAY,
+    DEFAULT_SETTINGS, HISTORY_RECENT_ITEMS, PROGRESS_FRAME_MS,
+    HISTORY_FLUSH_MS, HISTORY_ROW_HEIGHT, BANDWIDTH_LIMIT_CHOICES_KB,
 )
-from i18n import t, set_language, get_language
+from i18n import t, set_language, get_language, bind_text, unbind_text
 from utils import (
-    detect_platform, format_size, get_download_folder, get_platform_icon,
-    get_platform_color, check_ffmpeg, normalize_media_url, Debouncer,
+    format_size, get_download_folder, get_platform_icon,
+    get_platform_color, check_ffmpeg, Debouncer,
     flash_taskbar_icon, get_platform_download_path, check_ytdlp_update,
-    update_ytdlp, get_clipboard_text,
+    update_ytdlp, get_clipboard_text, format_rate,
 )
 from downloader import (
     create_downloader, ProgressCallback, InstagramDownloader, DownloadResult,
 )
 from widgets import (
     QueueItem, QueueItemWidget, VideoPreviewFrame, DownloadHistoryItem, StatsPanel,
+    VirtualList, QueueView,
 )
 from dialogs import InstagramLoginDialog, SettingsDialog, BatchImportDialog
+from scheduler import QueueScheduler
+from progress_bus import ProgressBus, AggregateProgress
+from url_classifier import classify_url
+from download_queue import DownloadQueue
+from queue_journal import QueueJournal
+from metadata_prefetch import MetadataPrefetcher
+from bandwidth import get_shared_bandwidth
+from retry_engine import RetryEngine, RetryPolicy, classify_error
+from playlist_expander import ExpansionRange, PlaylistExpansion, can_expand
+from history_store import HistoryStore
+from history_search import HistorySearcher
+from lazy_import import start_warm_up
+from startup_profile import get_startup_profiler, phase
+
+# Progress bus slot used by the single (non-queue) download
+SINGLE_DOWNLOAD_KEY = "single"
 
 
 class VideoDownloaderApp(ctk.CTk):
@@ -51,7 +69,8 @@ class VideoDownloaderApp(ctk.CTk):
         self.settings_file = Path.home() / ".video_downloader_settings.json"
         self.settings = {}
         self.download_path = get_download_folder()
-        self.load_settings()
+        with phase("load_settings"):
+            self.load_settings()
 
         # Apply saved theme and language
         ctk.set_appearance_mode(self.settings.get("theme", "dark"))
@@ -68,21 +87,81 @@ class VideoDownloaderApp(ctk.CTk):
         self.instagram_downloader: Optional[InstagramDownloader] = None
         self.instagram_username: Optional[str] = None
         self.download_history = []
-        self.download_queue: List[QueueItem] = []
+        with phase("history_store.open"):
+            self.history_store = HistoryStore(Path.home() / ".video_downloader_history.db")
+        self.history_searcher = HistorySearcher(self.history_store)
+        self._history_flush_pending = False
+        self._history_total = 0
+        # Every queue change is journaled; the next start rebuilds the queue from it
+        self.download_queue = DownloadQueue(
+            journal=QueueJournal(Path.home() / ".video_downloader_queue.journal")
+        )
+        self._expansions: List[PlaylistExpansion] = []
         self.current_video_info = None
         self.filename_template = self.settings.get("filename_template", "%(title)s")
 
-        self.ffmpeg_available = check_ffmpeg()
+        with phase("check_ffmpeg"):
+            self.ffmpeg_available = check_ffmpeg()
         self.url_debouncer = Debouncer(delay_ms=400)
-
-        self.load_history()
-        self.setup_ui()
-        self.center_window()
+        self.progress_bus = ProgressBus()
+        self.retry_engine = RetryEngine(self._retry_policy(self.settings))
+        self.queue_scheduler = QueueScheduler(
+            self.download_queue_item,
+            self._get_pending_queue_items,
+            max_concurrent=self.settings.get(
+                "max_concurrent_downloads", DEFAULT_SETTINGS["max_concurrent_downloads"]
+            ),
+            platform_limits=self.settings.get("platform_concurrency"),
+            on_idle=lambda: self.after(0, self._on_queue_finished),
+            retry=self.retry_engine,
+        )
+        # Started with the first queued item; pauses while downloads run
+        self.metadata_prefetcher = MetadataPrefetcher(
+            self._prefetch_item_info,
+            self.download_queue.pending,
+            is_busy=lambda: self.queue_scheduler.active_count() > 0,
+            on_update=self._on_item_metadata,
+        )
+        # Shared by every downloader; resized live from the queue header and settings
+        self.bandwidth = get_shared_bandwidth()
+        self._apply_bandwidth_settings(self.settings)
+
+        with phase("load_history"):
+            self.load_history()
+        with phase("setup_ui"):
+            self.setup_ui()
+        with phase("center_window"):
+            self.center_window()
+        self.bandwidth.add_listener(self._on_bandwidth_change)
+        self._show_bandwidth()
+        with phase("restore_queue"):
+            self._restore_queue()
+        self._drain_progress()
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+        self._backends_warming = False
+        self.bind("<Map>", self._on_first_map, add="+")
 
         # Check for yt-dlp updates in background
         if self.settings.get("auto_update_check", True):
             threading.Thread(target=self._check_updates_bg, daemon=True).start()
 
+    def _on_first_map(self, event):
+        """Import the download backends in the background once the window is visible."""
+        if event.widget is not self or self._backends_warming:
+            return
+        self._backends_warming = True
+        start_warm_up()
+        profiler = get_startup_profiler()
+        profiler.mark("first_map")
+        if profiler.enabled:
+            self.after_idle(self._finish_startup_profile)
+
+    def _finish_startup_profile(self):
+        report = get_startup_profiler().finish()
+        if report:
+            # No console under pythonw or a frozen build; show it in the window
+            bind_text(self.status_label, "status_startup_profile", path=str(report))
+
     def center_window(self):
         self.update_idletasks()
         x = (self.winfo_screenwidth() // 2) - (340)
@@ -103,16 +182,20 @@ class VideoDownloaderApp(ctk.CTk):
 
         self.main_frame = self.main_scroll
 
-        self.create_header()
-        self.create_url_input()
-        self.create_video_preview()
-        self.create_options_panel()
-        self.create_download_button()
-        self.create_progress_section()
-        self.create_stats_section()
-        self.create_queue_section()
-        self.create_history_section()
-        self.create_footer()
+        for create_section in (
+            self.create_header,
+            self.create_url_input,
+            self.create_video_preview,
+            self.create_options_panel,
+            self.create_download_button,
+            self.create_progress_section,
+            self.create_stats_section,
+            self.create_queue_section,
+            self.create_history_section,
+            self.create_footer,
+        ):
+            with phase(create_section.__name__):
+                create_section()
 
         self.subtitle_checkbox.configure(state="disabled")
         self.instagram_section.pack_forget()
@@ -123,9 +206,9 @@ class VideoDownloaderApp(ctk.CTk):
 
         self.header_title = ctk.CTkLabel(
             header_frame,
-            text=t("app_title"),
             font=ctk.CTkFont(size=26, weight="bold"),
         )
+        bind_text(self.header_title, "app_title")
         self.header_title.pack()
 
         version_row = ctk.CTkFrame(header_frame, fg_color="transparent")
@@ -133,10 +216,10 @@ class VideoDownloaderApp(ctk.CTk):
 
         self.header_subtitle = ctk.CTkLabel(
             version_row,
-            text=t("app_subtitle"),
             font=ctk.CTkFont(size=13),
             text_color=COLORS["muted_text"],
         )
+        bind_text(self.header_subtitle, "app_subtitle")
         self.header_subtitle.pack(side="left")
 
         ctk.CTkLabel(
@@ -149,7 +232,6 @@ class VideoDownloaderApp(ctk.CTk):
         # yt-dlp update badge (hidden by default)
         self.update_badge = ctk.CTkButton(
             header_frame,
-            text=t("update_btn"),
             width=100,
             height=28,
             corner_radius=14,
@@ -158,42 +240,41 @@ class VideoDownloaderApp(ctk.CTk):
             font=ctk.CTkFont(size=11),
             command=self._do_ytdlp_update,
         )
+        bind_text(self.update_badge, "update_btn")
         # Will be shown by _check_updates_bg if update available
 
     def create_url_input(self):
         input_frame = ctk.CTkFrame(self.main_frame, fg_color="transparent")
         input_frame.pack(fill="x", pady=(5, 10))
 
-        ctk.CTkLabel(
+        bind_text(ctk.CTkLabel(
             input_frame,
-            text=t("url_label"),
             font=ctk.CTkFont(size=13, weight="bold"),
             anchor="w",
-        ).pack(fill="x", pady=(0, 6))
+        ), "url_label").pack(fill="x", pady=(0, 6))
 
         entry_frame = ctk.CTkFrame(input_frame, fg_color="transparent")
         entry_frame.pack(fill="x")
 
         self.url_entry = ctk.CTkEntry(
             entry_frame,
-            placeholder_text=t("url_placeholder"),
             height=48,
             corner_radius=10,
             font=ctk.CTkFont(size=13),
         )
+        bind_text(self.url_entry, "url_placeholder", option="placeholder_text")
         self.url_entry.pack(side="left", fill="x", expand=True, padx=(0, 4))
 
         # Paste from clipboard button
-        ctk.CTkButton(
+        bind_text(ctk.CTkButton(
             entry_frame,
-            text=t("btn_paste"),
             width=42,
             height=48,
             corner_radius=10,
             fg_color=COLORS["button_bg"],
             hover_color=COLORS["button_hover"],
             command=self._paste_from_clipboard,
-        ).pack(side="left", padx=(0, 4))
+        ), "btn_paste").pack(side="left", padx=(0, 4))
 
         self.fetch_btn = ctk.CTkButton(
             entry_frame,
@@ -233,38 +314,34 @@ class VideoDownloaderApp(ctk.CTk):
         format_frame = ctk.CTkFrame(row1, fg_color="transparent")
         format_frame.pack(side="left", expand=True)
 
-        ctk.CTkLabel(
+        bind_text(ctk.CTkLabel(
             format_frame,
-            text=t("format_label"),
             font=ctk.CTkFont(size=12, weight="bold"),
-        ).pack(anchor="w")
+        ), "format_label").pack(anchor="w")
         format_buttons = ctk.CTkFrame(format_frame, fg_color="transparent")
         format_buttons.pack(anchor="w", pady=(5, 0))
 
-        ctk.CTkRadioButton(
+        bind_text(ctk.CTkRadioButton(
             format_buttons,
-            text=t("format_video"),
             variable=self.format_var,
             value="video",
             font=ctk.CTkFont(size=12),
-        ).pack(side="left", padx=(0, 15))
-        ctk.CTkRadioButton(
+        ), "format_video").pack(side="left", padx=(0, 15))
+        bind_text(ctk.CTkRadioButton(
             format_buttons,
-            text=t("format_audio"),
             variable=self.format_var,
             value="audio",
             font=ctk.CTkFont(size=12),
-        ).pack(side="left")
+        ), "format_audio").pack(side="left")
 
         # Quality selection
         quality_frame = ctk.CTkFrame(row1, fg_color="transparent")
         quality_frame.pack(side="right", expand=True)
 
-        ctk.CTkLabel(
+        bind_text(ctk.CTkLabel(
             quality_frame,
-            text=t("quality_label"),
             font=ctk.CTkFont(size=12, weight="bold"),
-        ).pack(anchor="w")
+        ), "quality_label").pack(anchor="w")
 
         self.quality_menu = ctk.CTkOptionMenu(
             quality_frame,
@@ -280,12 +357,12 @@ class VideoDownloaderApp(ctk.CTk):
         row2.pack(fill="x", padx=15, pady=(4, 10))
         self.subtitle_checkbox = ctk.CTkCheckBox(
             row2,
-            text=t("subtitle_label"),
             variable=self.subtitles_var,
             onvalue=True,
             offvalue=False,
             font=ctk.CTkFont(size=11),
         )
+        bind_text(self.subtitle_checkbox, "subtitle_label")
         self.subtitle_checkbox.pack(anchor="w")
 
         # Instagram options (initially hidden)
@@ -294,18 +371,17 @@ class VideoDownloaderApp(ctk.CTk):
         )
         self.instagram_section.pack(fill="x", padx=15, pady=(0, 10))
 
-        ctk.CTkLabel(
+        bind_text(ctk.CTkLabel(
             self.instagram_section,
-            text=t("ig_section_title"),
             font=ctk.CTkFont(size=11, weight="bold"),
-        ).pack(anchor="w", padx=10, pady=(8, 4))
+        ), "ig_section_title").pack(anchor="w", padx=10, pady=(8, 4))
 
         ig_row = ctk.CTkFrame(self.instagram_section, fg_color="transparent")
         ig_row.pack(fill="x", padx=10, pady=(0, 8))
 
         ig_type_frame = ctk.CTkFrame(ig_row, fg_color="transparent")
         ig_type_frame.pack(side="left", fill="x", expand=True)
-        ctk.CTkLabel(ig_type_frame, text=t("ig_type_label"), font=ctk.CTkFont(size=10)).pack(anchor="w")
+        bind_text(ctk.CTkLabel(ig_type_frame, font=ctk.CTkFont(size=10)), "ig_type_label").pack(anchor="w")
         self.instagram_content_menu = ctk.CTkOptionMenu(
             ig_type_frame,
             values=[t("ig_auto"), t("ig_post"), t("ig_reel"), t("ig_story")],
@@ -317,7 +393,7 @@ class VideoDownloaderApp(ctk.CTk):
 
         ig_media_frame = ctk.CTkFrame(ig_row, fg_color="transparent")
         ig_media_frame.pack(side="right", fill="x", expand=True)
-        ctk.CTkLabel(ig_media_frame, text=t("ig_media_label"), font=ctk.CTkFont(size=10)).pack(anchor="w")
+        bind_text(ctk.CTkLabel(ig_media_frame, font=ctk.CTkFont(size=10)), "ig_media_label").pack(anchor="w")
         self.instagram_media_menu = ctk.CTkOptionMenu(
             ig_media_frame,
             values=[t("ig_media_auto"), t("ig_media_video"), t("ig_media_image")],
@@ -333,7 +409,6 @@ class VideoDownloaderApp(ctk.CTk):
 
         self.download_btn = ctk.CTkButton(
             btn_frame,
-            text=t("btn_download"),
             height=52,
             corner_radius=12,
             font=ctk.CTkFont(size=17, weight="bold"),
@@ -341,11 +416,11 @@ class VideoDownloaderApp(ctk.CTk):
             hover_color=COLORS["primary_hover"],
             command=self.start_download,
         )
+        bind_text(self.download_btn, "btn_download")
         self.download_btn.pack(side="left", fill="x", expand=True, padx=(0, 5))
 
         self.add_queue_btn = ctk.CTkButton(
             btn_frame,
-            text=t("btn_add_queue"),
             height=52,
             corner_radius=12,
             font=ctk.CTkFont(size=13),
@@ -355,6 +430,7 @@ class VideoDownloaderApp(ctk.CTk):
             text_color=COLORS["button_text"],
             command=self.add_to_queue,
         )
+        bind_text(self.add_queue_btn, "btn_add_queue")
         self.add_queue_btn.pack(side="right")
 
     def create_progress_section(self):
@@ -372,16 +448,16 @@ class VideoDownloaderApp(ctk.CTk):
 
         self.status_label = ctk.CTkLabel(
             self.progress_frame,
-            text=t("status_ready"),
             font=ctk.CTkFont(size=11),
             text_color=COLORS["muted_text"],
         )
+        bind_text(self.status_label, "status_ready")
         self.status_label.pack(pady=(6, 0))
 
     def create_stats_section(self):
         self.stats_panel = StatsPanel(self.main_frame)
         self.stats_panel.pack(fill="x", pady=(5, 10))
-        self.stats_panel.update_stats(self.download_history)
+        self.stats_panel.update_stats(self.history_store.stats())
 
     def create_queue_section(self):
         queue_frame = ctk.CTkFrame(self.main_frame, fg_color="transparent")
@@ -390,11 +466,10 @@ class VideoDownloaderApp(ctk.CTk):
         header = ctk.CTkFrame(queue_frame, fg_color="transparent")
         header.pack(fill="x")
 
-        ctk.CTkLabel(
+        bind_text(ctk.CTkLabel(
             header,
-            text=t("queue_title"),
             font=ctk.CTkFont(size=13, weight="bold"),
-        ).pack(side="left")
+        ), "queue_title").pack(side="left")
 
         self.queue_count_label = ctk.CTkLabel(
             header,
@@ -405,9 +480,8 @@ class VideoDownloaderApp(ctk.CTk):
         self.queue_count_label.pack(side="left", padx=5)
 
         # Batch import button
-        ctk.CTkButton(
+        bind_text(ctk.CTkButton(
             header,
-            text=t("btn_batch_import"),
             width=130,
             height=28,
             corner_radius=6,
@@ -416,11 +490,10 @@ class VideoDownloaderApp(ctk.CTk):
             text_color=COLORS["button_text"],
             font=ctk.CTkFont(size=11),
             command=self.show_batch_import,
-        ).pack(side="right", padx=(5, 0))
+        ), "btn_batch_import").pack(side="right", padx=(5, 0))
 
         self.start_queue_btn = ctk.CTkButton(
             header,
-            text=t("btn_start_queue"),
             width=80,
             height=28,
             corner_radius=6,
@@ -428,8 +501,37 @@ class VideoDownloaderApp(ctk.CTk):
             hover_color=COLORS["success_hover"],
             command=self.start_queue,
         )
+        bind_text(self.start_queue_btn, "btn_start_queue")
         self.start_queue_btn.pack(side="right")
 
+        bandwidth_row = ctk.CTkFrame(queue_frame, fg_color="transparent")
+        bandwidth_row.pack(fill="x", pady=(6, 0))
+        bind_text(ctk.CTkLabel(
+            bandwidth_row,
+            font=ctk.CTkFont(size=11),
+            text_color=COLORS["muted_text"],
+        ), "bandwidth_label").pack(side="left")
+
+        self.bandwidth_limit_var = ctk.StringVar()
+        self.bandwidth_menu = ctk.CTkOptionMenu(
+            bandwidth_row,
+            variable=self.bandwidth_limit_var,
+            command=self._on_bandwidth_limit_select,
+            width=110,
+            height=24,
+            font=ctk.CTkFont(size=11),
+        )
+        self.bandwidth_menu.pack(side="left", padx=(6, 0))
+        self._sync_bandwidth_menu()
+
+        self.bandwidth_label = ctk.CTkLabel(
+            bandwidth_row,
+            text="",
+            font=ctk.CTkFont(size=11),
+            text_color=COLORS["muted_text"],
+        )
+        self.bandwidth_label.pack(side="left", padx=8)
+
         self.queue_scroll = ctk.CTkScrollableFrame(
             queue_frame, fg_color="transparent", height=100
         )
@@ -437,12 +539,23 @@ class VideoDownloaderApp(ctk.CTk):
 
         self.queue_empty_label = ctk.CTkLabel(
             self.queue_scroll,
-            text=t("queue_empty"),
             font=ctk.CTkFont(size=11),
             text_color=COLORS["muted_text"],
         )
+        bind_text(self.queue_empty_label, "queue_empty")
         self.queue_empty_label.pack(pady=15)
 
+        self.queue_view = QueueView(
+            row_factory=lambda item: QueueItemWidget(self.queue_scroll, item, self.remove_from_queue),
+            on_empty=self._show_queue_empty,
+        )
+
+    def _show_queue_empty(self, empty: bool):
+        if empty:
+            self.queue_empty_label.pack(pady=15)
+        else:
+            self.queue_empty_label.pack_forget()
+
     def create_history_section(self):
         history_frame = ctk.CTkFrame(self.main_frame, fg_color="transparent")
         history_frame.pack(fill="both", expand=True, pady=(10, 5))
@@ -450,11 +563,10 @@ class VideoDownloaderApp(ctk.CTk):
         header = ctk.CTkFrame(history_frame, fg_color="transparent")
         header.pack(fill="x")
 
-        ctk.CTkLabel(
+        bind_text(ctk.CTkLabel(
             header,
-            text=t("history_title"),
             font=ctk.CTkFont(size=13, weight="bold"),
-        ).pack(side="left")
+        ), "history_title").pack(side="left")
 
         ctk.CTkButton(
             header,
@@ -472,20 +584,26 @@ class VideoDownloaderApp(ctk.CTk):
         self.history_search_var.trace_add("write", lambda *_: self.display_history())
         self.history_search_entry = ctk.CTkEntry(
             history_frame,
-            placeholder_text=t("history_search_placeholder"),
             height=32,
             corner_radius=8,
             font=ctk.CTkFont(size=11),
             textvariable=self.history_search_var,
         )
+        bind_text(self.history_search_entry, "history_search_placeholder", option="placeholder_text")
         self.history_search_entry.pack(fill="x", pady=(6, 0))
 
-        self.history_scroll = ctk.CTkScrollableFrame(
-            history_frame, fg_color="transparent", height=150
+        self.history_list = VirtualList(
+            history_frame,
+            row_factory=DownloadHistoryItem,
+            row_height=HISTORY_ROW_HEIGHT,
+            fg_color="transparent",
+            height=150,
         )
-        self.history_scroll.pack(fill="both", expand=True, pady=(8, 0))
+        bind_text(self.history_list.empty_label, "history_empty")
+        self.history_list.pack(fill="both", expand=True, pady=(8, 0))
 
-        self.display_history()
+        with phase("display_history"):
+            self.display_history()
 
     def create_footer(self):
         self.instagram_btn = ctk.CTkButton(
@@ -554,13 +672,11 @@ class VideoDownloaderApp(ctk.CTk):
 
     def _update_platform_display(self, url: str):
         if url:
-            platform = detect_platform(url)
+            platform = classify_url(url).platform
             if platform:
                 icon = get_platform_icon(platform)
-                self.platform_label.configure(
-                    text=t("platform_detected", icon=icon, platform=platform.capitalize()),
-                    text_color=get_platform_color(platform),
-                )
+                self.platform_label.configure(text_color=get_platform_color(platform))
+                bind_text(self.platform_label, "platform_detected", icon=icon, platform=platform.capitalize())
                 subtitle_state = "normal" if platform == "youtube" else "disabled"
                 self.subtitle_checkbox.configure(state=subtitle_state)
                 if platform != "youtube":
@@ -572,13 +688,13 @@ class VideoDownloaderApp(ctk.CTk):
                 else:
                     self.instagram_section.pack_forget()
             else:
-                self.platform_label.configure(
-                    text=t("url_unsupported"), text_color=COLORS["error_text"]
-                )
+                self.platform_label.configure(text_color=COLORS["error_text"])
+                bind_text(self.platform_label, "url_unsupported")
                 self.subtitle_checkbox.configure(state="disabled")
                 self.subtitles_var.set(False)
                 self.instagram_section.pack_forget()
         else:
+            unbind_text(self.platform_label)
             self.platform_label.configure(text="")
             self.preview_frame.show_empty()
             self.subtitle_checkbox.configure(state="disabled")
@@ -594,11 +710,11 @@ class VideoDownloaderApp(ctk.CTk):
             self._process_url_change()
 
     def fetch_video_info(self):
-        url = normalize_media_url(self.url_entry.get())
+        link = classify_url(self.url_entry.get())
+        url, platform = link.normalized, link.platform
         if not url:
             return
 
-        platform = detect_platform(url)
         if not platform:
             messagebox.showerror(t("error_title"), t("error_unsupported_url"))
             return
@@ -608,7 +724,7 @@ class VideoDownloaderApp(ctk.CTk):
 
         def fetch_thread():
             try:
-                downloader = create_downloader(platform, self.download_path)
+                downloader = create_downloader(platform, self.download_path, self.settings.get("transfer_profiles"))
                 info = downloader.get_info(url)
                 self.after(0, lambda: self.handle_video_info(info, platform))
             except Exception as e:
@@ -679,30 +795,32 @@ class VideoDownloaderApp(ctk.CTk):
 
     def _do_download(self, url: str, platform: str, as_audio: bool, quality: str,
                      download_subtitles: bool, instagram_content_type: str,
-                     instagram_media_mode: str, progress_callback: ProgressCallback) -> DownloadResult:
+                     instagram_media_mode: str, progress_callback: ProgressCallback,
+                     download_path: Optional[Path] = None,
+                     filename_template: Optional[str] = None) -> DownloadResult:
         """Unified download logic used by both single and queue downloads."""
-        effective_path = self._get_effective_download_path(platform)
+        effective_path = download_path or self._get_effective_download_path(platform)
 
         if platform == "instagram" and self.instagram_downloader:
             downloader = self.instagram_downloader
         else:
-            downloader = create_downloader(platform, effective_path)
+            downloader = create_downloader(platform, effective_path, self.settings.get("transfer_profiles"))
 
         return downloader.download(
             url, as_audio, quality, progress_callback,
-            self.filename_template, download_subtitles,
+            filename_template or self.filename_template, download_subtitles,
             instagram_content_type, instagram_media_mode,
         )
 
     # ─────────────── QUEUE ───────────────
 
     def add_to_queue(self):
-        url = normalize_media_url(self.url_entry.get())
+        link = classify_url(self.url_entry.get())
+        url, platform = link.normalized, link.platform
         if not url:
             messagebox.showwarning(t("warning"), t("error_no_url"))
             return
 
-        platform = detect_platform(url)
         if not platform:
             messagebox.showerror(t("error_title"), t("error_unsupported_url"))
             return
@@ -717,55 +835,162 @@ class VideoDownloaderApp(ctk.CTk):
         ig_content = self.get_instagram_content_type() if platform == "instagram" else "auto"
         ig_media = self.get_instagram_media_mode() if platform == "instagram" else "auto"
 
+        if can_expand(link):
+            selection = self._ask_expansion_range()
+            if selection is not None:
+                self._start_expansion(url, platform, selection, quality, as_audio, subtitles)
+                self._clear_url_input()
+            return
+
         new_item = QueueItem(
             url=url, platform=platform, quality=quality, as_audio=as_audio,
-            title=title or url[:40], download_subtitles=subtitles,
+            title=title, download_subtitles=subtitles,
             instagram_content_type=ig_content, instagram_media_mode=ig_media,
         )
 
-        # Duplicate check using QueueItem.matches()
-        with self._lock:
-            for queued in self.download_queue:
-                if queued.status in {"pending", "downloading"} and queued.matches(new_item):
-                    messagebox.showinfo(t("info"), t("queue_already_exists"))
-                    return
-            self.download_queue.append(new_item)
+        if not self._enqueue_items([new_item]):
+            messagebox.showinfo(t("info"), t("queue_already_exists"))
+            return
 
         self.update_queue_display()
+        self.queue_scheduler.pump()
+        self._clear_url_input()
+
+    def _clear_url_input(self):
         self.url_entry.delete(0, "end")
+        unbind_text(self.platform_label)
         self.platform_label.configure(text="")
         self.preview_frame.show_empty()
         self.current_video_info = None
 
-    def remove_from_queue(self, item: QueueItem):
-        with self._lock:
-            if item in self.download_queue:
-                self.download_queue.remove(item)
+    def _enqueue_items(self, items: List[QueueItem]) -> int:
+        """Append the items that aren't already pending or downloading."""
+        added = len(self.download_queue.add_many(items))
+        if added:
+            self.metadata_prefetcher.start()
+            self.metadata_prefetcher.wake()
+        return added
+
+    def _prefetch_item_info(self, item: QueueItem) -> dict:
+        """Runs on a prefetch worker; fills the shared info cache as a side effect."""
+        downloader = create_downloader(
+            item.platform, self._get_effective_download_path(item.platform), self.settings.get("transfer_profiles")
+        )
+        return downloader.get_info(item.url)
+
+    def _on_item_metadata(self, item: QueueItem):
+        """Runs on a prefetch worker once the item's metadata is in.
+
+        Not journaled: the metadata is only a cache, and it is written along
+        with the item's next status change anyway.
+        """
+        self.after(0, lambda: self._show_item_details(item))
+
+    def _show_item_details(self, item: QueueItem):
+        widget = self.queue_view.get(id(item))
+        if widget is not None:
+            widget.refresh_details()
+
+    def _restore_queue(self):
+        """Rebuild the queue left by the last run and continue interrupted downloads."""
+        journal = self.download_queue.journal
+        records = journal.load()
+        if journal.last_error is not None:
+            messagebox.showwarning(t("warning"), t("queue_journal_error", error=journal.last_error))
+        items = []
+        for record in records:
+            try:
+                items.append(QueueItem.from_record(record))
+            except (KeyError, TypeError):
+                continue
+        # Downloads cut off mid-way, and failures still waiting for their retry
+        interrupted = any(
+            item.status == "downloading" or (item.status == "pending" and item.retry_count)
+            for item in items
+        )
+        restored = self.download_queue.restore(items)
+        if not restored:
+            return
+        self.metadata_prefetcher.start()
         self.update_queue_display()
+        if interrupted:
+            self.start_queue()
 
-    def update_queue_display(self):
-        for widget in self.queue_scroll.winfo_children():
-            widget.destroy()
+    # ─────────────── PLAYLIST EXPANSION ───────────────
 
-        with self._lock:
-            queue_len = len(self.download_queue)
-            queue_copy = list(self.download_queue)
+    def _ask_expansion_range(self) -> Optional[ExpansionRange]:
+        """Ask which part of a playlist/channel to enqueue; None if cancelled."""
+        text = ctk.CTkInputDialog(title=t("playlist_range_title"), text=t("playlist_range_prompt")).get_input()
+        if text is None:
+            return None
+        try:
+            return ExpansionRange.parse(text)
+        except ValueError:
+            messagebox.showerror(t("error_title"), t("playlist_range_invalid"))
+            return None
+
+    def _start_expansion(self, url: str, platform: str, selection: ExpansionRange,
+                         quality: str = "best", as_audio: bool = False, subtitles: bool = False,
+                         start_queue: bool = False):
+        """List a playlist/channel in the background, queueing entries as they arrive."""
+        downloader = create_downloader(
+            platform, self._get_effective_download_path(platform), self.settings.get("transfer_profiles")
+        )
 
-        self.queue_count_label.configure(text=f"({queue_len})")
+        def on_batch(entries):
+            self.after(0, lambda: self._enqueue_playlist_entries(
+                expansion, entries, quality, as_audio, subtitles, start_queue
+            ))
 
-        if not queue_copy:
-            self.queue_empty_label = ctk.CTkLabel(
-                self.queue_scroll,
-                text=t("queue_empty"),
-                font=ctk.CTkFont(size=11),
-                text_color=COLORS["muted_text"],
+        expansion = PlaylistExpansion(
+            url, downloader.iter_playlist_entries, selection,
+            on_batch=on_batch,
+            on_done=lambda finished: self.after(0, lambda: self._on_expansion_done(finished)),
+        )
+        self._expansions.append(expansion)
+        bind_text(self.status_label, "playlist_expanding", count=0)
+        expansion.start()
+
+    def _enqueue_playlist_entries(self, expansion: PlaylistExpansion, entries: list,
+                                  quality: str, as_audio: bool, subtitles: bool, start_queue: bool):
+        items = [
+            QueueItem(
+                url=entry.url, platform=entry.platform, quality=quality, as_audio=as_audio,
+                title=entry.title,
+                download_subtitles=subtitles and entry.platform == "youtube",
             )
-            self.queue_empty_label.pack(pady=15)
+            for entry in entries
+        ]
+        self._enqueue_items(items)
+        self.update_queue_display()
+        if start_queue and self.download_queue and not self.is_downloading:
+            self.start_queue()
+        else:
+            self.queue_scheduler.pump()
+        if not self.queue_scheduler.is_running:
+            bind_text(self.status_label, "playlist_expanding", count=expansion.added)
+
+    def _on_expansion_done(self, expansion: PlaylistExpansion):
+        if expansion in self._expansions:
+            self._expansions.remove(expansion)
+        if expansion.cancelled:
             return
+        if expansion.error is not None and not expansion.added:
+            bind_text(self.status_label, "status_ready")
+            messagebox.showerror(t("error_title"), t("error_playlist_failed", error=str(expansion.error)))
+        elif not self.queue_scheduler.is_running:
+            bind_text(self.status_label, "playlist_done", count=expansion.added)
 
-        for item in queue_copy:
-            widget = QueueItemWidget(self.queue_scroll, item, self.remove_from_queue)
-            widget.pack(fill="x", pady=2)
+    def remove_from_queue(self, item: QueueItem):
+        self.download_queue.remove(item)
+        self.update_queue_display()
+
+    def update_queue_display(self):
+        """Create, remove or refresh only the queue rows that changed."""
+        queue_copy = self.download_queue.snapshot()
+
+        self.queue_count_label.configure(text=f"({len(queue_copy)})")
+        self.queue_view.sync(queue_copy)
 
     def start_queue(self):
         if not self.download_queue:
@@ -775,75 +1000,133 @@ class VideoDownloaderApp(ctk.CTk):
         with self._lock:
             if self.is_downloading:
                 return
+            self.is_downloading = True
 
-        self.process_next_queue_item()
-
-    def process_next_queue_item(self):
-        with self._lock:
-            pending_items = [item for item in self.download_queue if item.status == "pending"]
-
-        if not pending_items:
-            with self._lock:
-                self.is_downloading = False
-            self.download_btn.configure(state="normal", text=t("btn_download"))
-            self.progress_bar.set(0)
-            self.status_label.configure(text=t("status_ready"))
+        self.download_btn.configure(state="disabled")
 
-            if self.settings.get("notifications", True):
-                flash_taskbar_icon(self)
+        bind_text(self.download_btn, "btn_queue_processing")
+        self.queue_scheduler.start()
+        self.update_queue_display()
+        self._update_queue_status()
 
-            messagebox.showinfo(t("info"), t("queue_complete"))
-            return
+    def _get_pending_queue_items(self) -> List[QueueItem]:
+        return self.download_queue.pending()
 
-        item = pending_items[0]
-        item.status = "downloading"
-        self.update_queue_display()
+    @staticmethod
+    def _retry_policy(settings: dict) -> RetryPolicy:
+        retries = settings.get("queue_max_retries", DEFAULT_SETTINGS["queue_max_retries"])
+        return RetryPolicy(max_retries=max(0, int(retries)))
 
+    def _on_queue_finished(self):
+        """Called once the scheduler has no active or startable items left."""
         with self._lock:
-            self.is_downloading = True
-        self.download_btn.configure(state="disabled", text=t("btn_queue_processing"))
+            self.is_downloading = False
+        self.metadata_prefetcher.wake()
+        self.download_btn.configure(state="normal")
+        bind_text(self.download_btn, "btn_download")
+        self.progress_bar.set(0)
+        bind_text(self.status_label, "status_ready")
+
+        if self.settings.get("notifications", True):
+            flash_taskbar_icon(self)
+
+        messagebox.showinfo(t("info"), t("queue_complete"))
+
+    def _update_queue_status(self, aggregate: Optional[AggregateProgress] = None):
+        """Show overall queue completion in the shared progress bar."""
+        done, total = self.download_queue.progress()
+        active = self.queue_scheduler.active_count()
+        self.progress_bar.set(done / total if total else 0)
+        status_text = t("queue_status_progress", active=active, done=done, total=total)
+        paused = self.retry_engine.paused_platforms()
+        if paused:
+            status_text += " • " + t(
+                "queue_status_paused",
+                platforms=" ".join(get_platform_icon(platform) for platform in sorted(paused)),
+            )
+        if aggregate and aggregate.speed_bps > 0:
+            eta = int(aggregate.eta or 0)
+            status_text += " • " + t(
+                "queue_status_rate",
+                speed=format_size(int(aggregate.speed_bps)),
+                eta=f"{eta // 60}:{eta % 60:02d}",
+            )
+        unbind_text(self.status_label)
+        self.status_label.configure(text=status_text)
 
-        thread = threading.Thread(target=self.download_queue_item, args=(item,), daemon=True)
-        thread.start()
+    def _drain_progress(self):
+        """Apply coalesced worker progress to the UI once per frame."""
+        changed, aggregate = self.progress_bus.drain()
+        for key, state in changed.items():
+            if key == SINGLE_DOWNLOAD_KEY:
+                self.update_progress(state.percent, state.status, state.speed_text)
+                continue
+            widget = self.queue_view.get(key)
+            if widget is not None:
+                widget.update_progress()
+        if changed and self.queue_scheduler.is_running:
+            self._update_queue_status(aggregate)
+        self.after(PROGRESS_FRAME_MS, self._drain_progress)
 
     def download_queue_item(self, item: QueueItem):
+        """Worker body run by the queue scheduler on its own thread."""
+        if not item.download_dir:
+            # Kept for good, so a restart resumes into the same .part file
+            item.download_dir = str(self._get_effective_download_path(item.platform))
+            item.filename_template = self.filename_template
+        self.download_queue.touch(item)
+        self.after(0, self.update_queue_display)
+        self.after(0, self._update_queue_status)
         try:
             def progress_update(percent, status, speed):
-                self.after(0, lambda: self.update_progress(percent, status, speed))
+                item.progress = percent
+                item.speed = speed
 
-            callback = ProgressCallback(progress_update)
+            def partial_file(path):
+                item.partial_file = path
+                self.download_queue.touch(item)
+
+            callback = ProgressCallback(
+                progress_update, bus=self.progress_bus, key=id(item), on_partial_file=partial_file,
+            )
             result = self._do_download(
                 item.url, item.platform, item.as_audio, item.quality,
                 item.download_subtitles, item.instagram_content_type,
                 item.instagram_media_mode, callback,
+                download_path=Path(item.download_dir), filename_template=item.filename_template,
             )
 
             if result.success:
                 item.status = "completed"
+                item.error = item.error_kind = ""
                 self.after(0, lambda: self.add_to_history(result))
             else:
                 item.status = "error"
                 item.error = result.error
-
-            self.after(0, self.update_queue_display)
-            self.after(100, self.process_next_queue_item)
+                item.error_kind = result.error_kind
 
         except Exception as e:
             item.status = "error"
             item.error = str(e)
-            self.after(0, self.update_queue_display)
-            self.after(100, self.process_next_queue_item)
+            item.error_kind = classify_error(e)
+
+        # A retryable failure goes back to pending until its backoff is over
+        self.retry_engine.settle(item)
+        self.download_queue.touch(item)
+        self.progress_bus.remove(id(item))
+        self.after(0, self.update_queue_display)
+        self.after(0, self._update_queue_status)
 
     # ─────────────── SINGLE DOWNLOAD ───────────────
 
     def start_download(self):
-        url = normalize_media_url(self.url_entry.get())
+        link = classify_url(self.url_entry.get())
+        url, platform = link.normalized, link.platform
 
         if not url:
             messagebox.showwarning(t("warning"), t("error_no_url"))
             return
 
-        platform = detect_platform(url)
         if not platform:
             messagebox.showerror(t("error_title"), t("error_unsupported_url"))
             return
@@ -857,11 +1140,22 @@ class VideoDownloaderApp(ctk.CTk):
             messagebox.showwarning(t("error_ffmpeg_title"), t("error_ffmpeg_required"))
             return
 
+        if can_expand(link):
+            # A playlist is downloaded entry by entry through the queue
+            selection = self._ask_expansion_range()
+            if selection is not None:
+                subtitles = bool(self.subtitles_var.get()) and platform == "youtube" and not as_audio
+                self._start_expansion(url, platform, selection, self.get_selected_quality(),
+                                      as_audio, subtitles, start_queue=True)
+                self._clear_url_input()
+            return
+
         with self._lock:
             self.is_downloading = True
-        self.download_btn.configure(state="disabled", text=t("btn_downloading"))
+        self.download_btn.configure(state="disabled")
+        bind_text(self.download_btn, "btn_downloading")
         self.progress_bar.set(0)
-        self.status_label.configure(text=t("status_starting"))
+        bind_text(self.status_label, "status_starting")
 
         quality = self.get_selected_quality()
         subtitles = bool(self.subtitles_var.get()) and platform == "youtube" and not as_audio
@@ -877,13 +1171,12 @@ class VideoDownloaderApp(ctk.CTk):
 
     def download_thread(self, url, platform, as_audio, quality, subtitles, ig_content, ig_media):
         try:
-            def progress_update(percent, status, speed):
-                self.after(0, lambda: self.update_progress(percent, status, speed))
-
-            callback = ProgressCallback(progress_update)
+            callback = ProgressCallback(bus=self.progress_bus, key=SINGLE_DOWNLOAD_KEY)
             result = self._do_download(url, platform, as_audio, quality, subtitles, ig_content, ig_media, callback)
+            self.progress_bus.remove(SINGLE_DOWNLOAD_KEY)
             self.after(0, lambda: self.handle_download_result(result))
         except Exception as e:
+            self.progress_bus.remove(SINGLE_DOWNLOAD_KEY)
             self.after(0, lambda: self.handle_download_error(str(e)))
 
     def update_progress(self, percent: float, status: str, speed: str):
@@ -891,18 +1184,21 @@ class VideoDownloaderApp(ctk.CTk):
         status_text = f"{status} {percent:.0f}%"
         if speed:
             status_text += f" • {speed}"
+        unbind_text(self.status_label)
         self.status_label.configure(text=status_text)
 
     def handle_download_result(self, result: DownloadResult):
         with self._lock:
             self.is_downloading = False
-        self.download_btn.configure(state="normal", text=t("btn_download"))
+        self.download_btn.configure(state="normal")
+        bind_text(self.download_btn, "btn_download")
 
         if result.success:
             self.progress_bar.set(1)
-            self.status_label.configure(text=t("status_completed"))
+            bind_text(self.status_label, "status_completed")
             self.add_to_history(result)
             self.url_entry.delete(0, "end")
+            unbind_text(self.platform_label)
             self.platform_label.configure(text="")
             self.preview_frame.show_empty()
             self.current_video_info = None
@@ -911,15 +1207,16 @@ class VideoDownloaderApp(ctk.CTk):
                 flash_taskbar_icon(self)
         else:
             self.progress_bar.set(0)
-            self.status_label.configure(text=t("status_error", error=result.error[:50]))
+            bind_text(self.status_label, "status_error", error=result.error[:50])
             messagebox.showerror(t("error_download"), result.error)
 
     def handle_download_error(self, error: str):
         with self._lock:
             self.is_downloading = False
-        self.download_btn.configure(state="normal", text=t("btn_download"))
+        self.download_btn.configure(state="normal")
+        bind_text(self.download_btn, "btn_download")
         self.progress_bar.set(0)
-        self.status_label.configure(text=t("status_error_short"))
+        bind_text(self.status_label, "status_error_short")
         messagebox.showerror(t("error_download"), error)
 
     # ─────────────── HISTORY ───────────────
@@ -932,73 +1229,78 @@ class VideoDownloaderApp(ctk.CTk):
             "filepath": result.filepath,
             "date": datetime.now().isoformat(),
             "source_url": getattr(result, "source_url", ""),
+            "uploader": result.uploader,
+            "size_bytes": int(result.filesize or 0),
         }
+        self.history_store.add(item)
         self.download_history.insert(0, item)
-        self.download_history = self.download_history[:MAX_HISTORY_ITEMS]
+        del self.download_history[HISTORY_RECENT_ITEMS:]
+        self._history_total += 1
         self.save_history()
-        self.display_history()
-        self.stats_panel.update_stats(self.download_history)
-
-    def display_history(self):
-        for widget in self.history_scroll.winfo_children():
-            widget.destroy()
-
-        if not self.download_history:
-            ctk.CTkLabel(
-                self.history_scroll,
-                text=t("history_empty"),
-                font=ctk.CTkFont(size=11),
-                text_color=COLORS["muted_text"],
-            ).pack(pady=20)
+        self.display_history(keep_position=True)
+        self.stats_panel.update_stats(self.history_store.stats())
+
+    def display_history(self, keep_position: bool = False):
+        """Point the recycled history rows at the current (filtered) entries.
+
+        Searches run on the history searcher's worker thread; results are
+        applied here only if no newer query has been typed since.
+        """
+        search_text = self.history_search_var.get().strip() if hasattr(self, "history_search_var") else ""
+
+        if not search_text:
+            self.history_searcher.cancel()
+            self.history_list.set_source(self._history_total, self._fetch_history_page, keep_position)
             return
 
-        search_term = self.history_search_var.get().lower() if hasattr(self, "history_search_var") else ""
+        def deliver(generation, rows):
+            self.after(0, lambda: self._show_history_results(generation, rows, keep_position))
 
-        shown = 0
-        for item in self.download_history:
-            if shown >= MAX_HISTORY_DISPLAY:
-                break
+        self.history_searcher.submit(search_text, deliver)
 
-            # Filter by search
-            if search_term:
-                name = item.get("filename", "").lower()
-                platform = item.get("platform", "").lower()
-                if search_term not in name and search_term not in platform:
-                    continue
-
-            history_widget = DownloadHistoryItem(
-                self.history_scroll,
-                filename=item["filename"],
-                platform=item["platform"],
-                size=item["size"],
-                filepath=item["filepath"],
-            )
-            history_widget.pack(fill="x", pady=2)
-            shown += 1
+    def _show_history_results(self, generation: int, rows: List[dict], keep_position: bool):
+        if self.history_searcher.is_current(generation):
+            self.history_list.set_items(rows, keep_position)
+
+    def _fetch_history_page(self, offset: int, limit: int) -> List[dict]:
+        """Serve rows from the in-memory recent entries, paging older ones from the store."""
+        if offset + limit <= len(self.download_history):
+            return self.download_history[offset:offset + limit]
+        try:
+            return self.history_store.recent(limit, offset)
+        except Exception:
+            return self.download_history[offset:offset + limit]
 
     def clear_history(self):
         if messagebox.askyesno(t("confirm"), t("history_clear_confirm")):
             self.download_history = []
-            self.save_history()
+            self._history_total = 0
+            self.history_store.clear()
             self.display_history()
-            self.stats_panel.update_stats(self.download_history)
+            self.stats_panel.update_stats(self.history_store.stats())
 
     def save_history(self):
+        """Schedule a batched write of newly added history entries."""
+        if self._history_flush_pending:
+            return
+        self._history_flush_pending = True
+        self.after(HISTORY_FLUSH_MS, self._flush_history)
+
+    def _flush_history(self):
+        self._history_flush_pending = False
         try:
-            history_file = self.download_path / "history.json"
-            with open(history_file, "w", encoding="utf-8") as f:
-                json.dump(self.download_history, f, ensure_ascii=False, indent=2)
+            self.history_store.flush()
         except Exception:
             pass
 
     def load_history(self):
         try:
-            history_file = self.download_path / "history.json"
-            if history_file.exists():
-                with open(history_file, "r", encoding="utf-8") as f:
-                    self.download_history = json.load(f)
+            self.history_store.migrate_from_json(self.download_path / "history.json")
+            self.download_history = self.history_store.recent(HISTORY_RECENT_ITEMS)
+            self._history_total = self.history_store.count()
         except Exception:
             self.download_history = []
+            self._history_total = 0
 
     # ─────────────── DIALOGS ───────────────
 
@@ -1031,6 +1333,13 @@ class VideoDownloaderApp(ctk.CTk):
 
         self.settings = new_settings
         self.filename_template = new_settings.get("filename_template", "%(title)s")
+        self.queue_scheduler.set_limits(
+            new_settings.get("max_concurrent_downloads", DEFAULT_SETTINGS["max_concurrent_downloads"]),
+            new_settings.get("platform_concurrency"),
+        )
+        self._apply_bandwidth_settings(new_settings)
+        self._sync_bandwidth_menu()
+        self.retry_engine.configure(self._retry_policy(new_settings))
 
         # Apply language change
         new_lang = new_settings.get("language", "tr")
@@ -1054,23 +1363,19 @@ class VideoDownloaderApp(ctk.CTk):
 
     def on_batch_import(self, urls: list[str]):
         """Handle batch import of URLs — add all to queue."""
+        items = []
         for url in urls:
-            platform = detect_platform(url)
-            if not platform:
+            link = classify_url(url)
+            if not link.platform:
                 continue
+            if can_expand(link):
+                self._start_expansion(link.normalized, link.platform, ExpansionRange())
+                continue
+            items.append(QueueItem(url=url, platform=link.platform))
 
-            item = QueueItem(url=url, platform=platform, title=url[:40])
-
-            with self._lock:
-                duplicate = False
-                for queued in self.download_queue:
-                    if queued.status in {"pending", "downloading"} and queued.matches(item):
-                        duplicate = True
-                        break
-                if not duplicate:
-                    self.download_queue.append(item)
-
+        self._enqueue_items(items)
         self.update_queue_display()
+        self.queue_scheduler.pump()
 
     # ─────────────── FOLDER & THEME ───────────────
 
@@ -1122,21 +1427,80 @@ class VideoDownloaderApp(ctk.CTk):
             self.settings = dict(DEFAULT_SETTINGS)
             self.download_path = get_download_folder()
 
+    def _on_close(self):
+        self.bandwidth.remove_listener(self._on_bandwidth_change)
+        self.metadata_prefetcher.stop()
+        self.download_queue.journal.close()
+        for expansion in list(self._expansions):
+            expansion.cancel()
+        self.history_searcher.close()
+        try:
+            self.history_store.close()
+        except Exception:
+            pass
+        self.destroy()
+
     # ─────────────── LANGUAGE REFRESH ───────────────
 
     def _refresh_all_texts(self):
-        """Refresh all translatable UI strings after language change."""
-        self.title(f"🎬 {APP_NAME}")
-        self.header_title.configure(text=t("app_title"))
-        self.header_subtitle.configure(text=t("app_subtitle"))
-        self.download_btn.configure(text=t("btn_download"))
-        self.add_queue_btn.configure(text=t("btn_add_queue"))
-        self.status_label.configure(text=t("status_ready"))
-        self.preview_frame.refresh_texts()
-        self.stats_panel.refresh_texts()
-        self.stats_panel.update_stats(self.download_history)
-        self.update_queue_display()
-        self.display_history()
+        """Re-translate what a single text binding can't express.
+
+        Everything registered with ``bind_text`` has already been updated by
+        ``set_language``; the queue rows' composite quality lines and the
+        bandwidth limit choices remain.
+        """
+        self.queue_view.refresh_texts()
+        self._sync_bandwidth_menu()
+        self._show_bandwidth()
+
+    # ─────────────── BANDWIDTH ───────────────
+
+    def _apply_bandwidth_settings(self, settings: dict):
+        """Running downloads get their new share on their next read."""
+        weights = settings.get("bandwidth_weights")
+        self.bandwidth.configure(
+            limit=int(settings.get("bandwidth_limit_kb") or 0) * 1024,
+            weights=weights if isinstance(weights, dict) else None,
+            interactive_share=settings.get("interactive_share", DEFAULT_SETTINGS["interactive_share"]),
+        )
+
+    @staticmethod
+    def _bandwidth_limit_label(limit_kb: int) -> str:
+        return format_rate(limit_kb * 1024) if limit_kb else t("bandwidth_unlimited")
+
+    def _sync_bandwidth_menu(self):
+        self.bandwidth_menu.configure(
+            values=[self._bandwidth_limit_label(kb) for kb in BANDWIDTH_LIMIT_CHOICES_KB]
+        )
+        self.bandwidth_limit_var.set(self._bandwidth_limit_label(self.settings.get("bandwidth_limit_kb") or 0))
+
+    def _on_bandwidth_limit_select(self, label: str):
+        for limit_kb in BANDWIDTH_LIMIT_CHOICES_KB:
+            if self._bandwidth_limit_label(limit_kb) == label:
+                self.settings["bandwidth_limit_kb"] = limit_kb
+                break
+        self._apply_bandwidth_settings(self.settings)
+        self.save_settings()
+
+    def _on_bandwidth_change(self, allocation):
+        """Scheduler listener; runs on whichever thread opened or closed a transfer."""
+        self.after(0, self._show_bandwidth)
+
+    def _show_bandwidth(self):
+        allocation = self.bandwidth.allocation()
+        if allocation.unlimited:
+            text = ""
+        elif not allocation.platforms and not allocation.interactive:
+            text = t("bandwidth_idle")
+        else:
+            parts = [
+                f"{get_platform_icon(platform)} {format_rate(rate)}"
+                for platform, rate in sorted(allocation.platforms.items())
+            ]
+            if allocation.interactive:
+                parts.append(f"🔎 {format_rate(allocation.interactive)}")
+            text = " · ".join(parts)
+        self.bandwidth_label.configure(text=text)
 
     # ─────────────── YT-DLP UPDATE ───────────────
 
@@ -0,0 +1,139 @@
+"""Background metadata prefetch for queued items.
+
+While the queue waits, a few worker threads resolve title, duration, size
+estimate and available qualities for the next pending items. The fetch goes
+through ``YTDLPDownloader.get_info``, which stores the raw info dict in the
+shared ``InfoCache``, so the download later skips its own extraction.
+Prefetching pauses whenever ``is_busy()`` says downloads are running.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
+from constants import INFO_CACHE_MAX_ENTRIES
+
+if TYPE_CHECKING:
+    from widgets.queue_item import QueueItem
+
+PREFETCH_WORKERS = 2
+# Stay well inside the info cache so prefetched entries are still there at download time
+PREFETCH_LOOKAHEAD = max(1, INFO_CACHE_MAX_ENTRIES // 2)
+IDLE_POLL_SECONDS = 1.0
+
+# Instagram lookups count against the account's rate limit; leave them on demand
+SKIPPED_PLATFORMS = frozenset({"instagram"})
+
+# QueueItem.metadata_state values
+METADATA_NONE = ""
+METADATA_FETCHING = "fetching"
+METADATA_READY = "ready"
+METADATA_FAILED = "failed"
+
+
+def apply_info(item: "QueueItem", info: Dict[str, Any]) -> bool:
+    """Copy ``get_info`` results onto ``item``; False if the lookup failed."""
+    if not info or "error" in info:
+        item.metadata_state = METADATA_FAILED
+        return False
+    if not item.has_title and info.get("title"):
+        item.title = info["title"]
+        item.has_title = True
+    item.duration = info.get("duration") or 0
+    item.filesize = int(info.get("filesize") or 0)
+    item.qualities = list(info.get("qualities") or [])
+    item.metadata_state = METADATA_READY
+    return True
+
+
+class MetadataPrefetcher:
+    """Resolve metadata for the first ``lookahead`` pending items.
+
+    ``fetch(item)`` returns a ``get_info``-style dict and runs on a worker
+    thread, as does ``on_update(item)`` after the item has been updated.
+    Work is pulled from ``get_pending()`` in queue order; ``wake()`` after
+    adding items or when downloads finish avoids waiting for the next poll.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[["QueueItem"], Dict[str, Any]],
+        get_pending: Callable[[], List["QueueItem"]],
+        is_busy: Callable[[], bool] = lambda: False,
+        on_update: Optional[Callable[["QueueItem"], None]] = None,
+        max_workers: int = PREFETCH_WORKERS,
+        lookahead: int = PREFETCH_LOOKAHEAD,
+        idle_poll: float = IDLE_POLL_SECONDS,
+    ) -> None:
+        self._fetch = fetch
+        self._get_pending = get_pending
+        self._is_busy = is_busy
+        self.on_update = on_update
+        self.max_workers = max(1, max_workers)
+        self.lookahead = max(1, lookahead)
+        self.idle_poll = idle_poll
+        self._condition = threading.Condition()
+        self._threads: List[threading.Thread] = []
+        self._stopped = False
+
+    def start(self) -> None:
+        with self._condition:
+            if self._threads:
+                return
+            self._stopped = False
+            for index in range(self.max_workers):
+                thread = threading.Thread(target=self._work, name=f"metadata-prefetch-{index}", daemon=True)
+                self._threads.append(thread)
+                thread.start()
+
+    def stop(self) -> None:
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+
+    def wake(self) -> None:
+        with self._condition:
+            self._condition.notify_all()
+
+    def claim_next(self) -> Optional["QueueItem"]:
+        """Mark and return the next pending item that still needs metadata."""
+        with self._condition:
+            return self._claim_next()
+
+    def _claim_next(self) -> Optional["QueueItem"]:
+        for item in self._get_pending()[:self.lookahead]:
+            if item.metadata_state == METADATA_NONE and item.platform not in SKIPPED_PLATFORMS:
+                item.metadata_state = METADATA_FETCHING
+                return item
+        return None
+
+    def _work(self) -> None:
+        while True:
+            with self._condition:
+                item = None
+                while not self._stopped:
+                    # Downloads have priority; check again once they are done
+                    if not self._is_busy():
+                        item = self._claim_next()
+                        if item is not None:
+                            break
+                    self._condition.wait(self.idle_poll)
+                if self._stopped:
+                    if item is not None:
+                        item.metadata_state = METADATA_NONE
+                    return
+            self.prefetch(item)
+
+    def prefetch(self, item: "QueueItem") -> None:
+        if item.status != "pending":
+            # Picked up by a download meanwhile; it extracts for itself
+            item.metadata_state = METADATA_NONE
+            return
+        try:
+            info = self._fetch(item)
+        except Exception as exc:  # noqa: BLE001
+            info = {"error": str(exc)}
+        apply_info(item, info)
+        if self.on_update is not None:
+            self.on_update(item)
@@ -0,0 +1,199 @@
+"""
+Playlist and channel expansion into separate queue items.
+
+yt-dlp lists the collection flat (``extract_flat="in_playlist"``): it pages
+through the listing without resolving every video. ``PlaylistExpansion``
+hands the entries over in small batches while the pages arrive, so the
+first items show up in the queue almost at once, and a range ("first 50",
+"since 2024-05-01") stops the listing early instead of filtering afterwards.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+from url_classifier import CHANNEL, PLAYLIST, UrlInfo, classify_url
+
+# Platforms whose collections go through yt-dlp (Instagram profiles don't)
+EXPANDABLE_PLATFORMS = frozenset({"youtube", "tiktok", "vimeo", "dailymotion"})
+
+BATCH_SIZE = 50
+BATCH_INTERVAL = 0.25  # seconds; a slow listing still shows progress
+
+_ISO_DATE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_RANGE_WORDS = {"all", "first", "since", "newest", "tümü", "ilk", "son", "itibaren"}
+
+
+def can_expand(info: UrlInfo) -> bool:
+    """True for playlist and channel URLs that are worth listing entry by entry."""
+    return info.kind in (PLAYLIST, CHANNEL) and info.platform in EXPANDABLE_PLATFORMS
+
+
+def entry_date(entry: Dict[str, Any]) -> Optional[date]:
+    """Upload day of a (flat) entry, if yt-dlp reported one."""
+    for key in ("timestamp", "release_timestamp"):
+        value = entry.get(key)
+        if isinstance(value, (int, float)):
+            return datetime.fromtimestamp(value, tz=timezone.utc).date()
+    upload_date = entry.get("upload_date")
+    if isinstance(upload_date, str) and len(upload_date) == 8 and upload_date.isdigit():
+        try:
+            return date(int(upload_date[:4]), int(upload_date[4:6]), int(upload_date[6:]))
+        except ValueError:
+            return None
+    return None
+
+
+@dataclass(frozen=True)
+class ExpansionRange:
+    """Which part of a collection to enqueue; the default is all of it."""
+
+    limit: Optional[int] = None
+    since: Optional[date] = None
+
+    @classmethod
+    def parse(cls, text: str) -> "ExpansionRange":
+        """``""``/``all``, ``50``/``first 50``, ``since 2024-05-01``, or both.
+
+        Raises ValueError for anything else.
+        """
+        limit: Optional[int] = None
+        since: Optional[date] = None
+        for token in text.lower().replace(",", " ").split():
+            if token.isdigit():
+                limit = int(token)
+                if limit <= 0:
+                    raise ValueError(f"Invalid entry count: {token}")
+            elif _ISO_DATE.match(token):
+                since = date.fromisoformat(token)
+            elif token not in _RANGE_WORDS:
+                raise ValueError(f"Unknown range: {text!r}")
+        return cls(limit=limit, since=since)
+
+    def admits(self, entry: Dict[str, Any]) -> bool:
+        """Entries without a date pass; there is nothing to compare."""
+        if self.since is None:
+            return True
+        day = entry_date(entry)
+        return day is None or day >= self.since
+
+
+@dataclass(frozen=True)
+class PlaylistEntry:
+    url: str
+    platform: str
+    title: str = ""
+    duration: float = 0
+
+
+def make_entry(raw: Dict[str, Any]) -> Optional[PlaylistEntry]:
+    """Queue-ready entry for a flat yt-dlp entry; None if it has no usable URL."""
+    url = raw.get("url") or raw.get("webpage_url") or ""
+    if not isinstance(url, str) or not url.startswith(("http://", "https://")):
+        return None
+    info = classify_url(url)
+    if not info.supported:
+        return None
+    return PlaylistEntry(
+        url=info.normalized,
+        platform=info.platform,
+        title=raw.get("title") or "",
+        duration=raw.get("duration") or 0,
+    )
+
+
+class PlaylistExpansion:
+    """List a playlist/channel on a worker thread and report entries in batches.
+
+    ``list_entries(url, since)`` yields flat yt-dlp entries (see
+    ``YTDLPDownloader.iter_playlist_entries``). ``on_batch(entries)`` gets
+    up to ``batch_size`` new, unique entries at a time, at least every
+    ``batch_interval`` seconds while entries keep coming; ``on_done(self)``
+    runs at the end, also after ``cancel()`` or an error (kept in
+    ``error``). Both run on the worker thread.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        list_entries: Callable[[str, Optional[date]], Iterable[Dict[str, Any]]],
+        selection: ExpansionRange = ExpansionRange(),
+        on_batch: Optional[Callable[[List[PlaylistEntry]], None]] = None,
+        on_done: Optional[Callable[["PlaylistExpansion"], None]] = None,
+        batch_size: int = BATCH_SIZE,
+        batch_interval: float = BATCH_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.url = url
+        self.selection = selection
+        self.on_batch = on_batch
+        self.on_done = on_done
+        self.batch_size = max(1, batch_size)
+        self.batch_interval = batch_interval
+        self.added = 0
+        self.error: Optional[Exception] = None
+        self.done = threading.Event()
+        self._list_entries = list_entries
+        self._clock = clock
+        self._cancelled = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def start(self) -> threading.Thread:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self.run, name="playlist-expansion", daemon=True)
+            self._thread.start()
+        return self._thread
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+
+    def run(self) -> None:
+        pending: List[PlaylistEntry] = []
+        seen: Set[str] = set()
+        last_flush = self._clock()
+        limit = self.selection.limit
+        entries = None
+        try:
+            entries = self._list_entries(self.url, self.selection.since)
+            for raw in entries:
+                if self._cancelled.is_set():
+                    break
+                if not raw or not self.selection.admits(raw):
+                    continue
+                entry = make_entry(raw)
+                if entry is None or entry.url in seen:
+                    continue
+                seen.add(entry.url)
+                pending.append(entry)
+                self.added += 1
+                if len(pending) >= self.batch_size or self._clock() - last_flush >= self.batch_interval:
+                    self._flush(pending)
+                    last_flush = self._clock()
+                if limit is not None and self.added >= limit:
+                    break
+        except Exception as exc:  # noqa: BLE001 - extractor errors end the listing
+            self.error = exc
+        finally:
+            # Stops the listing (and releases its YoutubeDL) when we broke off early
+            close = getattr(entries, "close", None)
+            if close is not None:
+                close()
+            if not self._cancelled.is_set():
+                self._flush(pending)
+            self.done.set()
+            if self.on_done is not None:
+                self.on_done(self)
+
+    def _flush(self, pending: List[PlaylistEntry]) -> None:
+        if pending and self.on_batch is not None:
+            self.on_batch(list(pending))
+        pending.clear()
@@ -0,0 +1,95 @@
+"""Coalescing progress bus between download workers and the UI thread."""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import Dict, Hashable, Optional, Tuple
+
+
+@dataclass
+class ProgressState:
+    """Latest progress reported for one download."""
+
+    percent: float = 0.0
+    status: str = ""
+    speed_text: str = ""
+    downloaded_bytes: int = 0
+    total_bytes: int = 0
+    speed_bps: float = 0.0
+    eta: Optional[float] = None
+
+
+@dataclass
+class AggregateProgress:
+    """Totals across every active download."""
+
+    active: int = 0
+    downloaded_bytes: int = 0
+    total_bytes: int = 0
+    speed_bps: float = 0.0
+    eta: Optional[float] = None
+
+    @property
+    def percent(self) -> float:
+        if self.total_bytes <= 0:
+            return 0.0
+        return min(100.0, self.downloaded_bytes * 100.0 / self.total_bytes)
+
+
+class ProgressBus:
+    """Workers overwrite a per-download slot; the UI drains it once per frame.
+
+    ``publish`` only replaces the slot for its key, so however many chunks
+    a worker reports between two frames, the UI sees a single update per
+    active download. The number of Tk callbacks therefore depends on the
+    frame rate and the number of downloads, never on the download speed.
+    """
+
+    def __init__(self) -> None:
+        self._slots: Dict[Hashable, ProgressState] = {}
+        self._dirty: set = set()
+        self._lock = threading.Lock()
+
+    def publish(
+        self,
+        key: Hashable,
+        percent: float,
+        status: str = "",
+        speed_text: str = "",
+        downloaded_bytes: int = 0,
+        total_bytes: int = 0,
+        speed_bps: float = 0.0,
+        eta: Optional[float] = None,
+    ) -> None:
+        state = ProgressState(percent, status, speed_text, downloaded_bytes, total_bytes, speed_bps, eta)
+        with self._lock:
+            self._slots[key] = state
+            self._dirty.add(key)
+
+    def remove(self, key: Hashable) -> None:
+        """Forget a finished download so it no longer counts in the totals."""
+        with self._lock:
+            self._slots.pop(key, None)
+            self._dirty.discard(key)
+
+    def drain(self) -> Tuple[Dict[Hashable, ProgressState], AggregateProgress]:
+        """Return the slots changed since the last drain plus live totals."""
+        with self._lock:
+            changed = {key: self._slots[key] for key in self._dirty}
+            self._dirty.clear()
+            states = list(self._slots.values())
+
+        total = AggregateProgress(active=len(states))
+        for state in states:
+            total.downloaded_bytes += state.downloaded_bytes
+            total.total_bytes += state.total_bytes
+            total.speed_bps += state.speed_bps
+        remaining = total.total_bytes - total.downloaded_bytes
+        if total.speed_bps > 0 and remaining > 0:
+            total.eta = remaining / total.speed_bps
+        return changed, total
+
+    def has_pending(self) -> bool:
+        with self._lock:
+            return bool(self._dirty)
@@ -0,0 +1,228 @@
+"""
+Append-only journal of the download queue.
+
+Every change to a queue item appends one line with the item's full record;
+removing an item appends a delete. Each line carries a CRC-32 of its JSON, so
+a line cut short by a crash or power loss, or any garbage after it, is found
+on load. Everything from the first bad line onwards is cut off and the good
+records before it are kept. Once the journal holds many more lines than live
+items, it is rewritten to a temporary file and swapped in with
+``os.replace``, so a crash during compaction leaves the old journal intact.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+JOURNAL_VERSION = 1
+COMPACT_MIN_RECORDS = 1000  # don't compact tiny journals
+COMPACT_FACTOR = 4  # ... until they hold this many lines per live item
+
+PUT = "put"
+DELETE = "del"
+
+
+def encode_record(record: Dict[str, Any]) -> bytes:
+    payload = json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return b"%08x %s\n" % (zlib.crc32(payload), payload)
+
+
+def decode_line(line: bytes) -> Optional[Dict[str, Any]]:
+    """The record on ``line`` (without its newline); None if it is damaged."""
+    checksum, _, payload = line.partition(b" ")
+    if len(checksum) != 8 or not payload:
+        return None
+    try:
+        if int(checksum, 16) != zlib.crc32(payload):
+            return None
+        record = json.loads(payload.decode("utf-8"))
+    except (ValueError, UnicodeDecodeError):
+        return None
+    return record if isinstance(record, dict) else None
+
+
+class QueueJournal:
+    """Item records keyed by ``item_id``, kept in queue order.
+
+    ``load()`` replays the file and must run before the first write; it
+    returns the live records and counts what it threw away in
+    ``discarded``. Writes are flushed and, with ``durable=True``, fsynced
+    before they return. I/O errors don't raise; the latest is kept in
+    ``last_error``. After a failed write, or a torn tail that couldn't be
+    cut off, the next write rewrites the whole journal instead of appending
+    behind bad bytes. A journal that can't be read is renamed to
+    ``<name>.unreadable`` so nothing is compacted over it; if even that
+    fails, the journal stops writing for this session. All methods are
+    thread-safe.
+    """
+
+    def __init__(self, path: Union[str, Path], durable: bool = True) -> None:
+        self.path = Path(path)
+        self.durable = durable
+        self.discarded = 0
+        self.last_error: Optional[OSError] = None
+        self._records: Dict[str, Dict[str, Any]] = {}
+        self._lines = 0
+        self._file = None
+        self._needs_rewrite = False
+        self._disabled = False
+        self._lock = threading.Lock()
+
+    def load(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            self._records.clear()
+            self._lines = 0
+            self.discarded = 0
+            try:
+                data = self.path.read_bytes()
+            except FileNotFoundError:
+                data = b""
+            except OSError as exc:
+                self.last_error = exc
+                self._set_aside()
+                return []
+            good_end = 0
+            while good_end < len(data):
+                newline = data.find(b"\n", good_end)
+                record = decode_line(data[good_end:newline]) if newline != -1 else None
+                if record is None:
+                    break
+                self._apply(record)
+                self._lines += 1
+                good_end = newline + 1
+            if good_end < len(data):
+                # A torn tail; new lines must not end up behind it
+                self.discarded = data.count(b"\n", good_end) + (0 if data.endswith(b"\n") else 1)
+                try:
+                    with open(self.path, "r+b") as handle:
+                        handle.truncate(good_end)
+                        self._sync(handle)
+                except OSError as exc:
+                    self.last_error = exc
+                    self._needs_rewrite = True
+            return [dict(record) for record in self._records.values()]
+
+    def records(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [dict(record) for record in self._records.values()]
+
+    def put(self, item_id: str, record: Dict[str, Any]) -> None:
+        self.put_many([(item_id, record)])
+
+    def put_many(self, entries: Iterable[tuple]) -> None:
+        """Record ``(item_id, record)`` pairs with a single write."""
+        lines = [{"op": PUT, "id": item_id, "v": JOURNAL_VERSION, "item": record} for item_id, record in entries]
+        self._append(lines)
+
+    def delete(self, item_id: str) -> None:
+        self._append([{"op": DELETE, "id": item_id}])
+
+    def compact(self) -> None:
+        """Rewrite the journal with one line per live item."""
+        with self._lock:
+            self._compact()
+
+    def retain(self, item_ids: Iterable[str]) -> None:
+        """Forget every record but ``item_ids`` and compact."""
+        keep = set(item_ids)
+        with self._lock:
+            self._records = {item_id: record for item_id, record in self._records.items() if item_id in keep}
+            self._compact()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    # ─── Internals ───────────────────────────────────────────────────────
+
+    def _apply(self, record: Dict[str, Any]) -> None:
+        item_id = record.get("id")
+        if not isinstance(item_id, str):
+            return
+        if record.get("op") == DELETE:
+            self._records.pop(item_id, None)
+        elif record.get("op") == PUT and isinstance(record.get("item"), dict):
+            # An item that changes keeps its place in the queue
+            self._records[item_id] = record["item"]
+
+    def _append(self, lines: List[Dict[str, Any]]) -> None:
+        if not lines:
+            return
+        with self._lock:
+            for line in lines:
+                self._apply(line)
+            if self._disabled:
+                return
+            if self._needs_rewrite:
+                self._compact()
+                return
+            try:
+                handle = self._open()
+                handle.write(b"".join(encode_record(line) for line in lines))
+                self._sync(handle)
+            except OSError as exc:
+                self._fail(exc)
+                return
+            self._lines += len(lines)
+            if self._lines > max(COMPACT_MIN_RECORDS, COMPACT_FACTOR * len(self._records)):
+                self._compact()
+
+    def _open(self):
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "ab")
+        return self._file
+
+    def _sync(self, handle) -> None:
+        handle.flush()
+        if self.durable:
+            os.fsync(handle.fileno())
+
+    def _fail(self, exc: OSError) -> None:
+        self.last_error = exc
+        self._needs_rewrite = True
+        if self._file is not None:
+            try:
+                self._file.close()
+            except OSError:
+                pass
+            self._file = None
+
+    def _set_aside(self) -> None:
+        """Keep an unreadable journal for inspection and start a fresh one."""
+        try:
+            os.replace(self.path, self.path.with_name(self.path.name + ".unreadable"))
+        except OSError:
+            self._disabled = True
+            return
+        self._needs_rewrite = True
+
+    def _compact(self) -> None:
+        if self._disabled:
+            return
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        temp_path = self.path.with_name(self.path.name + ".tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, "wb") as handle:
+                handle.write(b"".join(
+                    encode_record({"op": PUT, "id": item_id, "v": JOURNAL_VERSION, "item": record})
+                    for item_id, record in self._records.items()
+                ))
+                self._sync(handle)
+            os.replace(temp_path, self.path)
+        except OSError as exc:
+            self._fail(exc)
+            return
+        self._needs_rewrite = False
+        self.last_error = None
+        self._lines = len(self._records)
@@ -0,0 +1,267 @@
+"""
+Resumable HTTP download - used by the launcher to fetch FFmpeg.
+
+Streams into a persistent ``<name>.part`` file and continues with an HTTP
+``Range`` request after a dropped connection, or on the next launch. The
+server's validator (ETag or Last-Modified) is kept next to the partial file
+and sent as ``If-Range``, so a file that changed on the server restarts
+cleanly instead of being spliced. The result can be checked against a
+SHA-256 before it replaces the destination.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import http.client
+import json
+import os
+import re
+import shutil
+import time
+import urllib.error
+import urllib.request
+import zipfile
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+CHUNK_SIZE = 1024 * 1024
+MAX_STALLED_ATTEMPTS = 5
+USER_AGENT = "SyronssMediaDownloader"
+
+# HTTP errors worth retrying; anything else (404, 403, ...) fails at once
+RETRYABLE_STATUS = {408, 429, 500, 502, 503, 504}
+
+_CONTENT_RANGE = re.compile(r"bytes\s+(\d+)-(\d+)/(\d+|\*)")
+_UNSATISFIED_RANGE = re.compile(r"bytes\s+\*/(\d+)")
+_SHA256 = re.compile(r"\b([0-9a-fA-F]{64})\b")
+
+
+class DownloadError(Exception):
+    """The download failed for good (retries exhausted, bad checksum, ...)."""
+
+
+def parse_content_range(value: Optional[str]) -> Optional[Tuple[int, Optional[int]]]:
+    """``bytes 100-199/1000`` → ``(100, 1000)``; the total is None for ``*``."""
+    match = _CONTENT_RANGE.match(value or "")
+    if not match:
+        return None
+    total = match.group(3)
+    return int(match.group(1)), (None if total == "*" else int(total))
+
+
+def fetch_sha256(url: str, timeout: float = 15) -> Optional[str]:
+    """Read a published ``.sha256`` file; None if it can't be fetched or parsed."""
+    try:
+        request = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            text = response.read(4096).decode("ascii", "replace")
+    except (OSError, http.client.HTTPException, ValueError):
+        return None
+    match = _SHA256.search(text)
+    return match.group(1).lower() if match else None
+
+
+class ResumableDownload:
+    """Download ``url`` to ``dest`` through ``<dest>.part``, resuming on failure.
+
+    A connection that drops mid-transfer is retried from the current size of
+    the partial file. Consecutive attempts that add no bytes count towards
+    ``max_stalled_attempts``; any progress resets the count. ``progress`` is
+    called with ``(downloaded, total)`` (total may be None) after each chunk.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        dest: Path,
+        expected_sha256: Optional[str] = None,
+        progress: Optional[Callable[[int, Optional[int]], None]] = None,
+        chunk_size: int = CHUNK_SIZE,
+        timeout: float = 30,
+        max_stalled_attempts: int = MAX_STALLED_ATTEMPTS,
+        retry_delay: float = 1.0,
+    ) -> None:
+        self.url = url
+        self.dest = Path(dest)
+        self.expected_sha256 = expected_sha256.lower() if expected_sha256 else None
+        self.progress = progress
+        self.chunk_size = chunk_size
+        self.timeout = timeout
+        self.max_stalled_attempts = max_stalled_attempts
+        self.retry_delay = retry_delay
+        self.part_path = self.dest.with_name(self.dest.name + ".part")
+        self.state_path = self.dest.with_name(self.dest.name + ".part.json")
+        self.total: Optional[int] = None
+        self.validator: Optional[str] = None
+        self._digest = hashlib.sha256()
+
+    def run(self) -> Path:
+        self._load_state()
+        stalled = 0
+        last_error: Optional[BaseException] = None
+        while True:
+            before = self._part_size()
+            try:
+                if self._fetch(before):
+                    break
+            except urllib.error.HTTPError as exc:
+                if exc.code not in RETRYABLE_STATUS:
+                    raise DownloadError(f"HTTP {exc.code}: {exc.reason}") from exc
+                last_error = exc
+            except (OSError, http.client.HTTPException) as exc:
+                last_error = exc
+
+            stalled = 0 if self._part_size() > before else stalled + 1
+            if stalled >= self.max_stalled_attempts:
+                raise DownloadError(f"Download keeps failing: {last_error}") from last_error
+            time.sleep(self.retry_delay * stalled)
+
+        self._verify()
+        os.replace(self.part_path, self.dest)
+        self._remove(self.state_path)
+        return self.dest
+
+    # ─── Transfer ─────────────────────────────────────────────────────────
+
+    def _fetch(self, offset: int) -> bool:
+        """One request from ``offset``; True once the partial file is complete."""
+        if offset and self.total is not None and offset >= self.total:
+            return offset == self.total or self._restart()
+
+        headers = {"User-Agent": USER_AGENT}
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+            if self.validator:
+                headers["If-Range"] = self.validator
+        request = urllib.request.Request(self.url, headers=headers)
+        try:
+            response = urllib.request.urlopen(request, timeout=self.timeout)
+        except urllib.error.HTTPError as exc:
+            if exc.code != 416 or not offset:
+                raise
+            # Nothing left past our offset: either we already have it all or the file shrank
+            match = _UNSATISFIED_RANGE.match(exc.headers.get("Content-Range") or "")
+            if match and int(match.group(1)) == offset:
+                self.total = offset
+                return True
+            return self._restart()
+
+        with response:
+            if response.status == 206:
+                content_range = parse_content_range(response.headers.get("Content-Range"))
+                if content_range is None or content_range[0] != offset:
+                    return self._restart()
+                total = content_range[1]
+            else:
+                # Full body: the server ignored Range, or the file changed (If-Range)
+                self._reset_part()
+                offset = 0
+                length = response.headers.get("Content-Length")
+                total = int(length) if length and length.isdigit() else None
+
+            self.total = total
+            self.validator = response.headers.get("ETag") or response.headers.get("Last-Modified")
+            self._save_state()
+
+            downloaded = offset
+            with open(self.part_path, "ab") as f:
+                while True:
+                    chunk = response.read(self.chunk_size)
+                    if not chunk:
+                        break
+                    f.write(chunk)
+                    self._digest.update(chunk)
+                    downloaded += len(chunk)
+                    if self.progress is not None:
+                        self.progress(downloaded, total)
+
+        if total is not None and downloaded < total:
+            raise ConnectionError(f"Connection closed after {downloaded} of {total} bytes")
+        return True
+
+    def _verify(self) -> None:
+        size = self._part_size()
+        if self.total is not None and size != self.total:
+            raise DownloadError(f"Size mismatch: expected {self.total} bytes, got {size}")
+        if self.expected_sha256 and self._digest.hexdigest() != self.expected_sha256:
+            self._reset_part()
+            self._remove(self.state_path)
+            raise DownloadError("Checksum mismatch; the partial download was discarded")
+
+    # ─── Partial file state ───────────────────────────────────────────────
+
+    def _part_size(self) -> int:
+        try:
+            return self.part_path.stat().st_size
+        except OSError:
+            return 0
+
+    def _load_state(self) -> None:
+        """Pick up a partial file from an earlier run, or start clean."""
+        self.part_path.parent.mkdir(parents=True, exist_ok=True)
+        state = {}
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            pass
+        if not isinstance(state, dict) or state.get("url") != self.url or not self.part_path.exists():
+            self._reset_part()
+            return
+        self.total = state.get("total")
+        self.validator = state.get("validator")
+        # The digest has to cover the bytes already on disk
+        with open(self.part_path, "rb") as f:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                self._digest.update(chunk)
+
+    def _save_state(self) -> None:
+        try:
+            with open(self.state_path, "w", encoding="utf-8") as f:
+                json.dump({"url": self.url, "total": self.total, "validator": self.validator}, f)
+        except OSError:
+            pass
+
+    def _reset_part(self) -> None:
+        with open(self.part_path, "wb"):
+            pass
+        self._digest = hashlib.sha256()
+
+    def _restart(self) -> bool:
+        self._reset_part()
+        self.total = None
+        self.validator = None
+        self._remove(self.state_path)
+        return False
+
+    @staticmethod
+    def _remove(path: Path) -> None:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+
+def extract_members(zip_path: Path, targets: Dict[str, Path]) -> Dict[str, Path]:
+    """Extract archive entries by base name, e.g. ``{"ffmpeg.exe": dest}``.
+
+    Entries are picked straight from the central directory and only those
+    members are read (their CRC is checked by ``zipfile`` while streaming).
+    Each file is written under a temporary name and moved into place.
+    Returns the base names that were found.
+    """
+    extracted: Dict[str, Path] = {}
+    with zipfile.ZipFile(zip_path) as archive:
+        for info in archive.infolist():
+            basename = info.filename.rsplit("/", 1)[-1]
+            dest = targets.get(basename)
+            if dest is None or basename in extracted or info.is_dir():
+                continue
+            tmp_path = dest.with_name(dest.name + ".tmp")
+            with archive.open(info) as source, open(tmp_path, "wb") as target:
+                shutil.copyfileobj(source, target, CHUNK_SIZE)
+            os.replace(tmp_path, dest)
+            extracted[basename] = dest
+            if len(extracted) == len(targets):
+                break
+    return extracted
@@ -0,0 +1,316 @@
+"""
+Retries for failed queue items, with a circuit breaker per platform.
+
+A failed download is sorted into one of four kinds. Transient failures
+(timeouts, dropped connections, 5xx) and rate limits (429, Instagram's
+"please wait a few minutes") are retried after an exponential backoff with
+jitter. A login wall or a dead URL fails straight away. The item goes back
+to ``pending`` with ``next_retry_at`` set, and the scheduler leaves it alone
+until then. Because its download directory and ``.part`` file are kept,
+yt-dlp continues the partial file on the next attempt.
+
+Each platform also has a ``CircuitBreaker``. A rate limit, or a run of
+transient failures, opens it, and that platform's items wait out a cooldown
+while other platforms keep downloading. After the cooldown a single item
+goes through as a probe. A success closes the breaker, and a failure opens
+it again for twice as long.
+"""
+
+from __future__ import annotations
+
+import random
+import re
+import socket
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Optional, Union
+
+from constants import (
+    CIRCUIT_COOLDOWN_SECONDS, CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_MAX_COOLDOWN_SECONDS,
+    DEFAULT_QUEUE_RETRIES,
+)
+
+if TYPE_CHECKING:
+    from widgets.queue_item import QueueItem
+
+# Error kinds (QueueItem.error_kind, DownloadResult.error_kind)
+TRANSIENT = "transient"
+RATE_LIMITED = "rate_limited"
+AUTH_REQUIRED = "auth_required"
+PERMANENT = "permanent"
+RETRYABLE_KINDS = frozenset({TRANSIENT, RATE_LIMITED})
+
+# Breaker states
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# instaloader raises these; matched by name so neither backend has to be imported
+_EXCEPTION_KINDS = {
+    "TooManyRequestsException": RATE_LIMITED,
+    "LoginRequiredException": AUTH_REQUIRED,
+    "LoginException": AUTH_REQUIRED,
+    "BadCredentialsException": AUTH_REQUIRED,
+    "TwoFactorAuthRequiredException": AUTH_REQUIRED,
+    "PrivateProfileNotFollowedException": AUTH_REQUIRED,
+    "QueryReturnedNotFoundException": PERMANENT,
+    "InvalidArgumentException": PERMANENT,
+}
+_NETWORK_EXCEPTIONS = (ConnectionError, TimeoutError, socket.timeout, socket.gaierror)
+
+# Checked in this order against the error text; status codes only count after
+# "error"/"code"/"status", not as any number in a title or ID
+_STATUS = r"(?:error|code|status)[: ]+"
+_MESSAGE_PATTERNS = (
+    (RATE_LIMITED, re.compile(
+        _STATUS + r"429\b|too many requests|rate.?limit|please wait a few minutes", re.IGNORECASE)),
+    (AUTH_REQUIRED, re.compile(
+        _STATUS + r"40[17]\b|sign in|login|cookies|authenticat|private|members.only|girişi gerekli|gizli",
+        re.IGNORECASE)),
+    (TRANSIENT, re.compile(_STATUS + r"(?:403|408|425|5\d\d)\b", re.IGNORECASE)),
+    (PERMANENT, re.compile(_STATUS + r"4\d\d\b", re.IGNORECASE)),
+    (TRANSIENT, re.compile(
+        r"timed? ?out|connection (?:reset|refused|aborted|error)|temporary failure|name resolution"
+        r"|network is unreachable|remote end closed|incomplete ?read|read error"
+        r"|unable to download (?:webpage|video data|api page)|bağlantı",
+        re.IGNORECASE)),
+)
+
+
+def _status_kind(status: int) -> str:
+    if status == 429:
+        return RATE_LIMITED
+    if status in (401, 407):
+        return AUTH_REQUIRED
+    # googlevideo answers 403 to an expired or throttled URL; a new attempt re-extracts
+    if status in (403, 408, 425) or status >= 500:
+        return TRANSIENT
+    return PERMANENT
+
+
+def _exception_chain(exc: BaseException) -> Iterable[BaseException]:
+    seen = set()
+    while exc is not None and id(exc) not in seen:
+        seen.add(id(exc))
+        yield exc
+        # yt-dlp's DownloadError keeps the original exception in exc_info
+        exc_info = getattr(exc, "exc_info", None)
+        wrapped = exc_info[1] if isinstance(exc_info, tuple) and len(exc_info) > 1 else None
+        exc = wrapped or exc.__cause__ or exc.__context__
+
+
+def classify_error(error: Union[BaseException, str, None]) -> str:
+    """Kind of a download failure, from the exception if there is one, else from its message."""
+    if isinstance(error, BaseException):
+        for exc in _exception_chain(error):
+            kind = _EXCEPTION_KINDS.get(type(exc).__name__)
+            if kind is not None:
+                return kind
+            status = getattr(exc, "status", None)
+            if status is None:
+                status = getattr(exc, "code", None)
+            if isinstance(status, int) and 400 <= status < 600:
+                return _status_kind(status)
+        message = " ".join(str(exc) for exc in _exception_chain(error))
+        network = any(isinstance(exc, _NETWORK_EXCEPTIONS) for exc in _exception_chain(error))
+    else:
+        message = error or ""
+        network = False
+    for kind, pattern in _MESSAGE_PATTERNS:
+        if pattern.search(message):
+            return kind
+    return TRANSIENT if network else PERMANENT
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How often and how long to wait before retrying each kind of failure.
+
+    The n-th retry waits ``base * multiplier ** (n - 1)`` seconds, capped at
+    ``max_delay``, of which a random half is jitter, so items that failed
+    together don't all come back at the same moment.
+    """
+
+    max_retries: int = DEFAULT_QUEUE_RETRIES
+    base_delay: float = 5.0
+    rate_limit_delay: float = 60.0
+    multiplier: float = 2.0
+    max_delay: float = 15 * 60
+
+    def retries_for(self, kind: str) -> int:
+        return self.max_retries if kind in RETRYABLE_KINDS else 0
+
+    def delay(self, kind: str, retry: int, rng: Callable[[float, float], float] = random.uniform) -> float:
+        """Seconds to wait before retry number ``retry`` (from 1)."""
+        base = self.rate_limit_delay if kind == RATE_LIMITED else self.base_delay
+        ceiling = min(self.max_delay, base * self.multiplier ** max(0, retry - 1))
+        return ceiling / 2 + rng(0, ceiling / 2)
+
+
+class CircuitBreaker:
+    """Failure state of one platform. Not thread-safe; ``RetryEngine`` locks around it.
+
+    ``failure_threshold`` transient failures in a row open the breaker, and
+    so does any rate limit. Auth and permanent failures are about the item,
+    not the platform, and don't count.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        cooldown: float = CIRCUIT_COOLDOWN_SECONDS,
+        max_cooldown: float = CIRCUIT_MAX_COOLDOWN_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.failure_threshold = max(1, failure_threshold)
+        self.base_cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.clock = clock
+        self.failures = 0
+        self.trips = 0
+        self.reopen_at = 0.0
+        self._probe_started: Optional[float] = None
+
+    @property
+    def state(self) -> str:
+        if not self.trips:
+            return CLOSED
+        return OPEN if self.clock() < self.reopen_at else HALF_OPEN
+
+    @property
+    def cooldown(self) -> float:
+        return min(self.max_cooldown, self.base_cooldown * 2 ** max(0, self.trips - 1))
+
+    def allow(self) -> bool:
+        """Whether an item may start now. In half-open state, the first caller becomes the probe."""
+        state = self.state
+        if state == CLOSED:
+            return True
+        if state == OPEN:
+            return False
+        now = self.clock()
+        # A probe that never reported back (removed item, crashed worker) expires
+        if self._probe_started is not None and now - self._probe_started < self.cooldown:
+            return False
+        self._probe_started = now
+        return True
+
+    def available_at(self) -> float:
+        """Earliest time ``allow()`` can say yes again."""
+        state = self.state
+        if state == OPEN:
+            return self.reopen_at
+        if state == HALF_OPEN and self._probe_started is not None:
+            return self._probe_started + self.cooldown
+        return self.clock()
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.trips = 0
+        self.reopen_at = 0.0
+        self._probe_started = None
+
+    def record_failure(self, kind: str) -> None:
+        if kind not in RETRYABLE_KINDS:
+            self._probe_started = None  # says nothing about the platform; let another item probe
+            return
+        state = self.state
+        if state == OPEN:
+            return  # downloads that started before the trip; already paused
+        self.failures += 1
+        if kind == RATE_LIMITED or state == HALF_OPEN or self.failures >= self.failure_threshold:
+            self.trips += 1
+            self.failures = 0
+            self.reopen_at = self.clock() + self.cooldown
+            self._probe_started = None
+
+
+class RetryEngine:
+    """Retry decisions for queue items plus one ``CircuitBreaker`` per platform.
+
+    The scheduler asks ``ready(item)`` before starting a pending item and
+    ``next_wakeup(items)`` when everything left is waiting. The worker calls
+    ``settle(item)`` once the item has its final status. ``settle`` either
+    leaves the item failed or puts it back to ``pending`` with
+    ``retry_count`` and ``next_retry_at`` updated. All methods are
+    thread-safe.
+    """
+
+    def __init__(
+        self,
+        policy: Optional[RetryPolicy] = None,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        cooldown: float = CIRCUIT_COOLDOWN_SECONDS,
+        max_cooldown: float = CIRCUIT_MAX_COOLDOWN_SECONDS,
+        clock: Callable[[], float] = time.time,
+        rng: Callable[[float, float], float] = random.uniform,
+    ) -> None:
+        self.policy = policy or RetryPolicy()
+        self.clock = clock
+        self.rng = rng
+        self._breaker_options = dict(
+            failure_threshold=failure_threshold, cooldown=cooldown, max_cooldown=max_cooldown, clock=clock,
+        )
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, policy: RetryPolicy) -> None:
+        with self._lock:
+            self.policy = policy
+
+    def breaker(self, platform: str) -> CircuitBreaker:
+        with self._lock:
+            return self._breaker(platform)
+
+    def ready(self, item: "QueueItem") -> bool:
+        """Whether ``item`` may start now; claims the probe slot of a half-open breaker."""
+        with self._lock:
+            if self.clock() < item.next_retry_at:
+                return False
+            return self._breaker(item.platform).allow()
+
+    def next_wakeup(self, items: Iterable["QueueItem"]) -> Optional[float]:
+        """Earliest time one of the waiting ``items`` can start, None if there are none."""
+        with self._lock:
+            times = [
+                max(item.next_retry_at, self._breaker(item.platform).available_at())
+                for item in items
+            ]
+        return min(times) if times else None
+
+    def paused_platforms(self) -> Dict[str, float]:
+        """Platforms whose breaker is open, with the time it lets a probe through."""
+        with self._lock:
+            return {
+                platform: breaker.reopen_at
+                for platform, breaker in self._breakers.items()
+                if breaker.state == OPEN
+            }
+
+    def settle(self, item: "QueueItem") -> bool:
+        """Account a finished attempt; True if ``item`` was put back for a retry."""
+        with self._lock:
+            breaker = self._breaker(item.platform)
+            if item.status == "completed":
+                breaker.record_success()
+                item.next_retry_at = 0.0
+                return False
+            if item.status != "error":
+                return False
+            kind = item.error_kind or classify_error(item.error)
+            item.error_kind = kind
+            breaker.record_failure(kind)
+            if item.retry_count >= self.policy.retries_for(kind):
+                return False
+            item.retry_count += 1
+            wait = self.policy.delay(kind, item.retry_count, self.rng)
+            item.next_retry_at = self.clock() + wait
+            item.status = "pending"
+            return True
+
+    def _breaker(self, platform: str) -> CircuitBreaker:
+        breaker = self._breakers.get(platform)
+        if breaker is None:
+            breaker = self._breakers[platform] = CircuitBreaker(**self._breaker_options)
+        return breaker
@@ -0,0 +1,163 @@
+"""Worker-pool scheduler for the download queue."""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+
+from constants import DEFAULT_MAX_CONCURRENT_DOWNLOADS, PLATFORM_CONCURRENCY_LIMITS
+
+if TYPE_CHECKING:
+    from retry_engine import RetryEngine
+    from widgets.queue_item import QueueItem
+
+MIN_WAKEUP_SECONDS = 0.05
+
+
+class QueueScheduler:
+    """Run pending queue items on a bounded pool of worker threads.
+
+    ``max_concurrent`` caps the total number of simultaneous downloads and
+    ``platform_limits`` caps them per platform. Items whose platform is
+    saturated are skipped rather than waited on, so a long Instagram backlog
+    never holds up YouTube items queued behind it.
+
+    With a ``retry`` engine, items waiting for their next attempt or behind
+    an open circuit breaker are skipped the same way. The queue then stays
+    running and a timer pumps again once the first of them is due.
+    """
+
+    def __init__(
+        self,
+        worker: Callable[["QueueItem"], None],
+        get_pending: Callable[[], List["QueueItem"]],
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT_DOWNLOADS,
+        platform_limits: Optional[Dict[str, int]] = None,
+        on_idle: Optional[Callable[[], None]] = None,
+        retry: Optional["RetryEngine"] = None,
+    ) -> None:
+        self._worker = worker
+        self._get_pending = get_pending
+        self.on_idle = on_idle
+        self.retry = retry
+        self._lock = threading.Lock()
+        self._active: Dict[int, "QueueItem"] = {}
+        self._platform_active: Dict[str, int] = {}
+        self._running = False
+        self._timer: Optional[threading.Timer] = None
+        self._wakeup_at = 0.0
+        self.max_concurrent = DEFAULT_MAX_CONCURRENT_DOWNLOADS
+        self.platform_limits: Dict[str, int] = dict(PLATFORM_CONCURRENCY_LIMITS)
+        self.set_limits(max_concurrent, platform_limits)
+
+    @property
+    def is_running(self) -> bool:
+        with self._lock:
+            return self._running
+
+    def active_count(self, platform: Optional[str] = None) -> int:
+        """Number of items currently downloading, optionally for one platform."""
+        with self._lock:
+            if platform is None:
+                return len(self._active)
+            return self._platform_active.get(platform, 0)
+
+    def set_limits(self, max_concurrent: int, platform_limits: Optional[Dict[str, int]] = None) -> None:
+        """Change the caps; takes effect immediately for a running queue."""
+        with self._lock:
+            self.max_concurrent = max(1, int(max_concurrent))
+            limits = dict(PLATFORM_CONCURRENCY_LIMITS)
+            limits.update(platform_limits or {})
+            self.platform_limits = {name: max(1, int(cap)) for name, cap in limits.items()}
+        self.pump()
+
+    def start(self) -> int:
+        """Start processing; returns the number of workers launched."""
+        with self._lock:
+            self._running = True
+        return self.pump()
+
+    def stop(self) -> None:
+        """Stop launching new items. Active downloads run to completion."""
+        with self._lock:
+            self._running = False
+            self._cancel_wakeup()
+
+    def pump(self) -> int:
+        """Fill free worker slots from the pending items.
+
+        Safe to call from any thread; the UI calls it after adding items and
+        every worker calls it when it finishes.
+        """
+        started: List["QueueItem"] = []
+        waiting: List["QueueItem"] = []
+        became_idle = False
+        with self._lock:
+            if not self._running:
+                return 0
+            for item in self._get_pending():
+                if len(self._active) >= self.max_concurrent:
+                    break
+                if item.status != "pending" or id(item) in self._active:
+                    continue
+                if not self._has_platform_slot(item.platform):
+                    continue
+                if self.retry is not None and not self.retry.ready(item):
+                    waiting.append(item)
+                    continue
+                item.status = "downloading"
+                self._active[id(item)] = item
+                self._platform_active[item.platform] = self._platform_active.get(item.platform, 0) + 1
+                started.append(item)
+
+            wakeup = self.retry.next_wakeup(waiting) if waiting else None
+            if wakeup is not None:
+                self._schedule_wakeup(wakeup)
+            elif not started and not self._active:
+                self._running = False
+                became_idle = True
+
+        for item in started:
+            threading.Thread(target=self._run, args=(item,), daemon=True).start()
+
+        if became_idle and self.on_idle:
+            self.on_idle()
+        return len(started)
+
+    def _schedule_wakeup(self, at: float) -> None:
+        """Pump again at ``at`` (on the retry engine's clock); an earlier wakeup still due wins."""
+        now = self.retry.clock()
+        if self._timer is not None and now < self._wakeup_at <= at:
+            return
+        self._cancel_wakeup()
+        self._wakeup_at = at
+        self._timer = threading.Timer(max(MIN_WAKEUP_SECONDS, at - now), self.pump)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _cancel_wakeup(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _has_platform_slot(self, platform: str) -> bool:
+        cap = self.platform_limits.get(platform)
+        if cap is None:
+            return True
+        return self._platform_active.get(platform, 0) < cap
+
+    def _run(self, item: "QueueItem") -> None:
+        try:
+            self._worker(item)
+        except Exception as exc:  # noqa: BLE001
+            item.status = "error"
+            item.error = str(exc)
+        finally:
+            with self._lock:
+                self._active.pop(id(item), None)
+                remaining = self._platform_active.get(item.platform, 1) - 1
+                if remaining > 0:
+                    self._platform_active[item.platform] = remaining
+                else:
+                    self._platform_active.pop(item.platform, None)
+            self.pump()
@@ -0,0 +1,120 @@
+"""
+Startup manifest - lets the launcher skip its checks on a warm start.
+
+The launcher checks the Python packages and looks for a working FFmpeg on
+every start. When those checks pass, the outcome is written here, keyed by
+the requirements.txt hash, the Python executable and the FFmpeg binary's
+path, mtime and size. If none of them changed, the next start trusts the
+manifest and launches right away.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Optional, Union
+
+MANIFEST_VERSION = 1
+
+PathLike = Union[str, Path]
+
+
+def get_manifest_file() -> Path:
+    return Path.home() / ".video_downloader_startup.json"
+
+
+def file_digest(path: PathLike) -> str:
+    """SHA-256 of a file's contents, or an empty string if it can't be read."""
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return ""
+
+
+@dataclass
+class StartupManifest:
+    """Outcome of the last successful launcher checks.
+
+    ``ffmpeg_path`` is empty when the app was started without FFmpeg; the
+    package check can still be skipped then, but FFmpeg is looked for again.
+    ``path_dir`` is the directory the launcher prepended to ``PATH`` (empty
+    when FFmpeg was already on ``PATH``).
+    """
+
+    requirements_hash: str
+    python: str
+    ffmpeg_path: str = ""
+    ffmpeg_mtime: float = 0.0
+    ffmpeg_size: int = 0
+    path_dir: str = ""
+
+    @classmethod
+    def capture(
+        cls,
+        requirements_hash: str,
+        ffmpeg_path: Optional[PathLike] = None,
+        path_dir: str = "",
+    ) -> "StartupManifest":
+        manifest = cls(requirements_hash=requirements_hash, python=sys.executable)
+        if ffmpeg_path:
+            try:
+                stat = Path(ffmpeg_path).stat()
+            except OSError:
+                return manifest
+            manifest.ffmpeg_path = str(ffmpeg_path)
+            manifest.ffmpeg_mtime = stat.st_mtime
+            manifest.ffmpeg_size = stat.st_size
+            manifest.path_dir = path_dir
+        return manifest
+
+    def packages_valid(self, requirements_hash: str) -> bool:
+        """Same requirements file and the same interpreter as last time."""
+        return self.requirements_hash == requirements_hash and self.python == sys.executable
+
+    def ffmpeg_valid(self) -> bool:
+        """The recorded FFmpeg binary is still there and unchanged."""
+        if not self.ffmpeg_path:
+            return False
+        try:
+            stat = Path(self.ffmpeg_path).stat()
+        except OSError:
+            return False
+        return stat.st_mtime == self.ffmpeg_mtime and stat.st_size == self.ffmpeg_size
+
+    def is_warm(self, requirements_hash: str) -> bool:
+        return self.packages_valid(requirements_hash) and self.ffmpeg_valid()
+
+
+def load_manifest(manifest_file: Optional[Path] = None) -> Optional[StartupManifest]:
+    try:
+        with open(manifest_file or get_manifest_file(), "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != MANIFEST_VERSION:
+            return None
+        return StartupManifest(**data["manifest"])
+    except (OSError, ValueError, AttributeError, KeyError, TypeError):
+        return None
+
+
+def save_manifest(manifest: StartupManifest, manifest_file: Optional[Path] = None) -> None:
+    manifest_file = manifest_file or get_manifest_file()
+    try:
+        tmp_file = manifest_file.with_name(manifest_file.name + ".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump({"version": MANIFEST_VERSION, "manifest": asdict(manifest)}, f, indent=2)
+        os.replace(tmp_file, manifest_file)
+    except OSError:
+        pass
+
+
+def clear_manifest(manifest_file: Optional[Path] = None) -> None:
+    """Force a full check on the next start (e.g. after the app failed to import)."""
+    try:
+        (manifest_file or get_manifest_file()).unlink()
+    except OSError:
+        pass
@@ -0,0 +1,244 @@
+"""
+Startup phase profiler - where does launch time go?
+
+Opt-in with ``--profile-startup`` (launcher.py or main.py). Code marks its
+phases with ``with phase("name"):``; nesting is tracked per thread. When
+the main window first goes idle, ``finish()`` writes two files:
+
+* ``startup-<timestamp>.json`` - phases with monotonic start/duration in
+  milliseconds, also carrying Chrome trace events (``traceEvents``), so it
+  opens directly in Perfetto or chrome://tracing.
+* ``startup-<timestamp>.folded`` - folded stacks (self time in µs) for
+  flamegraph.pl or speedscope.
+
+Only the last ``KEEP_RUNS`` reports are kept. ``python startup_profile.py``
+compares the top-level phases of those runs.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+PROFILE_FLAG = "--profile-startup"
+REPORT_VERSION = 1
+KEEP_RUNS = 10
+
+_NULL_PHASE = nullcontext()
+
+# The process-wide profiler measures from the first import of this module
+_IMPORTED_AT = time.perf_counter()
+
+
+def get_report_dir() -> Path:
+    return Path.home() / ".video_downloader_profiles"
+
+
+class StartupProfiler:
+    """Collect nested, per-thread phase timings for one process start.
+
+    Disabled profilers hand out a shared no-op context manager, so leaving
+    the ``phase`` calls in the startup path costs next to nothing.
+    """
+
+    def __init__(
+        self,
+        enabled: bool,
+        report_dir: Optional[Path] = None,
+        keep: int = KEEP_RUNS,
+        origin: Optional[float] = None,
+    ) -> None:
+        self.enabled = enabled
+        self.report_dir = report_dir or get_report_dir()
+        self.keep = keep
+        self.origin = time.perf_counter() if origin is None else origin
+        self.started_at = datetime.now()
+        self.phases: List[Dict[str, Any]] = []
+        self.marks: Dict[str, float] = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._finished = False
+
+    def _now_ms(self) -> float:
+        return (time.perf_counter() - self.origin) * 1000
+
+    def phase(self, name: str):
+        if not self.enabled:
+            return _NULL_PHASE
+        return self._record(name)
+
+    @contextmanager
+    def _record(self, name: str) -> Iterator[None]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        stack.append(name)
+        path = ";".join(stack)
+        start = self._now_ms()
+        try:
+            yield
+        finally:
+            end = self._now_ms()
+            stack.pop()
+            with self._lock:
+                self.phases.append({
+                    "name": name,
+                    "stack": path,
+                    "thread": threading.current_thread().name,
+                    "start_ms": round(start, 3),
+                    "duration_ms": round(end - start, 3),
+                })
+
+    def mark(self, name: str) -> None:
+        """Record a point in time (e.g. ``first_map``)."""
+        if self.enabled:
+            with self._lock:
+                self.marks.setdefault(name, round(self._now_ms(), 3))
+
+    # ─── Report ───────────────────────────────────────────────────────────
+
+    def report(self) -> Dict[str, Any]:
+        with self._lock:
+            phases = sorted(self.phases, key=lambda p: p["start_ms"])
+            marks = dict(self.marks)
+        threads = {name: index for index, name in enumerate(dict.fromkeys(p["thread"] for p in phases))}
+        trace_events = [
+            {
+                "name": p["name"], "ph": "X", "pid": 1, "tid": threads[p["thread"]],
+                "ts": round(p["start_ms"] * 1000), "dur": round(p["duration_ms"] * 1000),
+            }
+            for p in phases
+        ]
+        trace_events += [
+            {"name": name, "ph": "i", "s": "g", "pid": 1, "tid": 0, "ts": round(at * 1000)}
+            for name, at in marks.items()
+        ]
+        trace_events += [
+            {"name": "thread_name", "ph": "M", "pid": 1, "tid": tid, "args": {"name": name}}
+            for name, tid in threads.items()
+        ]
+        return {
+            "version": REPORT_VERSION,
+            "started_at": self.started_at.isoformat(timespec="seconds"),
+            "argv": sys.argv,
+            "python": sys.executable,
+            "total_ms": round(self._now_ms(), 3),
+            "marks": marks,
+            "phases": phases,
+            "traceEvents": trace_events,
+        }
+
+    def folded(self) -> str:
+        """Folded stacks, ``thread;outer;inner <self µs>`` per line."""
+        with self._lock:
+            phases = list(self.phases)
+        self_time: Dict[str, float] = {}
+        for p in phases:
+            key = f"{p['thread']};{p['stack']}"
+            self_time[key] = self_time.get(key, 0.0) + p["duration_ms"]
+            parent = key.rpartition(";")[0]
+            if ";" in parent:
+                self_time[parent] = self_time.get(parent, 0.0) - p["duration_ms"]
+        return "".join(
+            f"{stack} {max(0, round(ms * 1000))}\n" for stack, ms in sorted(self_time.items())
+        )
+
+    def finish(self) -> Optional[Path]:
+        """Write the report once and prune old runs; returns the JSON path."""
+        if not self.enabled or self._finished:
+            return None
+        self._finished = True
+        self.mark("finished")
+        stamp = self.started_at.strftime("%Y%m%d-%H%M%S-%f")
+        json_path = self.report_dir / f"startup-{stamp}.json"
+        try:
+            self.report_dir.mkdir(parents=True, exist_ok=True)
+            with open(json_path, "w", encoding="utf-8") as f:
+                json.dump(self.report(), f, indent=2)
+            with open(json_path.with_suffix(".folded"), "w", encoding="utf-8") as f:
+                f.write(self.folded())
+        except OSError:
+            return None
+        prune_reports(self.report_dir, self.keep)
+        return json_path
+
+
+def list_reports(report_dir: Optional[Path] = None) -> List[Path]:
+    """Saved JSON reports, oldest first."""
+    return sorted((report_dir or get_report_dir()).glob("startup-*.json"))
+
+
+def prune_reports(report_dir: Path, keep: int = KEEP_RUNS) -> None:
+    reports = list_reports(report_dir)
+    for old in reports[:max(0, len(reports) - keep)]:
+        for path in (old, old.with_suffix(".folded")):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+
+def top_level_totals(report: Dict[str, Any]) -> Dict[str, float]:
+    """Summed duration of each outermost phase (per thread) in a report."""
+    totals: Dict[str, float] = {}
+    for p in report.get("phases", []):
+        if ";" not in p["stack"]:
+            totals[p["name"]] = totals.get(p["name"], 0.0) + p["duration_ms"]
+    return totals
+
+
+_profiler: Optional[StartupProfiler] = None
+_profiler_lock = threading.Lock()
+
+
+def get_startup_profiler() -> StartupProfiler:
+    """Return the process-wide profiler, enabled by ``--profile-startup``."""
+    global _profiler
+    with _profiler_lock:
+        if _profiler is None:
+            _profiler = StartupProfiler(enabled=PROFILE_FLAG in sys.argv, origin=_IMPORTED_AT)
+        return _profiler
+
+
+def phase(name: str):
+    """``with phase("load_history"):`` on the process-wide profiler."""
+    return get_startup_profiler().phase(name)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare the last startup profiles.")
+    parser.add_argument("--runs", type=int, default=KEEP_RUNS)
+    args = parser.parse_args()
+
+    reports = []
+    for path in list_reports()[-args.runs:]:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                reports.append(json.load(f))
+        except (OSError, ValueError):
+            pass
+    if not reports:
+        print(f"No startup profiles yet; run the app with {PROFILE_FLAG}.")
+        return
+
+    totals = [top_level_totals(report) for report in reports]
+    names = list(dict.fromkeys(name for run in totals for name in run))
+    width = max(len(name) for name in names + ["total"])
+    print(f"{'phase':<{width}} " + " ".join(f"{report['started_at'][5:16]:>12}" for report in reports))
+    for name in names:
+        print(f"{name:<{width}} " + " ".join(f"{run.get(name, 0):>10.1f}ms" for run in totals))
+    print(f"{'total':<{width}} " + " ".join(f"{report['total_ms']:>10.1f}ms" for report in reports))
+    if len(reports) > 1:
+        delta = reports[-1]["total_ms"] - reports[-2]["total_ms"]
+        print(f"\nlast run vs previous: {delta:+.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""Tests for bandwidth.py — shared rate cap, weights and interactive reserve."""
+
+import threading
+import time
+
+from bandwidth import (
+    BULK, INTERACTIVE, MIN_RATE, BandwidthScheduler, throttle_session, ydl_rate_limit,
+)
+
+KB = 1024
+
+
+def test_unlimited_leases_never_wait() -> None:
+    scheduler = BandwidthScheduler()
+    with scheduler.open("youtube") as lease:
+        assert lease.rate is None
+        assert lease.consume(50 * 1024 * 1024) == 0.0
+    assert scheduler.allocation().unlimited
+
+
+def test_cap_is_split_by_platform_weight() -> None:
+    scheduler = BandwidthScheduler(limit=300 * KB, weights={"instagram": 2.0})
+    youtube = scheduler.open("youtube")
+    instagram = scheduler.open("instagram")
+
+    assert youtube.rate == 100 * KB
+    assert instagram.rate == 200 * KB
+    allocation = scheduler.allocation()
+    assert allocation.platforms == {"youtube": 100 * KB, "instagram": 200 * KB}
+    assert allocation.downloads == 2
+
+    instagram.close()
+    assert youtube.rate == 300 * KB
+
+
+def test_interactive_share_is_reserved_only_while_needed() -> None:
+    scheduler = BandwidthScheduler(limit=1000 * KB, interactive_share=20)
+    download = scheduler.open("youtube")
+    info = scheduler.open("instagram", INTERACTIVE)
+
+    assert info.rate == 200 * KB
+    assert download.rate == 800 * KB
+    assert scheduler.allocation().interactive == 200 * KB
+
+    info.close()
+    assert download.rate == 1000 * KB
+
+
+def test_interactive_alone_gets_the_whole_cap() -> None:
+    scheduler = BandwidthScheduler(limit=500 * KB)
+    with scheduler.open("youtube", INTERACTIVE) as info:
+        assert info.rate == 500 * KB
+
+
+def test_zero_share_treats_interactive_like_a_download() -> None:
+    scheduler = BandwidthScheduler(limit=400 * KB, weights={}, interactive_share=0)
+    download = scheduler.open("twitch")
+    info = scheduler.open("twitch", INTERACTIVE)
+    assert download.rate == info.rate == 200 * KB
+
+
+def test_many_leases_keep_a_minimum_rate() -> None:
+    scheduler = BandwidthScheduler(limit=64 * KB)
+    leases = [scheduler.open("youtube") for _ in range(10)]
+    assert all(lease.rate == MIN_RATE for lease in leases)
+
+
+def test_reconfigure_resizes_running_leases_and_notifies() -> None:
+    scheduler = BandwidthScheduler(limit=100 * KB)
+    seen_rates = []
+    allocations = []
+    scheduler.add_listener(allocations.append)
+    lease = scheduler.open("youtube")
+    lease.on_change = seen_rates.append
+
+    scheduler.configure(limit=400 * KB)
+    assert seen_rates == [400 * KB]
+    scheduler.configure(limit=0)
+    assert seen_rates == [400 * KB, None]
+    assert allocations[-1].unlimited
+
+
+def test_bucket_paces_to_the_lease_rate() -> None:
+    scheduler = BandwidthScheduler(limit=2048 * KB, burst_seconds=0.01)
+    with scheduler.open("youtube") as lease:
+        start = time.monotonic()
+        for _ in range(6):
+            lease.consume(64 * KB)
+        elapsed = time.monotonic() - start
+    # 384 KB at 2 MB/s; the first 64 KB fit the (minimum) bucket once it refills
+    assert elapsed >= 0.12
+
+
+def test_raising_the_cap_wakes_a_waiting_transfer() -> None:
+    scheduler = BandwidthScheduler(limit=MIN_RATE)
+    lease = scheduler.open("youtube")
+    waited = []
+    worker = threading.Thread(target=lambda: waited.append(lease.consume(10 * 1024 * 1024)))
+    worker.start()
+    time.sleep(0.05)
+    scheduler.configure(limit=0)
+    worker.join(timeout=2)
+
+    assert not worker.is_alive()
+    assert waited[0] < 1.0
+
+
+def test_account_charges_deltas_and_restarts_per_file() -> None:
+    scheduler = BandwidthScheduler()
+    lease = scheduler.open("youtube")
+    charged = []
+    lease.consume = charged.append
+
+    for total in (100, 250, 250, 40, 90):
+        lease.account(total)
+    assert charged == [100, 150, 40, 50]
+
+
+def test_current_lease_is_per_thread() -> None:
+    scheduler = BandwidthScheduler()
+    other = []
+    with scheduler.open("instagram") as lease:
+        assert scheduler.current() is lease
+        thread = threading.Thread(target=lambda: other.append(scheduler.current()))
+        thread.start()
+        thread.join()
+    assert other == [None]
+    assert scheduler.current() is None
+
+
+class FakeYDL:
+    def __init__(self, params):
+        self.params = params
+
+
+def test_ydl_rate_limit_follows_the_lease_and_restores() -> None:
+    scheduler = BandwidthScheduler(limit=500 * KB)
+    ydl = FakeYDL({"quiet": True})
+    with scheduler.open("youtube") as lease, ydl_rate_limit(ydl, lease):
+        assert ydl.params["ratelimit"] == 500 * KB
+        scheduler.configure(limit=200 * KB)
+        assert ydl.params["ratelimit"] == 200 * KB
+    assert "ratelimit" not in ydl.params
+
+    pooled = FakeYDL({"ratelimit": 50 * KB})
+    with scheduler.open("youtube") as lease, ydl_rate_limit(pooled, lease):
+        assert pooled.params["ratelimit"] == 200 * KB
+    assert pooled.params["ratelimit"] == 50 * KB
+
+
+class FakeRaw:
+    def __init__(self, chunks):
+        self.chunks = list(chunks)
+
+    def read(self, amt=None):
+        return self.chunks.pop(0) if self.chunks else b""
+
+
+class FakeResponse:
+    def __init__(self, chunks):
+        self.raw = FakeRaw(chunks)
+
+
+class FakeSession:
+    def __init__(self):
+        self.hooks = {"response": []}
+
+    def get(self, chunks):
+        response = FakeResponse(chunks)
+        for hook in self.hooks["response"]:
+            response = hook(response)
+        return response
+
+
+def test_throttle_session_charges_the_thread_lease() -> None:
+    scheduler = BandwidthScheduler()
+    session = throttle_session(throttle_session(FakeSession(), scheduler), scheduler)
+    assert len(session.hooks["response"]) == 1
+
+    untracked = session.get([b"x" * 10])
+    with scheduler.open("instagram", BULK) as lease:
+        charged = []
+        lease.consume = charged.append
+        response = session.get([b"a" * 300, b"b" * 200])
+        while response.raw.read(1024):
+            pass
+        untracked.raw.read()
+    assert charged == [300, 200]
@@ -1,5 +1,6 @@
 """Tests for constants and i18n modules."""
 
+import gc
 import json
 from pathlib import Path
 
@@ -7,7 +8,24 @@ from constants import (
     SUPPORTED_PLATFORMS, QUALITY_OPTIONS, FILENAME_TEMPLATES,
     PLATFORM_ICONS, PLATFORM_COLORS, DEFAULT_SETTINGS, LANGUAGES,
 )
-from i18n import t, set_language, get_language
+from i18n import (
+    t, set_language, get_language, bind_text, unbind_text, refresh_bindings, compile_catalog,
+)
+
+
+class FakeWidget:
+    """Records ``configure`` calls like a Tk widget would apply them."""
+
+    def __init__(self) -> None:
+        self.options = {}
+        self.configure_calls = 0
+        self.destroyed = False
+
+    def configure(self, **kwargs) -> None:
+        if self.destroyed:
+            raise RuntimeError("invalid command name")
+        self.configure_calls += 1
+        self.options.update(kwargs)
 
 
 # ─── Constants ───
@@ -80,6 +98,81 @@ def test_translate_format_params_en() -> None:
     assert "/tmp/downloads" in result
 
 
+def test_template_without_its_arguments_is_returned_as_is() -> None:
+    set_language("en")
+    assert "{folder}" in t("folder_changed")
+    assert "{folder}" in t("folder_changed", other="x")
+
+
+def test_compiled_catalog_merges_fallback_and_binds_templates() -> None:
+    catalog, templates = compile_catalog("en")
+    assert catalog["btn_download"] == t("btn_download")
+    assert templates["folder_changed"](folder="/x") == t("folder_changed", folder="/x")
+    assert "btn_download" not in templates
+
+    fallback_only, _ = compile_catalog("xx")
+    tr_catalog, _ = compile_catalog("tr")
+    assert fallback_only == tr_catalog
+
+
+# ─── Text bindings ───
+
+def test_language_switch_reconfigures_bound_widgets() -> None:
+    set_language("tr")
+    label, entry = FakeWidget(), FakeWidget()
+    bind_text(label, "btn_download")
+    bind_text(entry, "url_placeholder", option="placeholder_text")
+    turkish = label.options["text"]
+
+    set_language("en")
+
+    assert label.options["text"] == t("btn_download") != turkish
+    assert entry.options["placeholder_text"] == t("url_placeholder")
+    set_language("tr")
+
+
+def test_rebinding_replaces_and_unbinding_stops_updates() -> None:
+    set_language("tr")
+    status = FakeWidget()
+    bind_text(status, "status_ready")
+    bind_text(status, "status_error", error="boom")
+
+    set_language("en")
+    assert status.options["text"] == t("status_error", error="boom")
+
+    unbind_text(status)
+    calls = status.configure_calls
+    set_language("tr")
+    assert status.configure_calls == calls
+
+
+def test_same_language_does_not_touch_widgets() -> None:
+    set_language("tr")
+    label = FakeWidget()
+    bind_text(label, "queue_title")
+
+    set_language("tr")
+
+    assert label.configure_calls == 1
+
+
+def test_destroyed_and_collected_widgets_are_forgotten() -> None:
+    set_language("tr")
+    destroyed, collected = FakeWidget(), FakeWidget()
+    bind_text(destroyed, "queue_title")
+    bind_text(collected, "queue_title")
+    destroyed.destroyed = True
+    del collected
+    gc.collect()
+
+    refresh_bindings()
+    destroyed.destroyed = False
+    calls = destroyed.configure_calls
+    refresh_bindings()
+
+    assert destroyed.configure_calls == calls
+
+
 def test_both_translation_files_have_same_keys() -> None:
     """Ensure TR and EN have the same keys."""
     i18n_dir = Path(__file__).resolve().parent.parent / "i18n"
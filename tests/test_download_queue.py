@@ -0,0 +1,158 @@
+"""Tests for download_queue.py — indexed, status-aware duplicate detection."""
+
+import threading
+
+from download_queue import DownloadQueue
+from queue_journal import QueueJournal
+from widgets.queue_item import QueueItem
+
+
+def _item(n: int = 0, **options) -> QueueItem:
+    return QueueItem(url=f"https://www.youtube.com/watch?v={n:011d}", platform="youtube", **options)
+
+
+def test_duplicate_of_active_item_is_rejected() -> None:
+    queue = DownloadQueue()
+    first = _item()
+
+    assert queue.add(first)
+    assert not queue.add(_item())
+    assert queue.find_active(_item()) is first
+    assert len(queue) == 1
+
+
+def test_options_are_part_of_the_key() -> None:
+    queue = DownloadQueue()
+    assert queue.add(_item())
+    assert queue.add(_item(as_audio=True))
+    assert queue.add(_item(quality="720"))
+    assert len(queue) == 3
+
+
+def test_key_uses_the_canonical_url() -> None:
+    queue = DownloadQueue([_item()])
+    tracked = QueueItem(url="https://www.youtube.com/watch?v=00000000000&si=share", platform="youtube")
+
+    assert not queue.add(tracked)
+
+
+def test_finished_items_do_not_block_requeue() -> None:
+    queue = DownloadQueue()
+    first = _item()
+    queue.add(first)
+
+    first.status = "downloading"
+    assert not queue.add(_item())
+    first.status = "completed"
+    second = _item()
+    assert queue.add(second)
+    assert queue.find_active(_item()) is second
+    assert queue.snapshot() == [first, second]
+
+
+def test_remove_clears_the_index() -> None:
+    queue = DownloadQueue()
+    first = _item()
+    queue.add(first)
+
+    assert queue.remove(first)
+    assert not queue.remove(first)
+    assert first not in queue
+    assert queue.add(_item())
+
+
+def test_add_many_dedupes_within_the_batch() -> None:
+    queue = DownloadQueue([_item(1)])
+    added = queue.add_many([_item(n % 1000) for n in range(3000)])
+
+    assert len(added) == 999
+    assert len(queue) == 1000
+    assert [item.url for item in queue.pending()][:2] == [_item(1).url, _item(0).url]
+
+
+def test_progress_counts_finished_items() -> None:
+    items = [_item(n) for n in range(4)]
+    items[0].status = "completed"
+    items[1].status = "error"
+    queue = DownloadQueue(items)
+
+    assert queue.progress() == (2, 4)
+    assert queue.pending() == items[2:]
+
+
+def test_concurrent_bulk_adds_keep_one_item_per_key() -> None:
+    queue = DownloadQueue()
+    batches = [[_item(n) for n in range(2000)] for _ in range(4)]
+    threads = [threading.Thread(target=queue.add_many, args=(batch,)) for batch in batches]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(queue) == 2000
+
+
+def test_journal_follows_adds_touches_and_removes(tmp_path) -> None:
+    journal = QueueJournal(tmp_path / "queue.journal", durable=False)
+    journal.load()
+    queue = DownloadQueue(journal=journal)
+    first, second = _item(1), _item(2)
+    queue.add_many([first, second])
+    first.status = "downloading"
+    queue.touch(first)
+    queue.remove(second)
+    queue.touch(second)  # no longer queued; not written back
+
+    records = journal.records()
+
+    assert [record["item_id"] for record in records] == [first.item_id]
+    assert records[0]["status"] == "downloading"
+
+
+def test_restore_resumes_interrupted_items(tmp_path) -> None:
+    partial = tmp_path / "video.mp4.part"
+    partial.write_bytes(b"x" * 250)
+    resumed, lost, waiting, done = _item(1), _item(2), _item(3), _item(4)
+    resumed.status, resumed.progress, resumed.filesize = "downloading", 20.0, 1000
+    resumed.partial_file = str(partial)
+    lost.status, lost.progress = "downloading", 60.0
+    lost.partial_file = str(tmp_path / "gone.part")
+    waiting.metadata_state = "fetching"
+    done.status = "completed"
+    records = [item.to_record() for item in (resumed, lost, waiting, done)]
+
+    journal = QueueJournal(tmp_path / "queue.journal", durable=False)
+    journal.put_many((record["item_id"], record) for record in records)
+    queue = DownloadQueue(journal=journal)
+    restored = queue.restore(QueueItem.from_record(record) for record in records)
+
+    assert [item.item_id for item in restored] == [resumed.item_id, lost.item_id, waiting.item_id]
+    assert all(item.status == "pending" for item in restored)
+    assert restored[0].progress == 25 and restored[0].partial_file == str(partial)
+    assert restored[1].progress == 0 and restored[1].partial_file == ""
+    assert restored[2].metadata_state == ""
+    assert [record["item_id"] for record in journal.records()] == [item.item_id for item in restored]
+
+
+def test_journal_writes_do_not_hold_the_queue_lock() -> None:
+    entered, release = threading.Event(), threading.Event()
+
+    class SlowJournal:
+        def put(self, item_id, record) -> None:
+            entered.set()
+            release.wait(5)
+
+        def put_many(self, entries) -> None:
+            pass
+
+    queue = DownloadQueue([_item()], journal=SlowJournal())
+    item = queue.snapshot()[0]
+    writer = threading.Thread(target=queue.touch, args=(item,))
+    writer.start()
+    assert entered.wait(5)
+
+    # Readers get through while the record is being flushed
+    assert queue.pending() == [item]
+    assert queue.progress() == (0, 1)
+    release.set()
+    writer.join(5)
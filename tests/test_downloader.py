@@ -1,6 +1,46 @@
 from pathlib import Path
 
+from bandwidth import BandwidthScheduler
 from downloader import InstagramDownloader, YTDLPDownloader, create_downloader
+from info_cache import InfoCache
+from retry_engine import RATE_LIMITED
+from ydl_pool import YoutubeDLPool
+
+
+class FakeYDL:
+    """Stand-in for yt_dlp.YoutubeDL that records extraction calls."""
+
+    calls: list = []
+    fail_cached_download = False
+
+    def __init__(self, params):
+        self.params = params
+        self._progress_hooks = []
+        self._postprocessor_hooks = []
+
+    def extract_info(self, url, download=True, process=True):
+        FakeYDL.calls.append(("extract", url, download, process))
+        info = {
+            "id": "abc",
+            "title": "Fake video",
+            "formats": [{"format_id": "18", "height": 360, "url": "https://cdn/18"}],
+        }
+        return info
+
+    def process_ie_result(self, info, download=True):
+        FakeYDL.calls.append(("process", info["id"], download))
+        if download and FakeYDL.fail_cached_download:
+            FakeYDL.fail_cached_download = False
+            raise RuntimeError("ERROR: unable to download video data: HTTP Error 403: Forbidden")
+        return info
+
+    def close(self):
+        pass
+
+
+def _fake_ytdlp_downloader(tmp_path: Path) -> YTDLPDownloader:
+    FakeYDL.calls = []
+    return YTDLPDownloader(tmp_path, "youtube", pool=YoutubeDLPool(factory=FakeYDL), info_cache=InfoCache())
 
 
 def test_extract_shortcode_variants(tmp_path: Path) -> None:
@@ -26,6 +66,17 @@ def test_create_downloader_for_expanded_platforms(tmp_path: Path) -> None:
     assert isinstance(create_downloader("twitter", tmp_path), YTDLPDownloader)
 
 
+def test_transfer_profile_reaches_download_options(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setattr("downloader.check_and_get_ffmpeg", lambda: None)
+    downloader = create_downloader("twitch", tmp_path, {"twitch": {"fragment_concurrency": 2, "retries": 4}})
+    opts = downloader._get_ydl_opts(as_audio=False)
+    assert opts["concurrent_fragment_downloads"] == 2
+    assert opts["retries"] == opts["fragment_retries"] == 4
+
+    default_opts = create_downloader("youtube", tmp_path)._get_ydl_opts(as_audio=False)
+    assert default_opts["http_chunk_size"] == 10 * 1024 * 1024
+
+
 def test_subtitle_options(monkeypatch, tmp_path: Path) -> None:
     monkeypatch.setattr("downloader.check_and_get_ffmpeg", lambda: "ffmpeg")
     downloader = YTDLPDownloader(tmp_path, "youtube")
@@ -69,3 +120,141 @@ def test_extract_shortcode_with_username_path(tmp_path: Path) -> None:
     downloader = InstagramDownloader(tmp_path)
     assert downloader._extract_shortcode("https://www.instagram.com/cey_lazuli/p/DTAyNDAgqxt") == "DTAyNDAgqxt"
     assert downloader._extract_shortcode("https://www.instagram.com/cey_lazuli/reel/ABCdef123/") == "ABCdef123"
+
+
+def test_download_reuses_info_from_fetch(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setattr("downloader.check_and_get_ffmpeg", lambda: "ffmpeg")
+    downloader = _fake_ytdlp_downloader(tmp_path)
+
+    info = downloader.get_info("https://www.youtube.com/watch?v=abc")
+    result = downloader.download("https://www.youtube.com/watch?v=abc")
+
+    assert info["title"] == "Fake video"
+    assert result.success
+    extractions = [call for call in FakeYDL.calls if call[0] == "extract"]
+    assert extractions == [("extract", "https://www.youtube.com/watch?v=abc", False, False)]
+    assert ("process", "abc", True) in FakeYDL.calls
+
+
+class RateRecordingYDL(FakeYDL):
+    seen: list = []
+
+    def extract_info(self, url, download=True, process=True):
+        RateRecordingYDL.seen.append(self.params.get("ratelimit"))
+        for hook in self._progress_hooks:
+            hook({"status": "downloading", "downloaded_bytes": 1024, "total_bytes": 2048})
+        return super().extract_info(url, download, process)
+
+
+def test_download_runs_under_a_bandwidth_lease(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setattr("downloader.check_and_get_ffmpeg", lambda: None)
+    RateRecordingYDL.seen = []
+    scheduler = BandwidthScheduler(limit=512 * 1024)
+    pool = YoutubeDLPool(factory=RateRecordingYDL)
+    downloader = YTDLPDownloader(tmp_path, "youtube", pool=pool, info_cache=InfoCache(), bandwidth=scheduler)
+
+    assert downloader.download("https://www.youtube.com/watch?v=abc").success
+    assert RateRecordingYDL.seen == [512 * 1024]
+    assert scheduler.allocation().downloads == 0
+
+    # The pooled instance goes back without the per-download limit
+    with pool.checkout(downloader._get_ydl_opts(as_audio=False)) as ydl:
+        assert "ratelimit" not in ydl.params
+
+
+def test_download_reextracts_when_cached_urls_are_rejected(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setattr("downloader.check_and_get_ffmpeg", lambda: "ffmpeg")
+    downloader = _fake_ytdlp_downloader(tmp_path)
+    downloader.get_info("https://www.youtube.com/watch?v=abc")
+
+    FakeYDL.fail_cached_download = True
+    result = downloader.download("https://www.youtube.com/watch?v=abc")
+
+    assert result.success
+    assert FakeYDL.calls[-1] == ("extract", "https://www.youtube.com/watch?v=abc", True, True)
+
+
+class RateLimitedYDL(FakeYDL):
+    def extract_info(self, url, download=True, process=True):
+        raise RuntimeError("ERROR: [youtube] abc: Unable to download webpage: HTTP Error 429: Too Many Requests")
+
+
+def test_failed_download_carries_its_error_kind(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setattr("downloader.check_and_get_ffmpeg", lambda: None)
+    pool = YoutubeDLPool(factory=RateLimitedYDL)
+    downloader = YTDLPDownloader(tmp_path, "youtube", pool=pool, info_cache=InfoCache())
+
+    result = downloader.download("https://www.youtube.com/watch?v=abc")
+
+    assert not result.success
+    assert result.error_kind == RATE_LIMITED
+
+
+class FakeListingYDL(FakeYDL):
+    """Flat listings: a channel whose root redirects to tabs, paged lazily."""
+
+    pages_served = 0
+
+    def extract_info(self, url, download=True, process=True):
+        FakeYDL.calls.append(("extract", url, download, process))
+        if url == "https://www.youtube.com/@chan":
+            return {"_type": "playlist", "id": "chan", "entries": [
+                {"_type": "url", "url": "https://www.youtube.com/@chan/videos"},
+                {"_type": "url", "url": "https://www.youtube.com/@chan/shorts"},
+            ]}
+        if url.endswith("/videos"):
+            return {"_type": "playlist", "webpage_url": url, "entries": self._pages("v")}
+        return {"_type": "playlist", "webpage_url": url, "entries": self._pages("s")}
+
+    @staticmethod
+    def _pages(prefix):
+        newest = 1_685_620_800  # 2023-06-01, one video a day before that
+        for n in range(300):
+            if n % 100 == 0:
+                FakeListingYDL.pages_served += 1
+            yield {"_type": "url", "url": f"https://www.youtube.com/watch?v={prefix}{n}",
+                   "title": f"{prefix}{n}", "timestamp": newest - n * 86400}
+
+
+def _listing_downloader(tmp_path: Path) -> YTDLPDownloader:
+    FakeYDL.calls = []
+    FakeListingYDL.pages_served = 0
+    return YTDLPDownloader(tmp_path, "youtube", pool=YoutubeDLPool(factory=FakeListingYDL), info_cache=InfoCache())
+
+
+def test_playlist_entries_walk_channel_tabs(tmp_path: Path) -> None:
+    downloader = _listing_downloader(tmp_path)
+
+    entries = list(downloader.iter_playlist_entries("https://www.youtube.com/@chan"))
+
+    assert len(entries) == 600
+    assert entries[0]["url"].endswith("v=v0") and entries[300]["url"].endswith("v=s0")
+    assert all(call[3] is False for call in FakeYDL.calls)
+
+
+def test_playlist_entries_stop_at_older_channel_videos(tmp_path: Path) -> None:
+    from datetime import date
+    downloader = _listing_downloader(tmp_path)
+
+    entries = list(downloader.iter_playlist_entries("https://www.youtube.com/@chan/videos", since=date(2023, 5, 25)))
+
+    assert [entry["title"] for entry in entries] == [f"v{n}" for n in range(8)]
+    assert FakeListingYDL.pages_served == 1
+
+
+def test_closing_playlist_listing_stops_paging(tmp_path: Path) -> None:
+    downloader = _listing_downloader(tmp_path)
+
+    listing = downloader.iter_playlist_entries("https://www.youtube.com/@chan/videos")
+    first = [next(listing) for _ in range(10)]
+    listing.close()
+
+    assert len(first) == 10
+    assert FakeListingYDL.pages_served == 1
+    assert downloader.pool.idle_count() == 1
+
+
+def test_single_video_options_ignore_the_playlist(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setattr("downloader.check_and_get_ffmpeg", lambda: "ffmpeg")
+    opts = YTDLPDownloader(tmp_path, "youtube")._get_ydl_opts(as_audio=False)
+    assert opts["noplaylist"] is True
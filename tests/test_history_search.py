@@ -0,0 +1,175 @@
+"""Tests for history_search.py and HistoryStore.search — indexed history search."""
+
+import sqlite3
+import threading
+from pathlib import Path
+
+import history_store
+from history_search import HistorySearcher, parse_query
+from history_store import HistoryStore
+
+
+def _entry(n: int, platform: str = "youtube", **overrides) -> dict:
+    entry = {
+        "filename": f"Lecture {n} on Distributed Systems.mp4",
+        "platform": platform,
+        "size": "1.0 MB",
+        "size_bytes": (n + 1) * 1024 * 1024,
+        "filepath": f"/downloads/lecture {n}.mp4",
+        "date": f"2024-{n % 12 + 1:02d}-01T12:00:00",
+        "source_url": f"https://youtube.com/watch?v=vid{n:04d}",
+        "uploader": "Prof Ünal" if n % 2 else "MIT OpenCourseWare",
+    }
+    entry.update(overrides)
+    return entry
+
+
+def _store(tmp_path: Path, count: int = 24) -> HistoryStore:
+    store = HistoryStore(tmp_path / "history.db")
+    store.add_many([_entry(n, "youtube" if n % 3 else "vimeo") for n in range(count)])
+    return store
+
+
+def _names(rows) -> set:
+    return {row["filename"] for row in rows}
+
+
+# ─── parse_query ───
+
+def test_parse_query_splits_terms_and_filters() -> None:
+    query = parse_query("Lecture platform:YouTube size:>10MB date:2024-05 uploader:mit")
+    assert query.terms == ["lecture"]
+    assert query.platform == "youtube"
+    assert query.uploader == "mit"
+    assert query.size_min == 10 * 1024 * 1024 + 1
+    assert query.size_max is None
+    assert query.date_from == "2024-05"
+    assert "2024-05-31T23:59:59" < query.date_to < "2024-06"
+
+
+def test_parse_query_ranges_and_unknown_filters() -> None:
+    query = parse_query("size:1MB..2MB after:2024-01-01 before:2024-02-01 foo:bar size:huge")
+    assert (query.size_min, query.size_max) == (1024 * 1024, 2 * 1024 * 1024)
+    assert (query.date_from, query.date_to) == ("2024-01-01", "2024-02-01")
+    assert query.terms == ["foo:bar", "size:huge"]
+    assert parse_query("   ").is_empty
+
+
+# ─── HistoryStore.search ───
+
+def test_search_matches_word_prefixes_across_fields(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    assert len(store.search(parse_query("distrib"))) == 24
+    assert _names(store.search(parse_query("vid0007"))) == {"Lecture 7 on Distributed Systems.mp4"}
+    assert len(store.search(parse_query("unal"))) == 12
+    assert store.search(parse_query("nothing-like-this")) == []
+
+
+def test_search_filters(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    vimeo = store.search(parse_query("platform:vimeo"))
+    assert len(vimeo) == 8 and all(row["platform"] == "vimeo" for row in vimeo)
+    assert len(store.search(parse_query("lecture platform:vimeo"))) == 8
+    assert len(store.search(parse_query("size:<=3MB"))) == 3
+    assert len(store.search(parse_query("date:2024-03"))) == 2
+    assert len(store.search(parse_query("uploader:mit date:2024-03"))) == 2
+    assert store.search(parse_query("uploader:unal date:2024-03")) == []
+
+
+def test_search_is_newest_first_and_paginated(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    rows = store.search(parse_query("lecture"), limit=5)
+    assert [row["id"] for row in rows] == sorted((row["id"] for row in rows), reverse=True)
+    assert len(store.search(parse_query("lecture"), limit=5, offset=20)) == 4
+
+
+def test_narrow_filter_path_matches_full_text_path(tmp_path: Path, monkeypatch) -> None:
+    store = _store(tmp_path, 60)
+    query = parse_query("lecture systems size:<=30MB")
+    monkeypatch.setattr(history_store, "SEARCH_SCAN_THRESHOLD", 1000)
+    narrow = store.search(query)
+    monkeypatch.setattr(history_store, "SEARCH_SCAN_THRESHOLD", 0)
+    full = store.search(query)
+    assert len(narrow) == 30
+    assert _names(narrow) == _names(full)
+
+
+def test_search_sees_buffered_entries(tmp_path: Path) -> None:
+    store = HistoryStore(tmp_path / "history.db", batch_size=100)
+    store.add(_entry(1, filename="Pending upload.mp4"))
+    assert _names(store.search(parse_query("pending"))) == {"Pending upload.mp4"}
+
+
+def test_search_returns_none_when_cancelled(tmp_path: Path) -> None:
+    store = _store(tmp_path, 200)
+    assert store.search(parse_query("lecture"), is_cancelled=lambda: True) is None
+
+
+def test_clear_empties_the_index(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    store.clear()
+    assert store.search(parse_query("lecture")) == []
+
+
+def test_v1_database_is_migrated(tmp_path: Path) -> None:
+    db = tmp_path / "history.db"
+    conn = sqlite3.connect(str(db))
+    conn.executescript(
+        """
+        CREATE TABLE entries (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            filename TEXT NOT NULL DEFAULT '', platform TEXT NOT NULL DEFAULT '',
+            size TEXT NOT NULL DEFAULT '', filepath TEXT NOT NULL DEFAULT '',
+            date TEXT NOT NULL DEFAULT '', source_url TEXT NOT NULL DEFAULT ''
+        );
+        CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+        INSERT INTO entries (filename, platform, size, date) VALUES ('Old clip.mp4', 'tiktok', '1.5 MB', '2023-01-01');
+        PRAGMA user_version=1;
+        """
+    )
+    conn.close()
+
+    store = HistoryStore(db)
+    rows = store.search(parse_query("old"))
+    assert [row["filename"] for row in rows] == ["Old clip.mp4"]
+    assert rows[0]["size_bytes"] == int(1.5 * 1024 * 1024)
+    assert len(store.search(parse_query("size:>1MB"))) == 1
+
+
+# ─── HistorySearcher ───
+
+class BlockingStore:
+    """Fake store whose first search blocks until released."""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.queries = []
+
+    def search(self, query, limit, is_cancelled):
+        self.queries.append(query.terms)
+        if len(self.queries) == 1:
+            self.release.wait(2)
+            if is_cancelled():
+                return None
+        return [{"terms": query.terms}]
+
+
+def test_searcher_drops_stale_queries() -> None:
+    store = BlockingStore()
+    searcher = HistorySearcher(store)
+    delivered = []
+    done = threading.Event()
+
+    def callback(generation, rows):
+        delivered.append((generation, rows))
+        done.set()
+
+    searcher.submit("a", callback)
+    searcher.submit("ab", callback)
+    latest = searcher.submit("abc", callback)
+    store.release.set()
+    assert done.wait(2)
+    searcher.close()
+
+    assert delivered == [(latest, [{"terms": ["abc"]}])]
+    assert ["ab"] not in store.queries
@@ -0,0 +1,131 @@
+"""Tests for history_store.py — SQLite history with batched writes."""
+
+import json
+import sqlite3
+from pathlib import Path
+
+from history_store import HistoryStore
+
+
+def _entry(n: int, platform: str = "youtube") -> dict:
+    return {
+        "filename": f"video {n}.mp4",
+        "platform": platform,
+        "size": "1.0 MB",
+        "filepath": f"/downloads/video {n}.mp4",
+        "date": f"2024-01-{n % 28 + 1:02d}T12:00:{n % 60:02d}",
+        "source_url": f"https://youtube.com/watch?v={n}",
+    }
+
+
+def test_store_has_no_size_cap(tmp_path: Path) -> None:
+    store = HistoryStore(tmp_path / "history.db")
+    store.add_many([_entry(n) for n in range(500)])
+    assert store.count() == 500
+
+
+def test_add_is_buffered_until_flush(tmp_path: Path) -> None:
+    db = tmp_path / "history.db"
+    store = HistoryStore(db, batch_size=10)
+    for n in range(3):
+        store.add(_entry(n))
+
+    other = HistoryStore(db)
+    assert other.count() == 0
+
+    assert store.flush() == 3
+    assert other.count() == 3
+
+
+def test_recent_is_newest_first(tmp_path: Path) -> None:
+    store = HistoryStore(tmp_path / "history.db")
+    store.add(_entry(1))
+    store.add(_entry(5))
+    store.add(_entry(3))
+    assert [row["filename"] for row in store.recent(2)] == ["video 5.mp4", "video 3.mp4"]
+
+
+def test_indexed_lookups(tmp_path: Path) -> None:
+    store = HistoryStore(tmp_path / "history.db")
+    store.add_many([_entry(n, "youtube" if n % 2 else "tiktok") for n in range(20)])
+
+    assert all(row["platform"] == "tiktok" for row in store.by_platform("tiktok"))
+    assert len(store.by_platform("tiktok")) == 10
+    assert [row["filename"] for row in store.by_source_url("https://youtube.com/watch?v=7")] == ["video 7.mp4"]
+    assert len(store.between("2024-01-01", "2024-01-03")) == 2
+
+
+def test_migrates_legacy_json_once(tmp_path: Path) -> None:
+    legacy = tmp_path / "history.json"
+    legacy.write_text(json.dumps([_entry(2), _entry(1)]), encoding="utf-8")
+    store = HistoryStore(tmp_path / "history.db")
+
+    assert store.migrate_from_json(legacy) == 2
+    assert not legacy.exists()
+    assert (tmp_path / "history.json.migrated").exists()
+    assert [row["filename"] for row in store.recent()] == ["video 2.mp4", "video 1.mp4"]
+
+    legacy.write_text(json.dumps([_entry(3)]), encoding="utf-8")
+    assert store.migrate_from_json(legacy) == 0
+    assert store.count() == 2
+
+
+def test_clear_drops_pending_and_stored(tmp_path: Path) -> None:
+    store = HistoryStore(tmp_path / "history.db", batch_size=100)
+    store.add_many([_entry(n) for n in range(5)])
+    store.add(_entry(6))
+    store.clear()
+    assert store.count() == 0
+
+
+# ─── Running statistics ───
+
+def test_stats_are_exact_and_include_pending(tmp_path: Path) -> None:
+    store = HistoryStore(tmp_path / "history.db", batch_size=100)
+    store.add(dict(_entry(1), size_bytes=1_500_000_001))
+    store.add(dict(_entry(2, "tiktok"), size_bytes=7))
+
+    stats = store.stats()
+    assert stats.count == 2
+    assert stats.total_bytes == 1_500_000_008
+    assert stats.platform_counts == {"youtube": 1, "tiktok": 1}
+    assert stats.platform_bytes["youtube"] == 1_500_000_001
+    assert stats.day_counts == {"2024-01-02": 1, "2024-01-03": 1}
+
+
+def test_stats_persist_across_reopen(tmp_path: Path) -> None:
+    db = tmp_path / "history.db"
+    store = HistoryStore(db)
+    store.add_many([_entry(n, "youtube" if n % 4 else "vimeo") for n in range(40)])
+    store.close()
+
+    stats = HistoryStore(db).stats()
+    assert stats.count == 40
+    assert stats.total_bytes == 40 * 1024 * 1024
+    assert stats.top_platforms(1) == [("youtube", 30)]
+    assert sum(stats.day_counts.values()) == 40
+
+
+def test_clear_resets_stats(tmp_path: Path) -> None:
+    db = tmp_path / "history.db"
+    store = HistoryStore(db)
+    store.add_many([_entry(n) for n in range(5)])
+    store.clear()
+    assert store.stats().count == 0
+    store.close()
+    assert HistoryStore(db).stats().platform_counts == {}
+
+
+def test_stats_rebuilt_when_upgrading_from_v2(tmp_path: Path) -> None:
+    db = tmp_path / "history.db"
+    store = HistoryStore(db)
+    store.add_many([_entry(n) for n in range(6)])
+    store.close()
+
+    conn = sqlite3.connect(str(db))
+    conn.executescript("DELETE FROM stats_platform; DELETE FROM stats_day; PRAGMA user_version=2;")
+    conn.close()
+
+    stats = HistoryStore(db).stats()
+    assert stats.count == 6
+    assert stats.platform_bytes == {"youtube": 6 * 1024 * 1024}
@@ -0,0 +1,74 @@
+"""Tests for info_cache.py — TTL/LRU cache of extracted info dicts."""
+
+from info_cache import InfoCache, earliest_url_expiry, trim_info
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000_000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_cache_keys_on_normalized_url() -> None:
+    cache = InfoCache()
+    cache.put("https://www.youtube.com/watch?v=abc&si=tracking", {"id": "abc"})
+    assert cache.get("https://www.youtube.com/watch?v=abc") == {"id": "abc"}
+
+
+def test_cache_expires_after_ttl() -> None:
+    clock = FakeClock()
+    cache = InfoCache(ttl_seconds=60, clock=clock)
+    cache.put("https://vimeo.com/1", {"id": "1"})
+    clock.now += 59
+    assert cache.get("https://vimeo.com/1") is not None
+    clock.now += 2
+    assert cache.get("https://vimeo.com/1") is None
+    assert len(cache) == 0
+
+
+def test_cache_evicts_least_recently_used() -> None:
+    cache = InfoCache(max_entries=2)
+    cache.put("https://vimeo.com/1", {"id": "1"})
+    cache.put("https://vimeo.com/2", {"id": "2"})
+    cache.get("https://vimeo.com/1")
+    cache.put("https://vimeo.com/3", {"id": "3"})
+    assert "https://vimeo.com/1" in cache
+    assert "https://vimeo.com/2" not in cache
+    assert "https://vimeo.com/3" in cache
+
+
+def test_cache_drops_entries_with_expiring_signed_urls() -> None:
+    clock = FakeClock()
+    cache = InfoCache(ttl_seconds=3600, clock=clock)
+    deadline = int(clock.now + 600)
+    cache.put("https://youtube.com/watch?v=a", {
+        "id": "a",
+        "formats": [{"url": f"https://rr1.googlevideo.com/videoplayback?expire={deadline}&sig=x"}],
+    })
+    assert cache.get("https://youtube.com/watch?v=a") is not None
+    clock.now += 500
+    assert cache.get("https://youtube.com/watch?v=a") is None
+
+
+def test_earliest_url_expiry() -> None:
+    info = {"formats": [
+        {"url": "https://host/a?expire=200"},
+        {"url": "https://host/b?expire=100"},
+        {"url": "https://host/c"},
+    ]}
+    assert earliest_url_expiry(info) == 100
+    assert earliest_url_expiry({"formats": [{"url": "https://host/c"}]}) is None
+
+
+def test_trim_info_drops_bulky_fields() -> None:
+    trimmed = trim_info({
+        "id": "a",
+        "thumbnails": [{"url": "x"}] * 50,
+        "heatmap": [1, 2, 3],
+        "formats": [{"format_id": "sb0", "ext": "mhtml"}, {"format_id": "18", "ext": "mp4"}],
+    })
+    assert "thumbnails" not in trimmed
+    assert "heatmap" not in trimmed
+    assert [fmt["format_id"] for fmt in trimmed["formats"]] == ["18"]
@@ -0,0 +1,86 @@
+"""Tests for lazy_import.py — deferred backend imports."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+from lazy_import import AppPreloader, LazyModule, start_warm_up
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _make_module(tmp_path: Path, monkeypatch, name: str) -> None:
+    (tmp_path / f"{name}.py").write_text("VALUE = 42\n", encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, name, raising=False)
+
+
+def test_lazy_module_imports_on_first_attribute(tmp_path: Path, monkeypatch) -> None:
+    _make_module(tmp_path, monkeypatch, "lazy_probe_module")
+    lazy = LazyModule("lazy_probe_module")
+    assert not lazy.is_loaded
+    assert "lazy_probe_module" not in sys.modules
+
+    assert lazy.VALUE == 42
+    assert lazy.is_loaded
+    assert "lazy_probe_module" in sys.modules
+
+
+def test_warm_up_imports_in_background(tmp_path: Path, monkeypatch) -> None:
+    _make_module(tmp_path, monkeypatch, "warm_probe_module")
+    thread = start_warm_up(["warm_probe_module", "no_such_module_anywhere"])
+    thread.join(5)
+    assert "warm_probe_module" in sys.modules
+
+
+def test_preloader_reports_each_phase_then_finishes(tmp_path: Path, monkeypatch) -> None:
+    for name in ("preload_a", "preload_b", "preload_c"):
+        _make_module(tmp_path, monkeypatch, name)
+    phases = []
+    preloader = AppPreloader(
+        phases=[("first", ["preload_a"]), ("second", ["preload_b", "preload_c"])],
+        extra=[],
+        on_phase=lambda index, total, label: phases.append((index, total, label)),
+    )
+
+    preloader.start().join(5)
+
+    assert preloader.done.is_set() and preloader.error is None
+    assert phases == [(0, 2, "first"), (1, 2, "second")]
+    assert {"preload_a", "preload_b", "preload_c"} <= set(sys.modules)
+
+
+def test_preloader_stops_at_a_failing_phase(tmp_path: Path, monkeypatch) -> None:
+    _make_module(tmp_path, monkeypatch, "preload_after_failure")
+    done = []
+    preloader = AppPreloader(
+        phases=[("broken", ["no_such_module_anywhere"]), ("later", ["preload_after_failure"])],
+        extra=[],
+        on_done=lambda: done.append(True),
+    )
+
+    preloader.start().join(5)
+
+    assert isinstance(preloader.error, ImportError)
+    assert done == [True]
+    assert "preload_after_failure" not in sys.modules
+
+
+def test_preloader_skips_extra_modules_once_stopped(tmp_path: Path, monkeypatch) -> None:
+    _make_module(tmp_path, monkeypatch, "preload_extra")
+    preloader = AppPreloader(phases=[], extra=["preload_extra"])
+    preloader.stop_extra()
+
+    preloader.start().join(5)
+
+    assert preloader.done.is_set()
+    assert "preload_extra" not in sys.modules
+
+
+def test_importing_main_does_not_load_backends() -> None:
+    code = "import sys, main; print('yt_dlp' in sys.modules, 'instaloader' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=PROJECT_ROOT, capture_output=True, text=True, timeout=60
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.split() == ["False", "False"]
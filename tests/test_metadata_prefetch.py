@@ -0,0 +1,92 @@
+"""Tests for metadata_prefetch.py — background metadata for pending items."""
+
+import threading
+
+from download_queue import DownloadQueue
+from metadata_prefetch import MetadataPrefetcher, apply_info
+from widgets.queue_item import QueueItem
+
+INFO = {"title": "Real title", "duration": 215, "filesize": 12_000_000, "qualities": ["1080", "720"]}
+
+
+def _queue(count: int, platform: str = "youtube") -> DownloadQueue:
+    return DownloadQueue(
+        QueueItem(url=f"https://www.youtube.com/watch?v={n:011d}", platform=platform) for n in range(count)
+    )
+
+
+def test_apply_info_keeps_user_titles() -> None:
+    placeholder = QueueItem(url="https://youtu.be/abc", platform="youtube")
+    named = QueueItem(url="https://youtu.be/def", platform="youtube", title="Mine")
+
+    assert apply_info(placeholder, INFO)
+    apply_info(named, INFO)
+
+    assert placeholder.title == "Real title"
+    assert (placeholder.duration, placeholder.filesize, placeholder.qualities) == (215, 12_000_000, ["1080", "720"])
+    assert named.title == "Mine"
+
+
+def test_apply_info_marks_failures() -> None:
+    item = QueueItem(url="https://youtu.be/abc", platform="youtube")
+    assert not apply_info(item, {"error": "HTTP Error 404"})
+    assert item.metadata_state == "failed"
+
+
+def test_claims_in_queue_order_within_lookahead() -> None:
+    queue = _queue(5)
+    prefetcher = MetadataPrefetcher(lambda item: INFO, queue.pending, lookahead=3)
+
+    claimed = [prefetcher.claim_next() for _ in range(4)]
+
+    assert claimed[:3] == queue.snapshot()[:3]
+    assert claimed[3] is None
+
+
+def test_skips_instagram_and_items_no_longer_pending() -> None:
+    queue = _queue(1, platform="instagram")
+    fetched = []
+    prefetcher = MetadataPrefetcher(lambda item: fetched.append(item) or INFO, queue.pending)
+    assert prefetcher.claim_next() is None
+
+    item = QueueItem(url="https://youtu.be/abc", platform="youtube")
+    item.status = "downloading"
+    prefetcher.prefetch(item)
+    assert fetched == []
+    assert item.metadata_state == ""
+
+
+def test_workers_fill_pending_items_and_report() -> None:
+    queue = _queue(6)
+    updated = []
+    all_done = threading.Event()
+
+    def on_update(item):
+        updated.append(item)
+        if len(updated) == 6:
+            all_done.set()
+
+    prefetcher = MetadataPrefetcher(lambda item: INFO, queue.pending, on_update=on_update, idle_poll=0.01)
+    prefetcher.start()
+    assert all_done.wait(5)
+    prefetcher.stop()
+
+    assert {id(item) for item in updated} == {id(item) for item in queue}
+    assert all(item.metadata_state == "ready" for item in queue)
+
+
+def test_yields_while_downloads_are_active() -> None:
+    queue = _queue(2)
+    busy = threading.Event()
+    busy.set()
+    fetched = threading.Event()
+    prefetcher = MetadataPrefetcher(
+        lambda item: fetched.set() or INFO, queue.pending, is_busy=busy.is_set, idle_poll=0.01,
+    )
+    prefetcher.start()
+
+    assert not fetched.wait(0.1)
+    busy.clear()
+    prefetcher.wake()
+    assert fetched.wait(5)
+    prefetcher.stop()
@@ -0,0 +1,107 @@
+"""Tests for playlist_expander.py — ranges and batched, streaming expansion."""
+
+from datetime import date
+
+import pytest
+
+from playlist_expander import ExpansionRange, PlaylistExpansion, can_expand, entry_date
+from url_classifier import classify_url
+
+
+def _entries(count: int):
+    for n in range(count):
+        yield {"_type": "url", "url": f"https://www.youtube.com/watch?v=id{n}", "title": f"Video {n}"}
+
+
+# ─── ExpansionRange ───
+
+def test_parse_range() -> None:
+    assert ExpansionRange.parse("") == ExpansionRange()
+    assert ExpansionRange.parse("all") == ExpansionRange()
+    assert ExpansionRange.parse("first 50") == ExpansionRange(limit=50)
+    assert ExpansionRange.parse("since 2024-05-01") == ExpansionRange(since=date(2024, 5, 1))
+    assert ExpansionRange.parse("20, 2024-05-01") == ExpansionRange(limit=20, since=date(2024, 5, 1))
+
+
+@pytest.mark.parametrize("text", ["0", "yesterday", "2024-13-01"])
+def test_parse_range_rejects_garbage(text: str) -> None:
+    with pytest.raises(ValueError):
+        ExpansionRange.parse(text)
+
+
+def test_since_admits_undated_entries() -> None:
+    selection = ExpansionRange(since=date(2024, 5, 1))
+    assert selection.admits({"upload_date": "20240501"})
+    assert not selection.admits({"timestamp": 1_700_000_000})  # 2023-11-14
+    assert selection.admits({})
+    assert entry_date({"upload_date": "2024xx01"}) is None
+
+
+def test_can_expand() -> None:
+    assert can_expand(classify_url("https://www.youtube.com/playlist?list=PL1"))
+    assert can_expand(classify_url("https://www.youtube.com/@someone"))
+    assert not can_expand(classify_url("https://www.youtube.com/watch?v=a&list=PL1"))
+    assert not can_expand(classify_url("https://www.instagram.com/someone"))
+
+
+# ─── PlaylistExpansion ───
+
+def test_expansion_batches_and_dedupes() -> None:
+    batches, finished = [], []
+
+    def listing(url, since):
+        yield from _entries(120)
+        yield {"_type": "url", "url": "https://www.youtube.com/watch?v=id0&si=again"}
+        yield {"_type": "url", "url": "not-a-url"}
+
+    expansion = PlaylistExpansion(
+        "https://www.youtube.com/playlist?list=PL1", listing,
+        on_batch=batches.append, on_done=finished.append, batch_size=50, batch_interval=60,
+    )
+    expansion.run()
+
+    assert [len(batch) for batch in batches] == [50, 50, 20]
+    assert batches[0][0].url == "https://www.youtube.com/watch?v=id0"
+    assert batches[0][0].title == "Video 0"
+    assert expansion.added == 120
+    assert finished == [expansion]
+
+
+def test_expansion_stops_listing_at_limit() -> None:
+    pulled = []
+
+    def listing(url, since):
+        for entry in _entries(5000):
+            pulled.append(entry)
+            yield entry
+
+    batches = []
+    PlaylistExpansion("u", listing, ExpansionRange(limit=50), on_batch=batches.append, batch_interval=60).run()
+
+    assert sum(len(batch) for batch in batches) == 50
+    assert len(pulled) == 50
+
+
+def test_expansion_flushes_on_interval() -> None:
+    ticks = iter(range(1000))
+    batches = []
+
+    PlaylistExpansion(
+        "u", lambda url, since: _entries(4), on_batch=batches.append,
+        batch_size=100, batch_interval=2, clock=lambda: next(ticks),
+    ).run()
+
+    assert [len(batch) for batch in batches] == [2, 2]
+
+
+def test_expansion_records_listing_errors() -> None:
+    def listing(url, since):
+        yield from _entries(3)
+        raise RuntimeError("HTTP Error 429")
+
+    batches = []
+    expansion = PlaylistExpansion("u", listing, on_batch=batches.append)
+    expansion.run()
+
+    assert str(expansion.error) == "HTTP Error 429"
+    assert sum(len(batch) for batch in batches) == 3
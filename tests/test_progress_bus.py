@@ -0,0 +1,64 @@
+"""Tests for progress_bus.py — coalesced progress updates."""
+
+from downloader import ProgressCallback
+from progress_bus import ProgressBus
+
+
+def test_drain_returns_only_latest_state_per_key() -> None:
+    bus = ProgressBus()
+    for done in range(0, 1000, 10):
+        bus.publish("a", done / 10, downloaded_bytes=done, total_bytes=1000)
+    changed, _ = bus.drain()
+    assert list(changed) == ["a"]
+    assert changed["a"].downloaded_bytes == 990
+
+    changed, _ = bus.drain()
+    assert changed == {}
+
+
+def test_aggregate_sums_active_downloads() -> None:
+    bus = ProgressBus()
+    bus.publish("a", 50, downloaded_bytes=500, total_bytes=1000, speed_bps=100)
+    bus.publish("b", 25, downloaded_bytes=250, total_bytes=1000, speed_bps=150)
+    _, total = bus.drain()
+    assert total.active == 2
+    assert total.downloaded_bytes == 750
+    assert total.total_bytes == 2000
+    assert total.speed_bps == 250
+    assert total.eta == (2000 - 750) / 250
+    assert total.percent == 37.5
+
+    bus.remove("a")
+    _, total = bus.drain()
+    assert total.active == 1
+    assert total.downloaded_bytes == 250
+
+
+def test_ui_event_load_is_constant_as_speed_grows() -> None:
+    """Simulate 10 frames; UI callbacks must not grow with chunk rate."""
+    frames = 10
+    downloads = 3
+    ui_events_per_speed = {}
+
+    for chunks_per_frame in (1, 10, 100, 1000):
+        bus = ProgressBus()
+        callbacks = [ProgressCallback(bus=bus, key=n) for n in range(downloads)]
+        ui_events = 0
+        for _frame in range(frames):
+            for chunk in range(chunks_per_frame):
+                for callback in callbacks:
+                    callback.update(chunk / chunks_per_frame * 100, "downloading",
+                                    downloaded_bytes=chunk, total_bytes=chunks_per_frame)
+            changed, _ = bus.drain()
+            ui_events += len(changed)
+        ui_events_per_speed[chunks_per_frame] = ui_events
+
+    assert set(ui_events_per_speed.values()) == {frames * downloads}
+
+
+def test_progress_callback_still_calls_plain_callback() -> None:
+    seen = []
+    callback = ProgressCallback(lambda percent, status, speed: seen.append((percent, status, speed)))
+    callback.update(42, "downloading", "1.0 MB/s")
+    assert seen == [(42, "downloading", "1.0 MB/s")]
+    assert callback.last_percent == 42
@@ -0,0 +1,166 @@
+"""Tests for queue_journal.py — CRC-checked append-only queue journal."""
+
+from queue_journal import COMPACT_MIN_RECORDS, QueueJournal, decode_line, encode_record
+
+
+def _journal(tmp_path) -> QueueJournal:
+    journal = QueueJournal(tmp_path / "queue.journal", durable=False)
+    journal.load()
+    return journal
+
+
+def _reopen(journal: QueueJournal) -> QueueJournal:
+    journal.close()
+    return _journal(journal.path.parent)
+
+
+def test_encode_decode_round_trip() -> None:
+    record = {"op": "put", "id": "a", "item": {"title": "Çalışma ünite"}}
+    line = encode_record(record)
+
+    assert line.endswith(b"\n")
+    assert decode_line(line[:-1]) == record
+    assert decode_line(line[:-1].replace(b"a", b"b", 1)) is None
+    assert decode_line(b"garbage") is None
+
+
+def test_records_survive_a_reopen_in_queue_order(tmp_path) -> None:
+    journal = _journal(tmp_path)
+    journal.put_many([("a", {"url": "1"}), ("b", {"url": "2"}), ("c", {"url": "3"})])
+    journal.put("a", {"url": "1", "status": "downloading"})
+    journal.delete("b")
+
+    reopened = _reopen(journal)
+
+    assert reopened.records() == [{"url": "1", "status": "downloading"}, {"url": "3"}]
+    assert reopened.discarded == 0
+
+
+def test_torn_tail_is_cut_off_and_later_writes_stay_readable(tmp_path) -> None:
+    journal = _journal(tmp_path)
+    journal.put_many([("a", {"url": "1"}), ("b", {"url": "2"})])
+    journal.close()
+    with open(journal.path, "ab") as handle:
+        handle.write(encode_record({"op": "put", "id": "c", "item": {"url": "3"}})[:-7])
+
+    reopened = _journal(tmp_path)
+    assert [record["url"] for record in reopened.records()] == ["1", "2"]
+    assert reopened.discarded == 1
+
+    reopened.put("d", {"url": "4"})
+    assert [record["url"] for record in _reopen(reopened).records()] == ["1", "2", "4"]
+
+
+def test_corrupt_line_drops_everything_after_it(tmp_path) -> None:
+    journal = _journal(tmp_path)
+    journal.put_many([("a", {"url": "1"}), ("b", {"url": "2"}), ("c", {"url": "3"})])
+    journal.close()
+    lines = journal.path.read_bytes().splitlines(keepends=True)
+    lines[1] = lines[1].replace(b'"2"', b'"9"')
+    journal.path.write_bytes(b"".join(lines))
+
+    reopened = _journal(tmp_path)
+
+    assert [record["url"] for record in reopened.records()] == ["1"]
+    assert reopened.discarded == 2
+
+
+def test_compaction_keeps_one_line_per_live_item(tmp_path) -> None:
+    journal = _journal(tmp_path)
+    for index in range(COMPACT_MIN_RECORDS + 1):
+        journal.put("a", {"progress": index})
+
+    assert len(journal.path.read_bytes().splitlines()) == 1
+    assert _reopen(journal).records() == [{"progress": COMPACT_MIN_RECORDS}]
+    assert not journal.path.with_name("queue.journal.tmp").exists()
+
+
+def test_retain_forgets_other_items(tmp_path) -> None:
+    journal = _journal(tmp_path)
+    journal.put_many([("a", {"url": "1"}), ("b", {"url": "2"})])
+    journal.retain(["b"])
+
+    assert _reopen(journal).records() == [{"url": "2"}]
+
+
+def test_failed_write_is_recorded_and_rewritten_later(tmp_path, monkeypatch) -> None:
+    journal = _journal(tmp_path)
+    journal.put("a", {"url": "1"})
+
+    def fail(handle) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(journal, "_sync", fail)
+    journal.put("b", {"url": "2"})
+    assert str(journal.last_error) == "disk full"
+
+    monkeypatch.undo()
+    journal.put("c", {"url": "3"})
+    assert journal.last_error is None
+    assert [record["url"] for record in _reopen(journal).records()] == ["1", "2", "3"]
+
+
+def test_new_records_survive_a_torn_tail_that_could_not_be_cut(tmp_path, monkeypatch) -> None:
+    journal = _journal(tmp_path)
+    journal.put_many([("a", {"url": "1"}), ("b", {"url": "2"})])
+    journal.close()
+    with open(journal.path, "ab") as handle:
+        handle.write(b"0badc0de {\"op\":")
+
+    real_open = open
+
+    def no_truncate(path, mode="r", *args, **kwargs):
+        if mode == "r+b":
+            raise PermissionError("read-only")
+        return real_open(path, mode, *args, **kwargs)
+
+    monkeypatch.setattr("builtins.open", no_truncate)
+    reopened = _journal(tmp_path)
+    monkeypatch.undo()
+    assert reopened.discarded == 1
+    assert isinstance(reopened.last_error, PermissionError)
+
+    reopened.put("new", {"url": "3"})
+    again = _reopen(reopened)
+    assert [record["url"] for record in again.records()] == ["1", "2", "3"]
+    assert again.discarded == 0
+
+
+def test_unreadable_journal_is_set_aside_not_compacted_over(tmp_path, monkeypatch) -> None:
+    journal = _journal(tmp_path)
+    journal.put("a", {"url": "1"})
+    journal.close()
+    original = journal.path.read_bytes()
+
+    def unreadable(self):
+        raise PermissionError("locked")
+
+    monkeypatch.setattr("pathlib.Path.read_bytes", unreadable)
+    reopened = _journal(tmp_path)
+    monkeypatch.undo()
+    assert reopened.records() == []
+    assert isinstance(reopened.last_error, PermissionError)
+
+    reopened.retain([])
+    reopened.put("b", {"url": "2"})
+    assert journal.path.with_name("queue.journal.unreadable").read_bytes() == original
+    assert _reopen(reopened).records() == [{"url": "2"}]
+
+
+def test_journal_stops_writing_when_it_can_neither_read_nor_move_the_file(tmp_path, monkeypatch) -> None:
+    journal = _journal(tmp_path)
+    journal.put("a", {"url": "1"})
+    journal.close()
+    original = journal.path.read_bytes()
+
+    def fail(*args, **kwargs):
+        raise PermissionError("locked")
+
+    monkeypatch.setattr("pathlib.Path.read_bytes", fail)
+    monkeypatch.setattr("queue_journal.os.replace", fail)
+    reopened = _journal(tmp_path)
+    monkeypatch.undo()
+
+    reopened.retain([])
+    reopened.put("b", {"url": "2"})
+    assert journal.path.read_bytes() == original
@@ -0,0 +1,113 @@
+"""Tests for widgets/queue_view.py — diff-based queue row updates."""
+
+from widgets.queue_item import QueueItem
+from widgets.queue_view import QueueView, diff_queue
+
+
+class FakeRow:
+    def __init__(self, item, log):
+        self.item = item
+        self.log = log
+        self.log.append(("create", item.url))
+
+    def refresh_status(self):
+        self.log.append(("status", self.item.url, self.item.status))
+
+    def refresh_texts(self):
+        self.log.append(("texts", self.item.url))
+
+    def pack(self, **kwargs):
+        self.log.append(("pack", self.item.url))
+
+    def pack_forget(self):
+        self.log.append(("forget", self.item.url))
+
+    def destroy(self):
+        self.log.append(("destroy", self.item.url))
+
+
+def _make_view(log, empty_calls=None):
+    return QueueView(
+        lambda item: FakeRow(item, log),
+        key=lambda item: item.url,
+        on_empty=(empty_calls.append if empty_calls is not None else None),
+    )
+
+
+def _items(*urls):
+    return [QueueItem(url=url, platform="youtube") for url in urls]
+
+
+# ─── diff_queue ───
+
+def test_diff_detects_added_removed_and_changed() -> None:
+    diff = diff_queue({"a": "pending", "b": "pending"}, [("a", "downloading"), ("c", "pending")])
+    assert diff.added == ["c"]
+    assert diff.removed == ["b"]
+    assert diff.changed == ["a"]
+    assert not diff.reordered
+
+
+def test_diff_flags_reorder_only_when_order_changes() -> None:
+    assert not diff_queue({"a": "p", "b": "p"}, [("a", "p"), ("b", "p")]).reordered
+    assert diff_queue({"a": "p", "b": "p"}, [("b", "p"), ("a", "p")]).reordered
+    assert diff_queue({"a": "p"}, [("new", "p"), ("a", "p")]).reordered
+
+
+def test_diff_of_unchanged_queue_is_empty() -> None:
+    assert diff_queue({"a": "p"}, [("a", "p")]).is_empty
+
+
+# ─── QueueView ───
+
+def test_status_flip_touches_only_that_row() -> None:
+    log = []
+    view = _make_view(log)
+    items = _items(*[f"u{n}" for n in range(100)])
+    view.sync(items)
+    log.clear()
+
+    items[42].status = "downloading"
+    view.sync(items)
+    assert log == [("status", "u42", "downloading")]
+
+    log.clear()
+    view.sync(items)
+    assert log == []
+
+
+def test_add_and_remove_do_not_rebuild_other_rows() -> None:
+    log = []
+    view = _make_view(log)
+    items = _items("a", "b", "c")
+    view.sync(items)
+    log.clear()
+
+    items = [items[0], items[2]] + _items("d")
+    view.sync(items)
+    assert log == [("destroy", "b"), ("create", "d"), ("pack", "d")]
+    assert list(view.rows) == ["a", "c", "d"]
+
+
+def test_reorder_repacks_in_queue_order() -> None:
+    log = []
+    view = _make_view(log)
+    items = _items("a", "b")
+    view.sync(items)
+    log.clear()
+
+    view.sync(list(reversed(items)))
+    assert [entry for entry in log if entry[0] == "create"] == []
+    assert [entry[1] for entry in log if entry[0] == "pack"] == ["b", "a"]
+    assert list(view.rows) == ["b", "a"]
+
+
+def test_empty_callback_fires_on_transitions_only() -> None:
+    log, empty_calls = [], []
+    view = _make_view(log, empty_calls)
+    view.sync([])
+    items = _items("a")
+    view.sync(items)
+    view.sync(items)
+    view.sync([])
+    assert empty_calls == [True, False, True]
@@ -0,0 +1,175 @@
+"""Tests for resumable_download.py — Range resume against a flaky local server."""
+
+import hashlib
+import json
+import threading
+import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+import pytest
+
+from resumable_download import (
+    DownloadError, ResumableDownload, extract_members, parse_content_range,
+)
+
+PAYLOAD = bytes(range(256)) * 1024  # 256 KiB
+
+
+class FlakyServer:
+    """Serves ``payload`` with Range support, dropping the first responses early."""
+
+    def __init__(self, payload: bytes) -> None:
+        self.payload = payload
+        self.etag = '"v1"'
+        self.drops: List[int] = []  # bytes sent before hanging up, one entry per response
+        self.honor_range = True
+        self.ranges: List[Optional[str]] = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args) -> None:
+                pass
+
+            def do_GET(self) -> None:
+                range_header = self.headers.get("Range")
+                server.ranges.append(range_header)
+                start = 0
+                if range_header and server.honor_range and self.headers.get("If-Range", server.etag) == server.etag:
+                    start = int(range_header.split("=")[1].split("-")[0])
+                if start >= len(server.payload):
+                    self.send_response(416)
+                    self.send_header("Content-Range", f"bytes */{len(server.payload)}")
+                    self.end_headers()
+                    return
+                body = server.payload[start:]
+                self.send_response(206 if start else 200)
+                if start:
+                    self.send_header("Content-Range", f"bytes {start}-{len(server.payload) - 1}/{len(server.payload)}")
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("ETag", server.etag)
+                self.end_headers()
+                limit = server.drops.pop(0) if server.drops else len(body)
+                self.wfile.write(body[:limit])
+                self.close_connection = True
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}/ffmpeg.zip"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, args=(0.05,), daemon=True)
+        self.thread.start()
+
+    def close(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def server() -> Iterator[FlakyServer]:
+    flaky = FlakyServer(PAYLOAD)
+    yield flaky
+    flaky.close()
+
+
+def _download(server: FlakyServer, dest: Path, **kwargs) -> ResumableDownload:
+    return ResumableDownload(server.url, dest, chunk_size=8192, timeout=5, retry_delay=0, **kwargs)
+
+
+def test_parse_content_range() -> None:
+    assert parse_content_range("bytes 100-199/1000") == (100, 1000)
+    assert parse_content_range("bytes 0-9/*") == (0, None)
+    assert parse_content_range("garbage") is None
+
+
+def test_resumes_through_dropped_connections(server: FlakyServer, tmp_path: Path) -> None:
+    server.drops = [50_000, 0, 70_000]
+    dest = tmp_path / "ffmpeg.zip"
+    expected = hashlib.sha256(PAYLOAD).hexdigest()
+
+    _download(server, dest, expected_sha256=expected).run()
+
+    assert dest.read_bytes() == PAYLOAD
+    assert server.ranges == [None, "bytes=50000-", "bytes=50000-", "bytes=120000-"]
+    assert not (tmp_path / "ffmpeg.zip.part").exists()
+    assert not (tmp_path / "ffmpeg.zip.part.json").exists()
+
+
+def test_continues_a_partial_file_from_an_earlier_run(server: FlakyServer, tmp_path: Path) -> None:
+    dest = tmp_path / "ffmpeg.zip"
+    (tmp_path / "ffmpeg.zip.part").write_bytes(PAYLOAD[:100_000])
+    (tmp_path / "ffmpeg.zip.part.json").write_text(
+        json.dumps({"url": server.url, "total": len(PAYLOAD), "validator": server.etag})
+    )
+
+    _download(server, dest, expected_sha256=hashlib.sha256(PAYLOAD).hexdigest()).run()
+
+    assert dest.read_bytes() == PAYLOAD
+    assert server.ranges == ["bytes=100000-"]
+
+
+def test_changed_file_restarts_from_zero(server: FlakyServer, tmp_path: Path) -> None:
+    dest = tmp_path / "ffmpeg.zip"
+    (tmp_path / "ffmpeg.zip.part").write_bytes(b"x" * 100_000)
+    (tmp_path / "ffmpeg.zip.part.json").write_text(
+        json.dumps({"url": server.url, "total": len(PAYLOAD), "validator": '"old"'})
+    )
+
+    _download(server, dest).run()
+
+    assert dest.read_bytes() == PAYLOAD
+
+
+def test_server_without_range_support_still_completes(server: FlakyServer, tmp_path: Path) -> None:
+    server.honor_range = False
+    server.drops = [30_000]
+    dest = tmp_path / "ffmpeg.zip"
+
+    _download(server, dest, expected_sha256=hashlib.sha256(PAYLOAD).hexdigest()).run()
+
+    assert dest.read_bytes() == PAYLOAD
+
+
+def test_already_complete_part_is_accepted(server: FlakyServer, tmp_path: Path) -> None:
+    dest = tmp_path / "ffmpeg.zip"
+    (tmp_path / "ffmpeg.zip.part").write_bytes(PAYLOAD)
+    (tmp_path / "ffmpeg.zip.part.json").write_text(json.dumps({"url": server.url, "total": None, "validator": None}))
+
+    _download(server, dest).run()
+
+    assert dest.read_bytes() == PAYLOAD
+    assert server.ranges == [f"bytes={len(PAYLOAD)}-"]
+
+
+def test_checksum_mismatch_discards_the_download(server: FlakyServer, tmp_path: Path) -> None:
+    dest = tmp_path / "ffmpeg.zip"
+
+    with pytest.raises(DownloadError):
+        _download(server, dest, expected_sha256="0" * 64).run()
+
+    assert not dest.exists()
+    assert (tmp_path / "ffmpeg.zip.part").stat().st_size == 0
+
+
+def test_gives_up_when_no_progress_is_made(server: FlakyServer, tmp_path: Path) -> None:
+    server.drops = [0] * 10
+
+    with pytest.raises(DownloadError):
+        _download(server, tmp_path / "ffmpeg.zip", max_stalled_attempts=3).run()
+
+    assert len(server.ranges) == 3
+
+
+def test_extract_members_picks_entries_by_basename(tmp_path: Path) -> None:
+    archive = tmp_path / "ffmpeg.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("ffmpeg-7.0-essentials/doc/readme.txt", "docs")
+        zf.writestr("ffmpeg-7.0-essentials/bin/ffmpeg.exe", b"ffmpeg binary")
+        zf.writestr("ffmpeg-7.0-essentials/bin/ffprobe.exe", b"ffprobe binary")
+    targets = {"ffmpeg.exe": tmp_path / "ffmpeg.exe", "ffprobe.exe": tmp_path / "ffprobe.exe"}
+
+    extracted = extract_members(archive, targets)
+
+    assert extracted == targets
+    assert (tmp_path / "ffmpeg.exe").read_bytes() == b"ffmpeg binary"
+    assert (tmp_path / "ffprobe.exe").read_bytes() == b"ffprobe binary"
+    assert not (tmp_path / "readme.txt").exists()
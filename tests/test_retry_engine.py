@@ -0,0 +1,179 @@
+"""Tests for retry_engine.py — error kinds, backoff and per-platform circuit breakers."""
+
+import io
+
+from yt_dlp.networking import Response
+from yt_dlp.networking.exceptions import HTTPError, TransportError
+from yt_dlp.utils import DownloadError
+
+from retry_engine import (
+    AUTH_REQUIRED, CLOSED, HALF_OPEN, OPEN, PERMANENT, RATE_LIMITED, TRANSIENT,
+    CircuitBreaker, RetryEngine, RetryPolicy, classify_error,
+)
+from widgets.queue_item import QueueItem
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _ytdlp_error(cause: Exception) -> DownloadError:
+    return DownloadError(f"ERROR: unable to download video data: {cause}", exc_info=(type(cause), cause, None))
+
+
+def _http_error(status: int) -> HTTPError:
+    return HTTPError(Response(io.BytesIO(), "https://example.com/v.mp4", {}, status=status))
+
+
+def _failed(platform: str = "youtube", error: str = "timed out", n: int = 0) -> QueueItem:
+    item = QueueItem(url=f"https://example.com/{platform}/{n}", platform=platform)
+    item.status = "error"
+    item.error = error
+    return item
+
+
+def test_http_status_of_the_wrapped_exception_decides() -> None:
+    assert classify_error(_ytdlp_error(_http_error(429))) == RATE_LIMITED
+    assert classify_error(_ytdlp_error(_http_error(401))) == AUTH_REQUIRED
+    assert classify_error(_ytdlp_error(_http_error(503))) == TRANSIENT
+    assert classify_error(_ytdlp_error(_http_error(403))) == TRANSIENT
+    assert classify_error(_ytdlp_error(_http_error(404))) == PERMANENT
+
+
+def test_network_failures_are_transient() -> None:
+    reset = TransportError(cause=ConnectionResetError(104, "Connection reset by peer"))
+    assert classify_error(_ytdlp_error(reset)) == TRANSIENT
+    assert classify_error(TimeoutError("read")) == TRANSIENT
+
+
+def test_instaloader_exceptions_are_matched_by_name() -> None:
+    TooManyRequestsException = type("TooManyRequestsException", (Exception,), {})
+    LoginRequiredException = type("LoginRequiredException", (Exception,), {})
+    ConnectionException = type("ConnectionException", (Exception,), {})
+
+    assert classify_error(TooManyRequestsException("wait")) == RATE_LIMITED
+    assert classify_error(LoginRequiredException("login")) == AUTH_REQUIRED
+    assert classify_error(ConnectionException("JSON Query to graphql/query: HTTP error code 429")) == RATE_LIMITED
+
+
+def test_messages_are_classified_without_an_exception() -> None:
+    assert classify_error("ERROR: [youtube] abc: Sign in to confirm you're not a bot") == AUTH_REQUIRED
+    assert classify_error("Bu içerik için Instagram girişi gerekli") == AUTH_REQUIRED
+    assert classify_error("ERROR: unable to download video data: HTTP Error 404: Not Found") == PERMANENT
+    assert classify_error("ERROR: [youtube] Top 500 goals: Video unavailable") == PERMANENT
+    assert classify_error("") == PERMANENT
+
+
+def test_backoff_grows_exponentially_with_bounded_jitter() -> None:
+    policy = RetryPolicy(base_delay=4, rate_limit_delay=60, multiplier=2, max_delay=100)
+    low = lambda a, b: a  # noqa: E731
+    high = lambda a, b: b  # noqa: E731
+
+    assert [policy.delay(TRANSIENT, n, low) for n in (1, 2, 3)] == [2, 4, 8]
+    assert [policy.delay(TRANSIENT, n, high) for n in (1, 2, 3)] == [4, 8, 16]
+    assert policy.delay(RATE_LIMITED, 1, high) == 60
+    assert policy.delay(RATE_LIMITED, 5, high) == 100
+    assert policy.retries_for(AUTH_REQUIRED) == 0
+    assert policy.retries_for(PERMANENT) == 0
+
+
+def test_transient_failure_is_retried_until_attempts_run_out() -> None:
+    clock = FakeClock()
+    engine = RetryEngine(RetryPolicy(max_retries=2, base_delay=10), failure_threshold=100, clock=clock,
+                         rng=lambda a, b: b)
+    item = _failed()
+
+    assert engine.settle(item)
+    assert (item.status, item.retry_count, item.error_kind) == ("pending", 1, TRANSIENT)
+    assert item.next_retry_at == clock.now + 10
+    assert not engine.ready(item)
+    clock.now += 10
+    assert engine.ready(item)
+
+    item.status = "error"
+    assert engine.settle(item) and item.retry_count == 2
+    item.status = "error"
+    assert not engine.settle(item)
+    assert item.status == "error"
+
+
+def test_permanent_and_auth_failures_are_not_retried() -> None:
+    engine = RetryEngine(clock=FakeClock())
+    dead = _failed(error="ERROR: Unsupported URL: https://example.com")
+    login = _failed(error="irrelevant")
+    login.error_kind = AUTH_REQUIRED
+
+    assert not engine.settle(dead) and dead.error_kind == PERMANENT
+    assert not engine.settle(login) and login.status == "error"
+    assert engine.breaker("youtube").state == CLOSED
+
+
+def test_rate_limit_pauses_only_that_platform() -> None:
+    clock = FakeClock()
+    engine = RetryEngine(cooldown=60, clock=clock)
+    engine.settle(_failed("instagram", "HTTP error code 429"))
+    waiting = QueueItem(url="https://instagram.com/p/x", platform="instagram")
+    other = QueueItem(url="https://vimeo.com/1", platform="vimeo")
+
+    assert engine.paused_platforms() == {"instagram": clock.now + 60}
+    assert not engine.ready(waiting)
+    assert engine.ready(other)
+    assert engine.next_wakeup([waiting]) == clock.now + 60
+
+
+def test_breaker_opens_after_consecutive_transient_failures() -> None:
+    breaker = CircuitBreaker(failure_threshold=3, cooldown=30, clock=FakeClock())
+    breaker.record_failure(TRANSIENT)
+    breaker.record_failure(TRANSIENT)
+    breaker.record_success()
+    breaker.record_failure(TRANSIENT)
+    breaker.record_failure(TRANSIENT)
+    assert breaker.state == CLOSED
+
+    breaker.record_failure(TRANSIENT)
+    assert breaker.state == OPEN
+
+
+def test_half_open_breaker_lets_one_probe_through() -> None:
+    clock = FakeClock()
+    breaker = CircuitBreaker(cooldown=30, max_cooldown=100, clock=clock)
+    breaker.record_failure(RATE_LIMITED)
+    clock.now += 30
+
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow()
+    assert not breaker.allow()
+
+    breaker.record_failure(TRANSIENT)  # the probe failed: twice as long
+    assert breaker.state == OPEN and breaker.reopen_at == clock.now + 60
+    clock.now += 60
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CLOSED and breaker.allow() and breaker.allow()
+
+
+def test_lost_probe_expires() -> None:
+    clock = FakeClock()
+    breaker = CircuitBreaker(cooldown=30, clock=clock)
+    breaker.record_failure(RATE_LIMITED)
+    clock.now += 30
+    assert breaker.allow()
+
+    clock.now += 29
+    assert not breaker.allow()
+    clock.now += 1
+    assert breaker.allow()
+
+
+def test_retry_fields_round_trip_through_the_journal_record() -> None:
+    item = _failed()
+    RetryEngine(clock=FakeClock()).settle(item)
+    restored = QueueItem.from_record(item.to_record())
+
+    assert (restored.retry_count, restored.next_retry_at, restored.error_kind) == (
+        item.retry_count, item.next_retry_at, TRANSIENT,
+    )
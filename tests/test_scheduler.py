@@ -0,0 +1,132 @@
+"""Tests for scheduler.py — queue worker pool and concurrency caps."""
+
+import threading
+
+from retry_engine import RetryEngine, RetryPolicy
+from scheduler import QueueScheduler
+from widgets.queue_item import QueueItem
+
+
+def _make_scheduler(items, release: threading.Event, **kwargs):
+    lock = threading.Lock()
+    peak = {"total": 0, "instagram": 0}
+
+    def worker(item):
+        with lock:
+            active = [i for i in items if i.status == "downloading"]
+            peak["total"] = max(peak["total"], len(active))
+            peak["instagram"] = max(
+                peak["instagram"], sum(1 for i in active if i.platform == "instagram")
+            )
+        release.wait(2)
+        item.status = "completed"
+
+    def get_pending():
+        return [item for item in items if item.status == "pending"]
+
+    return QueueScheduler(worker, get_pending, **kwargs), peak
+
+
+def _errored(platform: str, error: str) -> QueueItem:
+    item = QueueItem(url=f"https://example.com/{platform}", platform=platform)
+    item.status = "error"
+    item.error = error
+    return item
+
+
+def test_global_cap_limits_active_workers() -> None:
+    items = [QueueItem(url=f"https://youtube.com/watch?v={i}", platform="youtube") for i in range(6)]
+    release = threading.Event()
+    scheduler, _ = _make_scheduler(items, release, max_concurrent=2, platform_limits={"youtube": 4})
+
+    assert scheduler.start() == 2
+    assert scheduler.active_count() == 2
+    assert sum(1 for item in items if item.status == "downloading") == 2
+    release.set()
+
+
+def test_platform_cap_does_not_block_other_platforms() -> None:
+    items = [QueueItem(url=f"https://instagram.com/p/{i}", platform="instagram") for i in range(3)]
+    items += [QueueItem(url=f"https://youtube.com/watch?v={i}", platform="youtube") for i in range(2)]
+    release = threading.Event()
+    scheduler, _ = _make_scheduler(items, release, max_concurrent=3, platform_limits={"instagram": 1})
+
+    assert scheduler.start() == 3
+    assert scheduler.active_count("instagram") == 1
+    assert scheduler.active_count("youtube") == 2
+    release.set()
+
+
+def test_queue_drains_and_reports_idle_once() -> None:
+    items = [QueueItem(url=f"https://instagram.com/p/{i}", platform="instagram") for i in range(4)]
+    items += [QueueItem(url=f"https://vimeo.com/{i}", platform="vimeo") for i in range(4)]
+    release = threading.Event()
+    release.set()
+    idle = threading.Event()
+    idle_calls = []
+
+    scheduler, peak = _make_scheduler(items, release, max_concurrent=3, platform_limits={"instagram": 1})
+    scheduler.on_idle = lambda: (idle_calls.append(1), idle.set())
+    scheduler.start()
+
+    assert idle.wait(5)
+    assert all(item.status == "completed" for item in items)
+    assert idle_calls == [1]
+    assert peak["total"] <= 3
+    assert peak["instagram"] <= 1
+    assert not scheduler.is_running
+
+
+def test_worker_exception_marks_item_error() -> None:
+    item = QueueItem(url="https://vimeo.com/1", platform="vimeo")
+    idle = threading.Event()
+
+    def worker(_item):
+        raise RuntimeError("boom")
+
+    scheduler = QueueScheduler(
+        worker, lambda: [item] if item.status == "pending" else [], on_idle=idle.set
+    )
+    scheduler.start()
+
+    assert idle.wait(5)
+    assert item.status == "error"
+    assert item.error == "boom"
+
+
+def test_failed_item_is_retried_after_its_backoff() -> None:
+    item = QueueItem(url="https://vimeo.com/1", platform="vimeo")
+    attempts = []
+    idle = threading.Event()
+
+    def worker(queued):
+        attempts.append(queued.status)
+        queued.status = "error" if len(attempts) < 3 else "completed"
+        queued.error = "Connection reset by peer"
+        engine.settle(queued)
+
+    engine = RetryEngine(RetryPolicy(base_delay=0.1), failure_threshold=10)
+    scheduler = QueueScheduler(
+        worker, lambda: [item] if item.status == "pending" else [], on_idle=idle.set, retry=engine,
+    )
+    scheduler.start()
+
+    assert idle.wait(5)
+    assert len(attempts) == 3
+    assert item.status == "completed"
+    assert item.retry_count == 2
+
+
+def test_open_breaker_holds_its_platform_but_not_others() -> None:
+    engine = RetryEngine(cooldown=60)
+    engine.settle(_errored("instagram", "HTTP error code 429"))
+    items = [QueueItem(url="https://instagram.com/p/a", platform="instagram")]
+    items += [QueueItem(url=f"https://vimeo.com/{i}", platform="vimeo") for i in range(2)]
+    release = threading.Event()
+    release.set()
+    scheduler, _ = _make_scheduler(items, release, max_concurrent=3, retry=engine)
+
+    assert scheduler.start() == 2
+    assert items[0].status == "pending"
+    assert scheduler.is_running  # waiting for the breaker, not idle
+    scheduler.stop()
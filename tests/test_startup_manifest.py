@@ -0,0 +1,92 @@
+"""Tests for startup_manifest.py — launcher warm-start manifest."""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+from startup_manifest import (
+    MANIFEST_VERSION, StartupManifest, clear_manifest, file_digest, load_manifest, save_manifest,
+)
+
+
+def _make_ffmpeg(directory: Path) -> Path:
+    binary = directory / "ffmpeg"
+    binary.write_bytes(b"fake ffmpeg")
+    return binary
+
+
+def test_file_digest_tracks_contents(tmp_path: Path) -> None:
+    requirements = tmp_path / "requirements.txt"
+    requirements.write_text("yt-dlp>=2024.1.1\n")
+    first = file_digest(requirements)
+
+    requirements.write_text("yt-dlp>=2025.1.1\n")
+
+    assert first and file_digest(requirements) != first
+    assert file_digest(tmp_path / "missing.txt") == ""
+
+
+def test_unchanged_environment_is_warm(tmp_path: Path) -> None:
+    ffmpeg = _make_ffmpeg(tmp_path)
+    manifest = StartupManifest.capture("abc", ffmpeg, str(tmp_path))
+
+    assert manifest.is_warm("abc")
+    assert manifest.path_dir == str(tmp_path)
+
+
+def test_requirements_change_invalidates_packages(tmp_path: Path) -> None:
+    manifest = StartupManifest.capture("abc", _make_ffmpeg(tmp_path))
+
+    assert not manifest.packages_valid("def")
+    assert not manifest.is_warm("def")
+
+
+def test_other_interpreter_invalidates_packages(tmp_path: Path) -> None:
+    manifest = StartupManifest.capture("abc", _make_ffmpeg(tmp_path))
+    manifest.python = sys.executable + "-other"
+
+    assert not manifest.is_warm("abc")
+
+
+def test_replaced_ffmpeg_invalidates_manifest(tmp_path: Path) -> None:
+    ffmpeg = _make_ffmpeg(tmp_path)
+    manifest = StartupManifest.capture("abc", ffmpeg)
+
+    stat = ffmpeg.stat()
+    os.utime(ffmpeg, (stat.st_atime, stat.st_mtime + 10))
+    assert not manifest.ffmpeg_valid()
+
+    ffmpeg.unlink()
+    assert not manifest.ffmpeg_valid()
+
+
+def test_start_without_ffmpeg_only_skips_packages(tmp_path: Path) -> None:
+    manifest = StartupManifest.capture("abc", None)
+
+    assert manifest.packages_valid("abc")
+    assert not manifest.is_warm("abc")
+
+
+def test_save_load_round_trip_and_clear(tmp_path: Path) -> None:
+    manifest_file = tmp_path / "startup.json"
+    manifest = StartupManifest.capture("abc", _make_ffmpeg(tmp_path), str(tmp_path))
+
+    save_manifest(manifest, manifest_file)
+    assert load_manifest(manifest_file) == manifest
+
+    clear_manifest(manifest_file)
+    assert load_manifest(manifest_file) is None
+
+
+def test_corrupt_or_outdated_manifest_is_ignored(tmp_path: Path) -> None:
+    manifest_file = tmp_path / "startup.json"
+
+    manifest_file.write_text("{not json")
+    assert load_manifest(manifest_file) is None
+
+    manifest_file.write_text(json.dumps({"version": MANIFEST_VERSION + 1, "manifest": {}}))
+    assert load_manifest(manifest_file) is None
+
+    manifest_file.write_text(json.dumps({"version": MANIFEST_VERSION, "manifest": {"bogus": 1}}))
+    assert load_manifest(manifest_file) is None
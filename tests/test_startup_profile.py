@@ -0,0 +1,87 @@
+"""Tests for startup_profile.py — startup phase timings and reports."""
+
+import json
+import threading
+from pathlib import Path
+
+from startup_profile import StartupProfiler, list_reports, top_level_totals
+
+
+def test_disabled_profiler_records_nothing(tmp_path: Path) -> None:
+    profiler = StartupProfiler(enabled=False, report_dir=tmp_path)
+
+    with profiler.phase("setup_ui"):
+        profiler.mark("first_map")
+
+    assert profiler.phases == [] and profiler.marks == {}
+    assert profiler.finish() is None
+    assert list_reports(tmp_path) == []
+
+
+def test_nested_phases_record_their_stack() -> None:
+    profiler = StartupProfiler(enabled=True)
+
+    with profiler.phase("app.construct"):
+        with profiler.phase("setup_ui"):
+            with profiler.phase("create_header"):
+                pass
+
+    stacks = {p["name"]: p["stack"] for p in profiler.phases}
+    assert stacks == {
+        "app.construct": "app.construct",
+        "setup_ui": "app.construct;setup_ui",
+        "create_header": "app.construct;setup_ui;create_header",
+    }
+    outer = next(p for p in profiler.phases if p["name"] == "app.construct")
+    inner = next(p for p in profiler.phases if p["name"] == "create_header")
+    assert outer["start_ms"] <= inner["start_ms"]
+    assert outer["duration_ms"] >= inner["duration_ms"]
+
+
+def test_threads_keep_separate_stacks() -> None:
+    profiler = StartupProfiler(enabled=True)
+
+    def worker() -> None:
+        with profiler.phase("launcher.checks"):
+            pass
+
+    with profiler.phase("launcher.window"):
+        thread = threading.Thread(target=worker, name="checks")
+        thread.start()
+        thread.join()
+
+    checks = next(p for p in profiler.phases if p["name"] == "launcher.checks")
+    assert checks["stack"] == "launcher.checks"
+    assert checks["thread"] == "checks"
+
+
+def test_folded_stacks_report_self_time() -> None:
+    profiler = StartupProfiler(enabled=True)
+    profiler.phases = [
+        {"name": "setup_ui", "stack": "setup_ui", "thread": "MainThread", "start_ms": 0.0, "duration_ms": 10.0},
+        {"name": "create_header", "stack": "setup_ui;create_header", "thread": "MainThread",
+         "start_ms": 1.0, "duration_ms": 4.0},
+    ]
+
+    lines = profiler.folded().splitlines()
+
+    assert lines == ["MainThread;setup_ui 6000", "MainThread;setup_ui;create_header 4000"]
+
+
+def test_finish_writes_trace_and_keeps_last_runs(tmp_path: Path) -> None:
+    written = []
+    for _ in range(4):
+        profiler = StartupProfiler(enabled=True, report_dir=tmp_path, keep=3)
+        with profiler.phase("load_history"):
+            pass
+        written.append(profiler.finish())
+        assert profiler.finish() is None  # only once per run
+
+    reports = list_reports(tmp_path)
+    assert reports == written[1:]
+    assert len(list(tmp_path.glob("*.folded"))) == 3
+
+    report = json.loads(reports[-1].read_text(encoding="utf-8"))
+    assert top_level_totals(report).keys() == {"load_history"}
+    assert "finished" in report["marks"]
+    assert any(event["ph"] == "X" and event["name"] == "load_history" for event in report["traceEvents"])
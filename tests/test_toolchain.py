@@ -0,0 +1,89 @@
+"""Tests for toolchain.py — cached ffmpeg/ffprobe probing."""
+
+import os
+import stat
+from pathlib import Path
+
+import pytest
+
+from toolchain import ToolchainRegistry, _parse_component_list
+
+FAKE_FFMPEG = """#!/bin/sh
+echo probe >> "{counter}"
+case "$*" in
+  *-encoders*) printf ' V..... = Video\\n ------\\n V....D libx264   H.264\\n A....D libmp3lame  MP3\\n' ;;
+  *-muxers*) printf ' .E = Muxing supported\\n --\\n  E mp4   MP4\\n  E matroska,webm  Matroska\\n' ;;
+  *) echo "ffmpeg version 6.1-test Copyright" ;;
+esac
+"""
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="fake ffmpeg is a shell script")
+
+
+def _make_fake_ffmpeg(directory: Path) -> Path:
+    counter = directory / "probes.log"
+    binary = directory / "ffmpeg"
+    binary.write_text(FAKE_FFMPEG.format(counter=counter))
+    binary.chmod(binary.stat().st_mode | stat.S_IEXEC)
+    return binary
+
+
+def _probe_count(directory: Path) -> int:
+    counter = directory / "probes.log"
+    return len(counter.read_text().splitlines()) if counter.exists() else 0
+
+
+def test_probe_records_version_encoders_and_muxers(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("PATH", "")
+    _make_fake_ffmpeg(tmp_path)
+    registry = ToolchainRegistry(cache_file=tmp_path / "cache.json", search_dirs=[tmp_path])
+
+    info = registry.get("ffmpeg")
+
+    assert info is not None
+    assert info.version == "6.1-test"
+    assert registry.has_encoder("libmp3lame")
+    assert registry.has_muxer("mp4")
+    assert registry.has_muxer("webm")
+
+
+def test_probe_runs_once_per_process(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("PATH", "")
+    _make_fake_ffmpeg(tmp_path)
+    registry = ToolchainRegistry(cache_file=tmp_path / "cache.json", search_dirs=[tmp_path])
+
+    registry.get("ffmpeg")
+    spawned = _probe_count(tmp_path)
+    for _ in range(10):
+        registry.ffmpeg_path()
+
+    assert _probe_count(tmp_path) == spawned
+
+
+def test_cache_file_skips_probe_until_binary_changes(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("PATH", "")
+    binary = _make_fake_ffmpeg(tmp_path)
+    cache_file = tmp_path / "cache.json"
+    ToolchainRegistry(cache_file=cache_file, search_dirs=[tmp_path]).get("ffmpeg")
+    spawned = _probe_count(tmp_path)
+
+    warm = ToolchainRegistry(cache_file=cache_file, search_dirs=[tmp_path]).get("ffmpeg")
+    assert warm is not None and warm.version == "6.1-test"
+    assert _probe_count(tmp_path) == spawned
+
+    os.utime(binary, (binary.stat().st_atime, binary.stat().st_mtime + 10))
+    ToolchainRegistry(cache_file=cache_file, search_dirs=[tmp_path]).get("ffmpeg")
+    assert _probe_count(tmp_path) > spawned
+
+
+def test_missing_tool_returns_none(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("PATH", "")
+    registry = ToolchainRegistry(cache_file=tmp_path / "cache.json", search_dirs=[tmp_path])
+    assert registry.get("ffmpeg") is None
+    assert registry.ffmpeg_path() is None
+    assert not registry.has_encoder("libmp3lame")
+
+
+def test_parse_component_list_ignores_header() -> None:
+    output = " V..... = Video\n ------\n V....D libx264  H.264\n A....D aac  AAC\n"
+    assert _parse_component_list(output) == ["aac", "libx264"]
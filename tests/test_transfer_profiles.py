@@ -0,0 +1,62 @@
+"""Tests for transfer_profiles.py — per-platform yt-dlp transfer settings."""
+
+from constants import DEFAULT_SETTINGS, PLATFORM_TRANSFER_PROFILES
+from transfer_profiles import MIB, TransferProfile, default_profile, profile_for, profile_overrides
+
+
+def test_platform_defaults_override_the_base_profile() -> None:
+    youtube = default_profile("youtube")
+    assert youtube.chunk_size_mb == PLATFORM_TRANSFER_PROFILES["youtube"]["chunk_size_mb"]
+    assert default_profile("twitch").fragment_concurrency == 8
+    assert default_profile("unknown-platform") == default_profile("dailymotion")
+
+
+def test_ydl_options() -> None:
+    options = TransferProfile(fragment_concurrency=8, chunk_size_mb=10, retries=5, buffer_kb=64).ydl_options()
+    assert options == {
+        "concurrent_fragment_downloads": 8,
+        "retries": 5,
+        "fragment_retries": 5,
+        "http_chunk_size": 10 * MIB,
+        "buffersize": 64 * 1024,
+        "noresizebuffer": True,
+    }
+
+
+def test_zero_chunk_and_buffer_keep_ytdlp_defaults() -> None:
+    options = TransferProfile(chunk_size_mb=0, buffer_kb=0).ydl_options()
+    assert "http_chunk_size" not in options
+    assert "buffersize" not in options
+    assert "noresizebuffer" not in options
+
+
+def test_from_dict_ignores_bad_values_and_clamps() -> None:
+    base = TransferProfile(fragment_concurrency=4, retries=10)
+    profile = TransferProfile.from_dict(
+        {"fragment_concurrency": "999", "retries": "many", "chunk_size_mb": -3, "bogus": 1}, base
+    )
+    assert profile.fragment_concurrency == 32
+    assert profile.retries == 10
+    assert profile.chunk_size_mb == 0
+
+
+def test_profile_for_applies_user_overrides() -> None:
+    overrides = {"youtube": {"fragment_concurrency": 16}}
+    profile = profile_for("youtube", overrides)
+    assert profile.fragment_concurrency == 16
+    assert profile.chunk_size_mb == default_profile("youtube").chunk_size_mb
+    assert profile_for("vimeo", overrides) == default_profile("vimeo")
+    # Settings files written by hand
+    assert profile_for("youtube", {"youtube": "fast"}) == default_profile("youtube")
+    assert profile_for("youtube", None) == default_profile("youtube")
+
+
+def test_profile_overrides_keep_only_changed_fields() -> None:
+    profiles = {
+        "youtube": default_profile("youtube"),
+        "twitch": TransferProfile.from_dict({"retries": 3}, default_profile("twitch")),
+    }
+    overrides = profile_overrides(profiles)
+    assert overrides == {"twitch": {"retries": 3}}
+    assert profile_for("twitch", overrides) == profiles["twitch"]
+    assert DEFAULT_SETTINGS["transfer_profiles"] == {}
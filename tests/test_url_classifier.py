@@ -0,0 +1,73 @@
+"""Tests for url_classifier.py — host-table URL classification."""
+
+import pytest
+
+from url_classifier import classify_url, lookup_host
+
+
+# ─── lookup_host ───
+
+def test_lookup_host_walks_parent_domains() -> None:
+    assert lookup_host("youtube.com") == "youtube"
+    assert lookup_host("m.youtube.com") == "youtube"
+    assert lookup_host("vm.tiktok.com") == "tiktok"
+    assert lookup_host("example.com") is None
+    assert lookup_host("localhost") is None
+
+
+def test_lookup_host_matches_whole_labels_only() -> None:
+    assert lookup_host("netflix.com") is None
+    assert lookup_host("notyoutube.com") is None
+    assert lookup_host("youtube.com.evil.net") is None
+
+
+# ─── classify_url ───
+
+@pytest.mark.parametrize("url, platform, kind, media_id, owner", [
+    ("https://www.youtube.com/watch?v=abc123&si=x", "youtube", "video", "abc123", None),
+    ("https://youtu.be/abc123?t=10", "youtube", "video", "abc123", None),
+    ("https://www.youtube.com/shorts/Sh0rt", "youtube", "short", "Sh0rt", None),
+    ("https://www.youtube.com/playlist?list=PLxyz", "youtube", "playlist", "PLxyz", None),
+    ("https://www.youtube.com/@someone", "youtube", "channel", None, "someone"),
+    ("https://www.tiktok.com/@user/video/7312", "tiktok", "video", "7312", "user"),
+    ("https://vm.tiktok.com/ZMabc/", "tiktok", "video", None, None),
+    ("https://www.instagram.com/p/ABCdef123/", "instagram", "post", "ABCdef123", None),
+    ("https://www.instagram.com/cey_lazuli/reel/ABC-ef_1/", "instagram", "reel", "ABC-ef_1", "cey_lazuli"),
+    ("https://www.instagram.com/tv/XYZ/", "instagram", "reel", "XYZ", None),
+    ("https://www.instagram.com/stories/testuser/3456789/", "instagram", "story", "3456789", "testuser"),
+    ("https://www.facebook.com/watch/?v=100", "facebook", "video", "100", None),
+    ("https://www.facebook.com/page/videos/555/", "facebook", "video", "555", "page"),
+    ("https://x.com/someone/status/1789", "twitter", "post", "1789", "someone"),
+    ("https://player.vimeo.com/video/76979871", "vimeo", "video", "76979871", None),
+    ("https://www.dailymotion.com/video/x7tgad0_some-title", "dailymotion", "video", "x7tgad0", None),
+    ("https://clips.twitch.tv/FunnyClip", "twitch", "clip", "FunnyClip", None),
+    ("https://www.twitch.tv/streamer", "twitch", "live", None, "streamer"),
+])
+def test_classify_url_kinds(url, platform, kind, media_id, owner) -> None:
+    info = classify_url(url)
+    assert (info.platform, info.kind, info.media_id, info.owner) == (platform, kind, media_id, owner)
+
+
+def test_classify_url_normalizes_once() -> None:
+    info = classify_url("  https://WWW.YouTube.com/watch?v=abc&si=track&list=PL1#frag  ")
+    assert info.host == "www.youtube.com"
+    assert info.normalized == "https://WWW.YouTube.com/watch?v=abc&list=PL1"
+
+
+def test_classify_url_without_scheme() -> None:
+    info = classify_url("instagram.com/p/abc")
+    assert info.platform == "instagram"
+    assert info.media_id == "abc"
+    assert info.normalized == "instagram.com/p/abc"
+
+
+def test_classify_url_unsupported_and_garbage() -> None:
+    assert not classify_url("https://www.netflix.com/title/1").supported
+    assert classify_url("").normalized == ""
+    assert classify_url("not-a-url").platform is None
+    assert classify_url("http://[::1").platform is None
+
+
+def test_classify_url_is_cached() -> None:
+    url = "https://www.youtube.com/watch?v=cached"
+    assert classify_url(url) is classify_url(url)
@@ -0,0 +1,92 @@
+"""Tests for url_import.py — streaming, deduplicating URL import."""
+
+from pathlib import Path
+
+from url_import import UrlCollector, UrlImportScan, collect_urls
+
+
+def _write_export(path: Path, count: int) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("# exported queue\n")
+        for n in range(count):
+            f.write(f"https://www.youtube.com/watch?v={n:011d}&si=share{n}\n")
+        f.write("https://www.youtube.com/watch?v=00000000000\n")  # duplicate once normalized
+        f.write("https://example.com/not-supported\n")
+
+
+# ─── UrlCollector ───
+
+def test_collector_dedupes_on_normalized_url() -> None:
+    collector = UrlCollector().add_lines([
+        "https://www.instagram.com/p/abc/?igsh=one",
+        "https://www.instagram.com/p/abc/?igsh=two",
+        "",
+        "# comment",
+        "not a url",
+        "https://youtu.be/xyz",
+    ])
+
+    assert collector.urls == ["https://www.instagram.com/p/abc/", "https://youtu.be/xyz"]
+    assert (collector.counts.lines, collector.counts.urls) == (6, 2)
+    assert (collector.counts.duplicates, collector.counts.skipped) == (1, 1)
+
+
+def test_collect_urls_keeps_first_seen_order() -> None:
+    text = "https://vimeo.com/2\nhttps://vimeo.com/1\nhttps://vimeo.com/2\n"
+    assert collect_urls(text) == ["https://vimeo.com/2", "https://vimeo.com/1"]
+
+
+# ─── UrlImportScan ───
+
+def test_file_scan_streams_counts_and_preview(tmp_path: Path) -> None:
+    export = tmp_path / "urls.txt"
+    _write_export(export, 5000)
+    previews, progress, finished = [], [], []
+
+    scan = UrlImportScan.from_file(
+        export,
+        on_preview=lambda lines, truncated: previews.append((lines, truncated)),
+        on_progress=progress.append,
+        on_done=finished.append,
+        preview_lines=10,
+        progress_every=1000,
+    )
+    scan.start().join(5)
+
+    assert finished == [scan]
+    assert len(scan.urls) == 5000
+    assert (scan.counts.duplicates, scan.counts.skipped) == (1, 1)
+    assert [counts.lines for counts in progress] == [1000, 2000, 3000, 4000, 5000]
+    assert progress[0].urls == 999  # copies, not the live counter
+    [(lines, truncated)] = previews
+    assert truncated and len(lines) == 10 and lines[0] == "# exported queue"
+
+
+def test_short_file_preview_is_not_truncated(tmp_path: Path) -> None:
+    export = tmp_path / "urls.txt"
+    export.write_text("\ufeffhttps://youtu.be/abc\n", encoding="utf-8")
+    previews = []
+
+    scan = UrlImportScan.from_file(export, on_preview=lambda lines, truncated: previews.append((lines, truncated)))
+    scan.run()
+
+    assert scan.urls == ["https://youtu.be/abc"]
+    assert previews == [(["https://youtu.be/abc"], False)]
+
+
+def test_missing_file_reports_error(tmp_path: Path) -> None:
+    scan = UrlImportScan.from_file(tmp_path / "missing.txt")
+    scan.run()
+
+    assert scan.error is not None
+    assert scan.done.is_set()
+    assert scan.urls == []
+
+
+def test_cancelled_scan_stops_reading() -> None:
+    scan = UrlImportScan.from_text("https://youtu.be/a\nhttps://youtu.be/b\n")
+    scan.cancel()
+    scan.run()
+
+    assert scan.cancelled
+    assert scan.counts.lines == 0
@@ -2,7 +2,7 @@
 
 from utils import (
     detect_platform, get_platform_icon, get_platform_color,
-    normalize_media_url, format_size, Debouncer,
+    normalize_media_url, format_size, parse_size, Debouncer,
     extract_urls_from_text, get_platform_download_path,
 )
 from constants import PLATFORM_ICONS, PLATFORM_COLORS
@@ -102,6 +102,16 @@ def test_format_size() -> None:
     assert format_size(1073741824) == "1.00 GB"
 
 
+def test_parse_size_round_trips_format_size() -> None:
+    assert parse_size("500 B") == 500
+    assert parse_size(format_size(1048576)) == 1048576
+    assert parse_size("1.5 GB") == int(1.5 * 1024 ** 3)
+    assert parse_size("100mb") == 100 * 1024 ** 2
+    assert parse_size("12,5 KB") == 12800
+    assert parse_size("") is None
+    assert parse_size("huge") is None
+
+
 # ─── extract_urls_from_text ───
 
 def test_extract_urls_basic() -> None:
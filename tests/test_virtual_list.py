@@ -0,0 +1,33 @@
+"""Tests for widgets/virtual_list.py — viewport window arithmetic."""
+
+from widgets.virtual_list import (
+    clamp_first, first_for_fraction, scroll_fractions, visible_range,
+)
+
+
+def test_visible_range_is_bounded_by_capacity() -> None:
+    assert visible_range(0, 5000, 8) == (0, 8)
+    assert visible_range(100, 5000, 8) == (100, 108)
+
+
+def test_visible_range_clamps_past_the_end() -> None:
+    assert visible_range(4999, 5000, 8) == (4992, 5000)
+    assert visible_range(-3, 5000, 8) == (0, 8)
+
+
+def test_short_lists_show_everything() -> None:
+    assert clamp_first(10, 3, 8) == 0
+    assert visible_range(10, 3, 8) == (0, 3)
+    assert visible_range(0, 0, 8) == (0, 0)
+
+
+def test_scroll_fractions_track_window() -> None:
+    assert scroll_fractions(0, 0, 8) == (0.0, 1.0)
+    assert scroll_fractions(0, 4, 8) == (0.0, 1.0)
+    assert scroll_fractions(50, 100, 10) == (0.5, 0.6)
+
+
+def test_first_for_fraction_round_trips() -> None:
+    assert first_for_fraction(0.5, 100, 10) == 50
+    assert first_for_fraction(1.0, 100, 10) == 90
+    assert first_for_fraction(0.0, 100, 10) == 0
@@ -0,0 +1,89 @@
+"""Tests for ydl_pool.py — keyed YoutubeDL instance reuse."""
+
+import threading
+
+from ydl_pool import YoutubeDLPool, make_pool_key
+
+
+class FakeYDL:
+    def __init__(self, params):
+        self.params = params
+        self._progress_hooks = []
+        self._postprocessor_hooks = []
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def test_pool_key_ignores_per_call_hooks() -> None:
+    base = {"format": "best", "outtmpl": "/tmp/%(title)s.%(ext)s"}
+    assert make_pool_key(base) == make_pool_key({**base, "progress_hooks": [print]})
+    assert make_pool_key(base) != make_pool_key({**base, "format": "bestaudio/best"})
+
+
+def test_checkout_reuses_instance_for_same_options() -> None:
+    pool = YoutubeDLPool(factory=FakeYDL)
+    options = {"format": "best"}
+
+    with pool.checkout(options) as first:
+        pass
+    with pool.checkout(options) as second:
+        pass
+
+    assert first is second
+    assert pool.created == 1
+    assert pool.reused == 1
+
+
+def test_checkout_separates_different_options() -> None:
+    pool = YoutubeDLPool(factory=FakeYDL)
+    with pool.checkout({"format": "best"}) as video:
+        pass
+    with pool.checkout({"format": "bestaudio/best", "postprocessors": [{"key": "FFmpegExtractAudio"}]}) as audio:
+        pass
+    assert video is not audio
+    assert "progress_hooks" not in audio.params
+
+
+def test_checkout_swaps_progress_hook() -> None:
+    pool = YoutubeDLPool(factory=FakeYDL)
+    hook_a, hook_b = (lambda d: None), (lambda d: None)
+
+    with pool.checkout({"format": "best", "progress_hooks": [hook_a]}) as ydl:
+        assert ydl._progress_hooks == [hook_a]
+    assert ydl._progress_hooks == []
+
+    with pool.checkout({"format": "best", "progress_hooks": [hook_b]}) as ydl:
+        assert ydl._progress_hooks == [hook_b]
+
+
+def test_concurrent_checkouts_get_distinct_instances() -> None:
+    pool = YoutubeDLPool(max_idle_per_key=2, factory=FakeYDL)
+    barrier = threading.Barrier(3)
+    seen = []
+
+    def worker():
+        with pool.checkout({"format": "best"}) as ydl:
+            seen.append(ydl)
+            barrier.wait(2)
+
+    threads = [threading.Thread(target=worker) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(ydl) for ydl in seen}) == 3
+    assert pool.idle_count() == 2
+    assert sum(ydl.closed for ydl in seen) == 1
+
+
+def test_disabled_pool_closes_every_instance() -> None:
+    pool = YoutubeDLPool(max_idle_per_key=0, factory=FakeYDL)
+    with pool.checkout({"format": "best"}) as first:
+        pass
+    with pool.checkout({"format": "best"}) as second:
+        pass
+    assert first is not second
+    assert first.closed and second.closed
@@ -0,0 +1,241 @@
+"""
+Toolchain registry - probes ffmpeg/ffprobe once and caches the result.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import threading
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+TOOL_NAMES = ("ffmpeg", "ffprobe")
+CACHE_VERSION = 1
+
+
+def get_managed_ffmpeg_dir() -> Path:
+    """Directory the launcher downloads FFmpeg into (survives app updates)."""
+    app_data = Path(os.environ.get("LOCALAPPDATA", Path.home() / "AppData" / "Local"))
+    return app_data / "SyronssMediaDownloader" / "ffmpeg"
+
+
+def get_default_search_dirs() -> List[Path]:
+    """Extra directories searched when a tool is not on PATH."""
+    app_dir = Path(sys.executable).parent if getattr(sys, "frozen", False) else Path(__file__).parent
+    return [
+        get_managed_ffmpeg_dir(),
+        app_dir / "bin",
+        Path.home() / "AppData" / "Local" / "yt-dlp",
+    ]
+
+
+@dataclass
+class ToolInfo:
+    """Probe result for a single executable."""
+
+    name: str
+    path: str
+    mtime: float
+    size: int
+    version: str = ""
+    encoders: List[str] = field(default_factory=list)
+    muxers: List[str] = field(default_factory=list)
+
+
+def _no_window_flags() -> int:
+    return subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0
+
+
+def _run(args: List[str]) -> Optional[str]:
+    try:
+        result = subprocess.run(
+            args,
+            capture_output=True,
+            text=True,
+            timeout=10,
+            creationflags=_no_window_flags(),
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout
+
+
+def _parse_version(output: str) -> str:
+    first_line = output.strip().splitlines()[0] if output.strip() else ""
+    parts = first_line.split()
+    if len(parts) >= 3 and parts[1] == "version":
+        return parts[2]
+    return first_line
+
+
+def _parse_component_list(output: Optional[str]) -> List[str]:
+    """Parse ``-encoders``/``-muxers`` output into a sorted list of names."""
+    if not output:
+        return []
+    names = set()
+    in_table = False
+    for line in output.splitlines():
+        stripped = line.strip()
+        if not in_table:
+            in_table = bool(stripped) and set(stripped) == {"-"}
+            continue
+        parts = stripped.split()
+        if len(parts) >= 2:
+            names.update(name for name in parts[1].split(",") if name)
+    return sorted(names)
+
+
+def probe_tool(name: str, path: Path) -> Optional[ToolInfo]:
+    """Run the executable to collect version, encoders and muxers."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+
+    version_output = _run([str(path), "-version"])
+    if version_output is None:
+        return None
+
+    info = ToolInfo(
+        name=name,
+        path=str(path),
+        mtime=stat.st_mtime,
+        size=stat.st_size,
+        version=_parse_version(version_output),
+    )
+    if name == "ffmpeg":
+        info.encoders = _parse_component_list(_run([str(path), "-hide_banner", "-encoders"]))
+        info.muxers = _parse_component_list(_run([str(path), "-hide_banner", "-muxers"]))
+    return info
+
+
+class ToolchainRegistry:
+    """Locate ffmpeg/ffprobe and remember what they can do.
+
+    A probe spawns the executable, so results are memoised for the life of
+    the process and persisted to ``cache_file`` keyed by the binary's path,
+    mtime and size. Replacing or updating the binary invalidates its entry.
+    """
+
+    def __init__(self, cache_file: Optional[Path] = None, search_dirs: Optional[List[Path]] = None) -> None:
+        self.cache_file = cache_file or Path.home() / ".video_downloader_toolchain.json"
+        self.search_dirs = list(search_dirs) if search_dirs is not None else get_default_search_dirs()
+        self._tools: Dict[str, Optional[ToolInfo]] = {}
+        self._lock = threading.RLock()
+        self._disk_cache: Optional[Dict[str, dict]] = None
+
+    def get(self, name: str) -> Optional[ToolInfo]:
+        """Return the probe result for ``name`` (probing at most once)."""
+        with self._lock:
+            if name not in self._tools:
+                self._tools[name] = self._locate_and_probe(name)
+            return self._tools[name]
+
+    def ffmpeg_path(self) -> Optional[str]:
+        info = self.get("ffmpeg")
+        return info.path if info else None
+
+    def has_encoder(self, encoder: str) -> bool:
+        info = self.get("ffmpeg")
+        return bool(info) and encoder in info.encoders
+
+    def has_muxer(self, muxer: str) -> bool:
+        info = self.get("ffmpeg")
+        return bool(info) and muxer in info.muxers
+
+    def verify(self, path: Path, name: str = "ffmpeg") -> Optional[ToolInfo]:
+        """Probe a specific binary, using the on-disk cache when it is unchanged.
+
+        Probes of different binaries may run concurrently; only the cache
+        lookup and update are serialised.
+        """
+        return self._probe_cached(name, Path(path))
+
+    def refresh(self) -> None:
+        """Forget in-memory results, e.g. after PATH changed or FFmpeg was installed."""
+        with self._lock:
+            self._tools.clear()
+
+    def _locate_and_probe(self, name: str) -> Optional[ToolInfo]:
+        for candidate in self._candidates(name):
+            info = self._probe_cached(name, candidate)
+            if info:
+                return info
+        return None
+
+    def _candidates(self, name: str) -> List[Path]:
+        candidates: List[Path] = []
+        found = shutil.which(name)
+        if found:
+            candidates.append(Path(found))
+        filenames = [f"{name}.exe", name] if os.name == "nt" else [name, f"{name}.exe"]
+        for directory in self.search_dirs:
+            for filename in filenames:
+                path = directory / filename
+                if path.is_file() and path not in candidates:
+                    candidates.append(path)
+        return candidates
+
+    def _probe_cached(self, name: str, path: Path) -> Optional[ToolInfo]:
+        try:
+            resolved = path.resolve()
+            stat = resolved.stat()
+        except OSError:
+            return None
+
+        with self._lock:
+            cache = self._load_disk_cache()
+            entry = cache.get(str(resolved))
+            if entry and entry.get("mtime") == stat.st_mtime and entry.get("size") == stat.st_size:
+                try:
+                    return ToolInfo(**entry)
+                except TypeError:
+                    pass
+
+        info = probe_tool(name, resolved)
+        if info:
+            with self._lock:
+                cache[str(resolved)] = asdict(info)
+                self._save_disk_cache(cache)
+        return info
+
+    def _load_disk_cache(self) -> Dict[str, dict]:
+        if self._disk_cache is None:
+            self._disk_cache = {}
+            try:
+                with open(self.cache_file, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if data.get("version") == CACHE_VERSION:
+                    self._disk_cache = dict(data.get("tools", {}))
+            except (OSError, ValueError, AttributeError):
+                pass
+        return self._disk_cache
+
+    def _save_disk_cache(self, cache: Dict[str, dict]) -> None:
+        try:
+            tmp_file = self.cache_file.with_name(self.cache_file.name + ".tmp")
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump({"version": CACHE_VERSION, "tools": cache}, f, indent=2)
+            os.replace(tmp_file, self.cache_file)
+        except OSError:
+            pass
+
+
+_registry: Optional[ToolchainRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_toolchain() -> ToolchainRegistry:
+    """Return the process-wide toolchain registry."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = ToolchainRegistry()
+        return _registry
@@ -0,0 +1,104 @@
+"""
+Per-platform transfer settings for yt-dlp downloads.
+
+Left alone, yt-dlp fetches HLS/DASH fragments one at a time and reads a
+progressive file with a single request, so on a high-latency link every
+fragment pays a full round trip. A ``TransferProfile`` sets fragment
+concurrency, HTTP chunk size, retries and read buffer size for one
+platform: the defaults live in ``constants.PLATFORM_TRANSFER_PROFILES`` and
+the user's overrides in ``settings["transfer_profiles"]``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, fields
+from typing import Any, Dict, Optional
+
+from constants import DEFAULT_TRANSFER_PROFILE, PLATFORM_TRANSFER_PROFILES
+
+MIB = 1024 * 1024
+
+# Accepted range per field; values outside are clamped
+_LIMITS = {
+    "fragment_concurrency": (1, 32),
+    "chunk_size_mb": (0, 1024),
+    "retries": (0, 100),
+    "buffer_kb": (0, 64 * 1024),
+}
+
+
+@dataclass(frozen=True)
+class TransferProfile:
+    """How yt-dlp moves the bytes of one download.
+
+    ``chunk_size_mb=0`` reads a progressive file with one request, and
+    ``buffer_kb=0`` keeps yt-dlp's self-adjusting read buffer.
+    """
+
+    fragment_concurrency: int = 1
+    chunk_size_mb: int = 0
+    retries: int = 10
+    buffer_kb: int = 0
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]], base: Optional["TransferProfile"] = None) -> "TransferProfile":
+        """Fields from ``data`` over ``base``; unknown keys and bad values are ignored."""
+        values = asdict(base or cls())
+        for name, value in (data or {}).items():
+            if name not in _LIMITS:
+                continue
+            try:
+                number = int(value)
+            except (TypeError, ValueError):
+                continue
+            low, high = _LIMITS[name]
+            values[name] = min(max(number, low), high)
+        return cls(**values)
+
+    def to_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+    def ydl_options(self) -> Dict[str, Any]:
+        """The yt-dlp parameters this profile stands for."""
+        options: Dict[str, Any] = {
+            "concurrent_fragment_downloads": self.fragment_concurrency,
+            "retries": self.retries,
+            "fragment_retries": self.retries,
+        }
+        if self.chunk_size_mb:
+            options["http_chunk_size"] = self.chunk_size_mb * MIB
+        if self.buffer_kb:
+            options["buffersize"] = self.buffer_kb * 1024
+            options["noresizebuffer"] = True
+        return options
+
+
+PROFILE_FIELDS = tuple(field.name for field in fields(TransferProfile))
+
+
+def default_profile(platform: str) -> TransferProfile:
+    """The built-in profile for ``platform``."""
+    base = TransferProfile.from_dict(DEFAULT_TRANSFER_PROFILE)
+    return TransferProfile.from_dict(PLATFORM_TRANSFER_PROFILES.get(platform), base)
+
+
+def profile_for(platform: str, overrides: Optional[Dict[str, Dict[str, Any]]] = None) -> TransferProfile:
+    """``platform``'s profile with the user's overrides (``settings["transfer_profiles"]``) applied."""
+    profile = default_profile(platform)
+    if isinstance(overrides, dict) and isinstance(overrides.get(platform), dict):
+        profile = TransferProfile.from_dict(overrides[platform], profile)
+    return profile
+
+
+def profile_overrides(profiles: Dict[str, TransferProfile]) -> Dict[str, Dict[str, int]]:
+    """Settings value for ``profiles``: per platform, only the fields that differ from its default.
+
+    Fields left at their default keep following the built-in profile when it changes.
+    """
+    overrides: Dict[str, Dict[str, int]] = {}
+    for platform, profile in profiles.items():
+        default = default_profile(platform).to_dict()
+        changed = {name: value for name, value in profile.to_dict().items() if value != default[name]}
+        if changed:
+            overrides[platform] = changed
+    return overrides
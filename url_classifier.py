@@ -0,0 +1,282 @@
+"""
+URL classification - which platform, what kind of content, which media ID.
+
+A URL is split once, its host is looked up in ``PLATFORM_HOSTS`` (exact
+match first, then each parent domain, so ``vm.tiktok.com`` resolves through
+``tiktok.com``), and the path is read segment by segment by the platform's
+rule. The resulting ``UrlInfo`` also carries the normalized URL (tracking
+parameters and fragment removed). ``classify_url`` caches its records, so
+the several places that look at the same URL pay for the parsing once.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+CACHE_SIZE = 8192
+
+# Registered domain → platform; subdomains are found by walking up the labels
+PLATFORM_HOSTS: Dict[str, str] = {
+    "youtube.com": "youtube",
+    "youtu.be": "youtube",
+    "tiktok.com": "tiktok",
+    "instagram.com": "instagram",
+    "instagr.am": "instagram",
+    "facebook.com": "facebook",
+    "fb.watch": "facebook",
+    "twitter.com": "twitter",
+    "x.com": "twitter",
+    "vimeo.com": "vimeo",
+    "dailymotion.com": "dailymotion",
+    "dai.ly": "dailymotion",
+    "twitch.tv": "twitch",
+}
+
+# Query parameters that identify the media; everything else is tracking
+ALLOWED_PARAMS: Dict[str, frozenset] = {
+    "youtube": frozenset({"v", "list", "index", "t"}),
+    "instagram": frozenset({"img_index"}),
+    "facebook": frozenset({"v"}),
+}
+
+# Content kinds
+VIDEO = "video"
+SHORT = "short"
+LIVE = "live"
+CLIP = "clip"
+REEL = "reel"
+POST = "post"
+STORY = "story"
+PLAYLIST = "playlist"
+CHANNEL = "channel"
+UNKNOWN = "unknown"
+
+_INSTAGRAM_MARKERS = {"p": POST, "reel": REEL, "reels": REEL, "tv": REEL}
+_SHORTCODE = re.compile(r"[A-Za-z0-9_-]+")
+
+_NO_PARAMS: frozenset = frozenset()
+
+
+@dataclass(frozen=True)
+class UrlInfo:
+    """Everything the app needs to know about one pasted URL.
+
+    ``platform`` is None for unsupported hosts. ``media_id`` is the video
+    ID, shortcode, story ID, ... when the path names one, and ``owner`` the
+    account the path belongs to (``@handle``, story user, ...).
+    """
+
+    url: str
+    normalized: str
+    host: str
+    platform: Optional[str]
+    kind: str = UNKNOWN
+    media_id: Optional[str] = None
+    owner: Optional[str] = None
+
+    @property
+    def supported(self) -> bool:
+        return self.platform is not None
+
+
+def lookup_host(host: str) -> Optional[str]:
+    """``m.youtube.com`` → ``youtube``; None if no suffix of ``host`` is known."""
+    while True:
+        platform = PLATFORM_HOSTS.get(host)
+        if platform is not None:
+            return platform
+        _, dot, host = host.partition(".")
+        if not dot:
+            return None
+
+
+def _host_of(netloc: str) -> str:
+    """Lower-cased host of ``user@Host:port``; empty for IPv6 literals."""
+    host = netloc.rpartition("@")[2]
+    if host.startswith("["):
+        return ""
+    return host.partition(":")[0].rstrip(".").lower()
+
+
+# ─── Path rules ──────────────────────────────────────────────────────────
+# Each rule gets the host, the non-empty path segments and the query
+# parameters, and returns (kind, media_id, owner).
+
+Rule = Callable[[str, List[str], Dict[str, str]], Tuple[str, Optional[str], Optional[str]]]
+
+
+def _youtube(host: str, segments: List[str], query: Dict[str, str]):
+    if host.endswith("youtu.be"):
+        return (VIDEO, segments[0], None) if segments else (UNKNOWN, None, None)
+    if not segments:
+        return UNKNOWN, None, None
+    head = segments[0].lower()
+    if head == "watch":
+        return (VIDEO, query["v"], None) if query.get("v") else (UNKNOWN, None, None)
+    if head == "playlist":
+        return (PLAYLIST, query["list"], None) if query.get("list") else (UNKNOWN, None, None)
+    if len(segments) >= 2:
+        if head == "shorts":
+            return SHORT, segments[1], None
+        if head == "live":
+            return LIVE, segments[1], None
+        if head in ("embed", "v"):
+            return VIDEO, segments[1], None
+        if head in ("channel", "c", "user"):
+            return CHANNEL, segments[1], segments[1]
+    if head.startswith("@"):
+        return CHANNEL, None, segments[0][1:]
+    return UNKNOWN, None, None
+
+
+def _tiktok(host: str, segments: List[str], query: Dict[str, str]):
+    # vm.tiktok.com/<code> and tiktok.com/t/<code> only redirect to the video
+    if host.startswith(("vm.", "vt.")) or (segments and segments[0] == "t"):
+        return (VIDEO, None, None) if segments else (UNKNOWN, None, None)
+    if not segments or not segments[0].startswith("@"):
+        return UNKNOWN, None, None
+    owner = segments[0][1:]
+    if len(segments) >= 3:
+        if segments[1] == "video":
+            return VIDEO, segments[2], owner
+        if segments[1] == "photo":
+            return POST, segments[2], owner
+    return CHANNEL, None, owner
+
+
+def _instagram(host: str, segments: List[str], query: Dict[str, str]):
+    if not segments:
+        return UNKNOWN, None, None
+    if segments[0].lower() == "stories":
+        if len(segments) >= 3:
+            return STORY, segments[2], segments[1]
+        return UNKNOWN, None, None
+    # /p/<shortcode>, or /<username>/p/<shortcode>
+    for index in (0, 1):
+        if len(segments) > index + 1:
+            kind = _INSTAGRAM_MARKERS.get(segments[index].lower())
+            if kind is not None:
+                match = _SHORTCODE.match(segments[index + 1])
+                if match:
+                    return kind, match.group(), segments[0] if index else None
+    if len(segments) == 1:
+        return CHANNEL, None, segments[0]
+    return UNKNOWN, None, None
+
+
+def _facebook(host: str, segments: List[str], query: Dict[str, str]):
+    if host.endswith("fb.watch"):
+        return (VIDEO, None, None) if segments else (UNKNOWN, None, None)
+    if segments and segments[0] == "watch" and query.get("v"):
+        return VIDEO, query["v"], None
+    if len(segments) >= 2 and segments[0] == "reel":
+        return REEL, segments[1], None
+    if "videos" in segments:
+        index = segments.index("videos")
+        if index + 1 < len(segments):
+            return VIDEO, segments[index + 1], segments[0] if index else None
+    return UNKNOWN, None, None
+
+
+def _twitter(host: str, segments: List[str], query: Dict[str, str]):
+    if len(segments) >= 3 and segments[1] == "status":
+        return POST, segments[2], None if segments[0] == "i" else segments[0]
+    if len(segments) == 1:
+        return CHANNEL, None, segments[0]
+    return UNKNOWN, None, None
+
+
+def _vimeo(host: str, segments: List[str], query: Dict[str, str]):
+    # vimeo.com/<id>, player.vimeo.com/video/<id>, vimeo.com/channels/<name>/<id>
+    for segment in reversed(segments):
+        if segment.isdigit():
+            return VIDEO, segment, None
+    if len(segments) == 1:
+        return CHANNEL, None, segments[0]
+    return UNKNOWN, None, None
+
+
+def _dailymotion(host: str, segments: List[str], query: Dict[str, str]):
+    if host.endswith("dai.ly"):
+        return (VIDEO, segments[0], None) if segments else (UNKNOWN, None, None)
+    if len(segments) >= 2:
+        if segments[0] == "video":
+            # Older links append the title: /video/x7tgad0_some-title
+            return VIDEO, segments[1].split("_", 1)[0], None
+        if segments[0] == "playlist":
+            return PLAYLIST, segments[1], None
+    if len(segments) == 1:
+        return CHANNEL, None, segments[0]
+    return UNKNOWN, None, None
+
+
+def _twitch(host: str, segments: List[str], query: Dict[str, str]):
+    if host.startswith("clips."):
+        return (CLIP, segments[0], None) if segments else (UNKNOWN, None, None)
+    if len(segments) >= 2 and segments[0] == "videos":
+        return VIDEO, segments[1], None
+    if len(segments) >= 3 and segments[1] == "clip":
+        return CLIP, segments[2], segments[0]
+    if len(segments) == 1:
+        return LIVE, None, segments[0]
+    return UNKNOWN, None, None
+
+
+PATH_RULES: Dict[str, Rule] = {
+    "youtube": _youtube,
+    "tiktok": _tiktok,
+    "instagram": _instagram,
+    "facebook": _facebook,
+    "twitter": _twitter,
+    "vimeo": _vimeo,
+    "dailymotion": _dailymotion,
+    "twitch": _twitch,
+}
+
+
+# ─── Classification ──────────────────────────────────────────────────────
+
+def _classify(url: str) -> UrlInfo:
+    cleaned = url.strip()
+    if not cleaned:
+        return UrlInfo(url="", normalized="", host="", platform=None)
+
+    has_scheme = "://" in cleaned
+    try:
+        # Without a scheme, "youtube.com/watch?v=..." would parse as a path
+        parts = urlsplit(cleaned if has_scheme else "//" + cleaned)
+    except ValueError:
+        return UrlInfo(url=cleaned, normalized=cleaned, host="", platform=None)
+
+    host = _host_of(parts.netloc)
+    platform = lookup_host(host) if host else None
+    keep = ALLOWED_PARAMS.get(platform, _NO_PARAMS)
+    query_items = [(key, value) for key, value in parse_qsl(parts.query) if key in keep] if parts.query else []
+
+    if not (has_scheme and parts.scheme and parts.netloc):
+        normalized = cleaned
+    elif "?" in cleaned or "#" in cleaned or not cleaned.startswith(parts.scheme):
+        normalized = urlunsplit(parts._replace(query=urlencode(query_items), fragment=""))
+    else:
+        # Nothing to strip, and urlunsplit would give back the same string
+        normalized = cleaned
+
+    if platform is None:
+        return UrlInfo(url=cleaned, normalized=normalized, host=host, platform=None)
+
+    segments = [segment for segment in parts.path.split("/") if segment]
+    kind, media_id, owner = PATH_RULES[platform](host, segments, dict(query_items))
+    return UrlInfo(
+        url=cleaned, normalized=normalized, host=host, platform=platform,
+        kind=kind, media_id=media_id, owner=owner,
+    )
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def classify_url(url: str) -> UrlInfo:
+    """Classify ``url``; records are immutable and shared between callers."""
+    return _classify(url)
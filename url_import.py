@@ -0,0 +1,157 @@
+"""
+Streaming URL import for the batch dialog.
+
+A URL list is read line by line (a file is never loaded whole) and only
+supported URLs are kept, normalized and deduplicated in first-seen order.
+``UrlImportScan`` does this on a worker thread and reports its counts while
+it runs, so a 50k-line export doesn't freeze the dialog.
+"""
+
+from __future__ import annotations
+
+import io
+import threading
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional, Set, TextIO, Union
+
+from url_classifier import classify_url
+
+PREVIEW_LINES = 200
+PROGRESS_EVERY = 2000  # lines between progress reports
+
+
+@dataclass
+class ImportCounts:
+    lines: int = 0
+    urls: int = 0  # unique, supported
+    duplicates: int = 0
+    skipped: int = 0  # non-empty lines that aren't a supported URL
+
+
+class UrlCollector:
+    """Feed lines one at a time; keeps each supported URL once."""
+
+    def __init__(self) -> None:
+        self.urls: List[str] = []
+        self.counts = ImportCounts()
+        self._seen: Set[str] = set()
+
+    def add_line(self, line: str) -> None:
+        self.counts.lines += 1
+        line = line.strip()
+        if not line or line.startswith("#"):
+            return
+        info = classify_url(line) if line.startswith(("http://", "https://")) else None
+        if info is None or not info.supported:
+            self.counts.skipped += 1
+        elif info.normalized in self._seen:
+            self.counts.duplicates += 1
+        else:
+            self._seen.add(info.normalized)
+            self.urls.append(info.normalized)
+            self.counts.urls += 1
+
+    def add_lines(self, lines: Iterable[str]) -> "UrlCollector":
+        for line in lines:
+            self.add_line(line)
+        return self
+
+
+def collect_urls(text: str) -> List[str]:
+    """Unique supported URLs in ``text``, in order."""
+    return UrlCollector().add_lines(text.splitlines()).urls
+
+
+class UrlImportScan:
+    """Collect URLs from a file or text on a background thread.
+
+    Callbacks run on the worker thread:
+
+    * ``on_preview(lines, truncated)`` once, with the first ``preview_lines``
+      raw lines (``truncated`` is True if the source has more);
+    * ``on_progress(counts)`` every ``progress_every`` lines, with a copy;
+    * ``on_done(scan)`` at the end, also after ``cancel()`` or a read error
+      (kept in ``error``).
+    """
+
+    def __init__(
+        self,
+        open_lines: Callable[[], TextIO],
+        on_preview: Optional[Callable[[List[str], bool], None]] = None,
+        on_progress: Optional[Callable[[ImportCounts], None]] = None,
+        on_done: Optional[Callable[["UrlImportScan"], None]] = None,
+        preview_lines: int = PREVIEW_LINES,
+        progress_every: int = PROGRESS_EVERY,
+    ) -> None:
+        self._open_lines = open_lines
+        self.on_preview = on_preview
+        self.on_progress = on_progress
+        self.on_done = on_done
+        self.preview_lines = preview_lines
+        self.progress_every = max(1, progress_every)
+        self.collector = UrlCollector()
+        self.error: Optional[OSError] = None
+        self.done = threading.Event()
+        self._cancelled = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def from_file(cls, path: Union[str, Path], **kwargs) -> "UrlImportScan":
+        # utf-8-sig drops the BOM Notepad puts in front of the first URL
+        return cls(lambda: open(path, "r", encoding="utf-8-sig", errors="replace"), **kwargs)
+
+    @classmethod
+    def from_text(cls, text: str, **kwargs) -> "UrlImportScan":
+        return cls(lambda: io.StringIO(text), **kwargs)
+
+    @property
+    def urls(self) -> List[str]:
+        return self.collector.urls
+
+    @property
+    def counts(self) -> ImportCounts:
+        return self.collector.counts
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def start(self) -> threading.Thread:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self.run, name="url-import", daemon=True)
+            self._thread.start()
+        return self._thread
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+
+    def run(self) -> None:
+        preview: List[str] = []
+        preview_sent = False
+        try:
+            with self._open_lines() as lines:
+                for line in lines:
+                    if self._cancelled.is_set():
+                        break
+                    if not preview_sent:
+                        if len(preview) < self.preview_lines:
+                            preview.append(line.rstrip("\r\n"))
+                        else:
+                            self._send_preview(preview, truncated=True)
+                            preview_sent = True
+                    self.collector.add_line(line)
+                    if self.on_progress is not None and self.collector.counts.lines % self.progress_every == 0:
+                        self.on_progress(replace(self.collector.counts))
+        except OSError as exc:
+            self.error = exc
+        finally:
+            if not preview_sent and self.error is None:
+                self._send_preview(preview, truncated=False)
+            self.done.set()
+            if self.on_done is not None:
+                self.on_done(self)
+
+    def _send_preview(self, preview: List[str], truncated: bool) -> None:
+        if self.on_preview is not None:
+            self.on_preview(list(preview), truncated)
@@ -8,64 +8,21 @@ import ctypes
 import subprocess
 import threading
 from pathlib import Path
-from urllib.parse import urlparse, parse_qsl, urlencode, urlunparse
 from typing import Optional, Callable
 
 from constants import PLATFORM_ICONS, PLATFORM_COLORS
+from toolchain import get_toolchain
+from url_classifier import classify_url
 
 
 def detect_platform(url: str) -> Optional[str]:
     """URL'den platformu tespit eder."""
-    normalized_url = url.strip().lower()
-    if not normalized_url:
-        return None
-
-    platform_patterns = {
-        'youtube': [r'(youtube\.com|youtu\.be)'],
-        'tiktok': [r'tiktok\.com', r'vm\.tiktok\.com'],
-        'instagram': [r'instagram\.com', r'instagr\.am'],
-        'facebook': [r'facebook\.com', r'fb\.watch'],
-        'twitter': [r'twitter\.com', r'x\.com'],
-        'vimeo': [r'vimeo\.com'],
-        'dailymotion': [r'dailymotion\.com', r'dai\.ly'],
-        'twitch': [r'twitch\.tv'],
-    }
-
-    for platform, patterns in platform_patterns.items():
-        for pattern in patterns:
-            if re.search(pattern, normalized_url):
-                return platform
-
-    return None
+    return classify_url(url).platform
 
 
 def normalize_media_url(url: str) -> str:
     """URL üzerindeki takip parametrelerini temizler."""
-    cleaned = url.strip()
-    if not cleaned:
-        return ""
-
-    try:
-        parsed = urlparse(cleaned)
-    except ValueError:
-        return cleaned
-
-    if not parsed.scheme or not parsed.netloc:
-        return cleaned
-
-    allowed_params = {
-        'youtube': {'v', 'list', 'index', 't'},
-        'instagram': {'img_index'},
-        'facebook': {'v'},
-    }
-    platform = detect_platform(cleaned)
-    keep = allowed_params.get(platform, set())
-
-    query_items = [(key, value) for key, value in parse_qsl(parsed.query, keep_blank_values=False)
-                   if key in keep]
-    normalized_query = urlencode(query_items)
-    normalized = parsed._replace(query=normalized_query, fragment='')
-    return urlunparse(normalized)
+    return classify_url(url).normalized
 
 
 def format_size(size_bytes: int) -> str:
@@ -80,6 +37,27 @@ def format_size(size_bytes: int) -> str:
         return f"{size_bytes / (1024 * 1024 * 1024):.2f} GB"
 
 
+_SIZE_UNITS = {"": 1, "B": 1, "K": 1024, "KB": 1024, "M": 1024 ** 2, "MB": 1024 ** 2,
+               "G": 1024 ** 3, "GB": 1024 ** 3, "T": 1024 ** 4, "TB": 1024 ** 4}
+_SIZE_PATTERN = re.compile(r"^\s*(\d+(?:[.,]\d+)?)\s*([A-Za-z]*)\s*$")
+
+
+def parse_size(text: str) -> Optional[int]:
+    """Okunabilir boyut metnini ("1.5 GB", "100MB") bayta çevirir; geçersizse None."""
+    match = _SIZE_PATTERN.match(text or "")
+    if not match:
+        return None
+    multiplier = _SIZE_UNITS.get(match.group(2).upper())
+    if multiplier is None:
+        return None
+    return int(float(match.group(1).replace(",", ".")) * multiplier)
+
+
+def format_rate(bytes_per_second: float) -> str:
+    """Transfer rate as text, e.g. ``1.5 MB/s``."""
+    return f"{format_size(int(bytes_per_second))}/s"
+
+
 def get_download_folder() -> Path:
     """Varsayılan indirme klasörünü döndürür."""
     downloads = Path.home() / "Downloads" / "VideoDownloader"
@@ -88,13 +66,8 @@ def get_download_folder() -> Path:
 
 
 def check_ffmpeg() -> bool:
-    """FFmpeg'in kurulu olup olmadığını kontrol eder."""
-    try:
-        subprocess.run(['ffmpeg', '-version'], stdout=subprocess.DEVNULL, 
-                      stderr=subprocess.DEVNULL, check=True)
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return False
+    """FFmpeg'in kurulu olup olmadığını kontrol eder (sonuç önbellekten gelir)."""
+    return get_toolchain().get("ffmpeg") is not None
 
 
 def get_platform_icon(platform: str) -> str:
@@ -234,8 +207,8 @@ def extract_urls_from_text(text: str) -> list[str]:
         if not line or line.startswith("#"):
             continue
         # Basic URL validation
-        if re.match(r'https?://', line):
-            normalized = normalize_media_url(line)
-            if normalized and detect_platform(normalized):
-                urls.append(normalized)
+        if line.startswith(("http://", "https://")):
+            info = classify_url(line)
+            if info.supported:
+                urls.append(info.normalized)
     return urls
@@ -1,14 +1,18 @@
 """Widget modules for Syronss's Media Downloader."""
 
 from widgets.queue_item import QueueItem, QueueItemWidget
+from widgets.queue_view import QueueView
 from widgets.video_preview import VideoPreviewFrame
 from widgets.history_item import DownloadHistoryItem
+from widgets.virtual_list import VirtualList
 from widgets.stats_panel import StatsPanel
 
 __all__ = [
     "QueueItem",
     "QueueItemWidget",
+    "QueueView",
     "VideoPreviewFrame",
     "DownloadHistoryItem",
+    "VirtualList",
     "StatsPanel",
 ]
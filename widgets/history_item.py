@@ -3,43 +3,61 @@
 import os
 import sys
 import subprocess
+from typing import Dict, Optional
+
 import customtkinter as ctk
 from utils import get_platform_icon
 from constants import COLORS
 
+_FONTS: Dict[str, ctk.CTkFont] = {}
+
+
+def _shared_fonts() -> Dict[str, ctk.CTkFont]:
+    """Fonts shared by every history row (created once a Tk root exists)."""
+    if not _FONTS:
+        _FONTS["icon"] = ctk.CTkFont(size=20)
+        _FONTS["name"] = ctk.CTkFont(size=13, weight="bold")
+        _FONTS["detail"] = ctk.CTkFont(size=11)
+    return _FONTS
+
 
 class DownloadHistoryItem(ctk.CTkFrame):
-    """Single entry in the download history list."""
+    """Single entry in the download history list.
 
-    def __init__(self, master, filename: str, platform: str, size: str, filepath: str, **kwargs):
+    Rows are recycled by ``VirtualList``: ``set_data`` rebinds an existing
+    row to another history entry without rebuilding its child widgets.
+    """
+
+    def __init__(
+        self,
+        master,
+        filename: str = "",
+        platform: str = "",
+        size: str = "",
+        filepath: str = "",
+        **kwargs,
+    ):
         super().__init__(master, **kwargs)
         self.filepath = filepath
         self.configure(fg_color=COLORS["card_bg"], corner_radius=8)
+        fonts = _shared_fonts()
 
-        ctk.CTkLabel(
-            self,
-            text=get_platform_icon(platform),
-            font=ctk.CTkFont(size=20),
-            width=30,
-        ).pack(side="left", padx=(10, 5))
+        self.icon_label = ctk.CTkLabel(self, text="", font=fonts["icon"], width=30)
+        self.icon_label.pack(side="left", padx=(10, 5))
 
         info_frame = ctk.CTkFrame(self, fg_color="transparent")
         info_frame.pack(side="left", fill="x", expand=True, padx=5)
 
-        display_name = filename[:40] + "..." if len(filename) > 43 else filename
-        ctk.CTkLabel(
+        self.name_label = ctk.CTkLabel(info_frame, text="", font=fonts["name"], anchor="w")
+        self.name_label.pack(fill="x")
+        self.detail_label = ctk.CTkLabel(
             info_frame,
-            text=display_name,
-            font=ctk.CTkFont(size=13, weight="bold"),
-            anchor="w",
-        ).pack(fill="x")
-        ctk.CTkLabel(
-            info_frame,
-            text=f"{platform.capitalize()} • {size}",
-            font=ctk.CTkFont(size=11),
+            text="",
+            font=fonts["detail"],
             text_color=COLORS["muted_text"],
             anchor="w",
-        ).pack(fill="x")
+        )
+        self.detail_label.pack(fill="x")
 
         ctk.CTkButton(
             self,
@@ -52,6 +70,26 @@ class DownloadHistoryItem(ctk.CTkFrame):
             command=self.open_folder,
         ).pack(side="right", padx=10, pady=8)
 
+        self._bound: Optional[tuple] = None
+        self.set_data({"filename": filename, "platform": platform, "size": size, "filepath": filepath})
+
+    def set_data(self, entry: dict) -> None:
+        """Show ``entry``; labels are only reconfigured when their text changes."""
+        filename = entry.get("filename", "")
+        platform = entry.get("platform", "")
+        size = entry.get("size", "")
+        self.filepath = entry.get("filepath", "")
+
+        key = (filename, platform, size)
+        if key == self._bound:
+            return
+        self._bound = key
+
+        display_name = filename[:40] + "..." if len(filename) > 43 else filename
+        self.icon_label.configure(text=get_platform_icon(platform))
+        self.name_label.configure(text=display_name)
+        self.detail_label.configure(text=f"{platform.capitalize()} • {size}")
+
     def open_folder(self):
         """Open the containing folder — cross-platform safe."""
         if not self.filepath or not os.path.exists(self.filepath):
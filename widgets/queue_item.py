@@ -1,10 +1,43 @@
 """Queue item data model and widget."""
 
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
+
 import customtkinter as ctk
 from i18n import t
-from utils import get_platform_icon
+from utils import format_size, get_platform_icon
+from url_classifier import classify_url
 from constants import COLORS
 
+# Status → (symbol, shows the remove button instead of a label)
+STATUS_INDICATORS = {
+    "pending": ("✕", True),
+    "downloading": ("⏳", False),
+    "completed": ("✅", False),
+    "error": ("❌", False),
+}
+
+# QueueItem attributes kept in the queue journal (see queue_journal.py)
+JOURNAL_FIELDS = (
+    "item_id", "url", "platform", "quality", "as_audio", "title", "has_title",
+    "download_subtitles", "instagram_content_type", "instagram_media_mode",
+    "status", "progress", "speed", "error", "metadata_state", "duration",
+    "filesize", "qualities", "download_dir", "filename_template", "partial_file",
+    "error_kind", "retry_count", "next_retry_at",
+)
+
+_FONTS: Dict[str, ctk.CTkFont] = {}
+
+
+def _shared_fonts() -> Dict[str, ctk.CTkFont]:
+    """Fonts shared by every queue row (created once a Tk root exists)."""
+    if not _FONTS:
+        _FONTS["icon"] = ctk.CTkFont(size=18)
+        _FONTS["title"] = ctk.CTkFont(size=12, weight="bold")
+        _FONTS["detail"] = ctk.CTkFont(size=10)
+        _FONTS["status"] = ctk.CTkFont(size=16)
+    return _FONTS
+
 
 class QueueItem:
     """Data model for a download queue entry."""
@@ -25,60 +58,161 @@ class QueueItem:
         self.quality = quality
         self.as_audio = as_audio
         self.title = title or url[:50]
+        self.has_title = bool(title)
         self.download_subtitles = download_subtitles
         self.instagram_content_type = instagram_content_type
         self.instagram_media_mode = instagram_media_mode
         self.status = "pending"
         self.progress = 0
+        self.speed = ""
         self.error = ""
+        # Filled in by the metadata prefetcher while the item waits
+        self.metadata_state = ""
+        self.duration = 0
+        self.filesize = 0
+        self.qualities: List[str] = []
+        # Fixed when the download first starts, so that after a restart it
+        # writes to the same place and yt-dlp continues its .part file
+        self.item_id = uuid.uuid4().hex
+        self.download_dir = ""
+        self.filename_template = ""
+        self.partial_file = ""
+        # Managed by the retry engine (see retry_engine.py)
+        self.error_kind = ""
+        self.retry_count = 0
+        self.next_retry_at = 0.0
+        self._dedupe_key: Optional[Tuple] = None
+
+    def to_record(self) -> Dict[str, Any]:
+        """Journal record with every persistent field."""
+        return {name: getattr(self, name) for name in JOURNAL_FIELDS}
+
+    @classmethod
+    def from_record(cls, record: Dict[str, Any]) -> "QueueItem":
+        item = cls(url=record["url"], platform=record["platform"])
+        for name in JOURNAL_FIELDS:
+            if name in record:
+                setattr(item, name, record[name])
+        return item
+
+    def dedupe_key(self) -> Tuple:
+        """Canonical (URL, options) identity used for duplicate detection."""
+        if self._dedupe_key is None:
+            self._dedupe_key = (
+                classify_url(self.url).normalized,
+                self.as_audio,
+                self.quality,
+                self.download_subtitles,
+                self.instagram_content_type,
+                self.instagram_media_mode,
+            )
+        return self._dedupe_key
 
     def matches(self, other: "QueueItem") -> bool:
         """Check if another queue item is a duplicate of this one."""
-        return (
-            self.url == other.url
-            and self.as_audio == other.as_audio
-            and self.quality == other.quality
-            and self.download_subtitles == other.download_subtitles
-            and self.instagram_content_type == other.instagram_content_type
-            and self.instagram_media_mode == other.instagram_media_mode
-        )
+        return self.dedupe_key() == other.dedupe_key()
 
 
 class QueueItemWidget(ctk.CTkFrame):
-    """Visual representation of a queue item."""
+    """Visual representation of a queue item.
+
+    The row is built once; ``refresh_status`` swaps the status indicator and
+    shows or hides the progress bar in place when the item's status changes.
+    """
 
     def __init__(self, master, item: QueueItem, on_remove: callable, **kwargs):
         super().__init__(master, **kwargs)
         self.item = item
         self.on_remove = on_remove
         self.configure(fg_color=COLORS["card_bg"], corner_radius=8)
+        fonts = _shared_fonts()
 
         icon = get_platform_icon(item.platform)
-        ctk.CTkLabel(self, text=icon, font=ctk.CTkFont(size=18), width=30).pack(
+        ctk.CTkLabel(self, text=icon, font=fonts["icon"], width=30).pack(
             side="left", padx=(8, 5)
         )
 
-        info_frame = ctk.CTkFrame(self, fg_color="transparent")
-        info_frame.pack(side="left", fill="x", expand=True, padx=5)
+        # Reserved before the expanding info frame so swapping the
+        # indicator never changes the row's packing order
+        self.status_slot = ctk.CTkFrame(self, fg_color="transparent")
+        self.status_slot.pack(side="right")
 
-        title = item.title[:35] + "..." if len(item.title) > 38 else item.title
-        ctk.CTkLabel(
-            info_frame,
-            text=title,
-            font=ctk.CTkFont(size=12, weight="bold"),
+        self.info_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self.info_frame.pack(side="left", fill="x", expand=True, padx=5)
+
+        self.title_label = ctk.CTkLabel(
+            self.info_frame,
+            text=self._build_title_text(item),
+            font=fonts["title"],
             anchor="w",
-        ).pack(fill="x")
+        )
+        self.title_label.pack(fill="x")
 
-        quality_text = self._build_quality_text(item)
-        ctk.CTkLabel(
-            info_frame,
-            text=quality_text,
-            font=ctk.CTkFont(size=10),
+        self.quality_label = ctk.CTkLabel(
+            self.info_frame,
+            text="",  # filled in by refresh_status
+            font=fonts["detail"],
             text_color=COLORS["muted_text"],
             anchor="w",
-        ).pack(fill="x")
+        )
+        self.quality_label.pack(fill="x")
 
-        self._add_status_indicator(item)
+        self.progress_row = None
+        self.progress_bar = None
+        self.progress_label = None
+        self.remove_btn = None
+        self.status_label = None
+        self._shown_status = None
+        self.refresh_status()
+
+    def refresh_status(self):
+        """Bring the indicator and progress row in line with ``item.status``."""
+        status = self.item.status
+        if status == self._shown_status:
+            return
+        self._shown_status = status
+        # The retry counter changes along with the status
+        self.quality_label.configure(text=self._build_quality_text(self.item))
+
+        if status == "downloading":
+            self._show_progress_row()
+        elif self.progress_row is not None:
+            self.progress_row.pack_forget()
+
+        symbol, is_button = STATUS_INDICATORS.get(status, ("?", False))
+        if is_button:
+            if self.status_label is not None:
+                self.status_label.pack_forget()
+            self._get_remove_button().pack(padx=8, pady=6)
+        else:
+            if self.remove_btn is not None:
+                self.remove_btn.pack_forget()
+            label = self._get_status_label()
+            label.configure(text=symbol)
+            label.pack(padx=12)
+
+    def refresh_texts(self):
+        """Re-translate the quality line after a language change."""
+        self.quality_label.configure(text=self._build_quality_text(self.item))
+
+    def refresh_details(self):
+        """Show prefetched title, duration and size."""
+        self.title_label.configure(text=self._build_title_text(self.item))
+        self.quality_label.configure(text=self._build_quality_text(self.item))
+
+    def update_progress(self):
+        """Refresh this row's progress bar from the item's progress fields."""
+        if self.progress_bar is None or self._shown_status != "downloading":
+            return
+        self.progress_bar.set(max(0.0, min(self.item.progress, 100)) / 100)
+        text = f"{self.item.progress:.0f}%"
+        if self.item.speed:
+            text += f" • {self.item.speed}"
+        self.progress_label.configure(text=text)
+
+    @staticmethod
+    def _build_title_text(item: QueueItem) -> str:
+        return item.title[:35] + "..." if len(item.title) > 38 else item.title
 
     def _build_quality_text(self, item: QueueItem) -> str:
         if item.as_audio:
@@ -94,29 +228,52 @@ class QueueItemWidget(ctk.CTkFrame):
             text += f" • {t(f'ig_{item.instagram_content_type}')}"
             if item.instagram_media_mode != "auto":
                 text += f"/{t(f'ig_media_{item.instagram_media_mode}')}"
+        if item.duration:
+            minutes, seconds = divmod(int(item.duration), 60)
+            text += f" • {minutes}:{seconds:02d}"
+        if item.filesize:
+            text += f" • ~{format_size(item.filesize)}"
+        if item.retry_count:
+            text += " • " + t("queue_retry_attempt", count=item.retry_count)
         return text
 
-    def _add_status_indicator(self, item: QueueItem):
-        status_map = {
-            "pending": ("✕", True),
-            "downloading": ("⏳", False),
-            "completed": ("✅", False),
-            "error": ("❌", False),
-        }
-        symbol, is_button = status_map.get(item.status, ("?", False))
+    def _show_progress_row(self):
+        if self.progress_row is None:
+            self.progress_row = ctk.CTkFrame(self.info_frame, fg_color="transparent")
+            self.progress_bar = ctk.CTkProgressBar(
+                self.progress_row,
+                height=6,
+                corner_radius=3,
+                progress_color=COLORS["primary"],
+            )
+            self.progress_bar.pack(side="left", fill="x", expand=True)
+            self.progress_label = ctk.CTkLabel(
+                self.progress_row,
+                text="",
+                font=_shared_fonts()["detail"],
+                text_color=COLORS["muted_text"],
+                width=90,
+                anchor="e",
+            )
+            self.progress_label.pack(side="right", padx=(6, 0))
+        self.progress_row.pack(fill="x", pady=(2, 0))
+        self.update_progress()
 
-        if is_button:
-            ctk.CTkButton(
-                self,
-                text=symbol,
+    def _get_remove_button(self):
+        if self.remove_btn is None:
+            self.remove_btn = ctk.CTkButton(
+                self.status_slot,
+                text=STATUS_INDICATORS["pending"][0],
                 width=30,
                 height=30,
                 corner_radius=6,
                 fg_color=("gray80", "gray25"),
                 hover_color=COLORS["danger"],
-                command=lambda: self.on_remove(item),
-            ).pack(side="right", padx=8, pady=6)
-        else:
-            ctk.CTkLabel(self, text=symbol, font=ctk.CTkFont(size=16)).pack(
-                side="right", padx=12
+                command=lambda: self.on_remove(self.item),
             )
+        return self.remove_btn
+
+    def _get_status_label(self):
+        if self.status_label is None:
+            self.status_label = ctk.CTkLabel(self.status_slot, text="", font=_shared_fonts()["status"])
+        return self.status_label
@@ -0,0 +1,116 @@
+"""Diff-based synchronisation between the download queue and its rows."""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+
+@dataclass
+class QueueDiff:
+    """What has to change to turn the rendered rows into the current queue."""
+
+    added: List[Hashable] = field(default_factory=list)
+    removed: List[Hashable] = field(default_factory=list)
+    changed: List[Hashable] = field(default_factory=list)
+    reordered: bool = False
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.added or self.removed or self.changed or self.reordered)
+
+
+def diff_queue(
+    rendered: Dict[Hashable, str],
+    current: Sequence[Tuple[Hashable, str]],
+) -> QueueDiff:
+    """Compare rendered ``key → status`` with the queue's ``(key, status)`` pairs.
+
+    ``rendered`` must preserve row order (a plain dict does). Rows that are
+    kept and new rows appended at the end never count as a reorder, so the
+    common add/remove/status-flip cases cost one pass over the queue and no
+    repacking.
+    """
+    diff = QueueDiff()
+    current_keys = set()
+    kept_order: List[Hashable] = []
+    for key, status in current:
+        current_keys.add(key)
+        shown = rendered.get(key)
+        if shown is None:
+            diff.added.append(key)
+            continue
+        if diff.added:
+            # An existing row after a new one: the new row can't simply be appended
+            diff.reordered = True
+        kept_order.append(key)
+        if shown != status:
+            diff.changed.append(key)
+
+    diff.removed = [key for key in rendered if key not in current_keys]
+    if not diff.reordered:
+        survivors = [key for key in rendered if key in current_keys]
+        diff.reordered = survivors != kept_order
+    return diff
+
+
+class QueueView:
+    """Keep one row per queue item, touching only the rows that changed.
+
+    Rows come from ``row_factory(item)`` and must provide ``refresh_status()``,
+    ``pack``/``pack_forget`` and ``destroy``. The view itself has no Tk
+    dependency, so the diffing can be exercised without a display.
+    """
+
+    def __init__(
+        self,
+        row_factory: Callable[[Any], Any],
+        key: Callable[[Any], Hashable] = id,
+        on_empty: Optional[Callable[[bool], None]] = None,
+    ) -> None:
+        self._row_factory = row_factory
+        self._key = key
+        self._on_empty = on_empty
+        self.rows: Dict[Hashable, Any] = {}
+        self._statuses: Dict[Hashable, str] = {}
+        self._empty: Optional[bool] = None
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        return self.rows.get(key)
+
+    def sync(self, items: Sequence[Any]) -> QueueDiff:
+        """Apply the minimal set of row changes for ``items``."""
+        by_key = {self._key(item): item for item in items}
+        diff = diff_queue(self._statuses, [(key, item.status) for key, item in by_key.items()])
+
+        for key in diff.removed:
+            self.rows.pop(key).destroy()
+            del self._statuses[key]
+
+        for key in diff.changed:
+            self.rows[key].refresh_status()
+            self._statuses[key] = by_key[key].status
+
+        for key in diff.added:
+            row = self._row_factory(by_key[key])
+            self.rows[key] = row
+            self._statuses[key] = by_key[key].status
+            if not diff.reordered:
+                row.pack(fill="x", pady=2)
+
+        if diff.reordered:
+            for row in self.rows.values():
+                row.pack_forget()
+            ordered = {key: self.rows[key] for key in by_key}
+            self.rows = ordered
+            self._statuses = {key: self._statuses[key] for key in by_key}
+            for row in ordered.values():
+                row.pack(fill="x", pady=2)
+
+        empty = not self.rows
+        if empty != self._empty and self._on_empty is not None:
+            self._on_empty(empty)
+        self._empty = empty
+        return diff
+
+    def refresh_texts(self) -> None:
+        for row in self.rows.values():
+            row.refresh_texts()
@@ -1,7 +1,7 @@
 """Video preview frame widget."""
 
 import customtkinter as ctk
-from i18n import t
+from i18n import bind_text
 from utils import format_size
 from constants import COLORS
 
@@ -16,9 +16,9 @@ class VideoPreviewFrame(ctk.CTkFrame):
 
         self.title_label = ctk.CTkLabel(
             self,
-            text=t("preview_title"),
             font=ctk.CTkFont(size=14, weight="bold"),
         )
+        bind_text(self.title_label, "preview_title")
         self.title_label.pack(fill="x", padx=15, pady=(12, 5))
 
         self.content_frame = ctk.CTkFrame(self, fg_color="transparent")
@@ -26,10 +26,10 @@ class VideoPreviewFrame(ctk.CTkFrame):
 
         self.empty_label = ctk.CTkLabel(
             self.content_frame,
-            text=t("preview_empty"),
             font=ctk.CTkFont(size=11),
             text_color=COLORS["muted_text"],
         )
+        bind_text(self.empty_label, "preview_empty")
         self.empty_label.pack(pady=10)
 
         self.preview_container = ctk.CTkFrame(self.content_frame, fg_color="transparent")
@@ -75,10 +75,10 @@ class VideoPreviewFrame(ctk.CTkFrame):
 
         self.loading_label = ctk.CTkLabel(
             self.content_frame,
-            text=t("status_loading_info"),
             font=ctk.CTkFont(size=11),
             text_color=COLORS["muted_text"],
         )
+        bind_text(self.loading_label, "status_loading_info")
 
     def show_loading(self):
         self.empty_label.pack_forget()
@@ -129,10 +129,3 @@ class VideoPreviewFrame(ctk.CTkFrame):
         if self.video_info:
             return self.video_info.get("qualities", ["best"])
         return ["best"]
-
-    def refresh_texts(self):
-        """Refresh all translatable text (called on language change)."""
-        self.title_label.configure(text=t("preview_title"))
-        if not self.video_info:
-            self.empty_label.configure(text=t("preview_empty"))
-        self.loading_label.configure(text=t("status_loading_info"))
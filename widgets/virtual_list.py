@@ -0,0 +1,159 @@
+"""Virtualized list that recycles a fixed pool of row widgets."""
+
+import math
+from typing import Any, Callable, List, Sequence, Tuple
+
+import customtkinter as ctk
+from constants import COLORS
+
+
+def clamp_first(first: int, total: int, capacity: int) -> int:
+    """Keep the first visible index inside ``[0, total - capacity]``."""
+    return max(0, min(first, total - capacity))
+
+
+def visible_range(first: int, total: int, capacity: int) -> Tuple[int, int]:
+    """Return the ``[start, end)`` slice of rows shown from ``first`` on."""
+    start = clamp_first(first, total, capacity)
+    return start, min(total, start + capacity)
+
+
+def scroll_fractions(first: int, total: int, capacity: int) -> Tuple[float, float]:
+    """Scrollbar thumb position for the current window."""
+    if total <= 0:
+        return 0.0, 1.0
+    start, end = visible_range(first, total, capacity)
+    return start / total, end / total
+
+
+def first_for_fraction(fraction: float, total: int, capacity: int) -> int:
+    """First visible index for a scrollbar ``moveto`` fraction."""
+    return clamp_first(int(round(fraction * total)), total, capacity)
+
+
+class VirtualList(ctk.CTkFrame):
+    """Scrollable list whose row widgets are created once and rebound.
+
+    Only enough rows to fill the viewport exist. Scrolling or replacing
+    the data calls ``row.set_data(item)`` on the existing rows instead of
+    destroying and rebuilding them, so redraw cost depends on the viewport
+    height and not on how many items the list holds.
+
+    Items are pulled on demand through ``fetch(offset, limit)`` so the
+    backing data can live in a database rather than in memory.
+    """
+
+    def __init__(
+        self,
+        master,
+        row_factory: Callable[[Any], Any],
+        row_height: int = 56,
+        empty_text: str = "",
+        **kwargs,
+    ):
+        super().__init__(master, **kwargs)
+        self._row_factory = row_factory
+        self.row_height = row_height
+        self._rows: List[Any] = []
+        self._total = 0
+        self._first = 0
+        self._capacity = 1
+        self._fetch: Callable[[int, int], Sequence[Any]] = lambda offset, limit: []
+
+        self.body = ctk.CTkFrame(self, fg_color="transparent")
+        self.body.pack(side="left", fill="both", expand=True)
+        self.scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y")
+
+        self.empty_label = ctk.CTkLabel(
+            self.body,
+            text=empty_text,
+            font=ctk.CTkFont(size=11),
+            text_color=COLORS["muted_text"],
+        )
+
+        self.body.bind("<Configure>", self._on_resize)
+        self._bind_wheel(self.body)
+        self._bind_wheel(self.empty_label)
+
+    # ─── Data ───
+
+    def set_source(self, total: int, fetch: Callable[[int, int], Sequence[Any]], keep_position: bool = False) -> None:
+        """Point the list at ``total`` items served by ``fetch``."""
+        self._total = max(0, total)
+        self._fetch = fetch
+        if not keep_position:
+            self._first = 0
+        self.refresh()
+
+    def set_items(self, items: Sequence[Any], keep_position: bool = False) -> None:
+        """Convenience wrapper for an in-memory sequence."""
+        self.set_source(len(items), lambda offset, limit: items[offset:offset + limit], keep_position)
+
+    def set_empty_text(self, text: str) -> None:
+        self.empty_label.configure(text=text)
+
+    def scroll_to(self, first: int) -> None:
+        first = clamp_first(first, self._total, self._capacity)
+        if first != self._first:
+            self._first = first
+            self.refresh()
+
+    def refresh(self) -> None:
+        """Rebind the visible rows to the current window of data."""
+        self._first = clamp_first(self._first, self._total, self._capacity)
+        start, end = visible_range(self._first, self._total, self._capacity)
+        items = list(self._fetch(start, end - start)) if end > start else []
+
+        if items:
+            self.empty_label.place_forget()
+        else:
+            self.empty_label.place(relx=0.5, y=20, anchor="n")
+
+        self._ensure_rows(len(items))
+        for index, row in enumerate(self._rows):
+            if index < len(items):
+                row.set_data(items[index])
+                row.place(x=0, y=index * self.row_height, relwidth=1.0, height=self.row_height - 4)
+            else:
+                row.place_forget()
+        self.scrollbar.set(*scroll_fractions(self._first, self._total, self._capacity))
+
+    # ─── Internals ───
+
+    def _ensure_rows(self, needed: int) -> None:
+        while len(self._rows) < needed:
+            row = self._row_factory(self.body)
+            self._bind_wheel(row)
+            self._rows.append(row)
+
+    def _on_resize(self, event) -> None:
+        capacity = max(1, math.ceil(event.height / self.row_height))
+        if capacity != self._capacity:
+            self._capacity = capacity
+            self.refresh()
+
+    def _on_scrollbar(self, action: str, *args) -> None:
+        if action == "moveto":
+            self.scroll_to(first_for_fraction(float(args[0]), self._total, self._capacity))
+        elif action == "scroll":
+            step = int(args[0])
+            if len(args) > 1 and args[1] == "pages":
+                step *= self._capacity
+            self.scroll_to(self._first + step)
+
+    def _on_wheel(self, event) -> None:
+        if getattr(event, "num", None) == 4:
+            step = -1
+        elif getattr(event, "num", None) == 5:
+            step = 1
+        else:
+            step = -1 if event.delta > 0 else 1
+        self.scroll_to(self._first + step)
+
+    def _bind_wheel(self, widget) -> None:
+        """Route wheel events from ``widget`` and all its children to the list."""
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            widget.bind(sequence, self._on_wheel, add="+")
+        for child in widget.winfo_children():
+            self._bind_wheel(child)
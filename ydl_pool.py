@@ -0,0 +1,133 @@
+"""Thread-safe pool of reusable yt-dlp ``YoutubeDL`` instances."""
+
+from __future__ import annotations
+
+import json
+import threading
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional
+
+from lazy_import import LazyModule
+
+yt_dlp = LazyModule("yt_dlp")
+
+# Options that are bound to a single call and never part of the pool key
+PER_CALL_OPTIONS = ("progress_hooks", "postprocessor_hooks")
+
+
+def make_pool_key(options: Dict[str, Any]) -> str:
+    """Build a stable key from every option that shapes a YoutubeDL instance.
+
+    Format, postprocessors and the output template root all end up here;
+    per-call hooks are excluded so that the same instance can serve
+    downloads with different progress callbacks.
+    """
+    keyed = {name: value for name, value in options.items() if name not in PER_CALL_OPTIONS}
+    return json.dumps(keyed, sort_keys=True, default=repr)
+
+
+class YoutubeDLPool:
+    """Keep ready ``YoutubeDL`` objects around between downloads.
+
+    Constructing a ``YoutubeDL`` registers every extractor class, builds the
+    HTTP request director and cookie jar, and throws away any open
+    connections and initialised extractors once it is closed. The pool
+    hands out an idle instance built with identical options instead, and
+    only swaps the progress hooks for the caller.
+
+    ``max_idle_per_key=0`` disables reuse, which makes the pool behave like
+    the old one-instance-per-call code path.
+    """
+
+    def __init__(
+        self,
+        max_idle_per_key: int = 4,
+        max_keys: int = 16,
+        factory: Optional[Callable[[Dict[str, Any]], Any]] = None,
+    ) -> None:
+        self.max_idle_per_key = max(0, max_idle_per_key)
+        self.max_keys = max(1, max_keys)
+        self._factory = factory
+        self._idle: "OrderedDict[str, Deque[Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.created = 0
+        self.reused = 0
+
+    @contextmanager
+    def checkout(self, options: Dict[str, Any]) -> Iterator[Any]:
+        """Borrow an instance configured with ``options`` for one call."""
+        key = make_pool_key(options)
+        ydl = self._acquire(key, options)
+        try:
+            ydl._progress_hooks[:] = list(options.get("progress_hooks") or [])
+            ydl._postprocessor_hooks[:] = list(options.get("postprocessor_hooks") or [])
+            yield ydl
+        finally:
+            ydl._progress_hooks[:] = []
+            ydl._postprocessor_hooks[:] = []
+            self._release(key, ydl)
+
+    def close(self) -> None:
+        """Close every idle instance (saves cookies, drops connections)."""
+        with self._lock:
+            instances = [ydl for idle in self._idle.values() for ydl in idle]
+            self._idle.clear()
+        for ydl in instances:
+            self._close_instance(ydl)
+
+    def idle_count(self) -> int:
+        with self._lock:
+            return sum(len(idle) for idle in self._idle.values())
+
+    def _acquire(self, key: str, options: Dict[str, Any]) -> Any:
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                self._idle.move_to_end(key)
+                self.reused += 1
+                return idle.pop()
+            self.created += 1
+
+        params = {name: value for name, value in options.items() if name not in PER_CALL_OPTIONS}
+        factory = self._factory or yt_dlp.YoutubeDL
+        return factory(params)
+
+    def _release(self, key: str, ydl: Any) -> None:
+        evicted: List[Any] = []
+        with self._lock:
+            idle = self._idle.setdefault(key, deque())
+            self._idle.move_to_end(key)
+            if len(idle) < self.max_idle_per_key:
+                idle.append(ydl)
+            else:
+                evicted.append(ydl)
+                if not idle:
+                    del self._idle[key]
+
+            while len(self._idle) > self.max_keys:
+                _, stale = self._idle.popitem(last=False)
+                evicted.extend(stale)
+
+        for instance in evicted:
+            self._close_instance(instance)
+
+    @staticmethod
+    def _close_instance(ydl: Any) -> None:
+        try:
+            ydl.close()
+        except Exception:
+            pass
+
+
+_shared_pool: Optional[YoutubeDLPool] = None
+_shared_pool_lock = threading.Lock()
+
+
+def get_shared_pool() -> YoutubeDLPool:
+    """Return the process-wide pool used by ``YTDLPDownloader``."""
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            _shared_pool = YoutubeDLPool()
+        return _shared_pool